@@ -0,0 +1,67 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Round-trip throughput of the interconnection serializer.
+
+The message sizes follow the SGB handler: per-sample bool lists (sample
+selects), bucket int lists and ndarrays of split points.
+
+Usage: python serializer_benchmark.py [--repeat 10]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from secretflow.ic.proxy.serializer import deserialize, serialize
+
+
+def _cases():
+    rng = np.random.default_rng(0)
+    for samples in (10_000, 100_000, 1_000_000):
+        yield f'bool list [{samples}]', (rng.random(samples) > 0.5).tolist()
+        yield f'int list [{samples}]', rng.integers(0, 1 << 20, samples).tolist()
+    for features, buckets in ((100, 10), (1000, 32)):
+        yield f'ndarray [{features}x{buckets}]', rng.random((features, buckets))
+        yield f'ndarray list [{features}]', [
+            rng.random(buckets) for _ in range(features)
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f'{"case":<28}{"bytes":>12}{"ser MB/s":>12}{"de MB/s":>12}')
+    for name, data in _cases():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            msg_bytes = serialize(data)
+        ser_cost = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            deserialize(msg_bytes)
+        de_cost = (time.perf_counter() - start) / args.repeat
+
+        mb = len(msg_bytes) / (1 << 20)
+        print(
+            f'{name:<28}{len(msg_bytes):>12}{mb / ser_cost:>12.1f}{mb / de_cost:>12.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
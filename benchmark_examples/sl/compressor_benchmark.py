@@ -0,0 +1,103 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bytes on wire and throughput of the compressors of split learning.
+
+Hiddens (non-negative, like outputs of relu) and gradients (small gaussian) of
+a batch are compressed and serialized like they are sent to other parties.
+Bytes of the serialized data, and the throughput of encode (compress and
+serialize) and decode (deserialize and decompress) in dense MB/s are reported.
+
+Usage: python compressor_benchmark.py [--batch_size 256] [--hidden_size 64]
+"""
+
+import argparse
+import pickle
+import time
+
+import numpy as np
+
+from secretflow.utils.compressor import (
+    MixedCompressor,
+    QuantizedFP,
+    QuantizedLSTM,
+    QuantizedZeroPoint,
+    RandomSparse,
+    TopkSparse,
+)
+
+COMPRESSORS = [
+    ('zero_point_8', lambda: QuantizedZeroPoint(8)),
+    ('zero_point_4', lambda: QuantizedZeroPoint(4)),
+    ('zero_point_2', lambda: QuantizedZeroPoint(2)),
+    ('lstm_4', lambda: QuantizedLSTM(4)),
+    ('fp_16', lambda: QuantizedFP(16)),
+    ('topk_0.9', lambda: TopkSparse(0.9)),
+    ('random_0.9', lambda: RandomSparse(0.9)),
+    (
+        'topk_0.9+zero_point_4',
+        lambda: MixedCompressor(TopkSparse(0.9), QuantizedZeroPoint(4)),
+    ),
+    (
+        'topk_0.9+zero_point_2',
+        lambda: MixedCompressor(TopkSparse(0.9), QuantizedZeroPoint(2)),
+    ),
+]
+
+
+def _bench(compressor, data, repeat):
+    wire = pickle.dumps(compressor.compress(data))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        wire = pickle.dumps(compressor.compress(data))
+    encode_cost = (time.perf_counter() - start) / repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        compressor.decompress(pickle.loads(wire))
+    decode_cost = (time.perf_counter() - start) / repeat
+    return len(wire), encode_cost, decode_cost
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--batch_size', type=int, default=256)
+    parser.add_argument('--hidden_size', type=int, default=64)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    shape = (args.batch_size, args.hidden_size)
+    tensors = {
+        'hidden': np.maximum(rng.normal(size=shape), 0).astype(np.float32),
+        'gradient': (rng.normal(size=shape) * 1e-3).astype(np.float32),
+    }
+
+    print(
+        f'{"tensor":<10}{"compressor":<26}{"bytes":>10}{"ratio":>8}'
+        f'{"enc MB/s":>12}{"dec MB/s":>12}'
+    )
+    for name, data in tensors.items():
+        dense = len(pickle.dumps(data))
+        mb = data.nbytes / 2**20
+        print(f'{name:<10}{"none":<26}{dense:>10}{1.0:>8.2f}{"-":>12}{"-":>12}')
+        for compressor_name, compressor_fn in COMPRESSORS:
+            size, encode_cost, decode_cost = _bench(compressor_fn(), data, args.repeat)
+            print(
+                f'{name:<10}{compressor_name:<26}{size:>10}{dense / size:>8.2f}'
+                f'{mb / encode_cost:>12.1f}{mb / decode_cost:>12.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Training throughput of the torch split learning strategies.
+
+Two parties train the DNN application (sl_dnn_torch) on synthetic dense
+features in simulation mode, bob holds the label. Each strategy is trained
+with the same data and the samples per second of SLModel.fit are reported.
+
+Usage: python torch_strategy_benchmark.py [--samples 20000] [--batch_size 64]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from torch import nn, optim
+from torchmetrics import Accuracy
+
+import secretflow as sf
+from secretflow.data.ndarray import FedNdarray, PartitionWay
+from secretflow.ml.nn import SLModel
+from secretflow.ml.nn.applications.sl_dnn_torch import DnnBase, DnnFuse
+from secretflow.ml.nn.fl.utils import metric_wrapper, optim_wrapper
+from secretflow.ml.nn.utils import TorchModel
+
+STRATEGIES = [
+    ('split_nn', {}),
+    ('pipeline', {'pipeline_size': 2}),
+    ('pipeline', {'pipeline_size': 4}),
+    ('split_async', {'base_local_steps': 2, 'fuse_local_steps': 2}),
+    ('split_state_async', {'loss_thres': 0.01, 'split_steps': 1}),
+]
+
+
+def _make_data(alice, bob, samples, features):
+    def _features(seed):
+        return np.random.default_rng(seed).random((samples, features), np.float32)
+
+    def _label(seed):
+        rng = np.random.default_rng(seed)
+        return (rng.random((samples, 1)) > 0.5).astype(np.float32)
+
+    x = FedNdarray(
+        partitions={alice: alice(_features)(0), bob: bob(_features)(1)},
+        partition_way=PartitionWay.VERTICAL,
+    )
+    y = FedNdarray(partitions={bob: bob(_label)(2)}, partition_way=PartitionWay.VERTICAL)
+    return x, y
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--samples', type=int, default=20000)
+    parser.add_argument('--features', type=int, default=32)
+    parser.add_argument('--batch_size', type=int, default=64)
+    parser.add_argument('--epochs', type=int, default=1)
+    args = parser.parse_args()
+
+    sf.init(['alice', 'bob'], address='local')
+    alice, bob = sf.PYU('alice'), sf.PYU('bob')
+    x, y = _make_data(alice, bob, args.samples, args.features)
+
+    metrics = [metric_wrapper(Accuracy, task="binary")]
+    optim_fn = optim_wrapper(optim.Adam, lr=1e-3)
+    base_model = TorchModel(
+        model_fn=DnnBase,
+        loss_fn=nn.BCELoss,
+        optim_fn=optim_fn,
+        metrics=metrics,
+        input_dims=[args.features],
+        dnn_units_size=[64, 16],
+    )
+    fuse_model = TorchModel(
+        model_fn=DnnFuse,
+        loss_fn=nn.BCELoss,
+        optim_fn=optim_fn,
+        metrics=metrics,
+        input_dims=[16, 16],
+        dnn_units_size=[1],
+    )
+
+    print(f'{"strategy":<20}{"options":<48}{"samples/s":>12}')
+    for strategy, options in STRATEGIES:
+        sl_model = SLModel(
+            base_model_dict={alice: base_model, bob: base_model},
+            device_y=bob,
+            model_fuse=fuse_model,
+            random_seed=1234,
+            backend='torch',
+            strategy=strategy,
+            **options,
+        )
+        start = time.perf_counter()
+        sl_model.fit(
+            x,
+            y,
+            batch_size=args.batch_size,
+            epochs=args.epochs,
+            verbose=0,
+            random_seed=1234,
+        )
+        cost = time.perf_counter() - start
+        throughput = args.samples * args.epochs / cost
+        print(f'{strategy:<20}{str(options):<48}{throughput:>12.1f}')
+
+    sf.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -16,17 +16,20 @@
 from typing import Dict, List
 
 import pandas as pd
+import pyarrow as pa
 import pyarrow.csv as csv
+import pyarrow.parquet as pq
 
 from secretflow import PYU, reveal
 
 
 class SimpleBatchReader:
-    def __init__(self, path, batch_size, col, to_numpy):
+    def __init__(self, path, batch_size, col, to_numpy, file_format="csv"):
         self.path = path
         self.batch_size = batch_size
-        self.col = col
+        self.col = list(col) if col is not None else None
         self.to_numpy = to_numpy
+        self.file_format = file_format
         self.read_idx_in_batch = 0
         self.total_read_cnt = 0
         self.batch_idx = 0
@@ -35,28 +38,60 @@ class SimpleBatchReader:
     def __iter__(self):
         return self
 
-    def read_next(self):
+    def _open_batches(self, start: int):
+        """Returns an iterator of batches from the start-th batch."""
+        if self.file_format == "parquet":
+            # row groups are decoded on demand, only the selected columns.
+            pf = pq.ParquetFile(self.path, memory_map=True)
+            return (
+                pf.read_row_group(i, columns=self.col)
+                for i in range(start, pf.num_row_groups)
+            )
+        elif self.file_format == "arrow":
+            reader = pa.ipc.open_file(pa.memory_map(self.path, 'r'))
+            return (
+                reader.get_batch(i).select(self.col)
+                if self.col
+                else reader.get_batch(i)
+                for i in range(start, reader.num_record_batches)
+            )
+
         convert_options = csv.ConvertOptions()
         if self.col:
             convert_options.include_columns = self.col
         reader = csv.open_csv(self.path, convert_options=convert_options)
-        batch = None
 
-        for _ in range(self.batch_idx):
-            batch = reader.read_next_batch()
+        def _csv_batches():
+            while True:
+                try:
+                    yield reader.read_next_batch()
+                except StopIteration:
+                    return
+
+        batches = _csv_batches()
+        for _ in range(start):
+            next(batches, None)
+        return batches
+
+    def read_next(self):
+        batch = None
+        if self.batch_idx > 0:
+            reader = self._open_batches(self.batch_idx - 1)
+            batch = next(reader, None)
+        else:
+            reader = self._open_batches(0)
 
         res = []
         res_cnt = 0
 
         while not self.end and res_cnt < self.batch_size:
             if batch is None or self.read_idx_in_batch >= batch.num_rows:
-                try:
-                    batch = reader.read_next_batch()
-                    self.batch_idx += 1
-                    self.read_idx_in_batch = 0
-                except StopIteration:
+                batch = next(reader, None)
+                if batch is None:
                     self.end = True
                     break
+                self.batch_idx += 1
+                self.read_idx_in_batch = 0
 
             if (batch.num_rows - self.read_idx_in_batch) > (self.batch_size - res_cnt):
                 res.append(
@@ -99,16 +134,23 @@ class SimpleVerticalBatchReader:
         batch_size: int = 100000,
         cols: Dict[str, List[str]] = None,
         to_numpy=False,
+        formats: Dict[str, str] = None,
     ) -> None:
         self.readers = {}
         assert len(paths) > 0, "At least one party should be included."
         for party, path in paths.items():
             pyu = PYU(party)
             self.readers[party] = pyu(
-                lambda path, batch_size, col, to_numpy: SimpleBatchReader(
-                    path, batch_size, col, to_numpy
+                lambda path, batch_size, col, to_numpy, file_format: SimpleBatchReader(
+                    path, batch_size, col, to_numpy, file_format
                 )
-            )(path, batch_size, cols.get(party) if cols else None, to_numpy)
+            )(
+                path,
+                batch_size,
+                cols.get(party) if cols else None,
+                to_numpy,
+                formats.get(party, "csv") if formats else "csv",
+            )
 
     def __iter__(self):
         return self
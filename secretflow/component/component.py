@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import inspect
 import json
 import logging
@@ -39,6 +40,106 @@ def clean_text(x: str, no_line_breaks: bool = True) -> str:
     return cleantext.clean(x.strip(), lower=False, no_line_breaks=no_line_breaks)
 
 
+def _setup_sf_cluster(config: SFClusterConfig):
+    import multiprocess
+
+    cross_silo_comm_backend = (
+        config.desc.ray_fed_config.cross_silo_comm_backend
+        if len(config.desc.ray_fed_config.cross_silo_comm_backend)
+        else 'brpc_link'
+    )
+
+    # From https://grpc.github.io/grpc/core/md_doc_statuscodes.html
+    # We take an aggressive strategy that all error code are retriable except OK.
+    # The code could even be inconsistent with the original meaning because the
+    # complex real produciton environment.
+    _GRPC_RETRY_CODES = [
+        'CANCELLED',
+        'UNKNOWN',
+        'INVALID_ARGUMENT',
+        'DEADLINE_EXCEEDED',
+        'NOT_FOUND',
+        'ALREADY_EXISTS',
+        'PERMISSION_DENIED',
+        'RESOURCE_EXHAUSTED',
+        'ABORTED',
+        'OUT_OF_RANGE',
+        'UNIMPLEMENTED',
+        'INTERNAL',
+        'UNAVAILABLE',
+        'DATA_LOSS',
+        'UNAUTHENTICATED',
+    ]
+
+    if cross_silo_comm_backend == 'grpc':
+        cross_silo_comm_options = {
+            'proxy_max_restarts': 3,
+            'grpc_retry_policy': {
+                # The maximum is 5.
+                # ref https://github.com/grpc/proposal/blob/master/A6-client-retries.md#validation-of-retrypolicy
+                "maxAttempts": 5,
+                "initialBackoff": "2s",
+                "maxBackoff": "3600s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": _GRPC_RETRY_CODES,
+            },
+        }
+    elif cross_silo_comm_backend == 'brpc_link':
+        cross_silo_comm_options = {
+            'proxy_max_restarts': 3,
+            'timeout_in_ms': 300 * 1000,
+            # Give recv_timeout_ms a big value, e.g.
+            # The server does nothing but waits for task finish.
+            # To fix the psi timeout, got a week here.
+            'recv_timeout_ms': 7 * 24 * 3600 * 1000,
+            'connect_retry_times': 3600,
+            'connect_retry_interval_ms': 1000,
+            'brpc_channel_protocol': 'http',
+            'brpc_channel_connection_type': 'pooled',
+        }
+
+    else:
+        raise RuntimeError(
+            f"unknown cross_silo_comm_backend: {cross_silo_comm_backend}"
+        )
+
+    cluster_config = {
+        "parties": {},
+        "self_party": config.private_config.self_party,
+    }
+    for party, addr in zip(
+        list(config.public_config.ray_fed_config.parties),
+        list(config.public_config.ray_fed_config.addresses),
+    ):
+        if cross_silo_comm_backend == 'brpc_link':
+            # if port is not present, use default 80 port.
+            if len(addr.split(":")) < 2:
+                addr += ":80"
+
+            splits = addr.split(":")
+            assert len(splits) == 2, f"addr = {addr}"
+
+            cluster_config["parties"][party] = {
+                # add "http://" to force brpc to set the correct host
+                "address": f'http://{addr}',
+                'listen_addr': f'0.0.0.0:{splits[1]}',
+            }
+        else:
+            cluster_config["parties"][party] = {"address": addr}
+
+    init(
+        address=config.private_config.ray_head_addr,
+        num_cpus=32,
+        log_to_driver=True,
+        cluster_config=cluster_config,
+        omp_num_threads=multiprocess.cpu_count(),
+        logging_level='debug',
+        cross_silo_comm_backend=cross_silo_comm_backend,
+        cross_silo_comm_options=cross_silo_comm_options,
+        enable_waiting_for_other_parties_ready=True,
+    )
+
+
 class CompDeclError(Exception):
     ...
 
@@ -106,8 +207,119 @@ class CompEvalContext:
     local_fs_wd: str = None
     spu_configs: Dict = None
     cluster_config: SFClusterConfig = None
+    session: "CompSession" = None
+    # format of tables dumped by components, see DataSetFormatSupported.
+    table_format: str = "csv"
     tracer = CompTracer()
 
+    def make_spu(self, cluster_def: Dict, link_desc: Dict = None):
+        """Create a SPU device, which is reused across components in a session."""
+        if self.session is not None:
+            return self.session.get_spu(cluster_def, link_desc)
+        from secretflow.device import SPU
+
+        return SPU(cluster_def, link_desc)
+
+    def make_heu(self, heu_config: Dict, spu_field_type):
+        """Create a HEU device, which is reused across components in a session."""
+        if self.session is not None:
+            return self.session.get_heu(heu_config, spu_field_type)
+        from secretflow.device import HEU
+
+        return HEU(heu_config, spu_field_type)
+
+
+_active_session: "CompSession" = None
+
+
+def get_active_session() -> "CompSession":
+    return _active_session
+
+
+class CompSession:
+    def __init__(self, cluster_config: SFClusterConfig, table_format: str = "csv"):
+        """A long-lived session to eval a pipeline of components in one cluster.
+
+        Within a session, the secretflow cluster is set up once, SPU and HEU
+        devices are reused by following components, and vertical tables dumped
+        by a component are kept in memory and handed to following components
+        by reference. Tables are still written to storage when dumped, so
+        readers which open the files by path see them.
+
+        Example:
+
+        .. code:: python
+
+            with CompSession(cluster_config):
+                psi_comp.eval(psi_param, storage_config, cluster_config)
+                sgb_comp.eval(sgb_param, storage_config, cluster_config)
+
+        Args:
+            cluster_config: the cluster config shared by all components in this
+                session.
+            table_format: format of tables dumped by components in this
+                session, 'csv', 'parquet' or 'arrow'.
+        """
+        self.cluster_config = cluster_config
+        self.table_format = table_format
+        self._spus = {}
+        self._heus = {}
+        # (party, uri) -> (Partition, columns)
+        self._tables = {}
+
+    def __enter__(self) -> "CompSession":
+        global _active_session
+        if _active_session is not None:
+            raise CompEvalError("a component session is already active.")
+        _setup_sf_cluster(self.cluster_config)
+        _active_session = self
+        return self
+
+    def __exit__(self, *_):
+        global _active_session
+        self._tables.clear()
+        self._spus.clear()
+        self._heus.clear()
+        _active_session = None
+        shutdown()
+
+    def match(self, cluster_config: SFClusterConfig) -> bool:
+        return (
+            cluster_config.SerializeToString(deterministic=True)
+            == self.cluster_config.SerializeToString(deterministic=True)
+        )
+
+    def get_spu(self, cluster_def: Dict, link_desc: Dict = None):
+        from secretflow.device import SPU
+
+        key = json.dumps([cluster_def, link_desc], sort_keys=True, default=str)
+        if key not in self._spus:
+            addresses = {n["address"] for n in cluster_def["nodes"]}
+            for k in list(self._spus.keys()):
+                # the links of a SPU with different config but same addresses
+                # must be released before creating a new one.
+                if addresses & {n["address"] for n in self._spus[k].cluster_def["nodes"]}:
+                    self._spus.pop(k).shutdown()
+            self._spus[key] = SPU(copy.deepcopy(cluster_def), link_desc)
+        return self._spus[key]
+
+    def get_heu(self, heu_config: Dict, spu_field_type):
+        from secretflow.device import HEU
+
+        key = json.dumps([heu_config, spu_field_type], sort_keys=True, default=str)
+        if key not in self._heus:
+            self._heus[key] = HEU(copy.deepcopy(heu_config), spu_field_type)
+        return self._heus[key]
+
+    def put_table(self, uri: str, v_data):
+        """Keep a vertical table written to uri in memory."""
+        for pyu, part in v_data.partitions.items():
+            self._tables[(pyu.party, uri)] = (part, part.columns)
+
+    def get_table(self, party: str, uri: str):
+        """Returns (Partition, columns) of a table dumped in this session or None."""
+        return self._tables.get((party, uri), None)
+
 
 class Component:
     def __init__(self, name: str, domain="", version="", desc="") -> None:
@@ -666,103 +878,7 @@ class Component:
         return self.__definition
 
     def _setup_sf_cluster(self, config: SFClusterConfig):
-        import multiprocess
-
-        cross_silo_comm_backend = (
-            config.desc.ray_fed_config.cross_silo_comm_backend
-            if len(config.desc.ray_fed_config.cross_silo_comm_backend)
-            else 'brpc_link'
-        )
-
-        # From https://grpc.github.io/grpc/core/md_doc_statuscodes.html
-        # We take an aggressive strategy that all error code are retriable except OK.
-        # The code could even be inconsistent with the original meaning because the
-        # complex real produciton environment.
-        _GRPC_RETRY_CODES = [
-            'CANCELLED',
-            'UNKNOWN',
-            'INVALID_ARGUMENT',
-            'DEADLINE_EXCEEDED',
-            'NOT_FOUND',
-            'ALREADY_EXISTS',
-            'PERMISSION_DENIED',
-            'RESOURCE_EXHAUSTED',
-            'ABORTED',
-            'OUT_OF_RANGE',
-            'UNIMPLEMENTED',
-            'INTERNAL',
-            'UNAVAILABLE',
-            'DATA_LOSS',
-            'UNAUTHENTICATED',
-        ]
-
-        if cross_silo_comm_backend == 'grpc':
-            cross_silo_comm_options = {
-                'proxy_max_restarts': 3,
-                'grpc_retry_policy': {
-                    # The maximum is 5.
-                    # ref https://github.com/grpc/proposal/blob/master/A6-client-retries.md#validation-of-retrypolicy
-                    "maxAttempts": 5,
-                    "initialBackoff": "2s",
-                    "maxBackoff": "3600s",
-                    "backoffMultiplier": 2,
-                    "retryableStatusCodes": _GRPC_RETRY_CODES,
-                },
-            }
-        elif cross_silo_comm_backend == 'brpc_link':
-            cross_silo_comm_options = {
-                'proxy_max_restarts': 3,
-                'timeout_in_ms': 300 * 1000,
-                # Give recv_timeout_ms a big value, e.g.
-                # The server does nothing but waits for task finish.
-                # To fix the psi timeout, got a week here.
-                'recv_timeout_ms': 7 * 24 * 3600 * 1000,
-                'connect_retry_times': 3600,
-                'connect_retry_interval_ms': 1000,
-                'brpc_channel_protocol': 'http',
-                'brpc_channel_connection_type': 'pooled',
-            }
-
-        else:
-            raise RuntimeError(
-                f"unknown cross_silo_comm_backend: {cross_silo_comm_backend}"
-            )
-
-        cluster_config = {
-            "parties": {},
-            "self_party": config.private_config.self_party,
-        }
-        for party, addr in zip(
-            list(config.public_config.ray_fed_config.parties),
-            list(config.public_config.ray_fed_config.addresses),
-        ):
-            if cross_silo_comm_backend == 'brpc_link':
-                # if port is not present, use default 80 port.
-                if len(addr.split(":")) < 2:
-                    addr += ":80"
-
-                splits = addr.split(":")
-                assert len(splits) == 2, f"addr = {addr}"
-
-                cluster_config["parties"][party] = {
-                    # add "http://" to force brpc to set the correct host
-                    "address": f'http://{addr}',
-                    'listen_addr': f'0.0.0.0:{splits[1]}',
-                }
-            else:
-                cluster_config["parties"][party] = {"address": addr}
-
-        init(
-            address=config.private_config.ray_head_addr,
-            num_cpus=32,
-            log_to_driver=True,
-            cluster_config=cluster_config,
-            omp_num_threads=multiprocess.cpu_count(),
-            logging_level='debug',
-            cross_silo_comm_backend=cross_silo_comm_backend,
-            cross_silo_comm_options=cross_silo_comm_options,
-            enable_waiting_for_other_parties_ready=True,
-        )
+        _setup_sf_cluster(config)
 
     def _check_storage(self, storage: StorageConfig):
         # only local fs is supported at this moment.
@@ -934,7 +1050,20 @@ class Component:
         for output in definition.outputs:
             kwargs[output.name] = reader.get_output_uri(name=output.name)
 
-        if cluster_config is not None:
+        session = get_active_session()
+        if cluster_config is not None and session is not None:
+            if not session.match(cluster_config):
+                raise CompEvalError(
+                    "cluster config does not match the active component session."
+                )
+            # reuse the cluster and devices of the session.
+            ctx.session = session
+            ctx.table_format = session.table_format
+            setup_cluster = False
+        else:
+            setup_cluster = cluster_config is not None
+
+        if setup_cluster:
             self._setup_sf_cluster(cluster_config)
         try:
             ret = self.__eval_callback(**kwargs)
@@ -943,7 +1072,7 @@ class Component:
             # TODO: use error_code in report
             raise e from None
         finally:
-            if cluster_config is not None:
+            if setup_cluster:
                 shutdown()
 
         logging.info(f"{param}, getting eval return complete.")
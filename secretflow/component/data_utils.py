@@ -23,7 +23,7 @@ import numpy as np
 import pandas as pd
 
 from secretflow.data.core.io import read_file_meta
-from secretflow.data.vertical import read_csv
+from secretflow.data.vertical import read_columnar, read_csv
 from secretflow.data.vertical.dataframe import VDataFrame
 from secretflow.device.device.pyu import PYU, PYUObject
 from secretflow.device.device.spu import SPU, SPUObject
@@ -82,6 +82,9 @@ class DistDataType(BaseEnum):
 @enum.unique
 class DataSetFormatSupported(BaseEnum):
     CSV = "csv"
+    # columnar formats, which support column pruning and typed schema.
+    PARQUET = "parquet"
+    ARROW = "arrow"
 
 
 SUPPORTED_VTABLE_DATA_TYPE = {
@@ -294,6 +297,59 @@ def extract_table_header(
     return ret
 
 
+def _select_cached_partition(part, columns: List[str], dtypes: Dict, nrows: int):
+    # keep the order of columns in file, which is the same as read_csv.
+    selected = [c for c in columns if c in dtypes]
+    missing = set(dtypes) - set(selected)
+    assert not missing, f"columns {missing} not found in table"
+    part = part[selected].astype({c: dtypes[c] for c in selected})
+    if nrows is not None:
+        part = part.iloc(slice(0, nrows))
+    return part
+
+
+def _read_vertical_table(
+    filepaths: Dict[PYU, str],
+    formats: Dict[PYU, str],
+    dtypes: Dict[PYU, Dict],
+    nrows: int = None,
+) -> VDataFrame:
+    partitions = {}
+    for file_format in set(formats.values()):
+        pyus = [pyu for pyu in formats if formats[pyu] == file_format]
+        if file_format == DataSetFormatSupported.CSV:
+            vdf = read_csv(
+                {pyu: filepaths[pyu] for pyu in pyus},
+                dtypes={pyu: dtypes[pyu] for pyu in pyus},
+                nrows=nrows,
+            )
+        else:
+            # only the selected columns are decoded.
+            vdf = read_columnar(
+                {pyu: filepaths[pyu] for pyu in pyus},
+                file_format,
+                dtypes={pyu: dtypes[pyu] for pyu in pyus},
+                nrows=nrows,
+            )
+        partitions.update(vdf.partitions)
+    # keep the order of parties.
+    return VDataFrame({pyu: partitions[pyu] for pyu in filepaths})
+
+
+def write_vertical_table(
+    v_data: VDataFrame,
+    output_path: Dict[PYU, str],
+    file_format: str = DataSetFormatSupported.CSV,
+) -> List:
+    """Write VDataFrame to files in file_format, returns objects to wait."""
+    if file_format == DataSetFormatSupported.CSV:
+        return v_data.to_csv(output_path, index=False)
+    assert (
+        file_format in DataSetFormatSupported
+    ), f"Illegal file format: {file_format}"
+    return v_data.to_columnar(output_path, str(file_format))
+
+
 def load_table(
     ctx,
     db: DistData,
@@ -337,7 +393,6 @@ def load_table(
         assert (
             p in parties_path_format
         ), f"schema party {p} is not in dataref parties {v_headers.keys()}"
-        # only support csv for now, skip type distribute
         assert (
             parties_path_format[p].format.lower() in DataSetFormatSupported
         ), f"Illegal path format: {parties_path_format[p].format.lower()}, path format of party {p} should be in DataSetFormatSupported"
@@ -345,12 +400,30 @@ def load_table(
 
     with ctx.tracer.trace_io():
         pyus = {p: PYU(p) for p in v_headers}
-        filepaths = {
-            pyus[p]: os.path.join(ctx.local_fs_wd, parties_path_format[p].uri)
-            for p in v_headers
-        }
-        dtypes = {pyus[p]: v_headers[p] for p in v_headers}
-        vdf = read_csv(filepaths, dtypes=dtypes, nrows=nrows)
+        session = getattr(ctx, "session", None)
+        cached = None
+        if session is not None:
+            cached = {
+                p: session.get_table(p, parties_path_format[p].uri) for p in v_headers
+            }
+        if cached is not None and all(c is not None for c in cached.values()):
+            # tables dumped by former components in the same session, skip io.
+            vdf = VDataFrame(
+                {
+                    pyus[p]: _select_cached_partition(part, columns, v_headers[p], nrows)
+                    for p, (part, columns) in cached.items()
+                }
+            )
+        else:
+            vdf = _read_vertical_table(
+                {
+                    pyus[p]: os.path.join(ctx.local_fs_wd, parties_path_format[p].uri)
+                    for p in v_headers
+                },
+                {pyus[p]: parties_path_format[p].format.lower() for p in v_headers},
+                {pyus[p]: v_headers[p] for p in v_headers},
+                nrows,
+            )
         wait(vdf)
     if return_schema_names:
         return vdf, schema_names
@@ -445,7 +518,16 @@ def dump_vertical_table(
     uri: str,
     meta: VerticalTableWrapper,
     system_info: SystemInfo,
+    file_format: str = None,
 ) -> DistData:
+    """Dump VDataFrame to storage.
+
+    file_format is one of DataSetFormatSupported, defaults to the table
+    format of ctx, which is csv unless set by the component session.
+    """
+    if file_format is None:
+        file_format = getattr(ctx, "table_format", DataSetFormatSupported.CSV)
+    file_format = str(file_format).lower()
     assert isinstance(v_data, VDataFrame)
     assert v_data.aligned
     assert len(v_data.partitions) > 0
@@ -462,21 +544,25 @@ def dump_vertical_table(
         output_path = {
             p: os.path.join(ctx.local_fs_wd, output_uri[p]) for p in output_uri
         }
-        wait(v_data.to_csv(output_path, index=False))
         order = [p.party for p in v_data.partitions]
+        wait(write_vertical_table(v_data, output_path, file_format))
         file_metas = {}
         for pyu in output_path:
             file_metas[pyu] = reveal(pyu(read_file_meta)(output_path[pyu]))
         logging.info(
             f"dumped VDataFrame, file uri {output_path}, samples {parties_length}, file meta {file_metas}"
         )
+        session = getattr(ctx, "session", None)
+        if session is not None:
+            # keep in memory for following components.
+            session.put_table(uri, v_data)
 
     ret = DistData(
         name=uri,
         type=str(DistDataType.VERTICAL_TABLE),
         system_info=system_info,
         data_refs=[
-            DistData.DataRef(uri=output_uri[p], party=p.party, format="csv")
+            DistData.DataRef(uri=output_uri[p], party=p.party, format=file_format)
             for p in output_uri
         ],
     )
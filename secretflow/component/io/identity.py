@@ -16,7 +16,6 @@ import json
 
 from secretflow.component.component import CompEvalError, Component, IoType
 from secretflow.component.data_utils import DistDataType, model_dumps, model_loads
-from secretflow.device.device.spu import SPU
 from secretflow.spec.extend.data_pb2 import DeviceObjectCollection
 from secretflow.spec.v1.data_pb2 import DistData
 
@@ -59,7 +58,7 @@ def identity_eval_fn(*, ctx, input_data: DistData, output_data):
         raise CompEvalError("only support one spu")
     spu_config = next(iter(ctx.spu_configs.values()))
 
-    spu = SPU(spu_config["cluster_def"], spu_config["link_desc"])
+    spu = ctx.make_spu(spu_config["cluster_def"], spu_config["link_desc"])
     model_meta = DeviceObjectCollection()
     assert input_data.meta.Unpack(model_meta)
 
@@ -42,7 +42,6 @@ from secretflow.component.preprocessing.binning.vert_binning import (
     BINNING_RULE_MAX_MAJOR_VERSION,
     BINNING_RULE_MAX_MINOR_VERSION,
 )
-from secretflow.device.device.spu import SPU
 from secretflow.spec.extend.bin_data_pb2 import Bins
 from secretflow.spec.extend.linear_model_pb2 import LinearModel
 from secretflow.spec.v1.data_pb2 import DistData
@@ -99,7 +98,7 @@ def io_read_data_eval_fn(*, ctx, input_dd, output_data):
         cluster_def["runtime_config"]["field"] = "FM128"
         cluster_def["runtime_config"]["fxp_fraction_bits"] = 40
 
-        spu = SPU(cluster_def, spu_config["link_desc"])
+        spu = ctx.make_spu(cluster_def, spu_config["link_desc"])
         model_objs, public_info = model_loads(
             ctx,
             input_dd,
@@ -214,7 +213,7 @@ def io_write_data_eval_fn(*, ctx, write_data, write_data_type, input_dd, output_
         cluster_def["runtime_config"]["field"] = "FM128"
         cluster_def["runtime_config"]["fxp_fraction_bits"] = 40
 
-        spu = SPU(cluster_def, spu_config["link_desc"])
+        spu = ctx.make_spu(cluster_def, spu_config["link_desc"])
         model_objs, public_info = model_loads(
             ctx,
             input_dd,
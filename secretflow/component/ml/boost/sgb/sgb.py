@@ -14,6 +14,8 @@
 import json
 import os
 
+import spu
+
 from secretflow.component.batch_reader import SimpleVerticalBatchReader
 from secretflow.component.component import Component, IoType, TableColParam
 from secretflow.component.data_utils import (
@@ -27,7 +29,7 @@ from secretflow.component.data_utils import (
     model_loads,
     save_prediction_csv,
 )
-from secretflow.device.device.heu import heu_from_base_config
+from secretflow.device.device.heu import heu_config_from_base_config
 from secretflow.device.device.pyu import PYU
 from secretflow.device.driver import wait
 from secretflow.ml.boost.sgb_v import Sgb, SgbModel
@@ -366,10 +368,13 @@ def sgb_train_eval_fn(
     )
 
     label_party = next(iter(y.partitions.keys())).party
-    heu = heu_from_base_config(
-        ctx.heu_config,
-        label_party,
-        [p.party for p in x.partitions if p.party != label_party],
+    heu = ctx.make_heu(
+        heu_config_from_base_config(
+            ctx.heu_config,
+            label_party,
+            [p.party for p in x.partitions if p.party != label_party],
+        ),
+        spu.spu_pb2.FM64,
     )
 
     with ctx.tracer.trace_running():
@@ -552,8 +557,10 @@ def sgb_predict_eval_fn(
 
     cols = {k: list(v.keys()) for k, v in v_header_map.items()}
 
+    formats = {p: parties_path_format[p].format.lower() for p in parties_path_format}
+
     feature_reader = SimpleVerticalBatchReader(
-        feature_filepaths, DEFAULT_PREDICT_BATCH_SIZE, cols, True
+        feature_filepaths, DEFAULT_PREDICT_BATCH_SIZE, cols, True, formats
     )
 
     pyus = {p: PYU(p) for p in ctx.cluster_config.desc.parties}
@@ -571,7 +578,7 @@ def sgb_predict_eval_fn(
         }
 
         id_reader = SimpleVerticalBatchReader(
-            id_filepaths, DEFAULT_PREDICT_BATCH_SIZE, id_header_map, True
+            id_filepaths, DEFAULT_PREDICT_BATCH_SIZE, id_header_map, True, formats
         )
     else:
         id_header_map = None
@@ -592,7 +599,11 @@ def sgb_predict_eval_fn(
             for p in label_header_map
         }
         label_reader = SimpleVerticalBatchReader(
-            label_filepath, DEFAULT_PREDICT_BATCH_SIZE, label_header_map, True
+            label_filepath,
+            DEFAULT_PREDICT_BATCH_SIZE,
+            label_header_map,
+            True,
+            formats,
         )
     else:
         label_header_map = None
@@ -31,7 +31,6 @@ from secretflow.component.data_utils import (
     save_prediction_csv,
 )
 from secretflow.device.device.pyu import PYU
-from secretflow.device.device.spu import SPU
 from secretflow.device.driver import wait
 from secretflow.ml.boost.ss_xgb_v import Xgb, XgbModel
 from secretflow.ml.boost.ss_xgb_v.core.node_split import RegType
@@ -208,7 +207,7 @@ def ss_xgb_train_eval_fn(
         raise CompEvalError("only support one spu")
     spu_config = next(iter(ctx.spu_configs.values()))
 
-    spu = SPU(spu_config["cluster_def"], spu_config["link_desc"])
+    spu = ctx.make_spu(spu_config["cluster_def"], spu_config["link_desc"])
 
     y = load_table(
         ctx,
@@ -391,7 +390,7 @@ def ss_xgb_predict_eval_fn(
         raise CompEvalError("only support one spu")
     spu_config = next(iter(ctx.spu_configs.values()))
 
-    spu = SPU(spu_config["cluster_def"], spu_config["link_desc"])
+    spu = ctx.make_spu(spu_config["cluster_def"], spu_config["link_desc"])
 
     model_public_info = get_model_public_info(model)
 
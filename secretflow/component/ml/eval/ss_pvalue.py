@@ -17,7 +17,6 @@ import numpy as np
 from secretflow.component.component import CompEvalError, Component, IoType
 from secretflow.component.data_utils import DistDataType, load_table
 from secretflow.component.ml.linear.ss_sgd import load_ss_sgd_model
-from secretflow.device.device.spu import SPU
 from secretflow.spec.v1.component_pb2 import Attribute
 from secretflow.spec.v1.data_pb2 import DistData
 from secretflow.spec.v1.report_pb2 import Descriptions, Div, Report, Tab
@@ -67,7 +66,7 @@ def ss_pearsonr_eval_fn(
         raise CompEvalError("only support one spu")
     spu_config = next(iter(ctx.spu_configs.values()))
 
-    spu = SPU(spu_config["cluster_def"], spu_config["link_desc"])
+    spu = ctx.make_spu(spu_config["cluster_def"], spu_config["link_desc"])
 
     model, model_meta = load_ss_sgd_model(ctx, spu, model)
 
@@ -34,7 +34,7 @@ from secretflow.component.data_utils import (
     save_prediction_csv,
 )
 from secretflow.device.device.pyu import PYU
-from secretflow.device.device.spu import SPU, SPUObject
+from secretflow.device.device.spu import SPUObject
 from secretflow.device.driver import reveal, wait
 from secretflow.ml.linear import SSGLM
 from secretflow.ml.linear.ss_glm.core import Linker, get_link
@@ -265,7 +265,7 @@ def ss_glm_train_eval_fn(
     cluster_def["runtime_config"]["field"] = "FM128"
     cluster_def["runtime_config"]["fxp_fraction_bits"] = 40
 
-    spu = SPU(cluster_def, spu_config["link_desc"])
+    spu = ctx.make_spu(cluster_def, spu_config["link_desc"])
 
     glm = SSGLM(spu)
 
@@ -562,7 +562,7 @@ def ss_glm_predict_eval_fn(
     cluster_def["runtime_config"]["field"] = "FM128"
     cluster_def["runtime_config"]["fxp_fraction_bits"] = 40
 
-    spu = SPU(cluster_def, spu_config["link_desc"])
+    spu = ctx.make_spu(cluster_def, spu_config["link_desc"])
 
     model_public_info = get_model_public_info(model)
 
@@ -32,7 +32,7 @@ from secretflow.component.data_utils import (
     save_prediction_csv,
 )
 from secretflow.device.device.pyu import PYU
-from secretflow.device.device.spu import SPU, SPUObject
+from secretflow.device.device.spu import SPUObject
 from secretflow.device.driver import wait
 from secretflow.ml.linear import LinearModel, RegType, SSRegression
 from secretflow.spec.v1.data_pb2 import DistData
@@ -175,7 +175,7 @@ def ss_sgd_train_eval_fn(
         raise CompEvalError("only support one spu")
     spu_config = next(iter(ctx.spu_configs.values()))
 
-    spu = SPU(spu_config["cluster_def"], spu_config["link_desc"])
+    spu = ctx.make_spu(spu_config["cluster_def"], spu_config["link_desc"])
 
     reg = SSRegression(spu)
 
@@ -354,7 +354,7 @@ def ss_sgd_predict_eval_fn(
         raise CompEvalError("only support one spu")
     spu_config = next(iter(ctx.spu_configs.values()))
 
-    spu = SPU(spu_config["cluster_def"], spu_config["link_desc"])
+    spu = ctx.make_spu(spu_config["cluster_def"], spu_config["link_desc"])
 
     model, model_meta = load_ss_sgd_model(ctx, spu, model)
 
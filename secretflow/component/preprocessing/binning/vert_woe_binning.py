@@ -32,8 +32,6 @@ from secretflow.component.preprocessing.binning.vert_binning import (
     BINNING_RULE_MAX_MAJOR_VERSION,
     BINNING_RULE_MAX_MINOR_VERSION,
 )
-from secretflow.device.device.heu import HEU
-from secretflow.device.device.spu import SPU
 from secretflow.preprocessing.binning.vert_woe_binning import VertWoeBinning
 
 vert_woe_binning_comp = Component(
@@ -172,7 +170,7 @@ def vert_woe_binning_eval_fn(
         if len(ctx.spu_configs) > 1:
             raise CompEvalError("only support one spu")
         spu_config = next(iter(ctx.spu_configs.values()))
-        secure_device = SPU(spu_config["cluster_def"], spu_config["link_desc"])
+        secure_device = ctx.make_spu(spu_config["cluster_def"], spu_config["link_desc"])
     elif secure_device_type == "heu":
         assert ctx.heu_config is not None, "need heu config in SFClusterDesc"
         heu_config = {
@@ -188,7 +186,7 @@ def vert_woe_binning_eval_fn(
                 "key_pair": {"generate": {"bit_size": ctx.heu_config["key_size"]}},
             },
         }
-        secure_device = HEU((heu_config), spu.spu_pb2.FM64)
+        secure_device = ctx.make_heu(heu_config, spu.spu_pb2.FM64)
     else:
         raise CompEvalError(f"unsupported secure_device_type {secure_device_type}")
 
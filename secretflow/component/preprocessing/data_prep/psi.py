@@ -22,12 +22,21 @@ from secretflow.component.component import (
     TableColParam,
 )
 from secretflow.component.data_utils import (
+    DataSetFormatSupported,
     DistDataType,
     extract_distdata_info,
+    extract_table_header,
     merge_individuals_to_vtable,
 )
+from secretflow.data import partition
+from secretflow.data.core.io import (
+    csv_to_columnar,
+    read_columnar_wrapper,
+    read_csv_batches_wrapper,
+)
+from secretflow.data.vertical import VDataFrame
 from secretflow.device.device.pyu import PYU
-from secretflow.device.device.spu import SPU
+from secretflow.device.driver import wait
 from secretflow.spec.v1.data_pb2 import DistData, IndividualTable, VerticalTable
 
 psi_comp = Component(
@@ -179,11 +188,22 @@ def two_party_balanced_psi_eval_fn(
 
     logging.warning(spu_config)
 
-    spu = SPU(spu_config["cluster_def"], spu_config["link_desc"])
+    spu = ctx.make_spu(spu_config["cluster_def"], spu_config["link_desc"])
 
     receiver_pyu = PYU(receiver_party)
     sender_pyu = PYU(sender_party)
 
+    output_format = str(ctx.table_format).lower()
+    output_path = {
+        receiver_pyu: os.path.join(local_fs_wd, psi_output),
+        sender_pyu: os.path.join(local_fs_wd, psi_output),
+    }
+    if output_format == DataSetFormatSupported.CSV:
+        psi_path = output_path
+    else:
+        # PSI writes csv, which is converted to output_format afterwards.
+        psi_path = {pyu: f"{path}.psi.csv" for pyu, path in output_path.items()}
+
     with ctx.tracer.trace_running():
         intersection_count = spu.psi_csv(
             key={receiver_pyu: receiver_input_key, sender_pyu: sender_input_key},
@@ -195,10 +215,7 @@ def two_party_balanced_psi_eval_fn(
                     local_fs_wd, sender_path_format[sender_party].uri
                 ),
             },
-            output_path={
-                receiver_pyu: os.path.join(local_fs_wd, psi_output),
-                sender_pyu: os.path.join(local_fs_wd, psi_output),
-            },
+            output_path=psi_path,
             receiver=receiver_party,
             sort=sort,
             protocol=protocol,
@@ -214,12 +231,12 @@ def two_party_balanced_psi_eval_fn(
             DistData.DataRef(
                 uri=psi_output,
                 party=receiver_party,
-                format="csv",
+                format=output_format,
             ),
             DistData.DataRef(
                 uri=psi_output,
                 party=sender_party,
-                format="csv",
+                format=output_format,
             ),
         ],
     )
@@ -236,4 +253,53 @@ def two_party_balanced_psi_eval_fn(
     vmeta.line_count = intersection_count
     output_db.meta.Pack(vmeta)
 
+    dtypes = extract_table_header(
+        output_db, load_features=True, load_labels=True, load_ids=True
+    )
+    with ctx.tracer.trace_io():
+        _load_psi_output(ctx, psi_output, psi_path, output_path, output_format, dtypes)
+
     return {"psi_output": output_db}
+
+
+def _load_psi_output(ctx, uri, psi_path, output_path, output_format, dtypes):
+    """Hand the intersection to following components without a round trip
+    through csv.
+
+    The csv written by PSI is converted to output_format block by block if
+    output_format is columnar. In a component session, the output is also
+    loaded into the partitions of each party and kept in the session for
+    following components. The csv is parsed only once: a csv output is parsed
+    by the arrow csv reader, and a columnar output is read back from the
+    converted file.
+    """
+    if psi_path != output_path:
+        wait(
+            [
+                pyu(csv_to_columnar)(
+                    psi_path[pyu], path, output_format, dtype=dtypes[pyu.party]
+                )
+                for pyu, path in output_path.items()
+            ]
+        )
+    if ctx.session is not None:
+        if psi_path == output_path:
+            read_fn, read_kwargs = read_csv_batches_wrapper, {}
+        else:
+            read_fn, read_kwargs = read_columnar_wrapper, {"file_format": output_format}
+        v_data = VDataFrame(
+            {
+                pyu: partition(
+                    data=read_fn,
+                    device=pyu,
+                    filepath=path,
+                    dtype=dtypes[pyu.party],
+                    **read_kwargs,
+                )
+                for pyu, path in output_path.items()
+            }
+        )
+        wait(v_data)
+        ctx.session.put_table(uri, v_data)
+    if psi_path != output_path:
+        wait([pyu(os.remove)(path) for pyu, path in psi_path.items()])
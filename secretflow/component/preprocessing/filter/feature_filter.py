@@ -15,7 +15,11 @@
 import os
 
 from secretflow.component.component import Component, IoType, TableColParam
-from secretflow.component.data_utils import DistDataType, load_table
+from secretflow.component.data_utils import (
+    DistDataType,
+    load_table,
+    write_vertical_table,
+)
 from secretflow.device.driver import wait
 from secretflow.spec.v1.data_pb2 import DistData, TableSchema, VerticalTable
 
@@ -76,9 +80,12 @@ def feature_filter_eval_fn(*, ctx, in_ds, in_ds_drop_features, out_ds):
             ctx, out_dist, load_features=True, load_ids=True, load_labels=True
         )
         out_path = {p: os.path.join(ctx.local_fs_wd, out_ds) for p in ds.partitions}
-        wait(ds.to_csv(out_path, index=False))
+        # keep the format of input table.
+        file_format = out_dist.data_refs[0].format.lower()
+        wait(write_vertical_table(ds, out_path, file_format))
 
     for i in range(len(out_dist.data_refs)):
         out_dist.data_refs[i].uri = out_ds
+        out_dist.data_refs[i].format = file_format
 
     return {"out_ds": out_dist}
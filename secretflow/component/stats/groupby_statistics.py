@@ -23,7 +23,6 @@ from secretflow.component.component import (
     TableColParam,
 )
 from secretflow.component.data_utils import DistDataType, load_table
-from secretflow.device.device.spu import SPU
 from secretflow.spec.extend.groupby_aggregation_config_pb2 import (
     ColumnQuery,
     GroupbyAggregationConfig,
@@ -193,7 +192,7 @@ def groupby_statistics_eval_fn(
         raise CompEvalError("only support one spu")
     spu_config = next(iter(ctx.spu_configs.values()))
 
-    spu = SPU(spu_config["cluster_def"], spu_config["link_desc"])
+    spu = ctx.make_spu(spu_config["cluster_def"], spu_config["link_desc"])
 
     logging.info("set up complete")
 
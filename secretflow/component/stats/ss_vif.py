@@ -21,7 +21,6 @@ from secretflow.component.component import (
     TableColParam,
 )
 from secretflow.component.data_utils import DistDataType, load_table
-from secretflow.device.device.spu import SPU
 from secretflow.spec.v1.component_pb2 import Attribute
 from secretflow.spec.v1.data_pb2 import DistData
 from secretflow.spec.v1.report_pb2 import Descriptions, Div, Report, Tab
@@ -77,7 +76,7 @@ def ss_vif_eval_fn(
     cluster_def["runtime_config"]["field"] = "FM128"
     cluster_def["runtime_config"]["fxp_fraction_bits"] = 40
 
-    spu = SPU(cluster_def, spu_config["link_desc"])
+    spu = ctx.make_spu(cluster_def, spu_config["link_desc"])
 
     feature_selects = (
         input_data_feature_selects if len(input_data_feature_selects) else None
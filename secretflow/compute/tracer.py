@@ -14,9 +14,9 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import functools
 from enum import Enum
-from typing import Dict, List, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -31,6 +31,134 @@ class _TracerType(Enum):
     ARROW = 2
 
 
+_EFN_TB_COLUMN = compute_trace_pb2.ExtendFunctionName.Name(
+    compute_trace_pb2.EFN_TB_COLUMN
+)
+_EFN_TB_ADD_COLUMN = compute_trace_pb2.ExtendFunctionName.Name(
+    compute_trace_pb2.EFN_TB_ADD_COLUMN
+)
+_EFN_TB_REMOVE_COLUMN = compute_trace_pb2.ExtendFunctionName.Name(
+    compute_trace_pb2.EFN_TB_REMOVE_COLUMN
+)
+_EFN_TB_SET_COLUMN = compute_trace_pb2.ExtendFunctionName.Name(
+    compute_trace_pb2.EFN_TB_SET_COLUMN
+)
+
+
+class _CompiledTrace:
+    """The dag resolved into a flat list of kernels on static buffer slots.
+
+    Table operations only move columns around, so they are resolved while
+    compiling and cost nothing when running. Kernels whose outputs are not
+    used by the output table are eliminated, and buffers are released after
+    their last use. All kernels are scalar functions, so the compiled trace
+    could run on any slice of rows, e.g. record batches of a stream.
+    """
+
+    def __init__(self, dag: List[_Tracer]) -> None:
+        # a column is ("input", column index of dag input) or ("node", tracer).
+        tables = {dag[0]: [("input", i) for i in range(len(dag[0].output_schema))]}
+        columns = {}
+        for t in dag[1:]:
+            if t.operate == _EFN_TB_COLUMN:
+                columns[t] = tables[t.inputs[0]][t.inputs[1]]
+            elif t.operate == _EFN_TB_ADD_COLUMN:
+                table = list(tables[t.inputs[0]])
+                table.insert(t.inputs[1], columns[t.inputs[3]])
+                tables[t] = table
+            elif t.operate == _EFN_TB_REMOVE_COLUMN:
+                table = list(tables[t.inputs[0]])
+                del table[t.inputs[1]]
+                tables[t] = table
+            elif t.operate == _EFN_TB_SET_COLUMN:
+                table = list(tables[t.inputs[0]])
+                table[t.inputs[1]] = columns[t.inputs[3]]
+                tables[t] = table
+            else:
+                columns[t] = ("node", t)
+        outputs = tables[dag[-1]]
+
+        # dead kernel elimination.
+        live = set()
+        pending = [c for c in outputs if c[0] == "node"]
+        while pending:
+            t = pending.pop()[1]
+            if t in live:
+                continue
+            live.add(t)
+            for i in t.inputs:
+                if isinstance(i, _Tracer) and columns[i][0] == "node":
+                    pending.append(columns[i])
+        kernels = [t for t in dag if t in live]
+
+        # last use of each column, outputs are used after all kernels.
+        last_use = {}
+        for pos, t in enumerate(kernels):
+            for i in t.inputs:
+                if isinstance(i, _Tracer):
+                    last_use[columns[i]] = pos
+        for c in outputs:
+            last_use[c] = len(kernels)
+
+        slots = {}
+        free_slots = []
+        self.num_slots = 0
+
+        def _alloc(c) -> int:
+            if free_slots:
+                slots[c] = free_slots.pop()
+            else:
+                slots[c] = self.num_slots
+                self.num_slots += 1
+            return slots[c]
+
+        # (slot, column index of input)
+        self.loads = [
+            (_alloc(c), c[1]) for c in dict.fromkeys(last_use) if c[0] == "input"
+        ]
+        # (func, args, positions of args from slots, output slot, slots to free)
+        self.kernels = []
+        for pos, t in enumerate(kernels):
+            args, arg_slots = [], []
+            for i in t.inputs:
+                if isinstance(i, _Tracer):
+                    arg_slots.append((len(args), slots[columns[i]]))
+                    args.append(None)
+                else:
+                    args.append(i)
+            args.extend(t.py_args or [])
+            func = getattr(pc, t.operate)
+            kwargs = t.py_kwargs or {}
+            if kwargs:
+                func = functools.partial(func, **kwargs)
+            frees = [
+                slots[c]
+                for c in dict.fromkeys(
+                    columns[i] for i in t.inputs if isinstance(i, _Tracer)
+                )
+                if last_use[c] == pos
+            ]
+            free_slots.extend(frees)
+            out = _alloc(("node", t))
+            self.kernels.append((func, args, arg_slots, out, frees))
+        self.outputs = [slots[c] for c in outputs]
+        self.output_schema = dag[-1].output_schema
+
+    def run(self, columns: List) -> List:
+        """Run on columns of input, returns columns of output."""
+        buffers = [None] * self.num_slots
+        for slot, i in self.loads:
+            buffers[slot] = columns[i]
+        for func, args, arg_slots, out, frees in self.kernels:
+            args = list(args)
+            for pos, slot in arg_slots:
+                args[pos] = buffers[slot]
+            for slot in frees:
+                buffers[slot] = None
+            buffers[out] = func(*args)
+        return [buffers[slot] for slot in self.outputs]
+
+
 class _TraceRunner:
     def __init__(self, dag: List[_Tracer]) -> None:
         assert dag[0].output_type is _TracerType.TABLE
@@ -39,28 +167,23 @@ class _TraceRunner:
         assert len(set(dag)) == len(dag)
         assert len(dag) > 1
         self.dag: List[_Tracer] = dag
-        self.ref_count = defaultdict(int)
-        for t in self.dag:
-            if t.inputs is None:
-                continue
-            for i in t.inputs:
-                if isinstance(i, _Tracer):
-                    self.ref_count[i] += 1
-        assert len(self.ref_count) > 0
         self.input_features = dag[0].output_schema.names
         if not isinstance(self.input_features, list):
             assert isinstance(self.input_features, str)
             self.input_features = [self.input_features]
+        self._compiled = _CompiledTrace(dag)
+
+    def __getstate__(self):
+        # kernels are bound to pyarrow functions, compile again after loaded.
+        state = self.__dict__.copy()
+        state.pop("_compiled", None)
+        return state
 
-    def _get_input(self, t: _Tracer):
-        assert t in self.run_ref_count
-        assert t in self.output_map
-        assert self.run_ref_count[t] > 0
-        self.run_ref_count[t] -= 1
-        ret = self.output_map[t]
-        if self.run_ref_count[t] == 0:
-            del self.output_map[t]
-        return ret
+    def _get_compiled(self) -> _CompiledTrace:
+        # runners dumped by older versions are not compiled.
+        if getattr(self, "_compiled", None) is None:
+            self._compiled = _CompiledTrace(self.dag)
+        return self._compiled
 
     def get_input_features(self):
         return self.input_features
@@ -70,83 +193,34 @@ class _TraceRunner:
     ) -> Tuple[compute_trace_pb2.ComputeTrace, pa.Schema, pa.Schema]:
         return self.dag[-1].dump_serving_pb(name)
 
+    def run_arrow(
+        self, input: Union[pa.Table, pa.RecordBatch]
+    ) -> Union[pa.Table, pa.RecordBatch]:
+        """Run on arrow data without pandas conversions, returns the same type as input."""
+        assert isinstance(input, (pa.Table, pa.RecordBatch))
+        assert input.schema == self.dag[0].output_schema
+
+        compiled = self._get_compiled()
+        outputs = compiled.run(input.columns)
+        # keep the metadata of input, like pandas index.
+        schema = compiled.output_schema.with_metadata(input.schema.metadata)
+        if isinstance(input, pa.Table):
+            return pa.Table.from_arrays(outputs, schema=schema)
+        return pa.RecordBatch.from_arrays(outputs, schema=schema)
+
+    def run_batches(
+        self, batches: Iterable[pa.RecordBatch]
+    ) -> Iterator[pa.RecordBatch]:
+        """Run on a stream of record batches, e.g. a pa.RecordBatchReader."""
+        for batch in batches:
+            yield self.run_arrow(batch)
+
     def run(self, input: Union[pd.DataFrame, pa.Table]) -> pd.DataFrame:
         assert isinstance(input, (pd.DataFrame, pa.Table))
         if isinstance(input, pd.DataFrame):
             input = pa.Table.from_pandas(input)
 
-        assert input.schema == self.dag[0].output_schema
-
-        self.run_ref_count = self.ref_count.copy()
-        self.output_map = dict()
-        self.output_map[self.dag[0]] = input
-
-        for t in self.dag[1:]:
-            assert t not in self.output_map
-
-            if t.operate == compute_trace_pb2.ExtendFunctionName.Name(
-                compute_trace_pb2.EFN_TB_COLUMN
-            ):
-                assert len(t.inputs) == 2
-                assert isinstance(t.inputs[0], _Tracer)
-                input_table = self._get_input(t.inputs[0])
-                assert isinstance(input_table, pa.Table)
-                self.output_map[t] = input_table.column(t.inputs[1])
-            elif t.operate == compute_trace_pb2.ExtendFunctionName.Name(
-                compute_trace_pb2.EFN_TB_ADD_COLUMN
-            ):
-                assert len(t.inputs) == 4
-                assert isinstance(t.inputs[0], _Tracer)
-                assert isinstance(t.inputs[3], _Tracer)
-                input_table = self._get_input(t.inputs[0])
-                input_array = self._get_input(t.inputs[3])
-                assert isinstance(input_table, pa.Table)
-                assert isinstance(input_array, pa.ChunkedArray)
-                self.output_map[t] = input_table.add_column(
-                    t.inputs[1], t.inputs[2], input_array
-                )
-            elif t.operate == compute_trace_pb2.ExtendFunctionName.Name(
-                compute_trace_pb2.EFN_TB_REMOVE_COLUMN
-            ):
-                assert len(t.inputs) == 2
-                assert isinstance(t.inputs[0], _Tracer)
-                input_table = self._get_input(t.inputs[0])
-                assert isinstance(input_table, pa.Table)
-                self.output_map[t] = input_table.remove_column(t.inputs[1])
-            elif t.operate == compute_trace_pb2.ExtendFunctionName.Name(
-                compute_trace_pb2.EFN_TB_SET_COLUMN
-            ):
-                assert len(t.inputs) == 4
-                assert isinstance(t.inputs[0], _Tracer)
-                assert isinstance(t.inputs[3], _Tracer)
-                input_table = self._get_input(t.inputs[0])
-                input_array = self._get_input(t.inputs[3])
-                assert isinstance(input_table, pa.Table)
-                assert isinstance(input_array, pa.ChunkedArray)
-                self.output_map[t] = input_table.set_column(
-                    t.inputs[1], t.inputs[2], input_array
-                )
-            else:
-                py_func = getattr(pc, t.operate)
-                py_inputs = []
-                for i in t.inputs:
-                    if isinstance(i, _Tracer):
-                        array = self._get_input(i)
-                        assert isinstance(array, pa.ChunkedArray), f"got {type(array)}"
-                        py_inputs.append(array)
-                    else:
-                        py_inputs.append(i)
-                py_inputs.extend(t.py_args)
-                array = py_func(*py_inputs, **t.py_kwargs)
-                self.output_map[t] = array
-
-        assert len(self.output_map) == 1
-        assert self.dag[-1] in self.output_map
-        ret_table = self.output_map.pop(self.dag[-1])
-        assert isinstance(ret_table, pa.Table)
-        assert ret_table.schema == self.dag[-1].output_schema
-
-        return ret_table.to_pandas()
+        return self.run_arrow(input).to_pandas()
 
 
 class _Tracer:
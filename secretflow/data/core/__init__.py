@@ -12,6 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .partition import Partition, partition
+from .partition import LazyPartition, Partition, lazy_partition, partition
 
-__all__ = ["partition", "Partition"]
+__all__ = ["partition", "Partition", "lazy_partition", "LazyPartition"]
@@ -21,6 +21,7 @@ from secretflow.device import PYUObject, proxy
 
 from .base import AgentIndex, PartDataFrameBase, PartitionAgentBase
 from .pandas import PdPartDataFrame
+from .plan import PlanStep, execute_plan, plan_columns
 
 
 def partition_data(source, backend="pandas") -> "PartDataFrameBase":
@@ -30,6 +31,10 @@ def partition_data(source, backend="pandas") -> "PartDataFrameBase":
         from secretflow.data.core.polars import PlPartDataFrame
 
         return PlPartDataFrame(source)
+    elif backend == "arrow":
+        from secretflow.data.core.arrow import PaPartDataFrame
+
+        return PaPartDataFrame(source)
     else:
         raise RuntimeError(f"Unknown backend {backend}")
 
@@ -89,6 +94,10 @@ class PartitionAgent(PartitionAgentBase):
                     return "polars"
             except ImportError:
                 pass
+            from secretflow.data.core.arrow import PaPartDataFrame
+
+            if isinstance(working_object, PaPartDataFrame):
+                return "arrow"
         return "unknown"
 
     def __getitem__(self, idx: AgentIndex, item) -> AgentIndex:
@@ -181,6 +190,16 @@ class PartitionAgent(PartitionAgentBase):
         working_object = self.working_objects[idx]
         return working_object.quantile(*args, **kwargs)
 
+    def table_statistics(self, idx: AgentIndex) -> pd.DataFrame:
+        """Returns all statistics of table_statistics for each column in one scan."""
+        from secretflow.stats.core.table_statistics_core import table_statistics_core
+
+        working_object = self.working_objects[idx]
+        # arrow tables are scanned batch-wise, without converting to pandas.
+        if self.get_backend(idx) not in ("pandas", "arrow"):
+            working_object = working_object.to_pandas()
+        return table_statistics_core(working_object.get_data())
+
     def mode(self, idx: AgentIndex, *args, **kwargs) -> pd.Series:
         """Returns the mode of the values over the requested axis.
 
@@ -293,6 +312,21 @@ class PartitionAgent(PartitionAgentBase):
         working_object.to_csv(filepath, **kwargs)
         return True
 
+    def to_columnar(self, idx: AgentIndex, filepath, file_format: str = "parquet"):
+        """Save DataFrame to parquet or arrow ipc file."""
+        working_object = self.working_objects[idx]
+        working_object.to_columnar(filepath, file_format)
+        return True
+
+    def write_batches(self, idx: AgentIndex, writer: Callable, **kwargs):
+        """Stream DataFrame as arrow record batches to writer, which is called
+        as writer(schema, batches, **kwargs)."""
+        from secretflow.data.core.arrow.util import to_record_batches
+
+        working_object = self.working_objects[idx]
+        schema, batches = to_record_batches(working_object.get_data())
+        return writer(schema, batches, **kwargs)
+
     def iloc(self, idx: AgentIndex, index: Union[int, slice, List[int]]) -> AgentIndex:
         working_object = self.working_objects[idx]
         data = working_object.iloc(index)
@@ -385,6 +419,34 @@ class PartitionAgent(PartitionAgentBase):
             self.working_objects[cur_idx] = data
             return cur_idx
 
+    def _resolve_plan(self, steps: List[PlanStep]) -> List[PlanStep]:
+        def _resolve(x):
+            return self.working_objects[x] if isinstance(x, AgentIndex) else x
+
+        return [
+            PlanStep(
+                step.op,
+                tuple(_resolve(x) for x in step.args),
+                {k: _resolve(v) for k, v in step.kwargs.items()},
+            )
+            for step in steps
+        ]
+
+    def run_plan(self, idx: AgentIndex, steps: List[PlanStep]) -> AgentIndex:
+        """Execute a plan of a lazy partition, see :py:mod:`secretflow.data.core.plan`.
+        Only the result is kept, intermediate dataframes of the plan are released.
+        """
+        working_object = self.working_objects[idx]
+        data = execute_plan(working_object, self._resolve_plan(steps))
+        cur_idx = self.__next_agent_index()
+        self.working_objects[cur_idx] = data
+        return cur_idx
+
+    def plan_columns(self, idx: AgentIndex, steps: List[PlanStep]) -> list:
+        """Returns the column labels of the result of a plan without computing it."""
+        working_object = self.working_objects[idx]
+        return plan_columns(working_object, self._resolve_plan(steps))
+
     def to_pandas(self, idx: AgentIndex) -> AgentIndex:
         """
         Convert myself to pandas type.
@@ -0,0 +1,647 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import logging
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pandas.core.dtypes.inference import is_list_like
+
+from ...io.util import is_local_file
+from ..base import PartDataFrameBase
+from ..io import ColumnarFormat
+from ..pandas import PdPartDataFrame
+from . import util
+from .util import MomentAccumulator, spill_batches, to_arrow_table
+
+
+def _is_numeric(tp: pa.DataType) -> bool:
+    return (
+        pa.types.is_integer(tp) or pa.types.is_floating(tp) or pa.types.is_boolean(tp)
+    )
+
+
+def _to_float(col: Union[pa.Array, pa.ChunkedArray]) -> np.ndarray:
+    """Numeric column to float64 ndarray, nulls are NaN."""
+    if pa.types.is_boolean(col.type):
+        col = pc.cast(col, pa.int8())
+    return np.asarray(col.to_numpy(zero_copy_only=False), dtype=np.float64)
+
+
+def _zero_out_fperr(x: np.ndarray) -> np.ndarray:
+    # the same as pandas, treat values less than 1e-14 as zero.
+    return np.where(np.abs(x) < 1e-14, 0, x)
+
+
+class PaPartDataFrame(PartDataFrameBase):
+    """Partition backed by an arrow table, which is a sequence of record batches.
+
+    The table may be memory mapped from an Arrow IPC file, column selection,
+    rename and row slicing are zero-copy. Statistics and element-wise
+    operations stream over batches of util.BATCH_ROWS rows, so only one batch
+    is converted to pandas at a time, and results larger than
+    util.SPILL_THRESHOLD_BYTES are spilled to a memory mapped temp file.
+    """
+
+    table: pa.Table
+
+    def __init__(self, table: Union[pa.Table, pd.DataFrame]):
+        super().__init__()
+        self.table = to_arrow_table(table)
+
+    def get_data(self):
+        return self.table
+
+    def _pandas_empty(self) -> pd.DataFrame:
+        """An empty DataFrame with the dtypes of the whole table in pandas."""
+        df = self.table.schema.empty_table().to_pandas()
+        for name, col in zip(self.table.column_names, self.table.columns):
+            if col.null_count > 0:
+                if pa.types.is_integer(col.type):
+                    df[name] = df[name].astype(np.float64)
+                elif pa.types.is_boolean(col.type):
+                    df[name] = df[name].astype(object)
+        return df
+
+    def _iter_slices(self) -> Iterator[Tuple[int, int]]:
+        num_rows = self.table.num_rows
+        for start in range(0, num_rows, util.BATCH_ROWS):
+            yield start, min(start + util.BATCH_ROWS, num_rows)
+
+    def _slice_pandas(self, start: int, stop: int, dtypes: dict = None):
+        df = self.table.slice(start, stop - start).to_pandas()
+        df.index = pd.RangeIndex(start, stop)
+        if dtypes is not None:
+            # keep the dtypes same as the whole table in pandas, e.g. int
+            # columns with nulls in other batches are float.
+            casts = {c: t for c, t in dtypes.items() if df[c].dtype != t}
+            if casts:
+                df = df.astype(casts)
+        return df
+
+    def _iter_pandas(self) -> Iterator[pd.DataFrame]:
+        dtypes = self._pandas_empty().dtypes.to_dict()
+        for start, stop in self._iter_slices():
+            yield self._slice_pandas(start, stop, dtypes)
+
+    def _unwrap(self, args, kwargs, start: int, stop: int):
+        def _slice(x):
+            if isinstance(x, PaPartDataFrame):
+                return x._slice_pandas(start, stop, x._pandas_empty().dtypes.to_dict())
+            return x
+
+        return [_slice(x) for x in args], {k: _slice(v) for k, v in kwargs.items()}
+
+    def _result_schema(
+        self, empty_result: pd.DataFrame, first_result: pd.DataFrame
+    ) -> pa.Schema:
+        """Schema of results of a batch-wise function.
+
+        Types follow the dtypes of the result on an empty DataFrame, so that
+        all batches have the same schema. Object columns are inferred from
+        the result of the first batch.
+        """
+        first_schema = pa.Schema.from_pandas(first_result, preserve_index=False)
+        fields = []
+        for name, dtype in empty_result.dtypes.items():
+            if dtype != object:
+                field = pa.Schema.from_pandas(empty_result[[name]]).field(name)
+            elif not pa.types.is_null(first_schema.field(name).type):
+                field = first_schema.field(name)
+            else:
+                # all values of the first batch are null.
+                idx = self.table.schema.get_field_index(name)
+                tp = self.table.schema.field(idx).type if idx >= 0 else pa.string()
+                field = pa.field(name, tp)
+            fields.append(field)
+        return pa.schema(fields)
+
+    def _map_batches(self, func: Callable, *args, **kwargs) -> "PaPartDataFrame":
+        """Apply func(df, *args, **kwargs) on pandas batches of the table.
+
+        PaPartDataFrame in args are sliced along with the table.
+        """
+        empty = self._pandas_empty()
+        empty_args, empty_kwargs = self._unwrap(args, kwargs, 0, 0)
+        empty_result = func(empty, *empty_args, **empty_kwargs)
+        if self.table.num_rows == 0:
+            return PaPartDataFrame(empty_result)
+        dtypes = empty.dtypes.to_dict()
+
+        def _results():
+            for start, stop in self._iter_slices():
+                new_args, new_kwargs = self._unwrap(args, kwargs, start, stop)
+                yield func(
+                    self._slice_pandas(start, stop, dtypes), *new_args, **new_kwargs
+                )
+
+        results = _results()
+        first = next(results)
+        schema = self._result_schema(empty_result, first)
+        batches = (
+            pa.RecordBatch.from_pandas(df, schema=schema, preserve_index=False)
+            for df in itertools.chain([first], results)
+        )
+        if self.table.nbytes >= util.SPILL_THRESHOLD_BYTES:
+            return PaPartDataFrame(spill_batches(schema, batches))
+        return PaPartDataFrame(pa.Table.from_batches(list(batches), schema=schema))
+
+    def __getitem__(self, item) -> "PaPartDataFrame":
+        item_list = item
+        if not isinstance(item, (list, tuple, pd.Index)):
+            item_list = [item_list]
+        missing = set(item_list) - set(self.table.column_names)
+        if missing:
+            raise KeyError(f"{list(missing)} not in columns")
+        return PaPartDataFrame(self.table.select(list(item_list)))
+
+    def _to_column(self, value) -> pa.ChunkedArray:
+        num_rows = self.table.num_rows
+        if isinstance(value, (pa.Array, pa.ChunkedArray)):
+            col = value
+        elif isinstance(value, pd.Series):
+            col = pa.Array.from_pandas(value)
+        elif is_list_like(value):
+            col = pa.array(value)
+        else:
+            # fill all values in this column.
+            col = pa.nulls(num_rows, pa.scalar(value).type).fill_null(value)
+        assert (
+            len(col) == num_rows
+        ), f"expect value len({len(col)}) == table len({num_rows})"
+        return col if isinstance(col, pa.ChunkedArray) else pa.chunked_array([col])
+
+    def __setitem__(self, key, value):
+        if isinstance(value, PaPartDataFrame):
+            value = value.get_data()
+        elif isinstance(value, PdPartDataFrame):
+            value = value.get_data()
+        if isinstance(value, pd.DataFrame):
+            value = to_arrow_table(value)
+        keys = [key] if isinstance(key, str) else list(key)
+        if isinstance(value, pa.Table):
+            assert len(keys) == value.num_columns, (
+                f"input value len({value.num_columns}) does not equal with "
+                f"len of key({len(keys)})"
+            )
+            cols = value.columns
+        elif len(keys) > 1 and is_list_like(value) and not isinstance(value, pd.Series):
+            raise ValueError("set multiple columns with a DataFrame.")
+        else:
+            cols = [value] * len(keys)
+        table = self.table
+        for k, v in zip(keys, cols):
+            col = self._to_column(v)
+            idx = table.schema.get_field_index(k)
+            if idx >= 0:
+                table = table.set_column(idx, k, col)
+            else:
+                table = table.append_column(k, col)
+        self.table = table
+
+    def __len__(self):
+        return self.table.num_rows
+
+    def columns(self) -> list:
+        return self.table.column_names
+
+    def dtypes(self) -> dict:
+        return self._pandas_empty().dtypes.to_dict()
+
+    def shape(self) -> tuple:
+        return self.table.shape
+
+    def index(self) -> list:
+        return pd.RangeIndex(self.table.num_rows)
+
+    def _stat_columns(self, numeric_only, func_name: str) -> List[str]:
+        names = []
+        for field in self.table.schema:
+            if _is_numeric(field.type):
+                names.append(field.name)
+            elif numeric_only is False:
+                raise TypeError(
+                    f"{func_name} of column {field.name} with type {field.type} "
+                    f"is not supported."
+                )
+        return names
+
+    @staticmethod
+    def _check_axis(kwargs):
+        axis = kwargs.get('axis', 0)
+        assert axis in (0, None, 'index'), f"only support axis = 0, got {axis}"
+
+    def _iter_column(self, name: str) -> Iterator[pa.Array]:
+        for batch in self.table.select([name]).to_batches(util.BATCH_ROWS):
+            yield batch.column(0)
+
+    def _moments(self, names: List[str], order: int) -> Tuple[np.ndarray, ...]:
+        """Returns count, mean and central moment sums M2..M{order}."""
+        acc = MomentAccumulator(len(names))
+        for batch in self.table.select(names).to_batches(util.BATCH_ROWS):
+            acc.update(
+                np.column_stack([_to_float(c) for c in batch.columns])
+                if batch.num_columns
+                else np.zeros((batch.num_rows, 0))
+            )
+        mean = np.where(acc.n > 0, acc.mean, np.nan)
+        return (acc.n, mean, acc.m2, acc.m3, acc.m4)[: order + 1]
+
+    def count(self, *args, **kwargs) -> pd.Series:
+        self._check_axis(kwargs)
+        names = self.table.column_names
+        if kwargs.get('numeric_only', False):
+            names = self._stat_columns(True, 'count')
+        counts = []
+        for name in names:
+            col = self.table.column(name)
+            n = len(col) - col.null_count
+            if pa.types.is_floating(col.type):
+                n -= pc.sum(pc.is_nan(col)).as_py() or 0
+            counts.append(n)
+        return pd.Series(counts, index=names, dtype=np.int64)
+
+    def sum(self, *args, **kwargs) -> pd.Series:
+        self._check_axis(kwargs)
+        names = self._stat_columns(kwargs.get('numeric_only', None), 'sum')
+        values = []
+        for name in names:
+            col = self.table.column(name)
+            if pa.types.is_floating(col.type):
+                values.append(
+                    np.float64(
+                        sum(np.nansum(_to_float(c)) for c in self._iter_column(name))
+                    )
+                )
+            else:
+                # exact sum of integers.
+                values.append(np.int64(pc.sum(pc.cast(col, pa.int64())).as_py() or 0))
+        return pd.Series(values, index=names, dtype=None if names else np.float64)
+
+    def _min_max(self, func_name: str, kwargs) -> pd.Series:
+        self._check_axis(kwargs)
+        names = self._stat_columns(kwargs.get('numeric_only', None), func_name)
+        values = []
+        for name in names:
+            col = self.table.column(name)
+            value = pc.min_max(col)[func_name].as_py()
+            if value is None:
+                value = np.nan
+            elif pa.types.is_integer(col.type):
+                value = np.int64(value)
+            elif pa.types.is_boolean(col.type):
+                value = np.bool_(value)
+            values.append(value)
+        return pd.Series(values, index=names, dtype=None if names else np.float64)
+
+    def min(self, *args, **kwargs) -> pd.Series:
+        return self._min_max('min', kwargs)
+
+    def max(self, *args, **kwargs) -> pd.Series:
+        return self._min_max('max', kwargs)
+
+    def mean(self, *args, **kwargs) -> pd.Series:
+        self._check_axis(kwargs)
+        names = self._stat_columns(kwargs.get('numeric_only', None), 'mean')
+        _, mean = self._moments(names, 1)
+        return pd.Series(mean, index=names, dtype=np.float64)
+
+    def var(self, *args, **kwargs) -> pd.Series:
+        self._check_axis(kwargs)
+        ddof = kwargs.get('ddof', 1)
+        names = self._stat_columns(kwargs.get('numeric_only', None), 'var')
+        n, _, m2 = self._moments(names, 2)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = np.where(n - ddof > 0, m2 / (n - ddof), np.nan)
+        return pd.Series(var, index=names, dtype=np.float64)
+
+    def std(self, *args, **kwargs) -> pd.Series:
+        return np.sqrt(self.var(*args, **kwargs))
+
+    def sem(self, *args, **kwargs) -> pd.Series:
+        var = self.var(*args, **kwargs)
+        count = self.count(numeric_only=True)[var.index].astype(np.float64)
+        return np.sqrt(var) / np.sqrt(count)
+
+    def skew(self, *args, **kwargs) -> pd.Series:
+        self._check_axis(kwargs)
+        names = self._stat_columns(kwargs.get('numeric_only', None), 'skew')
+        n, _, m2, m3 = self._moments(names, 3)
+        m2, m3 = _zero_out_fperr(m2), _zero_out_fperr(m3)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = (n * (n - 1) ** 0.5 / (n - 2)) * (m3 / m2**1.5)
+        result = np.where(m2 == 0, 0, result)
+        result[n < 3] = np.nan
+        return pd.Series(result, index=names, dtype=np.float64)
+
+    def kurtosis(self, *args, **kwargs) -> pd.Series:
+        self._check_axis(kwargs)
+        names = self._stat_columns(kwargs.get('numeric_only', None), 'kurtosis')
+        n, _, m2, _, m4 = self._moments(names, 4)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            adj = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+            numerator = _zero_out_fperr(n * (n + 1) * (n - 1) * m4)
+            denominator = _zero_out_fperr((n - 2) * (n - 3) * m2**2)
+            result = numerator / denominator - adj
+        result = np.where(denominator == 0, 0, result)
+        result[n < 4] = np.nan
+        return pd.Series(result, index=names, dtype=np.float64)
+
+    def quantile(self, q=0.5, axis=0, **kwargs) -> Union[pd.Series, pd.DataFrame]:
+        self._check_axis({'axis': axis})
+        interpolation = kwargs.get('interpolation', 'linear')
+        names = self._stat_columns(kwargs.get('numeric_only', None), 'quantile')
+        qs = list(q) if is_list_like(q) else [q]
+        values = {}
+        for name in names:
+            # one column is sorted at a time.
+            col = self.table.column(name)
+            if pa.types.is_boolean(col.type):
+                col = pc.cast(col, pa.int8())
+            values[name] = pc.quantile(col, q=qs, interpolation=interpolation).to_numpy(
+                zero_copy_only=False
+            )
+        ret = pd.DataFrame(values, index=qs, columns=names, dtype=np.float64)
+        if is_list_like(q):
+            return ret
+        ret = ret.iloc[0]
+        ret.name = q
+        return ret
+
+    def mode(self, *args, **kwargs) -> pd.Series:
+        self._check_axis(kwargs)
+        values = []
+        for name in self.table.column_names:
+            counts = pc.value_counts(self.table.column(name).drop_null())
+            df = pd.DataFrame(
+                {
+                    "values": counts.field("values").to_pandas(),
+                    "counts": counts.field("counts").to_numpy(),
+                }
+            ).dropna()
+            if len(df) == 0:
+                values.append(np.nan)
+                continue
+            # the smallest one of the most frequent values, same as pandas.
+            values.append(df[df["counts"] == df["counts"].max()]["values"].min())
+        return pd.Series(values, index=self.table.column_names)
+
+    def value_counts(self, *args, **kwargs) -> pd.Series:
+        normalize = kwargs.pop('normalize', False)
+        sort = kwargs.pop('sort', True)
+        ascending = kwargs.pop('ascending', False)
+        ret = None
+        for df in self._iter_pandas():
+            counts = df.value_counts(*args, sort=False, **kwargs)
+            ret = counts if ret is None else ret.add(counts, fill_value=0)
+        if ret is None:
+            return self._pandas_empty().value_counts(
+                *args, normalize=normalize, sort=sort, ascending=ascending, **kwargs
+            )
+        ret = ret.astype(np.int64)
+        if sort:
+            ret = ret.sort_values(ascending=ascending, kind="stable")
+        if normalize:
+            ret = ret / ret.sum()
+        return ret
+
+    def values(self):
+        return self.table.to_pandas().values
+
+    def isna(self) -> "PaPartDataFrame":
+        return self._map_batches(lambda df: df.isna())
+
+    def replace(self, *args, **kwargs) -> "PaPartDataFrame":
+        return self._map_batches(lambda df: df.replace(*args, **kwargs))
+
+    def astype(
+        self, dtype, copy: bool = True, errors: str = "raise"
+    ) -> "PaPartDataFrame":
+        new_data = self._map_batches(lambda df: df.astype(dtype, errors=errors))
+        if copy:
+            return new_data
+        self.table = new_data.table
+        return self
+
+    def copy(self) -> "PaPartDataFrame":
+        # arrow tables are immutable.
+        return PaPartDataFrame(self.table)
+
+    def drop(
+        self,
+        labels=None,
+        axis=0,
+        index=None,
+        columns=None,
+        level=None,
+        inplace=False,
+        errors='raise',
+    ) -> "PaPartDataFrame":
+        if labels is not None:
+            if axis in (1, 'columns'):
+                columns = labels
+            else:
+                index = labels
+        table = self.table
+        if columns is not None:
+            columns = [columns] if not is_list_like(columns) else list(columns)
+            missing = set(columns) - set(table.column_names)
+            if missing and errors == 'raise':
+                raise KeyError(f"{list(missing)} not found in axis")
+            table = table.drop([c for c in columns if c in table.column_names])
+        if index is not None:
+            index = [index] if not is_list_like(index) else list(index)
+            keep = np.setdiff1d(np.arange(table.num_rows), index)
+            if len(keep) + len(set(index)) != table.num_rows and errors == 'raise':
+                raise KeyError(f"{index} not found in axis")
+            table = table.take(keep)
+        if not inplace:
+            return PaPartDataFrame(table)
+        self.table = table
+
+    def fillna(
+        self,
+        value=None,
+        method=None,
+        axis=None,
+        inplace=False,
+        limit=None,
+        downcast=None,
+    ) -> Union['PaPartDataFrame', None]:
+        """Fill nulls with value.
+
+        Unlike pandas, a column of arrow has one type, so columns which the
+        value does not fit, e.g. string columns for fillna(0), are left as is.
+        """
+        if method is not None or limit is not None:
+            raise NotImplementedError(
+                "fillna of arrow backend does not support method and limit."
+            )
+        value = self._fillable_value(value)
+        new_data = self._map_batches(
+            lambda df: df.fillna(value, axis=axis, downcast=downcast)
+        )
+        if not inplace:
+            return new_data
+        self.table = new_data.table
+
+    def _fillable_value(self, value):
+        """Restrict a scalar or dict fill value to the columns it fits."""
+        if value is None or (not isinstance(value, dict) and is_list_like(value)):
+            return value
+        values = value
+        if not isinstance(value, dict):
+            values = {name: value for name in self.table.column_names}
+        fillable = {}
+        skipped = []
+        for name, v in values.items():
+            idx = self.table.schema.get_field_index(name)
+            if idx < 0 or self.table.column(idx).null_count == 0:
+                continue
+            tp = self.table.schema.field(idx).type
+            if pa.types.is_boolean(tp):
+                if isinstance(v, (bool, np.bool_)):
+                    fillable[name] = v
+                else:
+                    skipped.append(name)
+                continue
+            if _is_numeric(tp) and isinstance(v, (int, float, np.number)):
+                fillable[name] = v
+                continue
+            try:
+                pa.scalar(v, type=tp)
+                fillable[name] = v
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+                skipped.append(name)
+        if skipped:
+            logging.warning(
+                f"fillna value {value} does not fit columns {skipped}, which are skipped."
+            )
+        return fillable
+
+    def to_csv(self, filepath, **kwargs):
+        if is_local_file(filepath):
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        header = kwargs.pop('header', True)
+        kwargs.pop('mode', None)
+        with open(filepath, 'w', newline='') as f:
+            written = False
+            for df in self._iter_pandas():
+                df.to_csv(f, header=header if not written else False, **kwargs)
+                written = True
+            if not written:
+                self._pandas_empty().to_csv(f, header=header, **kwargs)
+
+    def to_columnar(self, filepath, file_format: str = "parquet"):
+        if is_local_file(filepath):
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        if file_format == ColumnarFormat.PARQUET:
+            writer = pq.ParquetWriter(filepath, self.table.schema)
+        elif file_format == ColumnarFormat.ARROW:
+            writer = pa.ipc.new_file(filepath, self.table.schema)
+        else:
+            raise RuntimeError(f"Unknown columnar format {file_format}")
+        with writer:
+            for batch in self.table.to_batches(util.BATCH_ROWS):
+                writer.write_batch(batch)
+
+    def iloc(self, index: Union[int, slice, List[int]]) -> 'PaPartDataFrame':
+        num_rows = self.table.num_rows
+        if isinstance(index, slice):
+            rows = range(num_rows)[index]
+            if rows.step == 1:
+                return PaPartDataFrame(self.table.slice(rows.start, len(rows)))
+            return PaPartDataFrame(self.table.take(np.asarray(rows, dtype=np.int64)))
+        if not is_list_like(index):
+            index = [index]
+        index = np.asarray(index, dtype=np.int64)
+        index = np.where(index < 0, index + num_rows, index)
+        return PaPartDataFrame(self.table.take(index))
+
+    def rename(
+        self,
+        mapper=None,
+        index=None,
+        columns=None,
+        axis=None,
+        copy=True,
+        inplace=False,
+        level=None,
+        errors='ignore',
+    ) -> Union['PaPartDataFrame', None]:
+        if index is not None or (mapper is not None and axis in (None, 0, 'index')):
+            logging.warning(
+                "Arrow dataframe only support rename column names, index parameters will be ignored."
+            )
+        if columns is None and axis in (1, 'columns'):
+            columns = mapper
+        names = self.table.column_names
+        if columns is not None:
+            if callable(columns):
+                new_names = [columns(c) for c in names]
+            else:
+                missing = set(columns) - set(names)
+                if missing and errors == 'raise':
+                    raise KeyError(f"{list(missing)} not found in axis")
+                new_names = [columns.get(c, c) for c in names]
+        else:
+            new_names = names
+        table = self.table.rename_columns(new_names)
+        if not inplace:
+            return PaPartDataFrame(table)
+        self.table = table
+
+    def pow(self, *args, **kwargs) -> 'PaPartDataFrame':
+        return self._map_batches(
+            lambda df, *a, **k: df.__pow__(*a, **k), *args, **kwargs
+        )
+
+    def round(self, *args, **kwargs) -> 'PaPartDataFrame':
+        return self._map_batches(lambda df, *a, **k: df.round(*a, **k), *args, **kwargs)
+
+    def select_dtypes(self, *args, **kwargs) -> 'PaPartDataFrame':
+        names = self._pandas_empty().select_dtypes(*args, **kwargs).columns.tolist()
+        return PaPartDataFrame(self.table.select(names))
+
+    def subtract(self, *args, **kwargs) -> 'PaPartDataFrame':
+        return self._map_batches(
+            lambda df, *a, **k: df.__sub__(*a, **k), *args, **kwargs
+        )
+
+    def apply_func(
+        self, func: Callable, *, nums_return: int = 1, **kwargs
+    ) -> Union['PartDataFrameBase', 'List[PartDataFrameBase]']:
+        # func may not be batch-wise, so it runs on the whole table in pandas,
+        # results are converted back to arrow.
+        dfs = func(self.table.to_pandas(), **kwargs)
+
+        def _wrap(df):
+            assert isinstance(
+                df, (pa.Table, pd.DataFrame)
+            ), f"need DataFrame, got {type(df)}"
+            return PaPartDataFrame(df)
+
+        if nums_return != 1:
+            assert isinstance(dfs, tuple) and len(dfs) == nums_return
+            return [_wrap(df) for df in dfs]
+        return _wrap(dfs)
+
+    def to_pandas(self) -> 'PdPartDataFrame':
+        return PdPartDataFrame(self.table.to_pandas())
@@ -0,0 +1,188 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import os
+import tempfile
+from typing import Iterable, Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Tables larger than this are spilled to disk by the batch-streaming operations.
+SPILL_THRESHOLD_BYTES = 1 << 28
+
+# Rows of the pandas DataFrame a batch-streaming operation works on at a time.
+BATCH_ROWS = 1 << 16
+
+
+class MomentAccumulator:
+    """Numerically stable streaming accumulation of count, sum, min, max and
+    central moments (up to 4th order) of each column.
+
+    Blocks are merged with the pairwise update formulas of Chan et al. and
+    Pébay, which avoids the catastrophic cancellation of raw power sums.
+    """
+
+    def __init__(self, n_cols: int):
+        self.n = np.zeros(n_cols)
+        self.sum = np.zeros(n_cols)
+        self.mean = np.zeros(n_cols)
+        self.m2 = np.zeros(n_cols)
+        self.m3 = np.zeros(n_cols)
+        self.m4 = np.zeros(n_cols)
+        self.min = np.full(n_cols, np.inf)
+        self.max = np.full(n_cols, -np.inf)
+
+    def update(self, block: np.ndarray):
+        if block.shape[0] == 0:
+            return
+        mask = ~np.isnan(block)
+        nb = mask.sum(axis=0).astype(np.float64)
+        valid = np.where(mask, block, 0.0)
+        sum_b = valid.sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_b = np.where(nb > 0, sum_b / nb, 0.0)
+        d = np.where(mask, block - mean_b, 0.0)
+        d2 = d * d
+        m2b = d2.sum(axis=0)
+        m3b = (d2 * d).sum(axis=0)
+        m4b = (d2 * d2).sum(axis=0)
+
+        self.min = np.minimum(self.min, np.where(mask, block, np.inf).min(axis=0))
+        self.max = np.maximum(self.max, np.where(mask, block, -np.inf).max(axis=0))
+        self.sum += sum_b
+
+        na, ma = self.n, self.mean
+        n = na + nb
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delta = mean_b - ma
+            delta_n = np.where(n > 0, delta / n, 0.0)
+            delta_n2 = delta_n * delta_n
+            term = delta * delta_n * na * nb
+            mean = ma + delta_n * nb
+            m2 = self.m2 + m2b + term
+            m3 = (
+                self.m3
+                + m3b
+                + term * delta_n * (na - nb)
+                + 3.0 * delta_n * (na * m2b - nb * self.m2)
+            )
+            m4 = (
+                self.m4
+                + m4b
+                + term * delta_n2 * (na * na - na * nb + nb * nb)
+                + 6.0 * delta_n2 * (na * na * m2b + nb * nb * self.m2)
+                + 4.0 * delta_n * (na * m3b - nb * self.m3)
+            )
+        self.n, self.mean, self.m2, self.m3, self.m4 = n, mean, m2, m3, m4
+
+
+def spill_batches(schema: pa.Schema, batches: Iterable[pa.RecordBatch]) -> pa.Table:
+    """Write record batches to an Arrow IPC file and memory map it back.
+
+    Only one batch is in memory at a time while writing, and pages of the
+    returned table are loaded by the OS on demand. The file is unlinked once
+    mapped, so it is removed when the table is released. Files are created
+    in the temp directory, which could be set by the TMPDIR environment.
+    """
+    fd, path = tempfile.mkstemp(prefix="sf_arrow_", suffix=".arrow")
+    try:
+        with os.fdopen(fd, "wb") as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                for batch in batches:
+                    writer.write_batch(batch)
+        return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    finally:
+        os.remove(path)
+
+
+def to_arrow_table(source) -> pa.Table:
+    """Convert a source of partition to arrow table."""
+    if isinstance(source, pa.Table):
+        return source
+    if isinstance(source, pa.RecordBatch):
+        return pa.Table.from_batches([source])
+    if isinstance(source, pa.RecordBatchReader):
+        return spill_batches(source.schema, source)
+    if isinstance(source, pd.Series):
+        source = source.to_frame()
+    if isinstance(source, pd.DataFrame):
+        return pa.Table.from_pandas(source, preserve_index=False)
+    raise TypeError(f"need pa.Table/pd.DataFrame, got {type(source)}")
+
+
+def to_record_batches(source) -> Tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+    """Stream a dataframe of any backend as arrow record batches.
+
+    pandas DataFrames are converted BATCH_ROWS rows at a time, so only one
+    batch is converted in memory at a time.
+    """
+    if isinstance(source, pd.DataFrame):
+        schema = pa.Schema.from_pandas(source, preserve_index=False)
+
+        def _batches():
+            for start in range(0, len(source), BATCH_ROWS):
+                yield pa.RecordBatch.from_pandas(
+                    source.iloc[start : start + BATCH_ROWS],
+                    schema=schema,
+                    preserve_index=False,
+                )
+
+        return schema, _batches()
+    if not isinstance(source, pa.Table) and hasattr(source, "to_arrow"):
+        # polars DataFrame
+        source = source.to_arrow()
+    table = to_arrow_table(source)
+    return table.schema, iter(table.to_batches(BATCH_ROWS))
+
+
+def read_arrow_csv(filepath, *args, **kwargs) -> pa.Table:
+    """Read a csv file into a memory mapped arrow table with bounded memory.
+
+    Args are the same as :py:meth:`pandas.read_csv`, only delimiter, usecols,
+    dtype and nrows are supported.
+    """
+    from ..io import _empty_csv_table, iter_csv_batches
+
+    assert len(args) == 0, f"please use keyword arguments for arrow backend"
+    if kwargs.pop("header", "infer") is None:
+        raise NotImplementedError("arrow backend does not support csv without header")
+    delimiter = kwargs.pop("delimiter", None) or ","
+    usecols = kwargs.pop("usecols", None)
+    dtype = kwargs.pop("dtype", None)
+    nrows = kwargs.pop("nrows", None)
+    assert not kwargs, f"arrow backend does not support arguments {list(kwargs)}"
+
+    batches = iter_csv_batches(
+        filepath,
+        delimiter=delimiter,
+        columns=list(usecols) if usecols is not None else None,
+        dtype=dtype,
+    )
+    first = next(batches, None)
+    if first is None:
+        return _empty_csv_table(filepath, delimiter, usecols, dtype)
+
+    def _limit(batches):
+        read_rows = 0
+        for batch in batches:
+            if nrows is not None and read_rows + batch.num_rows > nrows:
+                yield batch.slice(0, nrows - read_rows)
+                return
+            read_rows += batch.num_rows
+            yield batch
+
+    return spill_batches(first.schema, _limit(itertools.chain([first], batches)))
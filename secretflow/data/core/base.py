@@ -174,6 +174,11 @@ class PartitionAgentBase:
         """Returns values at the given quantile over requested axis."""
         pass
 
+    @abstractmethod
+    def table_statistics(self, idx: AgentIndex) -> PYUObject:
+        """Returns all statistics of table_statistics for each column in one scan."""
+        pass
+
     @abstractmethod
     def mode(self, idx: AgentIndex, *args, **kwargs) -> PYUObject:
         """Returns the mode of the values over the requested axis.
@@ -259,6 +264,17 @@ class PartitionAgentBase:
         """Save DataFrame to csv file."""
         pass
 
+    @abstractmethod
+    def to_columnar(self, idx: AgentIndex, filepath, file_format: str = "parquet"):
+        """Save DataFrame to parquet or arrow ipc file."""
+        pass
+
+    @abstractmethod
+    def write_batches(self, idx: AgentIndex, writer: Callable, **kwargs):
+        """Stream DataFrame as arrow record batches to writer, which is called
+        as writer(schema, batches, **kwargs)."""
+        pass
+
     @abstractmethod
     def iloc(self, idx: AgentIndex, index: Union[int, slice, List[int]]) -> PYUObject:
         """Integer-location based indexing for selection by position.
@@ -334,6 +350,23 @@ class PartitionAgentBase:
         """
         pass
 
+    @abstractmethod
+    def run_plan(self, idx: AgentIndex, steps: List["PlanStep"]) -> PYUObject:
+        """
+        Execute a plan of a lazy partition on the data of idx in one call.
+        Args:
+            idx: the data's index
+            steps: the optimized plan.
+        Returns:
+            AgentIndex of the result.
+        """
+        pass
+
+    @abstractmethod
+    def plan_columns(self, idx: AgentIndex, steps: List["PlanStep"]) -> PYUObject:
+        """Returns the column labels of the result of a plan without computing it."""
+        pass
+
     @abstractmethod
     def to_pandas(self, idx: AgentIndex) -> PYUObject:
         """
@@ -522,6 +555,11 @@ class PartDataFrameBase(DataFrameBase, ABC):
         """Save DataFrame to csv file."""
         pass
 
+    @abstractmethod
+    def to_columnar(self, filepath, file_format: str = "parquet"):
+        """Save DataFrame to parquet or arrow ipc file."""
+        pass
+
     @abstractmethod
     def iloc(self, index: Union[int, slice, List[int]]) -> 'PartDataFrameBase':
         """Integer-location based indexing for selection by position.
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import csv
+import itertools
 import os
 import platform
-from typing import Union
+from typing import Dict, Iterator, List, Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -51,6 +54,10 @@ def read_csv_wrapper(
             from secretflow.data.core.polars.util import read_polars_csv
 
             return read_polars_csv(_filepath, *_args, **_kwargs)
+        elif _backend == "arrow":
+            from secretflow.data.core.arrow import read_arrow_csv
+
+            return read_arrow_csv(_filepath, *_args, **_kwargs)
         else:
             raise RuntimeError(f"Unknown data backend {_backend}")
 
@@ -64,3 +71,321 @@ def read_csv_wrapper(
     else:
         df = _read_csv(filepath, read_backend, **kwargs)
         return df
+
+
+class ColumnarFormat:
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+def _read_arrow_table(
+    filepath: str, file_format: str, columns=None, nrows: int = None
+) -> "pa.Table":
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if file_format == ColumnarFormat.PARQUET:
+        pf = pq.ParquetFile(filepath, memory_map=True)
+        names = pf.schema_arrow.names
+    elif file_format == ColumnarFormat.ARROW:
+        reader = pa.ipc.open_file(pa.memory_map(filepath, 'r'))
+        names = reader.schema.names
+    else:
+        raise RuntimeError(f"Unknown columnar format {file_format}")
+
+    if columns is not None:
+        missing = set(columns) - set(names)
+        if missing:
+            raise ValueError(f"columns {missing} not found in {filepath}")
+        # keep the order of columns in file, which is the same as read_csv.
+        columns = [c for c in names if c in set(columns)]
+
+    if file_format == ColumnarFormat.PARQUET:
+        if nrows is None:
+            return pf.read(columns=columns)
+        if nrows == 0:
+            return pf.schema_arrow.empty_table().select(columns or names)
+        # only decode the row groups needed.
+        batches, read_rows = [], 0
+        for batch in pf.iter_batches(batch_size=nrows, columns=columns):
+            batches.append(batch)
+            read_rows += batch.num_rows
+            if read_rows >= nrows:
+                break
+        if not batches:
+            return pf.schema_arrow.empty_table().select(columns or names)
+        return pa.Table.from_batches(batches).slice(0, nrows)
+
+    # record batches are zero-copy views of the memory mapped file.
+    table = reader.read_all()
+    if columns is not None:
+        table = table.select(columns)
+    if nrows is not None:
+        table = table.slice(0, nrows)
+    return table
+
+
+def read_columnar_wrapper(
+    filepath: str,
+    file_format: str = ColumnarFormat.PARQUET,
+    read_backend="pandas",
+    columns=None,
+    dtype=None,
+    nrows: int = None,
+) -> Union[pd.DataFrame, "pl.DataFrame"]:
+    """Read a Parquet or Arrow IPC file.
+
+    Only the selected columns are decoded, and Arrow IPC files are memory
+    mapped. The schema is stored in the file, so there is no type inference.
+
+    Args:
+        filepath: the file path.
+        file_format: 'parquet' or 'arrow'.
+        read_backend: reading backend.
+        columns: the columns to read, all columns if None.
+        dtype: Optional. Dict of column types, same as dtype of
+            :py:meth:`pandas.read_csv`.
+        nrows: Optional. Num of rows to read.
+
+    Returns:
+        a DataFrame.
+    """
+    if columns is not None:
+        columns = list(columns)
+    table = _read_arrow_table(filepath, file_format, columns, nrows)
+    if read_backend == "pandas":
+        df = table.to_pandas()
+        if dtype:
+            # no-op if type in file is the same.
+            df = df.astype(dtype, copy=False)
+        return df
+    elif read_backend == "polars":
+        import polars as pl
+
+        return pl.from_arrow(table)
+    elif read_backend == "arrow":
+        if dtype:
+            from .arrow import PaPartDataFrame
+
+            return PaPartDataFrame(table).astype(dtype).get_data()
+        # record batches of Arrow IPC files are memory mapped.
+        return table
+    else:
+        raise RuntimeError(f"Unknown data backend {read_backend}")
+
+
+def write_columnar(
+    df: Union[pd.DataFrame, "pl.DataFrame"],
+    filepath: str,
+    file_format: str = ColumnarFormat.PARQUET,
+):
+    """Write a DataFrame to a Parquet or Arrow IPC file."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if isinstance(df, pd.DataFrame):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    else:
+        table = df.to_arrow()
+    if file_format == ColumnarFormat.PARQUET:
+        pq.write_table(table, filepath)
+    elif file_format == ColumnarFormat.ARROW:
+        with pa.ipc.new_file(filepath, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        raise RuntimeError(f"Unknown columnar format {file_format}")
+
+
+def _read_csv_header(filepath: str, delimiter: str) -> List[str]:
+    with open(filepath, newline="") as f:
+        return next(csv.reader(f, delimiter=delimiter), [])
+
+
+def _arrow_column_types(dtype: Dict) -> Dict:
+    import pyarrow as pa
+
+    column_types = {}
+    for col, t in (dtype or {}).items():
+        try:
+            np_dtype = np.dtype(t)
+        except TypeError:
+            # e.g. category, converted after reading.
+            continue
+        if np_dtype.kind in ("O", "U", "S"):
+            column_types[col] = pa.string()
+        else:
+            column_types[col] = pa.from_numpy_dtype(np_dtype)
+    return column_types
+
+
+def _arrow_csv_options(
+    filepath: str, delimiter: str, columns: List[str], dtype: Dict, block_size: int
+) -> Dict:
+    import pyarrow.csv as pa_csv
+
+    if columns is not None:
+        names = _read_csv_header(filepath, delimiter)
+        missing = set(columns) - set(names)
+        if missing:
+            raise ValueError(f"columns {missing} not found in {filepath}")
+        # keep the order of columns in file, which is the same as read_csv.
+        columns = [c for c in names if c in set(columns)]
+    return dict(
+        read_options=pa_csv.ReadOptions(block_size=block_size),
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=columns,
+            column_types=_arrow_column_types(dtype),
+            strings_can_be_null=True,
+        ),
+    )
+
+
+def iter_csv_batches(
+    filepath: str,
+    delimiter: str = ",",
+    columns: List[str] = None,
+    dtype: Dict = None,
+    block_size: int = 16 << 20,
+) -> Iterator["pa.RecordBatch"]:
+    """Parse a csv file with header into arrow record batches of about
+    block_size bytes, only one block is kept in memory at a time.
+
+    Args:
+        filepath: the file path.
+        delimiter: the file separator.
+        columns: the columns to read, all columns if None.
+        dtype: Optional. Dict of column types, parsed as these types directly
+            instead of being inferred.
+        block_size: bytes of csv parsed into one record batch.
+    """
+    import pyarrow.csv as pa_csv
+
+    options = _arrow_csv_options(filepath, delimiter, columns, dtype, block_size)
+    with pa_csv.open_csv(filepath, **options) as reader:
+        for batch in reader:
+            yield batch
+
+
+def _empty_csv_table(
+    filepath: str, delimiter: str, columns: List[str], dtype: Dict
+) -> "pa.Table":
+    import pyarrow as pa
+
+    names = _read_csv_header(filepath, delimiter)
+    if columns is not None:
+        names = [c for c in names if c in set(columns)]
+    column_types = _arrow_column_types(dtype)
+    return pa.table({c: pa.array([], column_types.get(c, pa.string())) for c in names})
+
+
+def read_csv_batches_wrapper(
+    filepath: str,
+    delimiter: str = ",",
+    read_backend="pandas",
+    columns=None,
+    dtype=None,
+    nrows: int = None,
+    block_size: int = 16 << 20,
+) -> Union[pd.DataFrame, "pl.DataFrame"]:
+    """Read a csv file with header by the arrow csv reader.
+
+    Blocks of the file are parsed in parallel, or only the blocks needed if
+    nrows is set. Typed columns are parsed as their types directly instead of
+    being inferred, which is much faster than read_csv_wrapper for large
+    files, e.g. outputs of PSI.
+
+    Args:
+        filepath: the file path.
+        delimiter: the file separator.
+        read_backend: reading backend.
+        columns: the columns to read, all columns if None.
+        dtype: Optional. Dict of column types, same as dtype of
+            :py:meth:`pandas.read_csv`.
+        nrows: Optional. Num of rows to read.
+        block_size: bytes of csv parsed at a time.
+
+    Returns:
+        a DataFrame.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    if read_backend == "arrow":
+        from .arrow import read_arrow_csv
+
+        # streamed to a memory mapped file with bounded memory.
+        return read_arrow_csv(
+            filepath, delimiter=delimiter, usecols=columns, dtype=dtype, nrows=nrows
+        )
+    if columns is not None:
+        columns = list(columns)
+    if nrows is None:
+        # blocks are parsed by multiple threads.
+        options = _arrow_csv_options(filepath, delimiter, columns, dtype, block_size)
+        table = pa_csv.read_csv(filepath, **options)
+    else:
+        # only parse the blocks needed.
+        batches, read_rows = [], 0
+        for batch in iter_csv_batches(filepath, delimiter, columns, dtype, block_size):
+            if read_rows >= nrows:
+                break
+            batches.append(batch)
+            read_rows += batch.num_rows
+        if batches:
+            table = pa.Table.from_batches(batches).slice(0, nrows)
+        else:
+            table = _empty_csv_table(filepath, delimiter, columns, dtype)
+    if read_backend == "pandas":
+        df = table.to_pandas()
+        if dtype:
+            # no-op if the column is parsed as the type.
+            df = df.astype(dtype, copy=False)
+        return df
+    elif read_backend == "polars":
+        import polars as pl
+
+        return pl.from_arrow(table)
+    else:
+        raise RuntimeError(f"Unknown data backend {read_backend}")
+
+
+def csv_to_columnar(
+    csv_path: str,
+    filepath: str,
+    file_format: str = ColumnarFormat.PARQUET,
+    delimiter: str = ",",
+    dtype: Dict = None,
+    block_size: int = 16 << 20,
+) -> int:
+    """Convert a csv file with header to a Parquet or Arrow IPC file.
+
+    The csv is parsed and written block by block, so the memory used does not
+    grow with the size of file. Types of columns not in dtype are inferred
+    from the first block. Returns the number of rows.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    batches = iter_csv_batches(
+        csv_path, delimiter=delimiter, dtype=dtype, block_size=block_size
+    )
+    first = next(batches, None)
+    if first is None:
+        # no rows, keep the header.
+        schema = _empty_csv_table(csv_path, delimiter, None, dtype).schema
+    else:
+        schema = first.schema
+        batches = itertools.chain([first], batches)
+    if file_format == ColumnarFormat.PARQUET:
+        writer = pq.ParquetWriter(filepath, schema)
+    elif file_format == ColumnarFormat.ARROW:
+        writer = pa.ipc.new_file(filepath, schema)
+    else:
+        raise RuntimeError(f"Unknown columnar format {file_format}")
+    num_rows = 0
+    with writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            num_rows += batch.num_rows
+    return num_rows
@@ -21,6 +21,7 @@ from pandas import Index
 from pandas._typing import IgnoreRaise
 
 from ...io.util import is_local_file
+from ..io import write_columnar
 from ..base import PartDataFrameBase
 
 
@@ -175,6 +176,11 @@ class PdPartDataFrame(PartDataFrameBase):
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         self.data.to_csv(filepath, **kwargs)
 
+    def to_columnar(self, filepath, file_format: str = "parquet"):
+        if is_local_file(filepath):
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        write_columnar(self.data, filepath, file_format)
+
     def iloc(self, index: Union[int, slice, List[int]]) -> Union['PdPartDataFrame']:
         return PdPartDataFrame(self.data.iloc[index])
 
@@ -21,6 +21,13 @@ from secretflow.distributed.primitive import get_current_cluster_idx
 from ..base import DataFrameBase
 from .agent import PartitionAgent
 from .base import AgentIndex, PartitionAgentBase
+from .plan import (
+    DTYPE_DEPENDENT_OPS,
+    PlanStep,
+    infer_columns,
+    optimize_plan,
+    push_down_columns,
+)
 
 
 def partition(
@@ -56,6 +63,33 @@ def partition(
     return Partition(part_agent=agent, agent_idx=index, device=device, backend=backend)
 
 
+def lazy_partition(
+    data: Callable,
+    device: Device,
+    backend="pandas",
+    projection_arg: str = None,
+    **kwargs,
+) -> "LazyPartition":
+    """
+    Construct a LazyPartition whose data is not loaded until it is used.
+    Args:
+        data: A Callable func type which takes kwargs as parameters and retures a real dataframe.
+            It should accept a nrows parameter, the schema of data is read with nrows=0.
+        device: Which device use this partition.
+        backend: The partition backend, default to pandas.
+        projection_arg: The parameter of data to select columns, like usecols of read_csv.
+            If set, only the columns used by the plan are loaded.
+        kwargs: use kwargs as parameters of data.
+    Returns:
+        A LazyPartition.
+    """
+    assert callable(data), f"source of lazy partition must be a callable."
+    agent: PartitionAgentBase = PartitionAgent(device=device)
+    return LazyPartition(
+        _PendingSource(agent, device, backend, data, projection_arg, kwargs)
+    )
+
+
 class StatPartition:
     """
     A wrapper of pd.Series.
@@ -200,6 +234,9 @@ class Partition(DataFrameBase):
     def quantile(self, *args, **kwargs) -> StatPartition:
         return StatPartition(self.part_agent.quantile(self.agent_idx, *args, **kwargs))
 
+    def table_statistics(self) -> StatPartition:
+        return StatPartition(self.part_agent.table_statistics(self.agent_idx))
+
     def mode(self, *args, **kwargs) -> StatPartition:
         return StatPartition(self.part_agent.mode(self.agent_idx, *args, **kwargs))
 
@@ -266,6 +303,14 @@ class Partition(DataFrameBase):
     def to_csv(self, filepath, **kwargs):
         return self.part_agent.to_csv(self.agent_idx, filepath, **kwargs)
 
+    def to_columnar(self, filepath, file_format: str = "parquet"):
+        return self.part_agent.to_columnar(self.agent_idx, filepath, file_format)
+
+    def write_batches(self, writer: Callable, **kwargs) -> PYUObject:
+        """Stream the data as arrow record batches to writer in the partition
+        agent, writer is called as writer(schema, batches, **kwargs)."""
+        return self.part_agent.write_batches(self.agent_idx, writer, **kwargs)
+
     def iloc(self, index: Union[int, slice, List[int]]) -> 'Partition':
         data_idx = self.part_agent.iloc(self.agent_idx, index)
         return Partition(self.part_agent, data_idx, self.device, self.backend)
@@ -353,3 +398,267 @@ class Partition(DataFrameBase):
     @property
     def data(self):
         return self.part_agent.get_data(self.agent_idx)
+
+    def lazy(self) -> "LazyPartition":
+        """Returns a LazyPartition on the data of this partition."""
+        return LazyPartition(self)
+
+    def collect(self) -> "Partition":
+        return self
+
+
+class _PendingSource:
+    """The source of a lazy partition which is not loaded yet."""
+
+    def __init__(
+        self,
+        part_agent: PartitionAgentBase,
+        device: PYU,
+        backend: str,
+        source: Callable,
+        projection_arg: str,
+        kwargs: dict,
+    ):
+        self.part_agent = part_agent
+        self.device = device
+        self.backend = backend
+        self.source = source
+        self.projection_arg = projection_arg
+        self.kwargs = kwargs
+        self._probe: Partition = None
+        self._loaded: Partition = None
+
+    def _append(self, **kwargs) -> Partition:
+        index = self.part_agent.append_data(self.source, self.backend, **kwargs)
+        return Partition(self.part_agent, index, self.device, self.backend)
+
+    def probe(self) -> Partition:
+        """An empty partition with the schema of the source."""
+        if self._loaded is not None:
+            return self._loaded
+        if self._probe is None:
+            self._probe = self._append(**dict(self.kwargs, nrows=0))
+        return self._probe
+
+    def load(self, columns: List = None) -> Partition:
+        """Load the source, only the columns are loaded if not None."""
+        if columns is None or self.projection_arg is None:
+            if self._loaded is None:
+                self._loaded = self._append(**self.kwargs)
+                self._probe = None
+            return self._loaded
+        kwargs = dict(self.kwargs)
+        kwargs[self.projection_arg] = columns
+        if isinstance(kwargs.get("dtype"), dict):
+            kwargs["dtype"] = {
+                k: v for k, v in kwargs["dtype"].items() if k in set(columns)
+            }
+        return self._append(**kwargs)
+
+
+class LazyPartition(Partition):
+    """A partition records operations as a plan instead of executing them.
+
+    The plan is optimized (see :py:func:`secretflow.data.core.plan.optimize_plan`)
+    and executed inside the partition agent in one call when the data is needed,
+    e.g. statistics, values and to_csv. If the partition is created by
+    :py:func:`lazy_partition`, the column selection at the beginning of the
+    plan is pushed down to the loader.
+
+    Note that a LazyPartition with an empty plan shares data with the
+    partition it is created from, like views of pandas.
+    """
+
+    root: Union[Partition, _PendingSource]
+    steps: List[PlanStep]
+
+    def __init__(
+        self,
+        root: Union[Partition, _PendingSource],
+        steps: List[PlanStep] = None,
+        deps: List[Partition] = None,
+    ):
+        self.root = root
+        self.steps = steps or []
+        # partitions used by the plan, they must be alive until it is executed.
+        self._deps = deps or []
+        self.part_agent = root.part_agent
+        self.device = root.device
+        self.backend = root.backend
+        self.active_cluster_idx = get_current_cluster_idx()
+        self._result: Partition = None
+        self._columns: list = None
+
+    def __del__(self):
+        # data is owned by the root and the result partition.
+        pass
+
+    @property
+    def agent_idx(self) -> Union[AgentIndex, PYUObject]:
+        return self.collect().agent_idx
+
+    def lazy(self) -> "LazyPartition":
+        return self
+
+    def collect(self) -> Partition:
+        """Execute the plan and returns the result partition."""
+        if self._result is None:
+            steps = optimize_plan(self.steps)
+            root = self.root
+            if isinstance(root, _PendingSource):
+                columns = None
+                if steps and root.projection_arg is not None:
+                    columns, steps = push_down_columns(steps, root.probe().columns)
+                root = root.load(columns)
+            if steps:
+                index = self.part_agent.run_plan(root.agent_idx, steps)
+                self._result = Partition(
+                    self.part_agent, index, self.device, self.backend
+                )
+            else:
+                self._result = root
+            self._deps = []
+        return self._result
+
+    def _append(self, op, *args, deps=None, **kwargs) -> "LazyPartition":
+        step = PlanStep(op, args, kwargs)
+        if self._result is not None:
+            new = LazyPartition(self._result, [step], deps)
+        else:
+            new = LazyPartition(
+                self.root, self.steps + [step], self._deps + (deps or [])
+            )
+        new._columns = infer_columns(self._columns, step)
+        return new
+
+    def _append_inplace(self, op, *args, **kwargs):
+        new = self._append(op, *args, **kwargs)
+        self.root, self.steps, self._deps = new.root, new.steps, new._deps
+        self._result = None
+        self._columns = None
+
+    def __getitem__(self, item) -> "LazyPartition":
+        return self._append("__getitem__", item)
+
+    def __setitem__(self, key, value: Union['Partition', PYUObject]):
+        super().__setitem__(key, value)
+        self._columns = None
+
+    @property
+    def columns(self) -> list:
+        if self._columns is None:
+            if self._result is not None:
+                self._columns = self._result.columns
+            else:
+                steps = optimize_plan(self.steps)
+                root = self.root
+                if isinstance(root, _PendingSource):
+                    # dtypes of the probe might be different from the data.
+                    if any(step.op in DTYPE_DEPENDENT_OPS for step in steps):
+                        root = root.load()
+                    else:
+                        root = root.probe()
+                if steps:
+                    self._columns = reveal(
+                        self.part_agent.plan_columns(root.agent_idx, steps)
+                    )
+                else:
+                    self._columns = root.columns
+        return list(self._columns)
+
+    def isna(self) -> "LazyPartition":
+        return self._append("isna")
+
+    def replace(self, *args, **kwargs) -> "LazyPartition":
+        return self._append("replace", *args, **kwargs)
+
+    def astype(
+        self, dtype, copy: bool = True, errors: str = "raise"
+    ) -> "LazyPartition":
+        if copy:
+            return self._append("astype", dtype=dtype, errors=errors)
+        self._append_inplace("astype", dtype=dtype, errors=errors)
+
+    def copy(self) -> "LazyPartition":
+        return self._append("copy")
+
+    def drop(
+        self,
+        labels=None,
+        axis=0,
+        index=None,
+        columns=None,
+        level=None,
+        inplace=False,
+        errors='raise',
+    ) -> "LazyPartition":
+        kwargs = dict(
+            labels=labels,
+            axis=axis,
+            index=index,
+            columns=columns,
+            level=level,
+            errors=errors,
+        )
+        if not inplace:
+            return self._append("drop", **kwargs)
+        self._append_inplace("drop", **kwargs)
+
+    def fillna(
+        self,
+        value=None,
+        method=None,
+        axis=None,
+        inplace=False,
+        limit=None,
+        downcast=None,
+    ) -> Union['LazyPartition', None]:
+        kwargs = dict(
+            value=value, method=method, axis=axis, limit=limit, downcast=downcast
+        )
+        if not inplace:
+            return self._append("fillna", **kwargs)
+        self._append_inplace("fillna", **kwargs)
+
+    def rename(
+        self,
+        mapper=None,
+        index=None,
+        columns=None,
+        axis=None,
+        copy=True,
+        inplace=False,
+        level=None,
+        errors='ignore',
+    ) -> Union['LazyPartition', None]:
+        kwargs = dict(
+            mapper=mapper,
+            index=index,
+            columns=columns,
+            axis=axis,
+            level=level,
+            errors=errors,
+        )
+        if not inplace:
+            return self._append("rename", **kwargs)
+        self._append_inplace("rename", **kwargs)
+
+    def pow(self, *args, **kwargs) -> 'LazyPartition':
+        return self._append("pow", *args, **kwargs)
+
+    def round(self, *args, **kwargs) -> 'LazyPartition':
+        return self._append("round", *args, **kwargs)
+
+    def select_dtypes(self, *args, **kwargs) -> 'LazyPartition':
+        return self._append("select_dtypes", *args, **kwargs)
+
+    def subtract(self, other) -> 'LazyPartition':
+        if isinstance(other, StatPartition):
+            return self._append("subtract", other.data)
+        if isinstance(other, Partition):
+            assert self.device == other.device
+            return self._append("subtract", other.agent_idx, deps=[other])
+        return self._append("subtract", other)
+
+    def to_pandas(self) -> 'Partition':
+        return self.collect().to_pandas()
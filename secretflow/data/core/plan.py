@@ -0,0 +1,217 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Logical plans of lazy partitions.
+
+A plan is a list of steps, each of them is a method of PartDataFrameBase
+which returns a new dataframe. Plans are optimized on the driver and executed
+inside the partition agent in one call, so no intermediate dataframe is kept.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import Index
+
+from .base import PartDataFrameBase
+from .pandas import PdPartDataFrame
+
+
+class PlanStep(NamedTuple):
+    op: str
+    args: Tuple = ()
+    kwargs: Dict[str, Any] = {}
+
+
+# Element-wise ops keep the column labels, a column selection after them
+# could be moved before them when all of their arguments are scalars.
+_ELEMENT_WISE_OPS = {"isna", "replace", "astype", "fillna", "pow", "round", "subtract"}
+
+# Ops whose result depends on the dtypes of columns.
+DTYPE_DEPENDENT_OPS = {"select_dtypes"}
+
+# Ops supported by the polars lazy engine, see PlPartDataFrame.
+_POLARS_LAZY_OPS = {
+    "__getitem__",
+    "select_dtypes",
+    "drop",
+    "astype",
+    "fillna",
+    "round",
+    "rename",
+}
+
+_PANDAS_OPS = {"pow": "__pow__", "subtract": "__sub__"}
+
+_PANDAS_INPLACE_OPS = {"drop", "fillna", "rename"}
+
+
+def _is_scalar(value) -> bool:
+    return value is None or isinstance(
+        value, (str, bytes, int, float, bool, np.generic, np.dtype, type)
+    )
+
+
+def _item_list(item) -> Optional[List]:
+    if isinstance(item, Index):
+        return item.tolist()
+    if isinstance(item, (list, tuple)):
+        return list(item)
+    if _is_scalar(item):
+        return [item]
+    return None
+
+
+def _is_pushable(step: PlanStep) -> bool:
+    return step.op in _ELEMENT_WISE_OPS and all(
+        _is_scalar(v) for v in list(step.args) + list(step.kwargs.values())
+    )
+
+
+def optimize_plan(steps: List[PlanStep]) -> List[PlanStep]:
+    """Optimize a plan.
+
+    1. copy steps are removed, since every step returns a new dataframe.
+    2. column selections are moved before element-wise ops with scalar
+       arguments, so the element-wise ops only work on the selected columns.
+    3. consecutive column selections are fused into one.
+    """
+    optimized = []
+    for step in steps:
+        if step.op == "copy":
+            continue
+        if step.op != "__getitem__" or _item_list(step.args[0]) is None:
+            optimized.append(step)
+            continue
+        pos = len(optimized)
+        while pos > 0 and _is_pushable(optimized[pos - 1]):
+            pos -= 1
+        if pos > 0 and optimized[pos - 1].op == "__getitem__":
+            prev_items = _item_list(optimized[pos - 1].args[0])
+            items = _item_list(step.args[0])
+            if prev_items is not None and set(items).issubset(prev_items):
+                optimized[pos - 1] = step
+                continue
+        optimized.insert(pos, step)
+    return optimized
+
+
+def infer_columns(columns: Optional[List], step: PlanStep) -> Optional[List]:
+    """The columns after a step on a dataframe with columns, None if they could
+    not be inferred without the data.
+    """
+    if step.op == "__getitem__":
+        # missing columns are reported when the plan is executed.
+        return _item_list(step.args[0])
+    if columns is not None and (step.op == "copy" or _is_pushable(step)):
+        return list(columns)
+    return None
+
+
+def push_down_columns(
+    steps: List[PlanStep], columns: List
+) -> Tuple[Optional[List], List[PlanStep]]:
+    """Push the column selection or dropping at the beginning of a plan on a
+    dataframe with columns down to the loader.
+
+    Returns:
+        The columns to load, None if all columns are needed, and the plan to
+        execute on the loaded dataframe.
+    """
+    if not steps:
+        return None, steps
+    step = steps[0]
+    if step.op == "__getitem__":
+        items = _item_list(step.args[0])
+        if items is not None and set(items).issubset(columns):
+            return items, steps
+    elif step.op == "drop":
+        bound = dict(
+            zip(["labels", "axis", "index", "columns"], step.args), **step.kwargs
+        )
+        dropped = bound.get("columns")
+        if dropped is None and bound.get("axis") in (1, "columns"):
+            dropped = bound.get("labels")
+        if dropped is not None and bound.get("index") is None:
+            dropped = _item_list(dropped)
+            if dropped is not None and set(dropped).issubset(columns):
+                items = [c for c in columns if c not in set(dropped)]
+                return items, [PlanStep("__getitem__", (items,))] + steps[1:]
+    return None, steps
+
+
+def _execute_pandas(data: pd.DataFrame, steps: List[PlanStep]) -> PdPartDataFrame:
+    # Steps run on the underlying pandas DataFrame and the result is wrapped
+    # once, ops on intermediates of the plan are inplace when possible.
+    def _unwrap(x):
+        return x.get_data() if isinstance(x, PdPartDataFrame) else x
+
+    owned = False
+    for step in steps:
+        args = tuple(_unwrap(x) for x in step.args)
+        kwargs = {k: _unwrap(v) for k, v in step.kwargs.items()}
+        if step.op == "__getitem__":
+            item = args[0]
+            data = data[item if isinstance(item, (list, tuple, Index)) else [item]]
+        elif owned and step.op in _PANDAS_INPLACE_OPS:
+            kwargs["inplace"] = True
+            getattr(data, step.op)(*args, **kwargs)
+        else:
+            data = getattr(data, _PANDAS_OPS.get(step.op, step.op))(*args, **kwargs)
+        # results of column selections might be views of the input.
+        owned = step.op not in ("__getitem__", "select_dtypes")
+    return PdPartDataFrame(data)
+
+
+def _execute_polars(data: PartDataFrameBase, steps: List[PlanStep]):
+    from .polars import PlPartDataFrame
+
+    # methods of PlPartDataFrame work on LazyFrame too, the whole plan is
+    # optimized and computed by polars in one pass when collected.
+    lazy = PlPartDataFrame(data.get_data().lazy())
+    for step in steps:
+        lazy = getattr(lazy, step.op)(*step.args, **step.kwargs)
+    return lazy
+
+
+def _is_polars(data: PartDataFrameBase) -> bool:
+    try:
+        from .polars import PlPartDataFrame
+    except ImportError:
+        return False
+    return isinstance(data, PlPartDataFrame)
+
+
+def execute_plan(data: PartDataFrameBase, steps: List[PlanStep]) -> PartDataFrameBase:
+    """Execute a plan on data, the data itself is not modified."""
+    if not steps:
+        return data.copy()
+    if isinstance(data, PdPartDataFrame):
+        return _execute_pandas(data.get_data(), steps)
+    if _is_polars(data) and all(step.op in _POLARS_LAZY_OPS for step in steps):
+        from .polars import PlPartDataFrame
+
+        return PlPartDataFrame(_execute_polars(data, steps).get_data().collect())
+    for step in steps:
+        data = getattr(data, step.op)(*step.args, **step.kwargs)
+    return data
+
+
+def plan_columns(data: PartDataFrameBase, steps: List[PlanStep]) -> List:
+    """The columns of the result of a plan, without computing the data."""
+    if _is_polars(data) and all(step.op in _POLARS_LAZY_OPS for step in steps):
+        # schema of LazyFrame is resolved without collecting.
+        return list(_execute_polars(data, steps).get_data().columns)
+    return list(execute_plan(data.iloc(slice(0, 0)), steps).columns())
@@ -22,6 +22,7 @@ import polars.selectors as cs
 from pandas.core.dtypes.inference import is_list_like
 
 from ...io.util import is_local_file
+from ..io import write_columnar
 from ..base import PartDataFrameBase
 from ..pandas import PdPartDataFrame
 from .util import infer_pd_dtype, infer_pl_dtype
@@ -350,6 +351,12 @@ class PlPartDataFrame(PartDataFrameBase):
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
         self.df.write_csv(filepath)
 
+    def to_columnar(self, filepath, file_format: str = "parquet"):
+        self._collect()
+        if is_local_file(filepath):
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        write_columnar(self.df, filepath, file_format)
+
     def iloc(self, index: Union[int, slice, List[int]]) -> 'PlPartDataFrame':
         raise NotImplementedError()
 
@@ -11,8 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Union
+from typing import List, Sequence, Union
 
+import jax
 import jax.numpy as jnp
 import numpy as np
 import pandas as pd
@@ -47,6 +48,85 @@ def get_agg_fun(agg):
         raise ValueError(f'Unknown agg {agg}')
 
 
+_MULTI_AGGS = ('sum', 'count', 'mean', 'var', 'max', 'min')
+
+
+def _segment_scan(values, segment_ids, op):
+    """Inclusive scan of op over rows of the same segment, rows are sorted by
+    segment ids, so the row at the end of a segment holds the aggregation of
+    the whole segment.
+    """
+
+    def combine(a, b):
+        a_ids, a_values = a
+        b_ids, b_values = b
+        same = jnp.expand_dims(a_ids == b_ids, -1)
+        return b_ids, jnp.where(same, op(a_values, b_values), b_values)
+
+    return jax.lax.associative_scan(combine, (segment_ids, values))[1]
+
+
+def _groupby_aggs_via_shuffle(
+    key_cols, cols, segment_end_marks, segment_ids, secret_random_order, aggs
+):
+    """Compute aggs of all cols in one pass and shuffle the results together
+    with the keys, only the rows at the end of segments are non-zero.
+
+    sum and count are shared among sum, count, mean and var. var is computed
+    on values centered by the mean of their segments for numerical stability.
+    """
+    x = jnp.stack(cols, axis=1)
+    intermediates = {}
+
+    def intermediate(name):
+        if name not in intermediates:
+            if name == 'sum':
+                value = _segment_scan(x, segment_ids, jnp.add)
+            elif name == 'count':
+                value = _segment_scan(jnp.ones_like(x[:, :1]), segment_ids, jnp.add)
+            elif name == 'mean':
+                value = intermediate('sum') / intermediate('count')
+            elif name == 'segment_mean':
+                # scan backwards to spread the mean at the end of each segment
+                # to all its rows.
+                value = _segment_scan(
+                    intermediate('mean')[::-1], segment_ids[::-1], lambda a, _: a
+                )[::-1]
+            elif name == 'var':
+                centered = x - intermediate('segment_mean')
+                # unbiased like pandas, and 0 for groups of single sample.
+                value = _segment_scan(
+                    centered * centered, segment_ids, jnp.add
+                ) / jnp.maximum(intermediate('count') - 1, 1)
+            elif name == 'max':
+                value = _segment_scan(x, segment_ids, jnp.maximum)
+            elif name == 'min':
+                value = _segment_scan(x, segment_ids, jnp.minimum)
+            intermediates[name] = value
+        return intermediates[name]
+
+    values = jnp.concatenate(
+        [jnp.broadcast_to(intermediate(agg), x.shape) for agg in aggs], axis=1
+    )
+    values = values * jnp.expand_dims(segment_end_marks, -1)
+    keys = [key * segment_end_marks for key in key_cols]
+    # ids of rows in the middle of segments would reveal the size of groups.
+    segment_ids = segment_ids * segment_end_marks
+
+    shuffled = jax.lax.sort(
+        [secret_random_order, segment_ids, segment_end_marks]
+        + keys
+        + [values[:, i] for i in range(values.shape[1])],
+        num_keys=1,
+    )
+    return (
+        shuffled[1],
+        shuffled[2],
+        jnp.stack(shuffled[3 : 3 + len(keys)], axis=1),
+        jnp.stack(shuffled[3 + len(keys) :], axis=1),
+    )
+
+
 # TODO(zoupeicheng.zpc): add version that return SPUObjects and append with special shuffle-reveal-postprocess
 # TODO(zoupeicheng.zpc): allow reveal to a specific party.
 # 1. use groupby ops instead of groupby with shuffle ops
@@ -263,6 +343,83 @@ class DataFrameGroupBy:
     def min(self, target_col_names: List[str] = None):
         return self._agg('min', target_col_names)
 
+    def agg(
+        self, aggs: Sequence[str], target_col_names: List[str] = None
+    ) -> pd.DataFrame:
+        """Apply several aggregation functions to the target columns at once.
+
+        All aggregations are computed in one SPU program with one shuffle and
+        one reveal, so it is much cheaper than calling each function separately.
+
+        Args:
+            aggs: aggregation functions, in 'sum', 'count', 'mean', 'var', 'max'
+                and 'min'.
+            target_col_names: columns to aggregate, all target columns if None.
+
+        Returns:
+            A DataFrame indexed by the group keys, whose columns are a MultiIndex
+            of (column name, aggregation function) like pandas.
+        """
+        if isinstance(aggs, str):
+            aggs = [aggs]
+        aggs = list(aggs)
+        assert len(aggs) > 0, "aggs must not be empty"
+        for agg in aggs:
+            if agg not in _MULTI_AGGS:
+                raise ValueError(f'Unknown agg {agg}')
+        col_names = (
+            self.target_columns_names if target_col_names is None else target_col_names
+        )
+        for col_name in col_names:
+            assert (
+                col_name in self.target_columns_names
+            ), f"{col_name} not in {self.target_columns_names}"
+        cols = [
+            self.target_columns_sorted[self.target_columns_names.index(col_name)]
+            for col_name in col_names
+        ]
+
+        segment_ids, segment_end_marks, keys, values = reveal(
+            self.spu(_groupby_aggs_via_shuffle, static_argnames='aggs')(
+                self.key_columns_sorted,
+                cols,
+                self.seg_end_marks,
+                self.segment_ids,
+                self.gen_secret_random_order(),
+                aggs=tuple(aggs),
+            )
+        )
+
+        # restore the order of groups and drop rows not at the end of segments.
+        ends = np.asarray(segment_end_marks).astype(bool)
+        order = np.argsort(np.asarray(segment_ids)[ends], kind='stable')
+        keys = np.asarray(keys)[ends][order]
+        values = np.asarray(values)[ends][order]
+        assert (
+            len(keys) == self.num_groups
+        ), f"expect {self.num_groups} groups, got {len(keys)}"
+
+        # (agg, column) -> (column, agg)
+        values = (
+            values.reshape(len(values), len(aggs), len(col_names))
+            .transpose(0, 2, 1)
+            .reshape(len(values), -1)
+        )
+        df = pd.DataFrame(
+            data=values,
+            columns=pd.MultiIndex.from_product([list(col_names), aggs]),
+        )
+        if self.num_key_cols == 1:
+            df.index = pd.Index(keys[:, 0], name=self.key_col_names[0])
+        else:
+            df.index = pd.MultiIndex.from_arrays(
+                matrix_to_cols(keys), names=self.key_col_names
+            )
+        if 'count' in aggs:
+            count_cols = [(col_name, 'count') for col_name in col_names]
+            df[count_cols] = df[count_cols].astype(np.int32)
+        return df
+
 
 def matrix_to_cols(matrix):
     return [matrix[:, i] for i in range(matrix.shape[1])]
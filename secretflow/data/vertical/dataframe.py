@@ -114,9 +114,10 @@ class VDataFrame(DataFrameBase):
 
         # Note the [par.columns] is here to make sure alice does not see bob's columns.
         # and it is only effective for subtract two VDataFrames with the same partitions roles and shapes.
+        # fn is looked up on the partition, since it might be overridden, e.g. by LazyPartition.
         return VDataFrame(
             {
-                pyu: fn(part, *args, **kwargs)[part.columns]
+                pyu: getattr(part, fn.__name__)(*args, **kwargs)[part.columns]
                 for pyu, part in self.partitions.items()
             },
             self.aligned,
@@ -133,7 +134,7 @@ class VDataFrame(DataFrameBase):
         for key in listed_col:
             found = False
             for pyu, part in self.partitions.items():
-                if key not in part.dtypes:
+                if key not in part.columns:
                     continue
 
                 found = True
@@ -601,6 +602,26 @@ class VDataFrame(DataFrameBase):
             for device, uri in fileuris.items()
         ]
 
+    def to_columnar(self, fileuris: Dict[PYU, str], file_format: str = "parquet"):
+        """Write object to a parquet or arrow ipc file.
+
+        Args:
+            fileuris: a dict of file uris specifying file for each PYU.
+            file_format: 'parquet' or 'arrow'.
+
+        Returns:
+            Returns a list of PYUObjects whose value is none. You can use
+            `secretflow.wait` to wait for the save to complete.
+        """
+        for device, uri in fileuris.items():
+            if device not in self.partitions:
+                raise InvalidArgumentError(f'PYU {device} is not in this dataframe.')
+
+        return [
+            self.partitions[device].to_columnar(uri, file_format)
+            for device, uri in fileuris.items()
+        ]
+
     def iloc(self, index: Union[int, slice, List[int]]) -> 'DataFrameBase':
         raise NotImplementedError()
 
@@ -725,6 +746,32 @@ class VDataFrame(DataFrameBase):
             self.aligned,
         )
 
+    def lazy(self) -> "VDataFrame":
+        """Returns a lazy VDataFrame on the same data.
+
+        Operations like column selection, select_dtypes, fillna, astype and
+        subtract are recorded as a plan of each party instead of executed. The
+        plan is optimized and executed inside the party in one call when the
+        data is needed, e.g. statistics, values and to_csv, so no intermediate
+        dataframe is created.
+
+        Examples:
+            >>> df = v_df.lazy()
+            >>> df = df.subtract(df.mean(numeric_only=True)).select_dtypes('number')
+            >>> df.pow(3).mean()
+        """
+        return VDataFrame(
+            {pyu: part.lazy() for pyu, part in self.partitions.items()},
+            self.aligned,
+        )
+
+    def collect(self) -> "VDataFrame":
+        """Execute the plans of a lazy VDataFrame, no-op for others."""
+        return VDataFrame(
+            {pyu: part.collect() for pyu, part in self.partitions.items()},
+            self.aligned,
+        )
+
     def groupby(self, spu: SPU, by: List[str]) -> DataFrameGroupBy:
         """Group the VDataFrame by the specified columns.
         To groupby with string columns, use encode the string columns first.
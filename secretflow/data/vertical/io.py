@@ -19,8 +19,14 @@ from secretflow.device import PYU, SPU, Device, reveal
 from secretflow.utils.errors import InvalidArgumentError
 from secretflow.utils.random import global_random
 
-from ..core import partition
-from ..core.io import read_csv_wrapper, read_file_meta
+from ..core import lazy_partition, partition
+from ..core.io import (
+    ColumnarFormat,
+    read_columnar_wrapper,
+    read_csv_batches_wrapper,
+    read_csv_wrapper,
+    read_file_meta,
+)
 from .dataframe import VDataFrame
 
 
@@ -35,6 +41,7 @@ def read_csv(
     no_header: bool = False,
     backend: str = 'pandas',
     nrows: int = None,
+    lazy: bool = False,
 ) -> VDataFrame:
     """Read a comma-separated values (csv) file into VDataFrame.
 
@@ -74,12 +81,17 @@ def read_csv(
         psi_protocl: Specified protocol for PSI. Default 'KKRT_PSI_2PC' for 2
             parties, 'ECDH_PSI_3PC' for 3 parties.
         no_header: Whether the dataset has the header, defualt to False.
-        backend: The read csv backend, default use Pandas, support Polars as well.
+        backend: The read csv backend, default use Pandas, support Polars and Arrow as well.
+        nrows: Optional. Num of rows to read.
+        lazy: Whether to return a lazy VDataFrame, see :py:meth:`VDataFrame.lazy`.
+            The files are not read until the data is needed, and only the
+            columns used are read. The number of samples is not checked.
 
     Returns:
         A aligned VDataFrame.
     """
     assert spu is None or keys is not None, f"keys required when spu provided"
+    assert spu is None or not lazy, f"lazy read is not supported with psi"
     assert spu is None or drop_keys is not None, f"drop_keys required when spu provided"
     if spu is not None:
         assert len(filepath) <= 3, f"only support 2 or 3 parties for now"
@@ -124,10 +136,22 @@ def read_csv(
     for device, path in filepath_actual.items():
         usecols = dtypes[device].keys() if dtypes is not None else None
         dtype = dtypes[device] if dtypes is not None else None
-        partitions[device] = partition(
-            data=read_csv_wrapper,
-            device=device,
-            backend=backend,
+        if spu is not None and not no_header:
+            # outputs of PSI are parsed into arrow record batches directly,
+            # which is much faster than pandas for large intersections.
+            partitions[device] = partition(
+                data=read_csv_batches_wrapper,
+                device=device,
+                backend=backend,
+                filepath=path,
+                delimiter=delimiter,
+                read_backend=backend,
+                columns=usecols,
+                dtype=dtype,
+                nrows=nrows,
+            )
+            continue
+        read_kwargs = dict(
             filepath=path,
             auto_gen_header_prefix=str(device) if no_header else "",
             delimiter=delimiter,
@@ -136,6 +160,19 @@ def read_csv(
             read_backend=backend,
             nrows=nrows,
         )
+        if lazy:
+            # generated headers could not be used as usecols.
+            partitions[device] = lazy_partition(
+                data=read_csv_wrapper,
+                device=device,
+                backend=backend,
+                projection_arg=None if no_header else "usecols",
+                **read_kwargs,
+            )
+        else:
+            partitions[device] = partition(
+                data=read_csv_wrapper, device=device, backend=backend, **read_kwargs
+            )
     if drop_keys:
         for device, part in partitions.items():
             device_drop_key = get_keys(device, drop_keys)
@@ -161,7 +198,7 @@ def read_csv(
     unique_cols = set()
 
     # data columns must be unique across all devices
-    if len(partitions):
+    if len(partitions) and not lazy:
         parties_length = {}
         for device, part in partitions.items():
             parties_length[device.party] = len(part)
@@ -179,3 +216,57 @@ def read_csv(
             assert col not in unique_cols, f"col {col} duplicate in multiple devices"
             unique_cols.add(col)
     return VDataFrame(partitions)
+
+
+def read_columnar(
+    filepath: Dict[PYU, str],
+    file_format: str = ColumnarFormat.PARQUET,
+    dtypes: Dict[PYU, Dict[str, type]] = None,
+    backend: str = 'pandas',
+    nrows: int = None,
+    lazy: bool = False,
+) -> VDataFrame:
+    """Read a Parquet or Arrow IPC file into VDataFrame.
+
+    Unlike read_csv, only the columns in dtypes are decoded and no type
+    inference is needed. The data of all parties are supposed pre-aligned.
+
+    Args:
+        filepath: The file path of each party.
+        file_format: 'parquet' or 'arrow'.
+        dtypes: Participant field type. All columns are read if not specified.
+        backend: The read backend, default use Pandas, support Polars and Arrow as well.
+        nrows: Optional. Num of rows to read.
+        lazy: Whether to return a lazy VDataFrame, see :py:meth:`VDataFrame.lazy`.
+            The files are not read until the data is needed, and only the
+            columns used are read.
+
+    Returns:
+        A VDataFrame.
+    """
+    partitions = {}
+    for device, path in filepath.items():
+        read_kwargs = dict(
+            filepath=path,
+            file_format=file_format,
+            read_backend=backend,
+            columns=list(dtypes[device].keys()) if dtypes is not None else None,
+            dtype=dtypes[device] if dtypes is not None else None,
+            nrows=nrows,
+        )
+        if lazy:
+            partitions[device] = lazy_partition(
+                data=read_columnar_wrapper,
+                device=device,
+                backend=backend,
+                projection_arg="columns",
+                **read_kwargs,
+            )
+        else:
+            partitions[device] = partition(
+                data=read_columnar_wrapper,
+                device=device,
+                backend=backend,
+                **read_kwargs,
+            )
+    return VDataFrame(partitions)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 from dataclasses import dataclass
 from functools import reduce
 from pathlib import Path
@@ -29,7 +30,12 @@ import secretflow.distributed as sfd
 from secretflow.utils.errors import PartyNotFoundError
 
 from .base import Device, DeviceType
-from .spu import SPUIOInfo, SPUValueMeta
+from .spu import (
+    SPUIOInfo,
+    SPUValueMeta,
+    pack_share_chunks,
+    share_chunks_count,
+)
 from .type_traits import (
     heu_datatype_to_numpy,
     heu_datatype_to_spu,
@@ -105,6 +111,10 @@ class HEUActor:
         )
         return data[item]
 
+    def batch_getitem(self, items, *data):
+        """Delegate of hnp ndarray.__getitem___() on many ndarrays, returns a list"""
+        return [self.getitem(d, item) for d, item in zip(data, items)]
+
     def setitem(self, data, key, value):
         """Delegate of hnp ndarray.__setitem___()"""
         if isinstance(key, np.ndarray):
@@ -380,20 +390,23 @@ class HEUSkKeeper(HEUActor):
         return self.decode(self.decrypt(data), edr)
 
     def h2a_decrypt_make_share(
-        self, data_with_mask: hnp.CiphertextArray, spu_field_type
+        self,
+        data_with_mask: hnp.CiphertextArray,
+        spu_field_type,
+        spu_max_chunk_size: int = 0,
     ):
-        """H2A: Decrypt the masked data array"""
+        """H2A: Decrypt the masked data array
+
+        Returns:
+            Serialized ValueChunkProto of the share, the count of chunks is
+            decided by spu_max_chunk_size.
+        """
         # decrypt without decode
         data_with_mask = self.decrypt(data_with_mask)
         byte_content = data_with_mask.to_bytes(spu_fxp_size(spu_field_type), 'little')
         # ValueProto: see spu.proto in SPU repo for details.
-
-        # TODO: support chunk
-        chunk = spu.spu_pb2.ValueChunkProto()
-        chunk.content = byte_content
-        chunk.chunk_offset = 0
-        chunk.total_bytes = len(chunk.content)
-        return chunk.SerializeToString()
+        chunks = pack_share_chunks(byte_content, spu_max_chunk_size)
+        return chunks if len(chunks) > 1 else chunks[0]
 
 
 class HEUEvaluator(HEUActor):
@@ -424,6 +437,13 @@ class HEUEvaluator(HEUActor):
         with open(path, "wb") as f:
             pickle.dump(pk, f)
 
+    def h2a_shares_chunk_count(
+        self, data: hnp.CiphertextArray, spu_field_type, spu_max_chunk_size: int
+    ) -> int:
+        """H2A: count of chunks of each party's share"""
+        total_bytes = math.prod(data.shape) * spu_fxp_size(spu_field_type)
+        return share_chunks_count(total_bytes, spu_max_chunk_size)
+
     def a2h_sum_shards(self, *shards):
         """A2H: get the sum of arithmetic shares"""
         return reduce(self.evaluator.add, shards)
@@ -435,6 +455,7 @@ class HEUEvaluator(HEUActor):
         spu_protocol,
         spu_field_type,
         spu_fxp_fraction_bits,
+        spu_max_chunk_size: int = 0,
     ):
         """H2A: make share of data, runs on the side (party) where the data resides
 
@@ -444,10 +465,13 @@ class HEUEvaluator(HEUActor):
             spu_protocol: part of spu runtime config.
             spu_field_type: part of spu runtime config.
             spu_fxp_fraction_bits: part of spu runtime config.
+            spu_max_chunk_size: part of spu runtime config, 0 means unlimited.
 
         Returns:
-            Dynamical number of return values, equal to len(evaluator_parties) + 2
-            Return: spu_meta_info, sk_keeper's shard, and each evaluator's shard
+            Dynamical number of return values, equal to
+            len(evaluator_parties) * chunks_count + 3
+            Return: spu_meta_info, sk_keeper's shard, io_info, and chunks of
+            each evaluator's shard
         """
         # This import must be placed inside the function,
         # otherwise ray cannot serialize the actor
@@ -471,19 +495,18 @@ class HEUEvaluator(HEUActor):
         # ValueProto: see spu.proto in SPU repo for details.
         shares_chunk = []
         for mask in masks:
-            # TODO: support chunk
-            chunk = spu.spu_pb2.ValueChunkProto()
-            chunk.content = mask.to_bytes(spu_fxp_size(spu_field_type), 'little')
-            chunk.chunk_offset = 0
-            chunk.total_bytes = len(chunk.content)
-            shares_chunk.append(chunk.SerializeToString())
+            chunks = pack_share_chunks(
+                mask.to_bytes(spu_fxp_size(spu_field_type), 'little'),
+                spu_max_chunk_size,
+            )
+            shares_chunk.extend(chunks)
 
             meta = spu.spu_pb2.ValueMetaProto()
             meta.visibility = spu.Visibility.VIS_SECRET
             meta.data_type = heu_datatype_to_spu(self.cleartext_type)
             meta.storage_type = f"semi2k.AShr<{spu.FieldType.Name(spu_field_type)}>"
             meta.shape.dims.extend(tuple(mask.shape))
-            io_info = SPUIOInfo(0, 1, meta.SerializeToString())
+            io_info = SPUIOInfo(0, len(chunks), meta.SerializeToString())
 
         value_meta = SPUValueMeta(
             data.shape,
@@ -688,11 +711,11 @@ class HEU(Device):
         raise NotImplementedError("Heu function call is not implemented")
 
 
-def heu_from_base_config(
+def heu_config_from_base_config(
     base_heu_config: dict, new_sk_keeper: str, new_evaluators: List[str]
-):
-    """Create a HEU from an existing heu config, except replacing it with new sk keeper and new evaluators"""
-    heu_config = {
+) -> dict:
+    """Create a HEU config from an existing heu config, except replacing it with new sk keeper and new evaluators"""
+    return {
         "sk_keeper": {"party": new_sk_keeper},
         "evaluators": [{"party": p} for p in new_evaluators],
         "mode": base_heu_config["mode"],
@@ -701,4 +724,13 @@ def heu_from_base_config(
             "key_pair": {"generate": {"bit_size": base_heu_config["key_size"]}},
         },
     }
+
+
+def heu_from_base_config(
+    base_heu_config: dict, new_sk_keeper: str, new_evaluators: List[str]
+):
+    """Create a HEU from an existing heu config, except replacing it with new sk keeper and new evaluators"""
+    heu_config = heu_config_from_base_config(
+        base_heu_config, new_sk_keeper, new_evaluators
+    )
     return HEU((heu_config), spu.spu_pb2.FM64)
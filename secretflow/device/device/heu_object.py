@@ -222,3 +222,32 @@ class HEUObject(DeviceObject):
             self.location,
             self.is_plain,
         )
+
+
+def batch_getitem(objs: List[HEUObject], items) -> HEUObject:
+    """Index each HEUObject with the corresponding item, results are packed
+    into one HEUObject holding a list.
+
+    The packed HEUObject is moved by one transfer, and decrypted and decoded
+    in one call when moved to PYU, instead of one per HEUObject.
+
+    Args:
+        objs: HEUObjects at the same location.
+        items: items of each HEUObject, or a PYUObject holding them.
+    """
+    assert len(objs) > 0, "objs should not be empty"
+    location = objs[0].location
+    assert all(
+        obj.location == location for obj in objs
+    ), "HEUObjects should be at the same location"
+    items = jax.tree_util.tree_map(
+        lambda x: x.data if isinstance(x, PYUObject) else x, items
+    )
+    return HEUObject(
+        objs[0].device,
+        objs[0]
+        .device.get_participant(location)
+        .batch_getitem.remote(items, *[obj.data for obj in objs]),
+        location,
+        all(obj.is_plain for obj in objs),
+    )
@@ -38,18 +38,20 @@ import spu.libspu.link as spu_link
 import spu.libspu.logging as spu_logging
 import spu.utils.frontend as spu_fe
 from google.protobuf import json_format
+from heu import numpy as hnp
 from heu import phe
 from spu import pir, psi, spu_pb2
 from spu.utils.distributed import dtype_spu_to_np, shape_spu_to_np
 
 import secretflow.distributed as sfd
 from secretflow.utils.errors import InvalidArgumentError
-from secretflow.utils.ndarray_bigint import BigintNdArray
+from secretflow.utils import ndarray_bigint
 from secretflow.utils.progress import ProgressData
 
 from .base import Device, DeviceObject, DeviceType
 from .pyu import PYUObject
 from .register import dispatch
+from .spu_compile_cache import SPUCompileCache, make_compile_key
 from .type_traits import spu_datatype_to_heu, spu_fxp_size
 
 _LINK_DESC_NAMES = [
@@ -117,6 +119,47 @@ def _plaintext_to_numpy(data: Any) -> np.ndarray:
     return np.asarray(jnp.asarray(data))
 
 
+def pack_share_chunks(content: bytes, max_chunk_size: int) -> List[bytes]:
+    """Split share content into serialized ValueChunkProto.
+
+    Args:
+        content: bytes-like content of the share.
+        max_chunk_size: max size of each chunk, 0 means unlimited.
+
+    Returns:
+        List[bytes]: serialized chunks, at least one chunk is returned.
+    """
+    total_bytes = len(content)
+    if max_chunk_size <= 0:
+        max_chunk_size = max(total_bytes, 1)
+    view = memoryview(content)
+    chunks = []
+    for offset in range(0, max(total_bytes, 1), max_chunk_size):
+        chunk = spu_pb2.ValueChunkProto()
+        chunk.content = bytes(view[offset : offset + max_chunk_size])
+        chunk.chunk_offset = offset
+        chunk.total_bytes = total_bytes
+        chunks.append(chunk.SerializeToString())
+    return chunks
+
+
+def share_chunks_count(total_bytes: int, max_chunk_size: int) -> int:
+    """Num of chunks produced by pack_share_chunks."""
+    if max_chunk_size <= 0 or total_bytes == 0:
+        return 1
+    return (total_bytes + max_chunk_size - 1) // max_chunk_size
+
+
+def unpack_share_chunks(chunks: Sequence[bytes]) -> bytes:
+    """Concat contents of serialized ValueChunkProto."""
+    contents = []
+    for c in chunks:
+        chunk = spu_pb2.ValueChunkProto()
+        chunk.ParseFromString(c)
+        contents.append(chunk.content)
+    return b"".join(contents)
+
+
 @dataclass
 class SPUValueMeta:
     """The metadata of an SPU value, which is a Numpy array or equivalent."""
@@ -566,47 +609,14 @@ class SPURuntime:
         )
 
         size = spu_fxp_size(self.conf.field)
+        content = unpack_share_chunks(chunks)
+        assert len(content) % size == 0, f"share size {len(content)} need align to {size}"
 
-        def _bytes_to_pb(chunk_idx: int) -> spu_pb2.ValueChunkProto:
-            ret = spu_pb2.ValueChunkProto()
-            ret.ParseFromString(chunks[chunk_idx])
-            return ret
-
-        def _get_int_bytes() -> bytes:
-            if len(chunks) == 0:
-                return
-            chunk_idx = 0
-            chunk_pb = _bytes_to_pb(chunk_idx)
-            chunk_idx += 1
-            assert (
-                chunk_pb.total_bytes % size == 0
-            ), f"share size {chunk_pb.total_bytes} need align to {size}"
-            total_pos = 0
-            chunk_pos = 0
-            int_bytes = b""
-            while total_pos < chunk_pb.total_bytes:
-                except_len = size - len(int_bytes)
-                read_len = min(except_len, len(chunk_pb.content) - chunk_pos)
-                int_bytes += chunk_pb.content[chunk_pos : chunk_pos + read_len]
-                total_pos += read_len
-                chunk_pos += read_len
-                if len(int_bytes) == size:
-                    yield int_bytes
-                    int_bytes = b""
-                if chunk_pos == len(chunk_pb.content) and chunk_idx < len(chunks):
-                    chunk_pb = _bytes_to_pb(chunk_idx)
-                    chunk_idx += 1
-                    chunk_pos = 0
-
-        value = BigintNdArray(
-            [
-                int.from_bytes(int_b, sys.byteorder, signed=True)
-                for int_b in _get_int_bytes()
-            ],
-            spu_meta.shape.dims,
+        value = ndarray_bigint.from_bytes(
+            content, size, tuple(spu_meta.shape.dims), sys.byteorder, signed=True
         )
 
-        return value.to_hnp(encoder=phe.BigintEncoder(schema))
+        return hnp.array(value.tolist(), encoder=phe.BigintEncoder(schema))
 
     def psi_df(
         self,
@@ -1625,6 +1635,47 @@ def _spu_compile(fn, copts, *meta_args, **meta_kwargs):
     return executable, output_tree
 
 
+class SPUCompiler:
+    def __init__(self, cache_capacity: int = 128, cache_dir: str = None):
+        """Compiler of SPU device with a cache of compiled executables.
+
+        Args:
+            cache_capacity: max num of executables cached in memory, 0 disables
+                the in-memory cache.
+            cache_dir: Optional. Directory of the on-disk cache.
+        """
+        self.cache = SPUCompileCache(cache_capacity, cache_dir)
+
+    def compile(self, fn, copts, *meta_args, **meta_kwargs):
+        meta_args, meta_kwargs = jax.tree_util.tree_map(
+            lambda x: ray.get(x) if isinstance(x, ray.ObjectRef) else x,
+            (meta_args, meta_kwargs),
+        )
+
+        if self.cache.capacity == 0 and not self.cache.cache_dir:
+            return _spu_compile(fn, copts, *meta_args, **meta_kwargs)
+
+        key = make_compile_key(fn, copts, meta_args, meta_kwargs)
+        record = self.cache.get(key)
+        if record is None:
+            executable, output_tree = _spu_compile(
+                fn, copts, *meta_args, **meta_kwargs
+            )
+            self.cache.put(key, (executable.SerializeToString(), output_tree))
+            return executable, output_tree
+
+        executable_bytes, output_tree = record
+        executable = spu_pb2.ExecutableProto()
+        executable.ParseFromString(executable_bytes)
+        return executable, output_tree
+
+    def cache_stats(self) -> Dict[str, int]:
+        return self.cache.stats()
+
+    def clear_cache(self):
+        self.cache.clear()
+
+
 class SPU(Device):
     def __init__(
         self,
@@ -1632,6 +1683,8 @@ class SPU(Device):
         link_desc: Dict = None,
         log_options: spu_logging.LogOptions = spu_logging.LogOptions(),
         id: str = None,
+        compile_cache_capacity: int = 128,
+        compile_cache_dir: str = None,
     ):
         """SPU device constructor.
 
@@ -1716,6 +1769,14 @@ class SPU(Device):
 
                     8. brpc_channel_connection_type refer to `https://github.com/apache/brpc/blob/master/docs/en/client.md#connection-type`
             log_options: Optional. Options of spu logging.
+            compile_cache_capacity: Optional. Max num of compiled executables
+                cached in memory of the compiling party. Executables are keyed
+                on function, static args, input metas and compiler options.
+                0 disables the in-memory cache. Defaults to 128.
+            compile_cache_dir: Optional. Directory in the compiling party to
+                persist compiled executables across restarts. Please clear it
+                after upgrading secretflow or spu. Defaults to None, which
+                disables the on-disk cache.
         """
         super().__init__(DeviceType.SPU)
         self.cluster_def = cluster_def
@@ -1730,10 +1791,19 @@ class SPU(Device):
         self._task_id = -1
         self.io = SPUIO(self.conf, self.world_size)
         self.id = id
+        self.compile_cache_capacity = compile_cache_capacity
+        self.compile_cache_dir = compile_cache_dir
         self.init()
 
     def init(self):
         """Init SPU runtime in each party"""
+        # it's ok to choose any party to compile,
+        # here we choose party 0.
+        self.compiler = (
+            sfd.remote(SPUCompiler)
+            .party(self.cluster_def['nodes'][0]['party'])
+            .remote(self.compile_cache_capacity, self.compile_cache_dir)
+        )
         for rank, node in enumerate(self.cluster_def['nodes']):
             self.actors[node['party']] = (
                 sfd.remote(SPURuntime)
@@ -1756,6 +1826,20 @@ class SPU(Device):
     def shutdown(self):
         for actor in self.actors.values():
             sfd.kill(actor)
+        sfd.kill(self.compiler)
+
+    def compile_cache_stats(self) -> Dict[str, int]:
+        """Get hit/miss counters of the compile cache.
+
+        Returns:
+            Dict[str, int]: hits (including disk_hits), disk_hits, misses and
+                the num of executables cached in memory.
+        """
+        return sfd.get(self.compiler.cache_stats.remote())
+
+    def clear_compile_cache(self):
+        """Clear in-memory compile cache and its counters."""
+        return sfd.get(self.compiler.clear_cache.remote())
 
     def _place_arguments(self, *args, **kwargs):
         def place(obj):
@@ -1813,14 +1897,9 @@ class SPU(Device):
             num_returns = user_specified_num_returns
             meta_args = list(meta_args)
 
-            # it's ok to choose any party to compile,
-            # here we choose party 0.
-            executable, out_shape = (
-                sfd.remote(_spu_compile)
-                .party(self.cluster_def['nodes'][0]['party'])
-                .options(num_returns=2)
-                .remote(fn, copts, *meta_args, **meta_kwargs)
-            )
+            executable, out_shape = self.compiler.compile.options(
+                num_returns=2
+            ).remote(fn, copts, *meta_args, **meta_kwargs)
 
             if num_returns_policy == SPUCompilerNumReturnsPolicy.FROM_COMPILER:
                 # Since user choose to use num of returns from compiler result,
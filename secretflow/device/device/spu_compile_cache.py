@@ -0,0 +1,198 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import logging
+import marshal
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import cloudpickle
+import jax
+import numpy as np
+
+
+def _fn_fingerprint(fn: Callable) -> bytes:
+    """Fingerprint of a python callable.
+
+    cloudpickle serializes closures and functions defined in __main__ by value,
+    but importable functions only by reference. The bytecode of the function is
+    appended so that an on-disk cache never serves an executable compiled from
+    an older version of the same function.
+    """
+    h = hashlib.sha256()
+    try:
+        h.update(cloudpickle.dumps(fn))
+    except Exception:
+        # not picklable, fallback to the identity of fn which only works in
+        # current process.
+        h.update(f'{id(fn)}'.encode())
+
+    inner = fn
+    while hasattr(inner, 'func'):
+        # functools.partial
+        inner = inner.func
+    code = getattr(inner, '__code__', None)
+    if code is not None:
+        try:
+            h.update(marshal.dumps(code))
+        except ValueError:
+            pass
+    return h.digest()
+
+
+def _meta_fingerprint(meta: Any) -> str:
+    if all(hasattr(meta, attr) for attr in ('shape', 'dtype', 'vtype')):
+        return f'{tuple(meta.shape)}|{np.dtype(meta.dtype).str}|{int(meta.vtype)}'
+    return repr(meta)
+
+
+def make_compile_key(fn: Callable, copts: Any, meta_args, meta_kwargs) -> str:
+    """Build the cache key of an SPU compilation.
+
+    The key covers the function (including static args bound by
+    functools.partial), the tree structure and SPUValueMeta (shape, dtype and
+    visibility) of inputs and the compiler options.
+
+    Args:
+        fn: the function to compile.
+        copts: spu_pb2.CompilerOptions.
+        meta_args: positional metas.
+        meta_kwargs: keyword metas.
+
+    Returns:
+        str: hex digest of the key.
+    """
+    flatten_metas, tree = jax.tree_util.tree_flatten((meta_args, meta_kwargs))
+
+    h = hashlib.sha256()
+    h.update(_fn_fingerprint(fn))
+    h.update(str(tree).encode())
+    for meta in flatten_metas:
+        h.update(_meta_fingerprint(meta).encode())
+        h.update(b';')
+    if copts is not None:
+        h.update(copts.SerializeToString(deterministic=True))
+    return h.hexdigest()
+
+
+class SPUCompileCache:
+    def __init__(self, capacity: int = 128, cache_dir: str = None):
+        """Cache of compiled SPU executables.
+
+        It has an in-memory LRU layer and an optional on-disk layer which
+        survives restarts. Executables are kept in serialized form so that
+        every lookup returns a fresh copy which is safe to be modified by
+        runtime.
+
+        Args:
+            capacity: max num of executables in memory, 0 disables the in-memory
+                layer.
+            cache_dir: Optional. Directory of the on-disk layer. The on-disk
+                layer is disabled if None. Please clear it after upgrading
+                secretflow or spu.
+        """
+        assert capacity >= 0, f'capacity should be non-negative, got {capacity}'
+        self.capacity = capacity
+        self.cache_dir = cache_dir
+        if self.cache_dir:
+            Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.spu_exec')
+
+    def _put_memory(self, key: str, record: Tuple[bytes, Any]):
+        if self.capacity == 0:
+            return
+        self._cache[key] = record
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Any]]:
+        """Lookup a record of (serialized executable, output tree).
+
+        Returns None if missed.
+        """
+        with self._lock:
+            record = self._cache.get(key, None)
+            if record is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return record
+
+            if self.cache_dir and os.path.exists(self._disk_path(key)):
+                try:
+                    with open(self._disk_path(key), 'rb') as f:
+                        record = cloudpickle.load(f)
+                except Exception as e:
+                    logging.warning(f'Failed to load spu compile cache {key}: {e}')
+                    record = None
+                if record is not None:
+                    self._put_memory(key, record)
+                    self._hits += 1
+                    self._disk_hits += 1
+                    return record
+
+            self._misses += 1
+            return None
+
+    def put(self, key: str, record: Tuple[bytes, Any]):
+        with self._lock:
+            self._put_memory(key, record)
+            if not self.cache_dir:
+                return
+            path = self._disk_path(key)
+            # write to a temp file then rename to make it atomic for concurrent
+            # readers.
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    cloudpickle.dump(record, f)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logging.warning(f'Failed to dump spu compile cache {key}: {e}')
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def clear(self):
+        """Clear the in-memory layer and reset counters."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Counters of the cache.
+
+        Returns:
+            Dict[str, int]: hits (including disk_hits), disk_hits, misses and
+                the num of executables in memory.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'size': len(self._cache),
+            }
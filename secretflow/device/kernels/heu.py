@@ -15,6 +15,7 @@
 from heu import numpy as hnp
 from spu import spu_pb2
 
+import secretflow.distributed as sfd
 from secretflow.device import (
     HEU,
     PYU,
@@ -90,15 +91,25 @@ def heu_to_spu(self: HEUObject, spu: SPU):
     # protocol is restricted to SEMI2K.
     assert spu.conf.protocol == spu_pb2.SEMI2K
 
+    max_chunk_size = spu.conf.share_max_chunk_size
+    chunks_count = sfd.get(
+        heu.get_participant(self.location).h2a_shares_chunk_count.remote(
+            self.data, spu.conf.field, max_chunk_size
+        )
+    )
+
     res = (
         heu.get_participant(self.location)
-        .h2a_make_share.options(num_returns=len(evaluator_parties) + 3)
+        .h2a_make_share.options(
+            num_returns=len(evaluator_parties) * chunks_count + 3
+        )
         .remote(
             self.data,
             evaluator_parties,
             spu.conf.protocol,
             spu.conf.field,
             0,
+            max_chunk_size,
         )
     )
 
@@ -110,9 +121,11 @@ def heu_to_spu(self: HEUObject, spu: SPU):
     )
 
     # sk_keeper: set data_with_mask as shard
-    sk_keeper_chunk = heu.sk_keeper.h2a_decrypt_make_share.remote(
-        sk_keeper_data, spu.conf.field
-    )
+    sk_keeper_chunks = heu.sk_keeper.h2a_decrypt_make_share.options(
+        num_returns=chunks_count
+    ).remote(sk_keeper_data, spu.conf.field, max_chunk_size)
+    if chunks_count == 1:
+        sk_keeper_chunks = [sk_keeper_chunks]
 
     # make sure sk_keeper_data would be sent to the correct spu actor.
     spu_actor_idx_for_keeper = -1
@@ -125,7 +138,9 @@ def heu_to_spu(self: HEUObject, spu: SPU):
         spu_actor_idx_for_keeper != -1
     ), f"couldn't find {heu.sk_keeper_name()} in spu actor list."
 
-    chunks.insert(spu_actor_idx_for_keeper, sk_keeper_chunk)
+    # chunks of shares are ordered by spu actors.
+    insert_pos = spu_actor_idx_for_keeper * chunks_count
+    chunks[insert_pos:insert_pos] = list(sk_keeper_chunks)
 
     return SPUObject(spu, meta, spu.infeed_shares(io_info, chunks))
 
@@ -110,8 +110,16 @@ class Communicator(ABC):
 
 
 class FedCommunicator(Communicator):
-    def __init__(self, partners: List[PYU]):
+    def __init__(self, partners: List[PYU], device: PYU = None):
+        """Communicator based on the cross-silo channels of fed.
+
+        Args:
+            partners: devices to communicate with.
+            device: the device who owns this communicator. If not provided,
+                recv must be called with this device as src, like :py:class:`Link`.
+        """
         self.parties = [partner.party for partner in partners]
+        self.party = device.party if device is not None else None
 
     def send(self, dest: PYU, data: Any, key: str):
         assert dest.party in self.parties, f'Device {dest} is not in this communicator.'
@@ -127,7 +135,9 @@ class FedCommunicator(Communicator):
         if is_single:
             keys = [keys]
 
-        vals = ray.get([fed.recv(src.party, src.party, key, key) for key in keys])
+        # messages are received by the proxy of this party.
+        party = self.party or src.party
+        vals = ray.get([fed.recv(party, src.party, key, key) for key in keys])
         return vals[0] if is_single else vals
 
 
@@ -164,22 +174,94 @@ class RayCommunicator(Communicator):
         if is_single:
             keys = [keys]
         vals = {}
+        pending = list(keys)
         with self._cv:
             while True:
                 recv_keys = []
-                for k in keys:
+                for k in pending:
                     if k in self._messages:
                         vals[k] = self._messages.pop(k)
                         recv_keys.append(k)
 
                 for k in recv_keys:
-                    keys.remove(k)
+                    pending.remove(k)
 
-                if len(keys) == 0:
+                if len(pending) == 0:
                     break
                 self._cv.wait()
 
-        return list(vals.values())[0] if is_single else list(vals.values())
+        # keep the order of keys regardless of the arrival order.
+        return vals[keys[0]] if is_single else [vals[k] for k in keys]
+
+
+class Mailbox:
+    """Message box of a device in simulation mode.
+
+    Unlike :py:class:`Link`, the owner of a mailbox does not need to be a
+    concurrent actor. Other devices put messages into the mailbox and the
+    owner gets them in blocking manner, see :py:class:`MailboxCommunicator`.
+    """
+
+    def __init__(self):
+        self._comm = RayCommunicator()
+
+    def put(self, key: str, value: Any):
+        self._comm._recv_message(key, value)
+
+    def get(self, keys: Union[str, List[str]]):
+        return self._comm.recv(None, keys)
+
+
+class MailboxCommunicator(Communicator):
+    def __init__(self, device: PYU, mailboxes: Dict[PYU, ray.actor.ActorHandle]):
+        """Communicator of a device based on the mailboxes of all devices.
+
+        Args:
+            device: the device who owns this communicator.
+            mailboxes: mailbox actor of each device.
+        """
+        self._device = device
+        self._mailboxes = mailboxes
+
+    def send(self, dest: PYU, data: Any, key: str):
+        assert dest in self._mailboxes, f'Device {dest} is not in this communicator.'
+        logging.debug(f'send to dest {dest}')
+        self._mailboxes[dest].put.remote(key, data)
+
+    def recv(self, src: PYU, keys: Union[str, List[str]]):
+        # messages are always received from the mailbox of this device.
+        return ray.get(self._mailboxes[self._device].get.remote(keys))
+
+
+def create_communicators(devices: List[PYU]) -> Dict[PYU, Communicator]:
+    """Create a communicator for each device, which can be passed into actors
+    on the device to exchange messages with the other devices directly,
+    without any round trip to the driver.
+
+    Args:
+        devices: the devices to communicate with each other.
+
+    Returns:
+        Dict[PYU, Communicator]: communicator of each device.
+    """
+    mode = sfd.get_distribution_mode()
+    if mode == DISTRIBUTION_MODE.PRODUCTION:
+        return {
+            device: FedCommunicator([d for d in devices if d != device], device)
+            for device in devices
+        }
+    assert (
+        mode == DISTRIBUTION_MODE.SIMULATION
+    ), f'Communicators are not supported in {mode} mode.'
+    mailboxes = {
+        device: sfd.remote(Mailbox)
+        .party(device.party)
+        # one thread blocks in get, the others serve puts from other devices.
+        .options(max_concurrency=len(devices) + 1)
+        .remote()
+        for device in devices
+    }
+    return {device: MailboxCommunicator(device, mailboxes) for device in devices}
 
 
 class Link:
@@ -24,6 +24,7 @@ from .primitive import (
     active_sf_cluster,
     in_ic_mode,
     get_cluster_avaliable_resources,
+    wait_ready,
 )
 
 __all__ = [
@@ -37,4 +38,5 @@ __all__ = [
     'active_sf_cluster',
     'in_ic_mode',
     'get_cluster_avaliable_resources',
+    'wait_ready',
 ]
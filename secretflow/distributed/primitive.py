@@ -164,6 +164,43 @@ def get(
         raise Exception(f"Illegal distribute mode, only support ({DISTRIBUTION_MODE})")
 
 
+def wait_ready(
+    object_refs: List[ray.ObjectRef], num_returns: int = 1, timeout: float = None
+) -> List[int]:
+    """Wait until num_returns of the objects are ready or timeout.
+
+    Only available in simulation and debug mode. In production mode, each party
+    runs its own driver, which can not agree on the order of readiness.
+
+    Args:
+        object_refs: objects to wait.
+        num_returns: num of ready objects to wait.
+        timeout: Optional. Max seconds to wait, no limit if None.
+
+    Returns:
+        indices of the first num_returns ready objects, maybe less if timeout.
+    """
+    assert (
+        0 < num_returns <= len(object_refs)
+    ), f'num_returns should be in (0, {len(object_refs)}], got {num_returns}'
+    if get_distribution_mode() == DISTRIBUTION_MODE.SIMULATION:
+        ready, _ = ray.wait(
+            list(object_refs),
+            num_returns=num_returns,
+            timeout=timeout,
+            fetch_local=False,
+        )
+        ready = set(ready)
+        return [idx for idx, ref in enumerate(object_refs) if ref in ready]
+    elif get_distribution_mode() == DISTRIBUTION_MODE.DEBUG:
+        # objects are computed eagerly in debug mode.
+        return list(range(num_returns))
+    else:
+        raise NotImplementedError(
+            f'wait_ready is not supported in {get_distribution_mode()} mode.'
+        )
+
+
 def kill(actor, *, no_restart=True):
     if get_distribution_mode() == DISTRIBUTION_MODE.PRODUCTION:
         return fed.kill(actor, no_restart=no_restart)
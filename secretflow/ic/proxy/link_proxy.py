@@ -15,7 +15,12 @@
 import logging
 import spu.libspu.link as link
 from typing import Dict, Any
-from secretflow.ic.proxy.serializer import serialize, deserialize
+from secretflow.ic.proxy.serializer import (
+    deserialize,
+    deserialize_chunks,
+    serialize,
+    serialize_chunks,
+)
 
 
 class LinkProxy:
@@ -66,6 +71,31 @@ class LinkProxy:
         logging.debug(f'recv type {type(data)} from {src_party}')
         return data
 
+    @classmethod
+    def send_chunked(cls, dest_party: str, data: Any, max_chunk_size: int):
+        """Send data in chunks no larger than max_chunk_size.
+
+        The peer must receive it with recv_chunked.
+        """
+        chunks = list(serialize_chunks(data, max_chunk_size))
+        cls.send_raw(dest_party, serialize(len(chunks)))
+        for chunk in chunks:
+            cls.send_raw(dest_party, chunk)
+        logging.debug(
+            f'send type {type(data)} to {dest_party} in {len(chunks)} chunks'
+        )
+
+    @classmethod
+    def recv_chunked(cls, src_party: str) -> Any:
+        chunks_count = deserialize(cls.recv_raw(src_party))
+        data = deserialize_chunks(
+            [cls.recv_raw(src_party) for _ in range(chunks_count)]
+        )
+        logging.debug(
+            f'recv type {type(data)} from {src_party} in {chunks_count} chunks'
+        )
+        return data
+
     @classmethod
     def stop(cls):
         cls._link.stop_link()
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, List, Sequence, Union
+from typing import Any, Iterable, Iterator, List, Sequence, Union
 
 import jax
 import numpy as np
@@ -24,18 +24,56 @@ PublicKey = phe.PublicKey
 
 
 def serialize(data: Any) -> bytes:
+    return b''.join(_serialize_parts(data))
+
+
+def serialize_chunks(data: Any, max_chunk_size: int) -> Iterator[bytes]:
+    """Serialize data into a stream of chunks.
+
+    Large payloads are sliced into chunks directly from the buffers of data.
+    The concatenation of chunks is the same as serialize(data).
+
+    Args:
+        data: data to serialize.
+        max_chunk_size: max bytes of each chunk.
+
+    Yields:
+        chunks, at least one.
+    """
+    assert max_chunk_size > 0, f'max_chunk_size should be positive, got {max_chunk_size}'
+    chunk, chunk_size, yielded = [], 0, False
+    for part in _serialize_parts(data):
+        view = memoryview(part).cast('B')
+        offset = 0
+        while offset < len(view):
+            take = min(max_chunk_size - chunk_size, len(view) - offset)
+            chunk.append(view[offset : offset + take])
+            chunk_size += take
+            offset += take
+            if chunk_size == max_chunk_size:
+                yield b''.join(chunk)
+                chunk, chunk_size, yielded = [], 0, True
+    if chunk or not yielded:
+        yield b''.join(chunk)
+
+
+def deserialize_chunks(chunks: Iterable[bytes]) -> Any:
+    return deserialize(b''.join(chunks))
+
+
+def _serialize_parts(data: Any) -> List:
     if isinstance(data, (bool, np.bool_)):
-        return _serialize_bool(data)
+        return [_serialize_bool(data)]
     elif isinstance(data, int):
-        return _serialize_int(data)
+        return [_serialize_int(data)]
     elif isinstance(data, (np.ndarray, jax.numpy.ndarray)):
         return _serialize_ndarray(data)
     elif isinstance(data, (list, tuple)):
         return _serialize_list(data)
     elif isinstance(data, PublicKey):
-        return _serialize_public_key(data)
+        return [_serialize_public_key(data)]
     elif isinstance(data, hnp.CiphertextArray):
-        return data.serialize(format=hnp.MatrixSerializeFormat.Interconnection)
+        return [data.serialize(format=hnp.MatrixSerializeFormat.Interconnection)]
     else:
         raise NotImplementedError(f'serialize not implemented for type: {type(data)}')
 
@@ -123,12 +161,10 @@ def _scalar_from_bytes(
         return _int_from_bytes(scalar.buf, scalar_type)
 
 
-def _serialize_ndarray(data: Union[np.ndarray, jax.numpy.ndarray]) -> bytes:
-    data_pb = de.DataExchangeProtocol()
-    data_pb.scalar_type = _numpy_type_to_scalar_type(data.dtype)
-    data_pb.f_ndarray.shape.extend(data.shape)
-    data_pb.f_ndarray.item_buf = data.tobytes()
-    return data_pb.SerializeToString()
+def _serialize_ndarray(data: Union[np.ndarray, jax.numpy.ndarray]) -> List:
+    parts = _encode_scalar_type(_numpy_type_to_scalar_type(data.dtype))
+    parts += _encode_len_delimited(_FIELD_F_NDARRAY, _encode_fndarray(data))
+    return parts
 
 
 def _ndarray_from_bytes(ndarray: de.FNdArray, scalar_type: de.ScalarType) -> np.ndarray:
@@ -138,9 +174,9 @@ def _ndarray_from_bytes(ndarray: de.FNdArray, scalar_type: de.ScalarType) -> np.
     return data
 
 
-def _serialize_list(data: Sequence) -> bytes:
+def _serialize_list(data: Sequence) -> List:
     if len(data) == 0:
-        return _serialize_empty_list()
+        return [_serialize_empty_list()]
     else:
         if isinstance(data[0], (bool, np.bool_)):
             return _serialize_bool_list(data)
@@ -159,17 +195,12 @@ def _serialize_empty_list() -> bytes:
     return data_pb.SerializeToString()
 
 
-def _serialize_bool_list(data: Union[Sequence[bool], Sequence[np.bool_]]) -> bytes:
-    data_pb = de.DataExchangeProtocol()
-    data_pb.scalar_type = de.SCALAR_TYPE_BOOL
-    data_pb.f_scalar_list.item_count = len(data)
-    for item in data:
-        data_pb.f_scalar_list.item_buf += _bool_to_bytes(item)
-    return data_pb.SerializeToString()
+def _serialize_bool_list(data: Union[Sequence[bool], Sequence[np.bool_]]) -> List:
+    item_buf = np.asarray(data, dtype=np.bool_)
+    return _encode_scalar_list(de.SCALAR_TYPE_BOOL, len(data), item_buf)
 
 
-def _serialize_int_list(data: Sequence[int]) -> bytes:
-    data_pb = de.DataExchangeProtocol()
+def _serialize_int_list(data: Sequence[int]) -> List:
     # signed = any(item < 0 for item in data)
     # item_byte_size = max(_get_int_size(item, signed) for item in data)
     signed = True
@@ -177,28 +208,27 @@ def _serialize_int_list(data: Sequence[int]) -> bytes:
         _get_int_size(min(data), signed),
         _get_int_size(max(data), signed),
     )
-    data_pb.scalar_type = _get_scalar_type_from_size(signed, item_byte_size)
-    data_pb.f_scalar_list.item_count = len(data)
-    for item in data:
-        data_pb.f_scalar_list.item_buf += item.to_bytes(
-            length=item_byte_size, byteorder='little', signed=signed
-        )
-    return data_pb.SerializeToString()
-
+    # round up to the size of a numpy integer type.
+    item_byte_size = next(
+        size for size in _SIZE_TO_SIGNED_SCALAR_TYPE_DICT if size >= item_byte_size
+    )
+    scalar_type = _get_scalar_type_from_size(signed, item_byte_size)
+    item_buf = np.asarray(data, dtype=_int_list_dtype(scalar_type))
+    return _encode_scalar_list(scalar_type, len(data), item_buf)
 
-def _serialize_ndarray_list(data: Sequence[np.ndarray]) -> bytes:
-    data_pb = de.DataExchangeProtocol()
 
+def _serialize_ndarray_list(data: Sequence[np.ndarray]) -> List:
     assert all(ndarray.dtype == data[0].dtype for ndarray in data)
-    data_pb.scalar_type = _numpy_type_to_scalar_type(data[0].dtype)
+    scalar_type = _numpy_type_to_scalar_type(data[0].dtype)
 
+    parts = _encode_scalar_type(scalar_type)
+    ndarrays = []
     for ndarray in data:
-        ndarray_pb = de.FNdArray()
-        ndarray_pb.shape.extend(ndarray.shape)
-        ndarray_pb.item_buf = ndarray.tobytes()
-        data_pb.f_ndarray_list.ndarrays.append(ndarray_pb)
-
-    return data_pb.SerializeToString()
+        ndarrays += _encode_len_delimited(
+            _FIELD_FNDARRAYLIST_NDARRAYS, _encode_fndarray(ndarray)
+        )
+    parts += _encode_len_delimited(_FIELD_F_NDARRAY_LIST, ndarrays)
+    return parts
 
 
 def _scalar_list_from_bytes(
@@ -211,30 +241,23 @@ def _scalar_list_from_bytes(
 
 
 def _bool_list_from_bytes(scalar_list: de.FScalarList) -> List[bool]:
-    return [
-        _bool_from_bytes(scalar_list.item_buf[i : i + 1])
-        for i in range(len(scalar_list.item_buf))
-    ]
+    return np.frombuffer(scalar_list.item_buf, dtype=np.bool_).tolist()
 
 
 def _int_list_from_bytes(
     scalar_list: de.FScalarList, scalar_type: de.ScalarType
 ) -> List[int]:
+    return np.frombuffer(
+        scalar_list.item_buf,
+        dtype=_int_list_dtype(scalar_type),
+        count=scalar_list.item_count,
+    ).tolist()
+
+
+def _int_list_dtype(scalar_type: de.ScalarType) -> np.dtype:
     item_byte_size = _get_scalar_type_size(scalar_type)
     signed = _get_scalar_type_signed(scalar_type)
-    data = list()
-    begin = 0
-    end = item_byte_size
-    for i in range(scalar_list.item_count):
-        data.append(
-            int.from_bytes(
-                scalar_list.item_buf[begin:end], byteorder='little', signed=signed
-            )
-        )
-        begin = end
-        end += item_byte_size
-
-    return data
+    return np.dtype(f"<{'i' if signed else 'u'}{item_byte_size}")
 
 
 def _ndarray_list_from_bytes(
@@ -245,6 +268,112 @@ def _ndarray_list_from_bytes(
     ]
 
 
+# The messages with large payloads are encoded in protobuf wire format
+# directly, so that item_buf is written from the buffer of ndarray without
+# intermediate copies. Field numbers are taken from the descriptors.
+_FIELD_SCALAR_TYPE = de.DataExchangeProtocol.DESCRIPTOR.fields_by_name[
+    'scalar_type'
+].number
+_FIELD_F_SCALAR_LIST = de.DataExchangeProtocol.DESCRIPTOR.fields_by_name[
+    'f_scalar_list'
+].number
+_FIELD_F_NDARRAY = de.DataExchangeProtocol.DESCRIPTOR.fields_by_name[
+    'f_ndarray'
+].number
+_FIELD_F_NDARRAY_LIST = de.DataExchangeProtocol.DESCRIPTOR.fields_by_name[
+    'f_ndarray_list'
+].number
+_FIELD_FSCALARLIST_ITEM_COUNT = de.FScalarList.DESCRIPTOR.fields_by_name[
+    'item_count'
+].number
+_FIELD_FSCALARLIST_ITEM_BUF = de.FScalarList.DESCRIPTOR.fields_by_name[
+    'item_buf'
+].number
+_FIELD_FNDARRAY_SHAPE = de.FNdArray.DESCRIPTOR.fields_by_name['shape'].number
+_FIELD_FNDARRAY_ITEM_BUF = de.FNdArray.DESCRIPTOR.fields_by_name['item_buf'].number
+_FIELD_FNDARRAYLIST_NDARRAYS = de.FNdArrayList.DESCRIPTOR.fields_by_name[
+    'ndarrays'
+].number
+
+_WIRE_TYPE_VARINT = 0
+_WIRE_TYPE_LEN = 2
+
+
+def _encode_varint(value: int) -> bytes:
+    if value < 0:
+        # negative int32/int64 are encoded as 10 bytes.
+        value += 1 << 64
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _encode_tag(field_number: int, wire_type: int) -> bytes:
+    return _encode_varint((field_number << 3) | wire_type)
+
+
+def _buf_len(buf) -> int:
+    return buf.nbytes if isinstance(buf, (np.ndarray, memoryview)) else len(buf)
+
+
+def _encode_len_delimited(field_number: int, parts: List) -> List:
+    return [
+        _encode_tag(field_number, _WIRE_TYPE_LEN),
+        _encode_varint(sum(_buf_len(part) for part in parts)),
+        *parts,
+    ]
+
+
+def _encode_scalar_type(scalar_type: de.ScalarType) -> List:
+    if scalar_type == 0:
+        # default value is not serialized in proto3.
+        return []
+    return [
+        _encode_tag(_FIELD_SCALAR_TYPE, _WIRE_TYPE_VARINT),
+        _encode_varint(scalar_type),
+    ]
+
+
+def _as_bytes_view(data: Union[np.ndarray, jax.numpy.ndarray]) -> np.ndarray:
+    # a flat uint8 view, which shares memory with data if it is contiguous.
+    data = np.ascontiguousarray(data)
+    if data.dtype.byteorder == '>':
+        data = data.astype(data.dtype.newbyteorder('<'))
+    return data.reshape(-1).view(np.uint8)
+
+
+def _encode_fndarray(data: Union[np.ndarray, jax.numpy.ndarray]) -> List:
+    parts = []
+    if len(data.shape) > 0:
+        parts += _encode_len_delimited(
+            _FIELD_FNDARRAY_SHAPE, [b''.join(_encode_varint(d) for d in data.shape)]
+        )
+    item_buf = _as_bytes_view(data)
+    if item_buf.nbytes > 0:
+        parts += _encode_len_delimited(_FIELD_FNDARRAY_ITEM_BUF, [item_buf])
+    return parts
+
+
+def _encode_scalar_list(
+    scalar_type: de.ScalarType, item_count: int, items: np.ndarray
+) -> List:
+    scalar_list = []
+    if item_count > 0:
+        scalar_list += [
+            _encode_tag(_FIELD_FSCALARLIST_ITEM_COUNT, _WIRE_TYPE_VARINT),
+            _encode_varint(item_count),
+        ]
+    item_buf = _as_bytes_view(items)
+    if item_buf.nbytes > 0:
+        scalar_list += _encode_len_delimited(_FIELD_FSCALARLIST_ITEM_BUF, [item_buf])
+    parts = _encode_scalar_type(scalar_type)
+    parts += _encode_len_delimited(_FIELD_F_SCALAR_LIST, scalar_list)
+    return parts
+
+
 def _get_int_size(data: int, signed: bool) -> int:
     if signed:
         return (8 + (data + (data < 0)).bit_length()) // 8
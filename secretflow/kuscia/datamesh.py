@@ -14,6 +14,11 @@
 
 
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable
 
 import grpc
 import pyarrow as pa
@@ -44,12 +49,23 @@ from kuscia.proto.api.v1alpha1.datamesh.flightdm_pb2 import (
     FileWriteOptions,
 )
 
+from secretflow.data.core.arrow.util import to_arrow_table
+from secretflow.data.core.partition import Partition, partition
+from secretflow.device import PYU, PYUObject
+
 DEFAULT_GENERIC_OPTIONS = [("GRPC_ARG_KEEPALIVE_TIME_MS", 60000)]
 
 DEFAULT_FLIGHT_CALL_OPTIONS = flight.FlightCallOptions(
     timeout=10
 )  # timeout unit is second.
 
+DEFAULT_FLIGHT_READ_WORKERS = 4
+
+# batches buffered by the reader thread of an endpoint.
+_ENDPOINT_QUEUE_SIZE = 8
+
+_END_OF_ENDPOINT = object()
+
 
 def create_channel(address: str):
     env_client_cert_file = os.environ.get("CLIENT_CERT_FILE", '')
@@ -122,6 +138,9 @@ def get_domain_data_source(
 
 
 def create_dm_flight_client(dm_address: str):
+    if dm_address.startswith("grpc://"):
+        # an explicit insecure location, e.g. a datamesh in the same host.
+        return flight.connect(dm_address, generic_options=DEFAULT_GENERIC_OPTIONS)
     client_cert_path = os.environ.get("CLIENT_CERT_FILE", '')
     client_key_path = os.environ.get("CLIENT_PRIVATE_KEY_FILE", '')
     trusted_ca_path = os.environ.get("TRUSTED_CA_FILE", '')
@@ -140,42 +159,174 @@ def create_dm_flight_client(dm_address: str):
         return dm_flight_client
 
 
-def get_csv_from_dp(
-    dm_flight_client,
-    domain_data_id: str,
-    output_file_path: str,
-):
-    domain_data_query = CommandDomainDataQuery(
-        domaindata_id=domain_data_id,
-    )
-
+def _get_flight_info(dm_flight_client, command) -> flight.FlightInfo:
     any = Any()
-    any.Pack(domain_data_query)
+    any.Pack(command)
 
     descriptor = flight.FlightDescriptor.for_command(any.SerializeToString())
 
-    flight_info = dm_flight_client.get_flight_info(
+    return dm_flight_client.get_flight_info(
         descriptor=descriptor, options=DEFAULT_FLIGHT_CALL_OPTIONS
     )
 
-    dp_uri = flight_info.endpoints[0].locations[0]
-    ticket = flight_info.endpoints[0].ticket
-
-    dp_flight_client = flight.connect(dp_uri, generic_options=DEFAULT_GENERIC_OPTIONS)
-    flight_reader = dp_flight_client.do_get(ticket=ticket).to_reader()
-
-    # NOTE(junfeng): use pandas to write csv since pyarrow will add quotes in headers.
-    # FIXME: BUG io should running in pyu device context, not in driver context.
-    for batch in flight_reader:
-        batch_pd = batch.to_pandas()
-        batch_pd.to_csv(
-            output_file_path,
-            index=False,
-            mode='a',
-            header=not os.path.exists(output_file_path),
-        )
 
-    dp_flight_client.close()
+class FlightClientPool:
+    """Flight clients of data proxies keyed by location.
+
+    A pool could be shared by all reads and writes of a task, so connection to
+    a data proxy is set up only once. Clients are thread safe.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, location) -> flight.FlightClient:
+        key = getattr(location, "uri", location)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = flight.connect(
+                    location, generic_options=DEFAULT_GENERIC_OPTIONS
+                )
+                self._clients[key] = client
+            return client
+
+    def close(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _endpoint_client(dm_flight_client, endpoint, client_pool: FlightClientPool):
+    # an endpoint without locations is served by the datamesh itself.
+    if not endpoint.locations:
+        return dm_flight_client
+    return client_pool.get(endpoint.locations[0])
+
+
+def _read_endpoint(client, ticket, out: queue.Queue, stopped: threading.Event):
+    def _put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    if stopped.is_set():
+        return
+    try:
+        stream = client.do_get(ticket)
+        reader = stream.to_reader()
+        if not _put(reader.schema):
+            stream.cancel()
+            return
+        for batch in reader:
+            if not _put(batch):
+                stream.cancel()
+                return
+        _put(_END_OF_ENDPOINT)
+    except Exception as e:
+        _put(e)
+
+
+def read_batches_from_dp(
+    dm_flight_client,
+    domain_data_id: str,
+    client_pool: FlightClientPool = None,
+    max_workers: int = DEFAULT_FLIGHT_READ_WORKERS,
+) -> pa.RecordBatchReader:
+    """Stream a domain data from data proxies as arrow record batches.
+
+    Endpoints of the domain data are read in parallel by at most max_workers
+    threads, each of them buffers a few batches ahead, while batches are
+    returned in the order of endpoints. Threads are stopped once the returned
+    reader is exhausted or released.
+    """
+    flight_info = _get_flight_info(
+        dm_flight_client, CommandDomainDataQuery(domaindata_id=domain_data_id)
+    )
+    endpoints = flight_info.endpoints
+    if not endpoints:
+        return pa.RecordBatchReader.from_batches(flight_info.schema, [])
+
+    owned_pool = client_pool is None
+    if owned_pool:
+        client_pool = FlightClientPool()
+    stopped = threading.Event()
+    queues = [queue.Queue(_ENDPOINT_QUEUE_SIZE) for _ in endpoints]
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(endpoints))))
+
+    def _cleanup():
+        stopped.set()
+        executor.shutdown(wait=True)
+        if owned_pool:
+            client_pool.close()
+
+    def _next(q: queue.Queue):
+        item = q.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    try:
+        for endpoint, q in zip(endpoints, queues):
+            client = _endpoint_client(dm_flight_client, endpoint, client_pool)
+            executor.submit(_read_endpoint, client, endpoint.ticket, q, stopped)
+        schema = _next(queues[0])
+    except BaseException:
+        _cleanup()
+        raise
+
+    def _batches():
+        try:
+            for i, q in enumerate(queues):
+                if i > 0:
+                    endpoint_schema = _next(q)
+                    if not endpoint_schema.equals(schema):
+                        raise RuntimeError(
+                            f"schema of endpoint {i} of {domain_data_id} "
+                            f"{endpoint_schema} does not match {schema}"
+                        )
+                while True:
+                    item = _next(q)
+                    if item is _END_OF_ENDPOINT:
+                        break
+                    yield item
+        finally:
+            _cleanup()
+
+    return pa.RecordBatchReader.from_batches(schema, _batches())
+
+
+def get_csv_from_dp(
+    dm_flight_client,
+    domain_data_id: str,
+    output_file_path: str,
+    client_pool: FlightClientPool = None,
+):
+    reader = read_batches_from_dp(dm_flight_client, domain_data_id, client_pool)
+
+    Path(output_file_path).parent.mkdir(parents=True, exist_ok=True)
+    # NOTE(junfeng): use pandas to write csv since pyarrow will add quotes in
+    # headers and strings, and writes bools as true/false.
+    with open(output_file_path, 'w', newline='') as f:
+        header = True
+        for batch in reader:
+            batch.to_pandas().to_csv(f, index=False, header=header)
+            header = False
+        if header:
+            reader.schema.empty_table().to_pandas().to_csv(f, index=False)
 
 
 def create_domain_data_in_dp(
@@ -216,12 +367,18 @@ def create_domain_data_in_dp(
         assert action_response.response.status.message == "success"
 
 
-def put_data_to_dp(
+def put_batches_to_dp(
     dm_flight_client,
     domaindata_id: str,
-    file_local_path: str,
-    file_format: FileFormat,
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch],
+    file_format: FileFormat = FileFormat.CSV,
+    client_pool: FlightClientPool = None,
 ):
+    """Stream arrow record batches into a domain data through data proxy.
+
+    For FileFormat.BINARY, schema must be a single binary column.
+    """
     if file_format == FileFormat.CSV:
         command_domain_data_update = CommandDomainDataUpdate(
             domaindata_id=domaindata_id,
@@ -229,14 +386,44 @@ def put_data_to_dp(
                 csv_options=CSVWriteOptions(field_delimiter=",")
             ),
         )
-        # FIXME: BUG io should running in pyu device context, not in driver context.
-        reader = csv.open_csv(file_local_path)
-        schema = reader.schema
     elif file_format == FileFormat.BINARY:
         command_domain_data_update = CommandDomainDataUpdate(
             domaindata_id=domaindata_id,
             content_type=ContentType.RAW,
         )
+    else:
+        raise AttributeError(f"unknown file_format {file_format}")
+
+    flight_info = _get_flight_info(dm_flight_client, command_domain_data_update)
+    endpoint = flight_info.endpoints[0]
+
+    owned_pool = client_pool is None
+    if owned_pool:
+        client_pool = FlightClientPool()
+    try:
+        dp_flight_client = _endpoint_client(dm_flight_client, endpoint, client_pool)
+        descriptor = flight.FlightDescriptor.for_command(endpoint.ticket.ticket)
+        flight_writer, _ = dp_flight_client.do_put(descriptor=descriptor, schema=schema)
+        for batch in batches:
+            flight_writer.write(batch)
+        flight_writer.close()
+    finally:
+        if owned_pool:
+            client_pool.close()
+
+
+def put_data_to_dp(
+    dm_flight_client,
+    domaindata_id: str,
+    file_local_path: str,
+    file_format: FileFormat,
+    client_pool: FlightClientPool = None,
+):
+    if file_format == FileFormat.CSV:
+        # FIXME: BUG io should running in pyu device context, not in driver context.
+        reader = csv.open_csv(file_local_path)
+        schema = reader.schema
+    elif file_format == FileFormat.BINARY:
         bin_col_name = "bin_data"
 
         # FIXME: BUG io should running in pyu device context, not in driver context.
@@ -258,26 +445,88 @@ def put_data_to_dp(
     else:
         raise AttributeError(f"unknown file_format {file_format}")
 
-    any = Any()
-    any.Pack(command_domain_data_update)
+    try:
+        put_batches_to_dp(
+            dm_flight_client, domaindata_id, schema, reader, file_format, client_pool
+        )
+    finally:
+        reader.close()
 
-    descriptor = flight.FlightDescriptor.for_command(any.SerializeToString())
 
-    flight_info = dm_flight_client.get_flight_info(
-        descriptor=descriptor, options=DEFAULT_FLIGHT_CALL_OPTIONS
+def _read_dp_source(
+    dm_address: str, domain_data_id: str, output_backend: str, max_workers: int
+):
+    dm_flight_client = create_dm_flight_client(dm_address)
+    try:
+        with FlightClientPool() as client_pool:
+            reader = read_batches_from_dp(
+                dm_flight_client, domain_data_id, client_pool, max_workers
+            )
+            if output_backend == "arrow":
+                # spilled to a memory mapped file, see to_arrow_table.
+                return to_arrow_table(reader)
+            table = reader.read_all()
+    finally:
+        dm_flight_client.close()
+    if output_backend == "polars":
+        import polars as pl
+
+        return pl.from_arrow(table)
+    return table.to_pandas()
+
+
+def load_partition_from_dp(
+    device: PYU,
+    dm_address: str,
+    domain_data_id: str,
+    backend: str = "arrow",
+    max_workers: int = DEFAULT_FLIGHT_READ_WORKERS,
+) -> Partition:
+    """Load a domain data into a partition of device.
+
+    Batches are streamed from data proxies into the partition agent of device
+    directly, neither the driver nor a local csv file is involved. The arrow
+    backend keeps memory bounded by spilling batches to a memory mapped file.
+    """
+    return partition(
+        _read_dp_source,
+        device=device,
+        backend=backend,
+        dm_address=dm_address,
+        domain_data_id=domain_data_id,
+        output_backend=backend,
+        max_workers=max_workers,
     )
 
-    dp_uri = flight_info.endpoints[0].locations[0]
-    ticket = flight_info.endpoints[0].ticket
-
-    dp_flight_client = flight.connect(dp_uri, generic_options=DEFAULT_GENERIC_OPTIONS)
 
-    descriptor = flight.FlightDescriptor.for_command(ticket.ticket)
-    flight_writer, _ = dp_flight_client.do_put(descriptor=descriptor, schema=schema)
+def _put_dp_batches(
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch],
+    dm_address: str,
+    domaindata_id: str,
+    file_format: FileFormat,
+):
+    dm_flight_client = create_dm_flight_client(dm_address)
+    try:
+        put_batches_to_dp(dm_flight_client, domaindata_id, schema, batches, file_format)
+    finally:
+        dm_flight_client.close()
+    return True
 
-    for batch in reader:
-        flight_writer.write(batch)
 
-    flight_writer.close()
-    reader.close()
-    dp_flight_client.close()
+def put_partition_to_dp(
+    part: Partition,
+    dm_address: str,
+    domaindata_id: str,
+    file_format: FileFormat = FileFormat.CSV,
+) -> PYUObject:
+    """Stream a partition into a domain data from its partition agent.
+
+    The domain data should have been created by create_domain_data_in_dp.
+    """
+    return part.write_batches(
+        _put_dp_batches,
+        dm_address=dm_address,
+        domaindata_id=domaindata_id,
+        file_format=file_format,
+    )
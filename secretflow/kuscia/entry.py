@@ -23,8 +23,13 @@ from google.protobuf import json_format
 from kuscia.proto.api.v1alpha1.common_pb2 import FileFormat
 from kuscia.proto.api.v1alpha1.datamesh.domaindatasource_pb2 import DomainDataSource
 
+from secretflow.component.component import CompSession, get_active_session
+from secretflow.component.data_utils import write_vertical_table
 from secretflow.component.entry import comp_eval, get_comp_def
+from secretflow.data.vertical import VDataFrame
+from secretflow.device import PYU, wait
 from secretflow.kuscia.datamesh import (
+    FlightClientPool,
     create_channel,
     create_dm_flight_client,
     create_domain_data_in_dm,
@@ -34,7 +39,9 @@ from secretflow.kuscia.datamesh import (
     get_csv_from_dp,
     get_domain_data,
     get_domain_data_source,
+    load_partition_from_dp,
     put_data_to_dp,
+    put_partition_to_dp,
 )
 from secretflow.kuscia.meta_conversion import (
     convert_dist_data_to_domain_data,
@@ -80,6 +87,34 @@ def start_ray(ray_conf: RayConfig):
         )
 
 
+def _load_input_from_dp(
+    session: CompSession,
+    datamesh_addr: str,
+    domain_data_id: str,
+    data_ref: DistData.DataRef,
+    storage_config: StorageConfig,
+):
+    """Load the table of a party from its data proxy into a partition kept by
+    session, so that components get the partition instead of reading the file.
+
+    The table is streamed into the partition agent of the party, which also
+    writes the local file for components opening it by path. No data passes
+    through the driver. Every party loads the tables of all parties, as
+    devices of other parties are run by their own drivers.
+    """
+    pyu = PYU(data_ref.party)
+    part = load_partition_from_dp(pyu, datamesh_addr, domain_data_id, backend="pandas")
+    v_data = VDataFrame({pyu: part})
+    wait(
+        write_vertical_table(
+            v_data,
+            {pyu: os.path.join(storage_config.local_fs.wd, data_ref.uri)},
+            data_ref.format.lower(),
+        )
+    )
+    session.put_table(data_ref.uri, v_data)
+
+
 def preprocess_sf_node_eval_param(
     task_conf: KusciaTaskConfig,
     datamesh_addr: str,
@@ -101,9 +136,13 @@ def preprocess_sf_node_eval_param(
 
     # get input DistData from GRM
 
+    # in a component session, inputs are loaded into partitions, otherwise
+    # they are downloaded to local files by the driver.
+    session = get_active_session()
     if len(sf_input_ids):
-        if not datasource.access_directly:
+        if not datasource.access_directly and session is None:
             dm_flight_client = create_dm_flight_client(datamesh_addr)
+            dp_client_pool = FlightClientPool()
 
         param.ClearField('inputs')
         for id, input_def in zip(sf_input_ids, list(comp_def.inputs)):
@@ -135,16 +174,22 @@ def preprocess_sf_node_eval_param(
                 ], "only support tables."
 
                 for data_ref in list(dist_data.data_refs):
-                    if data_ref.party == task_conf.party_name:
+                    if session is not None:
+                        _load_input_from_dp(
+                            session, datamesh_addr, id, data_ref, storage_config
+                        )
+                    elif data_ref.party == task_conf.party_name:
                         get_csv_from_dp(
                             dm_flight_client,
                             id,
                             os.path.join(
                                 storage_config.local_fs.wd, domain_data.relative_uri
                             ),
+                            dp_client_pool,
                         )
 
-        if not datasource.access_directly:
+        if not datasource.access_directly and session is None:
+            dp_client_pool.close()
             dm_flight_client.close()
 
     if len(sf_output_uris):
@@ -206,8 +251,13 @@ def postprocess_sf_node_eval_result(
 ) -> None:
     # write output DistData to GRM
     if sf_output_ids is not None and len(sf_output_ids) > 0:
+        session = get_active_session()
+        # tables kept by the component session are streamed from partitions,
+        # others are uploaded from local files by the driver.
+        put_partitions = []
         if not datasource.access_directly:
             dm_flight_client = create_dm_flight_client(datamesh_addr)
+            dp_client_pool = FlightClientPool()
 
         for domain_data_id, dist_data, output_uri in zip(
             sf_output_ids, res.outputs, sf_output_uris
@@ -227,12 +277,33 @@ def postprocess_sf_node_eval_result(
                         create_domain_data_in_dp(
                             dm_flight_client, domain_data, FileFormat.CSV
                         )
+
+                for data_ref in list(dist_data.data_refs):
+                    table = (
+                        session.get_table(data_ref.party, data_ref.uri)
+                        if session is not None
+                        else None
+                    )
+                    if table is not None:
+                        # every party streams its own partition, as in loading.
+                        put_partitions.append(
+                            put_partition_to_dp(
+                                table[0], datamesh_addr, domain_data_id, FileFormat.CSV
+                            )
+                        )
+                    elif data_ref.party == task_conf.party_name:
                         path = os.path.join(storage_config.local_fs.wd, data_ref.uri)
                         put_data_to_dp(
-                            dm_flight_client, domain_data_id, path, FileFormat.CSV
+                            dm_flight_client,
+                            domain_data_id,
+                            path,
+                            FileFormat.CSV,
+                            dp_client_pool,
                         )
 
         if not datasource.access_directly:
+            wait(put_partitions)
+            dp_client_pool.close()
             dm_flight_client.close()
 
 
@@ -261,32 +332,35 @@ def main(task_config_path, datamesh_addr):
     storage_config = get_storage_config(task_conf, datasource)
 
     domaindata_stub = create_domain_data_service_stub(datamesh_channel)
-    sf_node_eval_param = preprocess_sf_node_eval_param(
-        task_conf,
-        datamesh_addr,
-        task_conf.sf_node_eval_param,
-        datasource,
-        storage_config,
-        domaindata_stub,
-        task_conf.sf_input_ids,
-        task_conf.sf_output_uris,
-    )
-
     sf_cluster_config = get_sf_cluster_config(task_conf)
 
-    res = comp_eval(sf_node_eval_param, storage_config, sf_cluster_config)
-
-    postprocess_sf_node_eval_result(
-        task_conf,
-        res,
-        datasource,
-        storage_config,
-        datamesh_addr,
-        domaindata_stub,
-        task_conf.party_name,
-        task_conf.sf_output_ids,
-        task_conf.sf_output_uris,
-    )
+    # the cluster is set up before inputs are loaded into partitions, and
+    # outputs are streamed from partitions before it is shut down.
+    with CompSession(sf_cluster_config):
+        sf_node_eval_param = preprocess_sf_node_eval_param(
+            task_conf,
+            datamesh_addr,
+            task_conf.sf_node_eval_param,
+            datasource,
+            storage_config,
+            domaindata_stub,
+            task_conf.sf_input_ids,
+            task_conf.sf_output_uris,
+        )
+
+        res = comp_eval(sf_node_eval_param, storage_config, sf_cluster_config)
+
+        postprocess_sf_node_eval_result(
+            task_conf,
+            res,
+            datasource,
+            storage_config,
+            datamesh_addr,
+            domaindata_stub,
+            task_conf.party_name,
+            task_conf.sf_output_ids,
+            task_conf.sf_output_uris,
+        )
 
     logging.info("Succeeded to run component.")
 
@@ -0,0 +1,164 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checkpoints of boosting state in the local storage of each party.
+
+Every party owns a checkpoint root directory. The state after n trees is
+written into checkpoint_<n> under the roots, then checkpoint.json of every
+root is updated to n. Older checkpoints are removed only after all parties
+have updated checkpoint.json, so the checkpoint of the minimum tree number
+recorded by parties is always complete.
+
+Quantization results (order map and split points) of a party are cached in
+order_map.npz, so a resumed training does not quantize the dataset again.
+"""
+
+import json
+import os
+import pickle
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from secretflow.device import PYU, reveal, wait
+
+CHECKPOINT_META = "checkpoint.json"
+ORDER_MAP_CACHE = "order_map.npz"
+
+
+def checkpoint_dir(root: str, tree_num: int) -> str:
+    return os.path.join(root, f"checkpoint_{tree_num}")
+
+
+def read_checkpoint_tree_num(root: str) -> int:
+    """Tree number of the last checkpoint under root, 0 if there is none."""
+    path = os.path.join(root, CHECKPOINT_META)
+    if not os.path.isfile(path):
+        return 0
+    with open(path, 'r') as f:
+        return int(json.load(f)['tree_num'])
+
+
+def write_checkpoint_meta(root: str, tree_num: int):
+    Path(root).mkdir(parents=True, exist_ok=True)
+    path = os.path.join(root, CHECKPOINT_META)
+    with open(path + '.tmp', 'w') as f:
+        json.dump({'tree_num': tree_num}, f)
+    os.replace(path + '.tmp', path)
+
+
+def remove_stale_checkpoints(root: str, tree_num: int):
+    """Remove checkpoints under root except the one of tree_num."""
+    if not os.path.isdir(root):
+        return
+    keep = os.path.basename(checkpoint_dir(root, tree_num))
+    for name in os.listdir(root):
+        if name.startswith("checkpoint_") and name != keep:
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def pickle_dump(path: str, obj: Any):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump(obj, f)
+
+
+def pickle_load(path: str) -> Any:
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def save_order_map_cache(
+    root: str,
+    order_map: np.ndarray,
+    split_points: List[List[float]],
+    feature_buckets: List[int],
+    buckets: int,
+):
+    """Cache the quantization of a partition under root.
+
+    Split points of a feature are as many as its buckets, they are saved
+    in one flat array.
+    """
+    Path(root).mkdir(parents=True, exist_ok=True)
+    path = os.path.join(root, ORDER_MAP_CACHE)
+    # np.savez appends .npz to file names without it.
+    tmp_path = path + '.tmp.npz'
+    np.savez(
+        tmp_path,
+        order_map=order_map,
+        split_points=np.array(
+            [p for points in split_points for p in points], dtype=np.float64
+        ),
+        feature_buckets=np.array(feature_buckets, dtype=np.int64),
+        buckets=np.array(buckets, dtype=np.int64),
+    )
+    os.replace(tmp_path, path)
+
+
+def load_order_map_cache(
+    root: str, shape: Tuple[int, int], buckets: int
+) -> Union[None, Tuple[np.ndarray, List[List[float]], List[int]]]:
+    """Load the quantization cached under root.
+
+    Returns:
+        (order_map, split_points, feature_buckets), None if there is no cache
+        or the cache does not match the shape of dataset or the buckets.
+    """
+    path = os.path.join(root, ORDER_MAP_CACHE)
+    if not os.path.isfile(path):
+        return None
+    with np.load(path) as cache:
+        if (
+            tuple(cache['order_map'].shape) != tuple(shape)
+            or int(cache['buckets']) != buckets
+        ):
+            return None
+        order_map = np.asfortranarray(cache['order_map'])
+        feature_buckets = cache['feature_buckets'].tolist()
+        offsets = np.cumsum([0] + feature_buckets)
+        flat = cache['split_points'].tolist()
+    split_points = [
+        flat[offsets[i] : offsets[i + 1]] for i in range(len(feature_buckets))
+    ]
+    return order_map, split_points, feature_buckets
+
+
+def latest_checkpoint(roots: Dict[PYU, str]) -> int:
+    """The tree number of the last checkpoint which is complete at all parties."""
+    return min(
+        reveal(
+            [device(read_checkpoint_tree_num)(root) for device, root in roots.items()]
+        )
+    )
+
+
+def commit_checkpoint(roots: Dict[PYU, str], tree_num: int):
+    """Mark the checkpoint of tree_num as the latest one at all parties, then
+    remove older ones. State of the checkpoint must have been written.
+    """
+    wait(
+        [
+            device(write_checkpoint_meta)(root, tree_num)
+            for device, root in roots.items()
+        ]
+    )
+    wait(
+        [
+            device(remove_stale_checkpoints)(root, tree_num)
+            for device, root in roots.items()
+        ]
+    )
@@ -107,7 +107,6 @@ class FedBooster(xgb_core.Booster):
             else 1.0,
             base_score=params['base_score'] if 'base_score' in params else 0.5,
             random_state=params['random_state'] if 'random_state' in params else 1234,
-            num_parallel=params['n_thread'] if 'n_thread' in params else None,
             subsample=params['subsample'] if 'subsample' in params else 1.0,
             decimal=params['decimal'] if 'decimal' in params else 10,
             num_class=params['num_class'] if 'num_class' in params else 0,
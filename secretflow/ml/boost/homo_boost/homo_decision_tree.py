@@ -18,17 +18,13 @@
 
 """ Homo Decision Tree """
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 
 import numpy as np
 import pandas as pd
 import secretflow.device.link as link
 from secretflow.ml.boost.homo_boost.tree_core.decision_tree import DecisionTree
-from secretflow.ml.boost.homo_boost.tree_core.feature_histogram import (
-    FeatureHistogram,
-    HistogramBag,
-)
+from secretflow.ml.boost.homo_boost.tree_core.feature_histogram import HistogramBag
 from secretflow.ml.boost.homo_boost.tree_core.node import Node
 from secretflow.ml.boost.homo_boost.tree_param import TreeParam
 
@@ -174,35 +170,9 @@ class HomoDecisionTree(DecisionTree):
                 weight=self.splitter.node_weight(g_sum, h_sum),
                 sample_num=len(self.data),
             )
+            self.bin_data()
             self.cur_layer_node = [root_node]
-            self.cur_layer_datas = [self.data]
-
-    @staticmethod
-    def cal_local_hist_bags(
-        cur_to_split,
-        cur_data_frame,
-        bin_split_points,
-        valid_features,
-        use_missing,
-        grad_key,
-        hess_key,
-        thread_pool,
-    ):
-        local_histograms = FeatureHistogram.calculate_histogram(
-            data_frame_list=cur_data_frame,
-            bin_split_points=bin_split_points,
-            valid_features=valid_features,
-            use_missing=use_missing,
-            grad_key=grad_key,
-            hess_key=hess_key,
-            thread_pool=thread_pool,
-        )
-        local_hist_bags = []
-        for idx, node in enumerate(cur_to_split):
-            local_hist_bags.append(
-                HistogramBag(local_histograms[idx], node.id, node.parent_nodeid)
-            )
-        return local_hist_bags
+            self.cur_layer_rows = [np.arange(len(self.data))]
 
     def cal_split_info_list(self, agg_histograms):
         if self.role == link.SERVER:
@@ -233,9 +203,6 @@ class HomoDecisionTree(DecisionTree):
 
     def fit(self):
         """Enter for homo decision tree"""
-        # setup thread pool
-        thread_pool = ThreadPoolExecutor(max_workers=self.num_parallel)
-
         logging.debug(
             'begin to fit local decision tree, tree id {}'.format(self.tree_id)
         )
@@ -257,22 +224,19 @@ class HomoDecisionTree(DecisionTree):
                 break
             if self.role == link.CLIENT:
                 logging.debug(f'start to fit layer {dep}')
-                agg_local_histograms = []
-
-                for batch_id, idx in enumerate(
-                    range(0, len(self.cur_layer_node), self.max_split_nodes)
-                ):
-                    local_hist_bags = HomoDecisionTree.cal_local_hist_bags(
-                        self.cur_layer_node[idx : idx + self.max_split_nodes],
-                        self.cur_layer_datas[idx : idx + self.max_split_nodes],
-                        self.bin_split_points,
-                        self.valid_features,
-                        self.use_missing,
-                        self.grad_key,
-                        self.hess_key,
-                        thread_pool,
+                local_histograms = self.cal_layer_histograms(
+                    self.cur_layer_node, self.cur_layer_rows
+                )
+                agg_local_histograms = [
+                    HistogramBag(
+                        self.binned_data.to_feature_histogram(
+                            histogram, self.valid_features, self.use_missing
+                        ),
+                        node.id,
+                        node.parent_nodeid,
                     )
-                    agg_local_histograms.extend(local_hist_bags)
+                    for node, histogram in zip(self.cur_layer_node, local_histograms)
+                ]
 
                 link.send_to_server(
                     name=self.key("agg_local_histograms"),
@@ -290,14 +254,13 @@ class HomoDecisionTree(DecisionTree):
             )
 
             if self.role == link.CLIENT:
-                new_layer_node, new_layer_data = self.update_tree(
-                    self.cur_layer_node, self.split_info_list, self.cur_layer_datas
+                new_layer_node, new_layer_rows = self.update_tree(
+                    self.cur_layer_node, self.split_info_list, self.cur_layer_rows
                 )
                 self.cur_layer_node = new_layer_node
-                self.cur_layer_datas = new_layer_data
+                self.cur_layer_rows = new_layer_rows
 
             self._sync_version += 1
-        thread_pool.shutdown()
         if self.role == link.CLIENT:
             self.convert_bin_to_real()
             logging.debug(
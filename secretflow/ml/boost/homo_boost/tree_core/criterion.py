@@ -22,6 +22,8 @@ import math
 from abc import abstractmethod
 from typing import Tuple
 
+import numpy as np
+
 
 class Criterion(abc.ABC):
     """Base class for split criterion"""
@@ -117,6 +119,45 @@ class XgboostCriterion(Criterion):
         gain = reg_grad * reg_grad / (sum_hess + self.reg_lambda)
         return self.truncate(gain, decimal=self.decimal)
 
+    @staticmethod
+    def truncate_array(f: np.ndarray, decimal=10) -> np.ndarray:
+        """Vectorized truncate"""
+        scale = float(10**decimal)
+        return np.floor(f * scale) / scale
+
+    def node_gain_array(self, sum_grad: np.ndarray, sum_hess: np.ndarray) -> np.ndarray:
+        """Vectorized node_gain on arrays of sum of gradient and hessian"""
+        grad = self.truncate_array(sum_grad, decimal=self.decimal)
+        hess = self.truncate_array(sum_hess, decimal=self.decimal)
+        reg_grad = np.where(
+            grad < -self.reg_alpha,
+            grad + self.reg_alpha,
+            np.where(grad > self.reg_alpha, grad - self.reg_alpha, 0.0),
+        )
+        gain = self.truncate_array(
+            reg_grad * reg_grad / (hess + self.reg_lambda), decimal=self.decimal
+        )
+        return np.where(sum_hess < 0, 0.0, gain)
+
+    def split_gain_array(
+        self,
+        node_sum: Tuple[np.ndarray, np.ndarray],
+        left_node_sum: Tuple[np.ndarray, np.ndarray],
+        right_node_sum: Tuple[np.ndarray, np.ndarray],
+    ) -> np.ndarray:
+        """Vectorized split_gain, which gives the same gains as split_gain on
+        each element.
+        """
+        sum_grad, sum_hess = node_sum
+        left_node_sum_grad, left_node_sum_hess = left_node_sum
+        right_node_sum_grad, right_node_sum_hess = right_node_sum
+        gain = (
+            self.node_gain_array(left_node_sum_grad, left_node_sum_hess)
+            + self.node_gain_array(right_node_sum_grad, right_node_sum_hess)
+            - self.node_gain_array(sum_grad, sum_hess)
+        )
+        return self.truncate_array(gain, decimal=self.decimal)
+
     def node_weight(self, sum_grad: float, sum_hess: float) -> float:
         """Calculte node weight
         Args:
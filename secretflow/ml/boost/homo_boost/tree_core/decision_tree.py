@@ -24,7 +24,7 @@ import numpy as np
 import pandas
 import xgboost as xgb
 
-from secretflow.ml.boost.homo_boost.tree_core.feature_histogram import FeatureHistogram
+from secretflow.ml.boost.homo_boost.tree_core.feature_histogram import BinnedData
 from secretflow.ml.boost.homo_boost.tree_core.feature_importance import (
     FeatureImportance,
 )
@@ -70,7 +70,6 @@ class DecisionTree(object):
         self.min_sample_split = tree_param.min_sample_split
         self.min_impurity_split = tree_param.gamma
         self.min_leaf_node = tree_param.min_leaf_node
-        self.max_split_nodes = tree_param.max_split_nodes
         self.feature_importance_type = tree_param.importance_type
         self.objective = tree_param.objective
         self.learning_rate = tree_param.eta
@@ -85,10 +84,9 @@ class DecisionTree(object):
         self.feature_importance = {}
         self.tree_node = []
         self.cur_layer_nodes = []
-        self.cur_layer_datas = []
+        self.cur_layer_rows = []
         self.cur_to_split_nodes = []
         self.tree_node_num = 0
-        self.num_parallel = tree_param.num_parallel
         self.splitter = Splitter(
             self.criterion_method,
             self.criterion_params,
@@ -101,7 +99,9 @@ class DecisionTree(object):
         self.bin_split_points = bin_split_points
         self.valid_features = None
         # histogram
-        self.hist_computer = FeatureHistogram()
+        self.binned_data = None
+        # node id -> flat histogram of the last layer
+        self.layer_histograms = {}
 
         # tree idx
         self.tree_id = tree_id
@@ -174,6 +174,56 @@ class DecisionTree(object):
         sum_hess = data_frame[self.hess_key].sum()
         return sum_grad, sum_hess
 
+    def bin_data(self):
+        """Bucketize features of training data once for building the tree"""
+        self.binned_data = BinnedData(
+            self.data[self.header].to_numpy(),
+            self.data[self.grad_key].to_numpy(),
+            self.data[self.hess_key].to_numpy(),
+            self.bin_split_points,
+        )
+        self.layer_histograms = {}
+
+    def cal_layer_histograms(
+        self, cur_layer_node: List[Node], cur_layer_rows: List[np.ndarray]
+    ) -> List[np.ndarray]:
+        """Calculate flat histograms of nodes in current layer
+
+        Only the smaller one of two siblings is scanned, histogram of the
+        other one is histogram of their parent minus it.
+
+        Args:
+            cur_layer_node: List of nodes in current layer
+            cur_layer_rows: List of row positions in each node
+        Returns:
+            flat histograms of each node
+        """
+        node_rows = {node.id: rows for node, rows in zip(cur_layer_node, cur_layer_rows)}
+
+        def _by_subtraction(node):
+            if (
+                node.parent_nodeid not in self.layer_histograms
+                or node.sibling_nodeid not in node_rows
+            ):
+                return False
+            num, sibling_num = len(node_rows[node.id]), len(
+                node_rows[node.sibling_nodeid]
+            )
+            return num > sibling_num or (num == sibling_num and not node.is_left_node)
+
+        histograms = {}
+        for node in cur_layer_node:
+            if not _by_subtraction(node):
+                histograms[node.id] = self.binned_data.histogram(node_rows[node.id])
+        for node in cur_layer_node:
+            if node.id not in histograms:
+                histograms[node.id] = (
+                    self.layer_histograms[node.parent_nodeid]
+                    - histograms[node.sibling_nodeid]
+                )
+        self.layer_histograms = histograms
+        return [histograms[node.id] for node in cur_layer_node]
+
     def update_feature_importance(self, split_info):
         """Calculate feature importance
         default split count
@@ -213,8 +263,9 @@ class DecisionTree(object):
             sample_num=len(self.data),
         )
 
+        self.bin_data()
         self.cur_layer_node = [root_node]
-        self.cur_layer_datas = [self.data]
+        self.cur_layer_rows = [np.arange(len(self.data))]
 
         tree_height = self.max_depth + 1  # non-leaf node height + 1 layer leaf
         for dep in range(tree_height):
@@ -230,39 +281,25 @@ class DecisionTree(object):
 
             logging.debug(f'start to fit layer {dep}')
 
-            agg_histograms = []
-            for batch_id, i in enumerate(
-                range(0, len(self.cur_layer_node), self.max_split_nodes)
-            ):
-                cur_to_split = self.cur_layer_node[i : i + self.max_split_nodes]
-                cur_data_frame = self.cur_layer_datas[i : i + self.max_split_nodes]
-                assert len(cur_to_split) == len(
-                    cur_data_frame
-                ), "node_to_split and data_frame_list must be aligned"
-                logging.debug(
-                    'computing histogram for batch{} at depth{}'.format(batch_id, dep)
+            agg_histograms = [
+                self.binned_data.to_feature_histogram(
+                    histogram, self.valid_features, self.use_missing
                 )
-                local_histograms = self.hist_computer.calculate_histogram(
-                    data_frame_list=cur_data_frame,
-                    bin_split_points=self.bin_split_points,
-                    valid_features=self.valid_features,
-                    use_missing=self.use_missing,
-                    grad_key=self.grad_key,
-                    hess_key=self.hess_key,
+                for histogram in self.cal_layer_histograms(
+                    self.cur_layer_node, self.cur_layer_rows
                 )
-
-                agg_histograms += local_histograms
+            ]
             split_info_list = self.splitter.find_split(
                 agg_histograms, self.valid_features, self.use_missing
             )
             logging.debug('got best splits from arbiter')
 
-            new_layer_node, new_layer_data = self.update_tree(
-                self.cur_layer_node, split_info_list, self.cur_layer_datas
+            new_layer_node, new_layer_rows = self.update_tree(
+                self.cur_layer_node, split_info_list, self.cur_layer_rows
             )
 
             self.cur_layer_node = new_layer_node
-            self.cur_layer_datas = new_layer_data
+            self.cur_layer_rows = new_layer_rows
 
         self.convert_bin_to_real()
 
@@ -272,22 +309,22 @@ class DecisionTree(object):
         self,
         cur_to_split: List[Node],
         split_info: List[SplitInfo],
-        cur_data_frames: List[pandas.DataFrame],
+        cur_layer_rows: List[np.ndarray],
     ):
         """Tree update function
         Args:
             cur_to_split: List of nodes to be split
             split_info: Global optim split info
-            cur_data_frames: List of dataframe in each node
+            cur_layer_rows: List of row positions in each node
         Returns:
             next_layer_node: List of nodes to be evaluated in the next iteration
-            next_layer_data: List of data to be evaluated in the next iteration
+            next_layer_rows: List of row positions to be evaluated in the next iteration
 
         """
         logging.debug(
             'updating tree_node, cur layer has {} node'.format(len(cur_to_split))
         )
-        next_layer_node, next_layer_data = [], []
+        next_layer_node, next_layer_rows = [], []
 
         assert len(cur_to_split) == len(
             split_info
@@ -302,12 +339,10 @@ class DecisionTree(object):
                 self.tree_node.append(cur_to_split[idx])
                 continue
 
-            cur_data_frame = cur_data_frames[idx]
-
-            best_split_col = self.header[split_info[idx].best_fid]
-            best_split_bin = self.bin_split_points[split_info[idx].best_fid][
-                split_info[idx].best_bid
-            ]
+            # feature value < best split point
+            left_rows, right_rows = self.binned_data.split_rows(
+                cur_layer_rows[idx], split_info[idx].best_fid, split_info[idx].best_bid
+            )
 
             sum_grad = cur_to_split[idx].sum_grad
             sum_hess = cur_to_split[idx].sum_hess
@@ -323,7 +358,6 @@ class DecisionTree(object):
 
             l_g, l_h = split_info[idx].sum_grad, split_info[idx].sum_hess
             # create new left node and new right node
-            left_data = cur_data_frame[cur_data_frame[best_split_col] < best_split_bin]
             left_node = Node(
                 id=l_id,
                 sum_grad=l_g,
@@ -332,11 +366,8 @@ class DecisionTree(object):
                 parent_nodeid=p_id,
                 sibling_nodeid=r_id,
                 is_left_node=True,
-                sample_num=len(left_data),
+                sample_num=len(left_rows),
             )
-            right_data = cur_data_frame[
-                cur_data_frame[best_split_col] >= best_split_bin
-            ]
             right_node = Node(
                 id=r_id,
                 sum_grad=sum_grad - l_g,
@@ -346,20 +377,20 @@ class DecisionTree(object):
                 parent_nodeid=p_id,
                 sibling_nodeid=l_id,
                 is_left_node=False,
-                sample_num=len(right_data),
+                sample_num=len(right_rows),
             )
 
             next_layer_node.append(left_node)
-            next_layer_data.append(left_data)
+            next_layer_rows.append(left_rows)
 
             next_layer_node.append(right_node)
-            next_layer_data.append(right_data)
+            next_layer_rows.append(right_rows)
             cur_to_split[idx].loss_change = split_info[idx].gain
             self.tree_node.append(cur_to_split[idx])
 
             self.update_feature_importance(split_info[idx])
 
-        return next_layer_node, next_layer_data
+        return next_layer_node, next_layer_rows
 
     def init_xgboost_model(self, model_path: str):
         """Init standard xgboost model
@@ -16,11 +16,9 @@
 # limitations under the License.
 
 
-import copy
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from operator import add, sub
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy
 import numpy as np
@@ -28,6 +26,9 @@ import pandas
 
 from secretflow.utils.errors import InvalidArgumentError
 
+# Num of rows scattered by one bincount, limits the size of temporary arrays.
+_ROW_BLOCK_SIZE = 1 << 16
+
 
 @dataclass()
 class HistogramBag(object):
@@ -51,27 +52,14 @@ class HistogramBag(object):
             other
         ), f"Expect two same length factors, but got {len(self.histogram)} and {len(other)}"
 
-        histogram = self.histogram
-        new_histogram = None
-        if not inplace:
-            new_histogram = copy.deepcopy(other)
-            histogram = new_histogram.histogram
-        for f_idx in range(len(self.histogram)):
-            for hist_idx in range(len(self.histogram[f_idx])):
-                # grad
-                histogram[f_idx][hist_idx][0] = func(
-                    self.histogram[f_idx][hist_idx][0], other[f_idx][hist_idx][0]
-                )
-                # hess
-                histogram[f_idx][hist_idx][1] = func(
-                    self.histogram[f_idx][hist_idx][1], other[f_idx][hist_idx][1]
-                )
-                # sample
-                histogram[f_idx][hist_idx][2] = func(
-                    self.histogram[f_idx][hist_idx][2], other[f_idx][hist_idx][2]
-                )
-
-        return self if inplace else new_histogram
+        histogram = [
+            func(np.asarray(s_hist, dtype=np.float64), np.asarray(o_hist))
+            for s_hist, o_hist in zip(self.histogram, other.histogram)
+        ]
+        if inplace:
+            self.histogram = histogram
+            return self
+        return HistogramBag(histogram, other.hid, other.p_hid)
 
     def __add__(self, other):
         return self.binary_op(other, add, inplace=False)
@@ -92,196 +80,167 @@ class HistogramBag(object):
         return str(self.histogram)
 
 
-class FeatureHistogram:
-    """Feature Histogram"""
+def _bucket_dtype(num_buckets: int):
+    for dtype in (np.uint8, np.uint16):
+        if num_buckets <= np.iinfo(dtype).max + 1:
+            return dtype
+    return np.uint32
 
-    @staticmethod
-    def _cal_histogram_once(
-        data_frame,
-        bin_split_points,
-        valid_features,
-        use_missing,
-        grad_key,
-        hess_key,
-        thread_pool,
+
+class BinnedData:
+    """Features bucketized by the global bin split points.
+
+    Features are bucketized once, then the histogram of any node is computed by
+    scatter-adding grad and hess of its rows into buckets. The bucket of value
+    x is the num of split points not greater than x, so x < split_points[bid]
+    iff bucket <= bid. Missing values fall into the last bucket.
+
+    Attributes:
+        bins: bucket of each value, with shape (num of rows, num of features)
+        grad: grad of each row
+        hess: hess of each row
+        num_buckets: num of buckets of each feature, num of split points + 1
+        offsets: offset of the first bucket of each feature in flat histogram
+    """
+
+    def __init__(
+        self,
+        features: np.ndarray,
+        grad: np.ndarray,
+        hess: np.ndarray,
+        bin_split_points: List,
     ):
-        if len(data_frame) == 0:
-            f_histogram = FeatureHistogram._generate_empty_histogram(
-                bin_split_points, valid_features, 1 if use_missing else 0
-            )
-        else:
-            f_histogram = FeatureHistogram._node_calculate_histogram(
-                data_frame,
-                bin_split_points=bin_split_points,
-                valid_features=valid_features,
-                use_missing=use_missing,
-                grad_key=grad_key,
-                hess_key=hess_key,
-                thread_pool=thread_pool,
+        features = np.asarray(features)
+        assert features.shape[1] >= len(
+            bin_split_points
+        ), f"Expect at least {len(bin_split_points)} features, but got {features.shape[1]}"
+        self.num_buckets = np.array(
+            [len(points) + 1 for points in bin_split_points], dtype=np.int64
+        )
+        self.offsets = np.concatenate([[0], np.cumsum(self.num_buckets)[:-1]]).astype(
+            np.int64
+        )
+        self.total_buckets = int(self.num_buckets.sum())
+        self.bins = np.empty(
+            (features.shape[0], len(bin_split_points)),
+            dtype=_bucket_dtype(int(self.num_buckets.max(initial=1))),
+        )
+        for fid, points in enumerate(bin_split_points):
+            self.bins[:, fid] = np.searchsorted(
+                np.asarray(points, dtype=np.float64),
+                features[:, fid].astype(np.float64),
+                side="right",
             )
-        return f_histogram
+        self.grad = np.asarray(grad, dtype=np.float64)
+        self.hess = np.asarray(hess, dtype=np.float64)
 
-    @staticmethod
-    def calculate_histogram(
-        data_frame_list: List[pandas.DataFrame],
-        bin_split_points: numpy.ndarray,
-        valid_features: Dict = None,
-        use_missing: bool = False,
-        grad_key: str = "grad",
-        hess_key: str = "hess",
-        thread_pool: ThreadPoolExecutor = None,
-    ):
-        """
-        Calculate histogram according to G and H
-        histogram: [cols,[buckets,[sum_g,sum_h,count]]
+    def __len__(self):
+        return self.bins.shape[0]
+
+    def histogram(self, rows: np.ndarray = None) -> np.ndarray:
+        """Sum of grad, hess and count of rows in each bucket
 
         Args:
-            data_frame_list: A list of data frame, which contain grad and hess
-            bin_split_points: global split point dicts
-            valid_features: valid feature names Dict[id:bool]
-            use_missing: whether missing value participate in train
-            grad_key: unique column name for grad value
-            hess_key: unique column name for hess value
+            rows: positions of rows in node, all rows if None
         Returns:
-            node_histograms:一个List[histogram1, histogram2, ...]
+            flat histogram of all features, with shape (total buckets, 3)
         """
-        node_histograms = []
-        for data_frame in data_frame_list:
-            node_histograms.append(
-                FeatureHistogram._cal_histogram_once(
-                    data_frame,
-                    bin_split_points,
-                    valid_features,
-                    use_missing,
-                    grad_key,
-                    hess_key,
-                    thread_pool,
-                )
+        if rows is None:
+            rows = np.arange(len(self))
+        num_features = self.bins.shape[1]
+        hist = np.zeros((self.total_buckets, 3))
+        for start in range(0, len(rows), _ROW_BLOCK_SIZE):
+            block = rows[start : start + _ROW_BLOCK_SIZE]
+            flat_bins = (self.bins[block] + self.offsets).ravel()
+            hist[:, 0] += np.bincount(
+                flat_bins,
+                weights=np.repeat(self.grad[block], num_features),
+                minlength=self.total_buckets,
             )
+            hist[:, 1] += np.bincount(
+                flat_bins,
+                weights=np.repeat(self.hess[block], num_features),
+                minlength=self.total_buckets,
+            )
+            hist[:, 2] += np.bincount(flat_bins, minlength=self.total_buckets)
+        return hist
 
-        return node_histograms
+    def to_feature_histogram(
+        self, hist: np.ndarray, valid_features: Dict, use_missing: bool
+    ) -> List:
+        """Convert flat histogram to the cumulative format of calculate_histogram
 
-    @staticmethod
-    def _generate_empty_histogram(
-        bin_split_points: Dict, valid_features: Dict, missing_bin: int
-    ):
-        """If data if empty, generate empty histogram
         Args:
-            bin_split_points: global bin split points
-            valid_features: Dict for valid features
-            missing_bin: Num of missing bin
+            hist: flat histogram returned by histogram
+            valid_features: valid feature names Dict[id:bool]
+            use_missing: whether missing value participate in train
         Returns:
-            feature_histogram_template: return empty histogram
+            histogram of node, [cols,[buckets,[sum_g,sum_h,count]]]
         """
-        feature_histogram_template = []
-        for fid in range(len(bin_split_points)):
-            # if is not valid features, skip generating
-            if valid_features is not None and valid_features[fid] is False:
-                feature_histogram_template.append([])
+        missing_bin = 1 if use_missing else 0
+        f_histograms = []
+        for fid, (offset, num) in enumerate(zip(self.offsets, self.num_buckets)):
+            if not valid_features.get(fid, False):
+                f_histograms.append(np.array([]))
                 continue
-            else:
-                # [0, 0, 0] -> [grad, hess, sample count]
-                feature_histogram_template.append(
-                    [[0, 0, 0] for j in range(len(bin_split_points[fid]) + missing_bin)]
-                )
-
-        # check feature num
-        assert len(feature_histogram_template) == len(
-            bin_split_points
-        ), "Length of feature_histogram_template and bin_split_points not consistent"
-
-        return feature_histogram_template
+            # the missing bucket sums up all rows of node
+            f_histograms.append(
+                np.cumsum(hist[offset : offset + num - 1 + missing_bin], axis=0)
+            )
+        return f_histograms
 
-    @staticmethod
-    def _cal_point_hist(data_slice):
-        sum_mat = data_slice.sum(axis=0)
-        sum_grad = sum_mat[1]
-        sum_hess = sum_mat[2]
-        sum_count = data_slice.shape[0]
-        return [sum_grad, sum_hess, sum_count]
+    def split_rows(
+        self, rows: np.ndarray, fid: int, bid: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Split rows by feature value < bin_split_points[fid][bid]
 
-    @staticmethod
-    def calculate_single_histogram(data: np.ndarray, bin_split_point: np.ndarray):
-        f_histogram = []
+        Returns:
+            positions of rows in left node and right node
+        """
+        is_left = self.bins[rows, fid] <= bid
+        return rows[is_left], rows[~is_left]
 
-        for bin_t in bin_split_point:
-            f_histogram.append(
-                FeatureHistogram._cal_point_hist(data[data[:, 0] < bin_t])
-            )
 
-        return f_histogram
+class FeatureHistogram:
+    """Feature Histogram"""
 
     @staticmethod
-    def _node_calculate_histogram(
-        data_frame: pandas.DataFrame,
-        bin_split_points: np.ndarray = None,
+    def calculate_histogram(
+        data_frame_list: List[pandas.DataFrame],
+        bin_split_points: numpy.ndarray,
         valid_features: Dict = None,
         use_missing: bool = False,
-        grad_key="grad",
-        hess_key="hess",
-        thread_pool=None,
+        grad_key: str = "grad",
+        hess_key: str = "hess",
     ):
-        """function to calculate histogram on node
+        """
+        Calculate histogram according to G and H
+        histogram: [cols,[buckets,[sum_g,sum_h,count]]
 
         Args:
-            data_frame: data frame with grad and hess
-            bin_split_points: global bin split point
+            data_frame_list: A list of data frame, which contain grad and hess
+            bin_split_points: global split point dicts
             valid_features: valid feature names Dict[id:bool]
             use_missing: whether missing value participate in train
             grad_key: unique column name for grad value
             hess_key: unique column name for hess value
-
         Returns:
-            single_histogram: histogram of this node
+            node_histograms:一个List[histogram1, histogram2, ...]
         """
-        if thread_pool is None:
-            thread_pool = ThreadPoolExecutor()
-        single_histogram = []
-        np_data = data_frame.to_numpy()
         if valid_features is None:
             raise InvalidArgumentError("valid can not be None")
-        header = data_frame.columns.tolist()
-        valid_features_list = [k for k, v in valid_features.items() if v]
-
-        futures = {}
-        for fid in range(len(bin_split_points)):
-            futures[fid] = thread_pool.submit(
-                FeatureHistogram._bin_hist,
-                np_data,
-                fid,
-                grad_key,
-                hess_key,
-                valid_features_list,
-                header,
+        node_histograms = []
+        for data_frame in data_frame_list:
+            binned_data = BinnedData(
+                data_frame.iloc[:, : len(bin_split_points)].to_numpy(),
+                data_frame[grad_key].to_numpy(),
+                data_frame[hess_key].to_numpy(),
                 bin_split_points,
-                use_missing,
             )
-
-        for ret in futures.values():
-            single_histogram.append(np.array(ret.result()))
-        return single_histogram
-
-    @staticmethod
-    def _bin_hist(
-        data,
-        fid,
-        grad_key,
-        hess_key,
-        valid_features_list,
-        header,
-        bin_split_points,
-        use_missing,
-    ):
-        if fid in valid_features_list:
-            t_data = data[:, [fid, header.index(grad_key), header.index(hess_key)]]
-            f_histogram = FeatureHistogram.calculate_single_histogram(
-                t_data, bin_split_points[fid]
+            node_histograms.append(
+                binned_data.to_feature_histogram(
+                    binned_data.histogram(), valid_features, use_missing
+                )
             )
-            if use_missing:
-                miss_grad = t_data[1:].sum() - f_histogram[-1][0]
-                miss_hess = t_data[2:].sum() - f_histogram[-1][1]
-                miss_count = len(t_data) - f_histogram[-1][2]
-                f_histogram.append([miss_grad, miss_hess, miss_count])
-        else:
-            f_histogram = []
-        return f_histogram
+
+        return node_histograms
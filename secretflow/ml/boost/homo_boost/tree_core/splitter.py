@@ -20,6 +20,8 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, List
 
+import numpy as np
+
 from secretflow.ml.boost.homo_boost.tree_core.criterion import XgboostCriterion
 
 
@@ -110,11 +112,53 @@ class Splitter(object):
     def _check_sample_num(self, l_cnt: int, r_cnt: int) -> bool:
         return l_cnt >= self.min_leaf_node and r_cnt >= self.min_leaf_node
 
+    def _no_split(self) -> SplitInfo:
+        return SplitInfo(
+            gain=self.min_impurity_split,
+            sum_grad=None,
+            sum_hess=None,
+            sample_count=None,
+        )
+
+    def _split_gains(
+        self,
+        node_sum: np.ndarray,
+        left_sum: np.ndarray,
+        right_sum: np.ndarray,
+        is_candidate: np.ndarray,
+    ) -> np.ndarray:
+        """Gains of all candidate splits, -inf for the invalid ones
+
+        Args:
+            node_sum: G,H,Count of node, with shape (features, 1, 3)
+            left_sum: G,H,Count of left node, with shape (features, bins, 3)
+            right_sum: G,H,Count of right node, with shape (features, bins, 3)
+            is_candidate: whether the bin is a split candidate of the feature
+        """
+        is_valid = (
+            is_candidate
+            & (left_sum[..., 2] >= self.min_leaf_node)
+            & (right_sum[..., 2] >= self.min_leaf_node)
+            & (left_sum[..., 1] >= self.min_child_weight)
+            & (right_sum[..., 1] >= self.min_child_weight)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gains = self.criterion.split_gain_array(
+                (node_sum[..., 0], node_sum[..., 1]),
+                (left_sum[..., 0], left_sum[..., 1]),
+                (right_sum[..., 0], right_sum[..., 1]),
+            )
+        return np.where(is_valid & ~np.isnan(gains), gains, -np.inf)
+
     def find_split_once(
         self, histogram: List, valid_features: Dict, use_missing: bool
     ) -> SplitInfo:
         """Find best split info from histogram
 
+        Gains of all split points of all features are computed at once, the
+        first one in order of (feature, bucket, right before left missing
+        direction) wins ties.
+
         Args:
             histogram: a three-dimensional matrix store G,H,Count
             valid_features: valid feature names Dict[id:bool]
@@ -122,100 +166,77 @@ class Splitter(object):
         Returns:
             SplitInfo: best split point info
         """
-        best_fid = None
-        best_gain = self.min_impurity_split
-        best_bid = None
-        best_sum_grad_l = None
-        best_sum_hess_l = None
-        best_sample_cnt = None
         missing_bin = 0
         if use_missing:
             missing_bin = 1
 
-        # default to right
-        missing_dir = 1
-
+        fids = []
         for fid in range(len(histogram)):
             if valid_features[fid] is False:
                 continue
             bin_num = len(histogram[fid])
             if bin_num == 0 + missing_bin:
                 continue
-
             # The last bucket stores the sum of all nodes(cumsum from left)
-            sum_grad = histogram[fid][bin_num - 1][0]
-            sum_hess = histogram[fid][bin_num - 1][1]
-            node_cnt = histogram[fid][bin_num - 1][2]
-            if node_cnt < self.min_sample_split:
+            if histogram[fid][bin_num - 1][2] < self.min_sample_split:
                 break
-
-            # The last bucket does not participate in the split point search, so bin_num-1
-            for bid in range(bin_num - missing_bin - 1):
-                # left gh
-                sum_grad_l, sum_hess_l, node_cnt_l = histogram[fid][bid]
-
-                # right gh
-                sum_grad_r = sum_grad - sum_grad_l
-                sum_hess_r = sum_hess - sum_hess_l
-                node_cnt_r = node_cnt - node_cnt_l
-                logging.debug(
-                    f"split::fid={fid} bid={bid} sum_of_grad_l:{sum_grad_l},sum_of_hess_l={sum_hess_l} ,"
-                    f"node_cnt_l={node_cnt_l}"
+            fids.append(fid)
+
+        # The last bucket does not participate in the split point search, so bin_num-1
+        split_nums = [len(histogram[fid]) - missing_bin - 1 for fid in fids]
+        max_split_num = max(split_nums, default=0)
+        if max_split_num <= 0:
+            return self._no_split()
+
+        # left gh of each split point, padded to the same length
+        left_sum = np.zeros((len(fids), max_split_num, 3))
+        is_candidate = np.zeros((len(fids), max_split_num), dtype=bool)
+        node_sum = np.empty((len(fids), 1, 3))
+        missing_sum = np.empty((len(fids), 1, 3))
+        for idx, (fid, split_num) in enumerate(zip(fids, split_nums)):
+            f_histogram = np.asarray(histogram[fid], dtype=np.float64)
+            left_sum[idx, :split_num] = f_histogram[:split_num]
+            is_candidate[idx, :split_num] = True
+            node_sum[idx, 0] = f_histogram[-1]
+            if use_missing:
+                missing_sum[idx, 0] = f_histogram[-1] - f_histogram[-2]
+        # right gh
+        right_sum = node_sum - left_sum
+
+        # missing values go to right sub tree by default.
+        gains = [self._split_gains(node_sum, left_sum, right_sum, is_candidate)]
+        if use_missing:
+            # handle missing value: dispatch to left sub tree
+            gains.append(
+                self._split_gains(
+                    node_sum,
+                    left_sum + missing_sum,
+                    right_sum - missing_sum,
+                    is_candidate,
                 )
-                if self._check_sample_num(
-                    node_cnt_l, node_cnt_r
-                ) and self._check_min_child_weight(sum_hess_l, sum_hess_r):
-                    gain = self.criterion.split_gain(
-                        (sum_grad, sum_hess),
-                        (sum_grad_l, sum_hess_l),
-                        (sum_grad_r, sum_hess_r),
-                    )
-                    if gain > self.min_impurity_split and gain > best_gain:
-                        best_gain = gain
-                        best_fid = fid
-                        best_bid = bid
-                        best_sum_grad_l = sum_grad_l
-                        best_sum_hess_l = sum_hess_l
-                        best_sample_cnt = node_cnt_l
-                        missing_dir = 1
-
-                # handle missing value: dispatch to left sub tree
-                if use_missing:
-                    sum_grad_l += histogram[fid][-1][0] - histogram[fid][-2][0]
-                    sum_hess_l += histogram[fid][-1][1] - histogram[fid][-2][1]
-                    node_cnt_l += histogram[fid][-1][2] - histogram[fid][-2][2]
-
-                    sum_grad_r -= histogram[fid][-1][0] - histogram[fid][-2][0]
-                    sum_hess_r -= histogram[fid][-1][1] - histogram[fid][-2][1]
-                    node_cnt_r -= histogram[fid][-1][2] - histogram[fid][-2][2]
-
-                    # If the left side is gain more, point missing_DIR to the left
-                    # and update the optimal split information
-                    if self._check_sample_num(
-                        node_cnt_l, node_cnt_r
-                    ) and self._check_min_child_weight(sum_hess_l, sum_hess_r):
-                        gain = self.criterion.split_gain(
-                            (sum_grad, sum_hess),
-                            (sum_grad_l, sum_hess_l),
-                            (sum_grad_r, sum_hess_r),
-                        )
-                        if gain > self.min_impurity_split and gain > best_gain:
-                            best_gain = gain
-                            best_fid = fid
-                            best_bid = bid
-                            best_sum_grad_l = sum_grad_l
-                            best_sum_hess_l = sum_hess_l
-                            missing_dir = -1
-                            best_sample_cnt = node_cnt_l
+            )
+        gains = np.stack(gains, axis=-1)
 
+        # argmax returns the first one of maximums.
+        best_idx, best_bid, best_dir = np.unravel_index(np.argmax(gains), gains.shape)
+        best_gain = gains[best_idx, best_bid, best_dir]
+        if not best_gain > self.min_impurity_split:
+            return self._no_split()
+
+        best_left_sum = left_sum[best_idx, best_bid]
+        # If the left side is gain more, point missing_DIR to the left
+        missing_dir = 1
+        if best_dir == 1:
+            best_left_sum = best_left_sum + missing_sum[best_idx, 0]
+            missing_dir = -1
         splitinfo = SplitInfo(
-            best_fid=best_fid,
-            best_bid=best_bid,
+            best_fid=fids[best_idx],
+            best_bid=int(best_bid),
             gain=best_gain,
-            sum_grad=best_sum_grad_l,
-            sum_hess=best_sum_hess_l,
+            sum_grad=best_left_sum[0],
+            sum_hess=best_left_sum[1],
             missing_dir=missing_dir,
-            sample_count=best_sample_cnt,
+            sample_count=best_left_sum[2],
         )
         logging.debug(f"splitInfo = {splitinfo}")
         return splitinfo
@@ -36,11 +36,13 @@ class TreeParam:
         reg_lambda : Optional[float] L2 regularization term on weights (xgb's lambda).
         base_score : Optional[float] base score, global bias.
         random_state : Optional[Union[numpy.random.RandomState, int]] Random number seed.
-        num_parallel: Optional[int] num of parallel when built tree
+        num_parallel: deprecated and ignored, histograms are computed by
+            vectorized scatter-adds in one thread.
         importance_type: Optional[str] importance type, in ['gain','split']
         use_missing: bool whether missing value participate in train
         min_sample_split: minimum sample split of splitting, default to 2
-        max_split_nodes: max_split_nodes to parallel finding their splits in a batch
+        max_split_nodes: deprecated and ignored, all nodes of a layer find
+            their splits in one batch.
         min_leaf_node: minimum samples on node to split
         decimal: decimal reserved of gain
         num_class: num of class
@@ -51,6 +51,11 @@ class SGBParams:
     'batch_encoding_enabled': bool. if use batch encoding optimization.
         default: True.
     'audit_paths': dict. {device : path to save log for audit}
+    'enable_pipelined_encryption': bool. if true, encryptions of zeros for the next tree
+        are computed while waiting for bucket sums of the last level,
+        gradients of the next tree are encrypted by adding them to the zeros.
+        not effective if label holder is in audit_paths.
+        default: False
     'enable_quantization': Whether enable quantization of g and h.
         only recommended for encryption schemes with small plaintext range, like elgamal.
         default: False
@@ -113,6 +118,16 @@ class SGBParams:
         default: level-wise
     'enable_packbits': bool. if true, turn on packbits transmission.
         default: False
+
+    The third part is checkpoint params.
+    'checkpoint_paths': dict. {party : directory to save checkpoints of this party}
+        if not empty, directories of all workers and label holder must be provided.
+        boosting state is saved periodically, and the quantization of dataset is cached,
+        so the training could be resumed by Sgb.resume.
+        default: {}
+    'checkpoint_interval': int. save a checkpoint every this number of trees.
+        default: 10
+        range: [1, 1024]
     """
 
     # security or encryption related params
@@ -120,6 +135,7 @@ class SGBParams:
     fixed_point_parameter: int = 20
     batch_encoding_enabled: bool = True
     audit_paths: dict = field(default_factory=dict)
+    enable_pipelined_encryption: bool = False
     enable_quantization: bool = False
     quantization_scale: float = 10000.0
 
@@ -146,6 +162,10 @@ class SGBParams:
     tree_growing_method: TreeGrowingMethod = TreeGrowingMethod.LEVEL
     enable_packbits: bool = False
 
+    # checkpoint params
+    checkpoint_paths: dict = field(default_factory=dict)
+    checkpoint_interval: int = 10
+
 
 default_params = SGBParams()
 
@@ -175,6 +195,7 @@ numeric_params_range = {
     'fixed_point_parameter': (1, 100, True, True),
     'quantization_scale': (0, 10000000.0, True, True),
     'num_boost_round': (1, 1024, True, True),
+    'checkpoint_interval': (1, 1024, True, True),
     'reg_lambda': (0, 10000, True, True),
     'learning_rate': (0, 1, False, True),
     'max_leaf': (1, 32768, True, True),
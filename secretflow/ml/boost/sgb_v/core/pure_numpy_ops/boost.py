@@ -16,6 +16,8 @@ from typing import List, Tuple
 
 import numpy as np
 
+from .node_select import node_positions
+
 
 def compute_obj(G: np.ndarray, H: np.ndarray, reg_lambda: float) -> np.ndarray:
     """
@@ -44,6 +46,35 @@ def compute_weight_from_node_select(
     return compute_weight(g_sum, h_sum, reg_lambda, learning_rate)
 
 
+def compute_weight_from_node_assignment(
+    node_assignment: np.ndarray,
+    leaf_indices: List[int],
+    g: np.ndarray,
+    h: np.ndarray,
+    reg_lambda: float,
+    learning_rate: float,
+) -> np.ndarray:
+    """same as compute_weight_from_node_select, leaf selects are given by
+    node index of each sample, weights are in the order of leaf_indices."""
+    positions = node_positions(node_assignment, leaf_indices)
+    mask = positions >= 0
+    positions = positions[mask]
+
+    def _leaf_sum(x):
+        x = np.asarray(x)
+        columns = x.reshape(x.shape[0], -1)[mask]
+        sums = np.stack(
+            [
+                np.bincount(positions, weights=c, minlength=len(leaf_indices))
+                for c in columns.T
+            ],
+            axis=1,
+        )
+        return sums.reshape((len(leaf_indices),) + x.shape[1:])
+
+    return compute_weight(_leaf_sum(g), _leaf_sum(h), reg_lambda, learning_rate)
+
+
 def compute_weight(
     G: float, H: float, reg_lambda: float, learning_rate: float
 ) -> np.ndarray:
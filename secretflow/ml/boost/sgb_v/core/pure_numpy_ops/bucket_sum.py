@@ -16,6 +16,8 @@ from typing import List
 from numba import njit, prange
 import numpy as np
 
+from .node_select import node_positions
+
 
 # regroup the roduct sums
 def regroup_bucket_sums(bucket_sums_list, i):
@@ -56,6 +58,29 @@ def batch_select_sum(arr, children_nodes_selects: List, order_map, bucket_num):
     return [bucket_sums_arr[i].reshape(-1, 2) for i in range(node_num)]
 
 
+def batch_assignment_sum(
+    arr, node_assignment: np.ndarray, children_node_indices: List, order_map, bucket_num
+):
+    """select sum with samples of nodes in a node assignment
+
+    Args:
+        arr: array of shape (n, 2). n is the sample number.
+        node_assignment (np.ndarray): node index of each sample.
+        children_node_indices (List): indices of nodes to sum.
+        order_map (np.ndarray): an array of shape (sample_number, feature_number), indicating which feature each sample belongs to.
+        bucket_num (int): number of buckets in each feature
+
+    Returns:
+        bucket sums (List): return a list of length node number. Each element is an array of shape (order_map.shape[1] * bucket_num, 2)
+    """
+    node_num = len(children_node_indices)
+    positions = node_positions(node_assignment, children_node_indices)
+    bucket_sums_arr = batch_select_sum_inner(
+        arr, positions.reshape(1, -1), order_map, bucket_num, node_num
+    )
+    return [bucket_sums_arr[i].reshape(-1, 2) for i in range(node_num)]
+
+
 @njit(parallel=True)
 def batch_select_sum_inner(
     arr, children_node_select_one_arr_form, order_map, bucket_num, node_num
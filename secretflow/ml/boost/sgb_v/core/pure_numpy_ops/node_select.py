@@ -108,3 +108,147 @@ def unpack_node_select_lists(
         ]
         for node_select_bits_l in node_selects_bits
     ]
+
+
+# Level wise training keeps the samples of nodes in a node assignment vector,
+# entry i is the index of the node which sample i is in. Node i's children are
+# 2 * i + 1 and 2 * i + 2, samples of leaf nodes stay at the leaves.
+
+
+def node_assignment_dtype(max_depth: int) -> np.dtype:
+    """the smallest int dtype holding node indices of a tree with max_depth."""
+    max_node_index = 2 ** (max_depth + 1) - 2
+    return np.dtype(np.int16 if max_node_index <= np.iinfo(np.int16).max else np.int32)
+
+
+def root_assignment(samples: int, dtype: np.dtype = np.int32) -> np.ndarray:
+    return np.zeros(samples, dtype=dtype)
+
+
+def node_positions(node_assignment: np.ndarray, node_indices: List[int]) -> np.ndarray:
+    """position of each sample's node in node_indices, -1 if not in node_indices."""
+    node_indices = np.asarray(node_indices, dtype=np.int64)
+    if node_indices.size == 0:
+        return np.full(node_assignment.shape, -1, dtype=np.int32)
+    lookup = np.full(
+        max(int(node_indices.max()), int(node_assignment.max(initial=0))) + 1,
+        -1,
+        dtype=np.int32,
+    )
+    lookup[node_indices] = np.arange(node_indices.size, dtype=np.int32)
+    return lookup[node_assignment]
+
+
+def node_sample_counts(
+    node_assignment: np.ndarray, node_indices: List[int]
+) -> np.ndarray:
+    positions = node_positions(node_assignment, node_indices)
+    return np.bincount(positions[positions >= 0], minlength=len(node_indices))
+
+
+def pick_children_nodes(
+    node_assignment: np.ndarray, node_indices: List[int]
+) -> Tuple[List[int], List[bool], int]:
+    """
+    pick left/right children based on number of samples at each node.
+
+    Args:
+        node_assignment: node index of each sample.
+        node_indices: node indices from the same level, in a [l_child, r_child, ...] fasion.
+
+    Returns:
+        children node indices, one of each [l_child, r_child] pair.
+        is_lefts: List[bool].
+        node_num: int. len of node_indices.
+    """
+    node_num = len(node_indices)
+    if node_num == 1:
+        return list(node_indices), [True], node_num
+    sums = node_sample_counts(node_assignment, node_indices)
+    is_lefts = [bool(sums[i] <= sums[i + 1]) for i in range(0, node_num, 2)]
+    children = [
+        node_indices[i] if is_lefts[i // 2] else node_indices[i + 1]
+        for i in range(0, node_num, 2)
+    ]
+    return children, is_lefts, node_num
+
+
+def node_assignment_to_selects(
+    node_assignment: np.ndarray, node_indices: List[int]
+) -> List[np.ndarray]:
+    """expand node assignment into the selects of nodes, for APIs need selects."""
+    positions = node_positions(node_assignment, node_indices)
+    return [
+        (positions == i).astype(np.int8).reshape(1, -1)
+        for i in range(len(node_indices))
+    ]
+
+
+def _split_node_assignment(
+    node_assignment: np.ndarray, in_split: np.ndarray, go_left: np.ndarray
+) -> np.ndarray:
+    result = node_assignment.copy()
+    result[in_split] = 2 * node_assignment[in_split] + 2 - go_left
+    return result
+
+
+def update_node_assignment(
+    node_assignment: np.ndarray,
+    left_bits_each_party: List[np.ndarray],
+    gain_is_cost_effective: List[bool],
+    split_node_indices: List[int],
+) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray], List[int], List[int]]:
+    """
+    move samples of split nodes into their children.
+
+    Args:
+        node_assignment: node index of each sample.
+        left_bits_each_party: packed bits from each party, bit i is 1 if sample i
+            goes to left child of a node split by this party.
+        gain_is_cost_effective: List[bool]. indicate whether node should be split.
+        split_node_indices: List[int]. node indices at the current level.
+
+    Returns:
+        node assignment of the next level.
+        delta for other parties to update their node assignment,
+            see apply_node_assignment_delta.
+        node indices for the next level.
+        node indices for pruned nodes.
+    """
+    sample_num = node_assignment.size
+    go_left = np.zeros(sample_num, dtype=np.uint8)
+    for bits in left_bits_each_party:
+        go_left |= np.unpackbits(bits, count=sample_num)
+
+    split_ids = []
+    child_node_indices = []
+    pruned_node_indices = []
+    for node_index, gain in zip(split_node_indices, gain_is_cost_effective):
+        if gain:
+            split_ids.append(node_index)
+            child_node_indices.extend([2 * node_index + 1, 2 * node_index + 2])
+        else:
+            pruned_node_indices.append(node_index)
+    split_ids = np.array(split_ids, dtype=node_assignment.dtype)
+    in_split = np.isin(node_assignment, split_ids)
+    go_left = go_left[in_split].astype(node_assignment.dtype)
+    # only bits of samples in split nodes are sent, other parties know them.
+    delta = (split_ids, np.packbits(go_left))
+    return (
+        _split_node_assignment(node_assignment, in_split, go_left),
+        delta,
+        child_node_indices,
+        pruned_node_indices,
+    )
+
+
+def apply_node_assignment_delta(
+    node_assignment: np.ndarray, delta: Tuple[np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """apply delta from update_node_assignment to the same node assignment."""
+    split_ids, packed_go_left = delta
+    in_split = np.isin(node_assignment, split_ids)
+    go_left = np.unpackbits(packed_go_left, count=int(np.count_nonzero(in_split)))
+    return _split_node_assignment(
+        node_assignment, in_split, go_left.astype(node_assignment.dtype)
+    )
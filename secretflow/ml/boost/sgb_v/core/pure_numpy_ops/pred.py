@@ -46,3 +46,58 @@ def predict_tree_weight(selects: List[np.ndarray], weights: np.ndarray) -> np.nd
         select.shape[1] == weights.shape[0]
     ), f"select {select.shape}, weights {weights.shape}"
     return np.matmul(select, weights).reshape((select.shape[0]), 1)
+
+
+def predict_forest_leaf_select(
+    x: np.ndarray, start: int, end: int, packbits: bool, *split_trees
+) -> np.ndarray:
+    """
+    compute leaf selects of all trees known by this partition in one pass.
+
+    Args:
+        x: dataset from this partition.
+        start: first row of x in this batch.
+        end: end row (exclusive) of x in this batch.
+        packbits: if True, pack the selects into bits along leaves axis.
+        split_trees: split trees of this partition, one for each tree.
+
+    Return:
+        leaf selects of shape (samples, total leaves of all trees).
+        If packbits, shape is (samples, ceil(total leaves / 8)) with dtype uint8.
+    """
+    x = x if isinstance(x, np.ndarray) else np.array(x)
+    x = x[start:end]
+    select = np.concatenate(
+        [np.asarray(t.predict_leaf_select(x), dtype=bool) for t in split_trees],
+        axis=1,
+    )
+    if packbits:
+        return np.packbits(select, axis=1)
+    return select
+
+
+def predict_forest_weight(selects: List[np.ndarray], weights: np.ndarray) -> np.ndarray:
+    """
+    get sum of all trees' pred for a batch of samples.
+
+    Args:
+        selects: leaf selects of all trees from each party, bit-packed or not.
+        weights: leaf weights of all trees, concatenated in the same order of selects.
+
+    Return:
+        pred of shape (samples, 1)
+    """
+    leaf_count = weights.shape[0]
+    select = reduce(
+        np.logical_and,
+        [
+            np.unpackbits(s, axis=1, count=leaf_count).astype(bool)
+            if s.dtype == np.uint8
+            else s
+            for s in selects
+        ],
+    )
+    assert (
+        select.shape[1] == weights.shape[0]
+    ), f"select {select.shape}, weights {weights.shape}"
+    return np.matmul(select, weights).reshape((select.shape[0], 1))
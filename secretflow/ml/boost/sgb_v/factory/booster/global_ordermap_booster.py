@@ -14,22 +14,31 @@
 
 import copy
 import logging
+import os
 import time
-from dataclasses import dataclass
-from typing import List, Union
+from dataclasses import dataclass, field
+from typing import Dict, List, Union
 
 import numpy as np
 
 from secretflow.data import FedNdarray
 from secretflow.data.vertical import VDataFrame
-from secretflow.device import HEU, wait
+from secretflow.device import HEU, PYU, PYUObject, wait
+from secretflow.ml.boost.core.checkpoint import (
+    checkpoint_dir,
+    commit_checkpoint,
+    latest_checkpoint,
+)
 from secretflow.ml.boost.sgb_v.core.params import default_params
 
-from ...model import SgbModel
+from ...model import SgbModel, load_model
 from ..components import DataPreprocessor, ModelBuilder, OrderMapManager, TreeTrainer
 from ..components.component import Composite, Devices, label_have_feature, print_params
 from ..sgb_actor import SGBActor
 
+# file name of the prediction saved with a checkpoint at label holder.
+PRED_FILE = "pred.npy"
+
 
 @dataclass
 class GlobalOrdermapBoosterComponents:
@@ -50,12 +59,20 @@ class GlobalOrdermapBoosterParams:
                 Can increase training speed and label security.
                 The training loss may increase.
                 If label holder has no feature, set this to False.
+    checkpoint_paths: dict, default={}
+                {party : directory to save checkpoints of this party}.
+                If not empty, directories of all workers and label holder must be provided.
+    checkpoint_interval: int, default=10
+                Save a checkpoint every this number of trees.
+                range: [1, 1024]
     """
 
     num_boost_round: int = default_params.num_boost_round
     first_tree_with_label_holder_feature: bool = (
         default_params.first_tree_with_label_holder_feature
     )
+    checkpoint_paths: dict = field(default_factory=dict)
+    checkpoint_interval: int = default_params.checkpoint_interval
 
 
 class GlobalOrdermapBooster(Composite):
@@ -78,12 +95,18 @@ class GlobalOrdermapBooster(Composite):
             'first_tree_with_label_holder_feature',
             default_params.first_tree_with_label_holder_feature,
         )
+        self.params.checkpoint_paths = params.get('checkpoint_paths', {})
+        self.params.checkpoint_interval = params.get(
+            'checkpoint_interval', default_params.checkpoint_interval
+        )
 
     def _get_booster_params(self, params: dict):
         params['num_boost_round'] = self.params.num_boost_round
         params[
             'first_tree_with_label_holder_feature'
         ] = self.params.first_tree_with_label_holder_feature
+        params['checkpoint_paths'] = self.params.checkpoint_paths
+        params['checkpoint_interval'] = self.params.checkpoint_interval
 
     def show_params(self):
         super().show_params()
@@ -114,11 +137,58 @@ class GlobalOrdermapBooster(Composite):
         super().del_actors()
         self.tree_trainer.del_actors()
 
+    def _checkpoint_roots(self, devices: Devices) -> Dict[PYU, str]:
+        paths = self.params.checkpoint_paths
+        if len(paths) == 0:
+            return {}
+        parties = [*devices.workers]
+        if devices.label_holder not in parties:
+            parties.append(devices.label_holder)
+        missing = [device.party for device in parties if device.party not in paths]
+        assert len(missing) == 0, f"checkpoint paths of {missing} must be provided"
+        return {device: paths[device.party] for device in parties}
+
+    def _save_checkpoint(
+        self,
+        roots: Dict[PYU, str],
+        label_holder: PYU,
+        tree_num: int,
+        pred: PYUObject,
+    ):
+        start = time.perf_counter()
+        dirs = {
+            device: checkpoint_dir(root, tree_num) for device, root in roots.items()
+        }
+        self.components.model_builder.save_model(dirs)
+        wait(label_holder(np.save)(os.path.join(dirs[label_holder], PRED_FILE), pred))
+        commit_checkpoint(roots, tree_num)
+        logging.info(
+            f"checkpoint of {tree_num} trees saved, time {time.perf_counter() - start}s"
+        )
+
+    def _restore_checkpoint(
+        self, roots: Dict[PYU, str], label_holder: PYU, tree_num: int
+    ) -> PYUObject:
+        dirs = {
+            device: checkpoint_dir(root, tree_num) for device, root in roots.items()
+        }
+        self.components.model_builder.restore_trees(load_model(dirs, label_holder))
+        return label_holder(np.load)(os.path.join(dirs[label_holder], PRED_FILE))
+
     def fit(
         self,
         dataset: Union[FedNdarray, VDataFrame],
         label: Union[FedNdarray, VDataFrame],
+        resume: bool = False,
     ) -> SgbModel:
+        """Train on dataset and label.
+
+        If resume is True, training continues from the last checkpoint under
+        checkpoint_paths, and order maps are loaded from the cache instead of
+        quantizing the dataset again. Trees and predictions are restored,
+        but random states of row and column sampling are not, so a resumed
+        training may differ from an uninterrupted one if sampling is enabled.
+        """
         import secretflow.distributed as sfd
 
         if sfd.in_ic_mode():
@@ -147,15 +217,29 @@ class GlobalOrdermapBooster(Composite):
         self.set_actors(actors)
         logging.debug("actors are set.")
 
-        pred = self.components.model_builder.init_pred(sample_num)
-        logging.debug("pred initialized.")
-        self.components.order_map_manager.build_order_map(x)
+        checkpoint_roots = self._checkpoint_roots(devices)
+        start_tree = 0
+        if resume:
+            assert (
+                len(checkpoint_roots) > 0
+            ), "checkpoint_paths must be provided to resume training"
+            start_tree = latest_checkpoint(checkpoint_roots)
+
+        self.components.order_map_manager.build_order_map(x, checkpoint_roots, resume)
         logging.debug("ordermap built.")
         self.components.model_builder.init_model()
         logging.debug("model initialized.")
         self.components.model_builder.set_parition_shapes(x)
+        if start_tree > 0:
+            pred = self._restore_checkpoint(
+                checkpoint_roots, devices.label_holder, start_tree
+            )
+            logging.info(f"resume training from checkpoint of {start_tree} trees.")
+        else:
+            pred = self.components.model_builder.init_pred(sample_num)
+        logging.debug("pred initialized.")
 
-        for tree_index in range(self.params.num_boost_round):
+        for tree_index in range(start_tree, self.params.num_boost_round):
             start = time.perf_counter()
             if self.params.first_tree_with_label_holder_feature and tree_index == 0:
                 # we are sure the config is small, so ok to copy
@@ -182,6 +266,13 @@ class GlobalOrdermapBooster(Composite):
                     pred, tree.predict(x.partitions)
                 )
                 wait([pred])
+                if (
+                    len(checkpoint_roots) > 0
+                    and cur_tree_num % self.params.checkpoint_interval == 0
+                ):
+                    self._save_checkpoint(
+                        checkpoint_roots, devices.label_holder, cur_tree_num, pred
+                    )
             else:
                 wait(tree)
 
@@ -14,16 +14,18 @@
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
+import secretflow.distributed as sfd
 from secretflow.data import FedNdarray
 from secretflow.device import HEUObject, PYU, PYUObject
+from secretflow.device.device.heu_object import batch_getitem
 from secretflow.ml.boost.sgb_v.factory.sgb_actor import SGBActor
 
-from ....core.pure_numpy_ops.bucket_sum import batch_select_sum, regroup_bucket_sums
-from ....core.pure_numpy_ops.grad import split_GH
-from ....core.pure_numpy_ops.node_select import (
-    packbits_node_selects,
-    unpackbits_node_selects,
+from ....core.pure_numpy_ops.bucket_sum import (
+    batch_assignment_sum,
+    regroup_bucket_sums,
 )
+from ....core.pure_numpy_ops.grad import split_GH
+from ....core.pure_numpy_ops.node_select import node_assignment_to_selects
 from ..cache.level_wise_cache import LevelWiseCache
 from ..component import Composite, Devices, print_params
 from ..gradient_encryptor import GradientEncryptor
@@ -88,38 +90,28 @@ class BucketSumCalculator(Composite):
         self,
         shuffler: Shuffler,
         encrypted_gh_dict: Dict[PYU, HEUObject],
-        children_split_node_selects: PYUObject,  # inner type is List[np.array]
+        node_assignments: List[PYUObject],  # inner type is np.ndarray
+        children_node_indices: List[int],
         is_lefts: List[bool],
         order_map_sub: FedNdarray,
         bucket_num: int,
         bucket_lists: List[PYUObject],
         gradient_encryptor: GradientEncryptor,
         node_num: int,
-        node_select_shape: Tuple[int, int],
     ) -> Tuple[PYUObject, PYUObject]:
         bucket_sums_list = [[] for _ in range(self.party_num)]
         bucket_num_plus_one = bucket_num + 1
         shuffler.reset_shuffle_masks()
         self.components.level_wise_cache.reset_level_caches()
-        enable = self.params.enable_packbits
-        if enable:
-            children_split_node_selects_bits = self.label_holder(packbits_node_selects)(
-                children_split_node_selects
-            )
         for i, worker in enumerate(self.workers):
             if worker != self.label_holder:
                 if self.params.label_holder_feature_only:
                     continue
                 else:
-                    if enable:
-                        children_split_node_selects_worker = worker(
-                            unpackbits_node_selects
-                        )(
-                            children_split_node_selects_bits.to(worker),
-                            node_select_shape,
-                        )
-                    else:
-                        children_split_node_selects_worker = children_split_node_selects
+                    # node selects are expanded locally from the node assignment.
+                    children_split_node_selects_worker = worker(
+                        node_assignment_to_selects
+                    )(node_assignments[i], children_node_indices)
                     bucket_sums = encrypted_gh_dict[
                         worker
                     ].batch_feature_wise_bucket_sum(
@@ -134,22 +126,32 @@ class BucketSumCalculator(Composite):
                     bucket_sums = self.components.level_wise_cache.get_level_nodes_GH(
                         worker
                     )
-                    bucket_sums = [
-                        bucket_sum[shuffler.create_shuffle_mask(i, j, bucket_lists[i])]
-                        for j, bucket_sum in enumerate(bucket_sums)
-                    ]
-
-                    bucket_sums_list[i] = [
-                        bucket_sum.to(
-                            self.label_holder,
-                            gradient_encryptor.get_move_config(self.label_holder),
+                    move_config = gradient_encryptor.get_move_config(self.label_holder)
+                    if sfd.in_ic_mode():
+                        bucket_sums = [
+                            bucket_sum[
+                                shuffler.create_shuffle_mask(i, j, bucket_lists[i])
+                            ]
+                            for j, bucket_sum in enumerate(bucket_sums)
+                        ]
+                        bucket_sums_list[i] = [
+                            bucket_sum.to(self.label_holder, move_config)
+                            for bucket_sum in bucket_sums
+                        ]
+                    else:
+                        # shuffled bucket sums of all nodes are moved and
+                        # decrypted at once, other workers are not waited.
+                        shuffle_masks = shuffler.create_shuffle_masks(
+                            i, list(range(len(bucket_sums))), bucket_lists[i]
                         )
-                        for bucket_sum in bucket_sums
-                    ]
+                        bucket_sums_list[i] = batch_getitem(
+                            bucket_sums, shuffle_masks
+                        ).to(self.label_holder, move_config)
             else:
-                bucket_sums = self.label_holder(batch_select_sum)(
+                bucket_sums = self.label_holder(batch_assignment_sum)(
                     encrypted_gh_dict[worker],
-                    children_split_node_selects,
+                    node_assignments[i],
+                    children_node_indices,
                     order_map_sub.partitions[worker],
                     bucket_num_plus_one,
                 )
@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 from dataclasses import dataclass, field
-from typing import Dict, Union
+from typing import Dict, Tuple, Union
 
 import numpy as np
 from heu import phe
@@ -44,12 +45,18 @@ class GradientEncryptorParams:
         default: False
         if turned on, gh won't be sent to workers in anyway.
     'audit_paths': dict. {device : path to save log for audit}
+    'enable_pipelined_encryption': bool. if true, encryptions of zeros for the next tree
+        are computed while waiting for bucket sums of the last level,
+        gradients of the next tree are encrypted by adding them to the zeros.
+        not effective if label holder is in audit_paths.
+        default: False
     """
 
     fixed_point_parameter: int = default_params.fixed_point_parameter
     batch_encoding_enabled: bool = default_params.batch_encoding_enabled
     label_holder_feature_only: bool = False
     audit_paths: dict = field(default_factory=dict)
+    enable_pipelined_encryption: bool = default_params.enable_pipelined_encryption
 
 
 def define_encoder(params: GradientEncryptorParams):
@@ -67,6 +74,11 @@ class GradientEncryptor(Component):
         self.params = GradientEncryptorParams()
         self.logging_params = LoggingParams()
         self.gh_encoder = define_encoder(self.params)
+        self.num_boost_round = default_params.num_boost_round
+        # (row number, encrypted zeros) computed ahead for the next tree.
+        self.encrypted_zeros: Union[None, Tuple[int, HEUObject]] = None
+        self.encrypted_rows = 0
+        self.pipelined_rows = 0
 
     def show_params(self):
         print_params(self.params)
@@ -76,6 +88,10 @@ class GradientEncryptor(Component):
         self.label_holder = devices.label_holder
         self.workers = devices.workers
         self.heu = devices.heu
+        # devices are set once per training, nothing is carried over from the last one.
+        self.encrypted_zeros = None
+        self.encrypted_rows = 0
+        self.pipelined_rows = 0
         label_holder_party_name = self.label_holder.party
         assert (
             label_holder_party_name == self.heu.sk_keeper_name()
@@ -92,6 +108,7 @@ class GradientEncryptor(Component):
         params['batch_encoding_enabled'] = self.params.batch_encoding_enabled
         params['audit_paths'] = self.params.audit_paths
         params['label_holder_feature_only'] = self.params.label_holder_feature_only
+        params['enable_pipelined_encryption'] = self.params.enable_pipelined_encryption
         LoggingTools.logging_params_write_dict(params, self.logging_params)
 
     def set_params(self, params: dict):
@@ -109,6 +126,15 @@ class GradientEncryptor(Component):
         self.params.fixed_point_parameter = fxp_r
         self.params.batch_encoding_enabled = enable_batch_encoding
         self.params.audit_paths = audit_paths
+        self.params.enable_pipelined_encryption = bool(
+            params.get(
+                'enable_pipelined_encryption',
+                default_params.enable_pipelined_encryption,
+            )
+        )
+        self.num_boost_round = params.get(
+            'num_boost_round', default_params.num_boost_round
+        )
 
         # calculate attributes
         self.gh_encoder = define_encoder(self.params)
@@ -117,8 +143,34 @@ class GradientEncryptor(Component):
     def pack(self, g: PYUObject, h: PYUObject) -> PYUObject:
         return self.label_holder(lambda g, h: np.concatenate([g, h], axis=1))(g, h)
 
+    def prefetch_encrypted_zeros(self, row_num: int, next_tree_index: int):
+        """Encrypt zeros for gradients of the next tree ahead.
+
+        Encryption is dominated by computing the randomness, which does not
+        depend on the plaintext. The encrypted zeros are computed by the label
+        holder while the current tree is still training, so the next tree only
+        adds its gradients to them in encrypt.
+        """
+        if (
+            not self.params.enable_pipelined_encryption
+            or self.params.label_holder_feature_only
+            or self.label_holder.party in self.params.audit_paths
+            or next_tree_index >= self.num_boost_round
+            or self.encrypted_zeros is not None
+        ):
+            return
+        zeros = self.label_holder(lambda row_num: np.zeros((row_num, 2)))(row_num)
+        self.encrypted_zeros = (
+            row_num,
+            zeros.to(
+                self.heu, move_config(self.label_holder, self.gh_encoder)
+            ).encrypt(),
+        )
+
     @LoggingTools.enable_logging
-    def encrypt(self, gh: PYUObject, tree_index: int) -> Union[None, HEUObject]:
+    def encrypt(
+        self, gh: PYUObject, tree_index: int, row_num: int = None
+    ) -> Union[None, HEUObject]:
         if self.params.label_holder_feature_only:
             return None
         if self.label_holder.party in self.params.audit_paths:
@@ -130,8 +182,32 @@ class GradientEncryptor(Component):
         else:
             path = None
 
-        return gh.to(self.heu, move_config(self.label_holder, self.gh_encoder)).encrypt(
-            path
+        # encrypted zeros are used at most once.
+        encrypted_zeros, self.encrypted_zeros = self.encrypted_zeros, None
+        gh = gh.to(self.heu, move_config(self.label_holder, self.gh_encoder))
+        if row_num is not None:
+            self.encrypted_rows += row_num
+        if (
+            path is None
+            and encrypted_zeros is not None
+            and row_num is not None
+            and encrypted_zeros[0] >= row_num
+        ):
+            zeros_row_num, zeros = encrypted_zeros
+            if zeros_row_num > row_num:
+                zeros = zeros[:row_num]
+            self.pipelined_rows += row_num
+            self._log_pipeline_stats(tree_index)
+            # gh is in plaintext at label holder, adding it is cheap.
+            return zeros + gh
+        if self.params.enable_pipelined_encryption:
+            self._log_pipeline_stats(tree_index)
+        return gh.encrypt(path)
+
+    def _log_pipeline_stats(self, tree_index: int):
+        logging.info(
+            f"tree {tree_index}: {self.pipelined_rows}/{self.encrypted_rows} rows of "
+            "gradients so far encrypted with zeros computed ahead."
         )
 
     @LoggingTools.enable_logging
@@ -17,7 +17,10 @@ from typing import List
 
 import numpy as np
 
-from ....core.pure_numpy_ops.boost import compute_weight_from_node_select
+from ....core.pure_numpy_ops.boost import (
+    compute_weight_from_node_assignment,
+    compute_weight_from_node_select,
+)
 
 # handle order map building for one party
 
@@ -33,6 +36,9 @@ class LeafActor:
         self.leaf_node_selects.extend(pruned_node_selects)
         self.leaf_node_indices.extend(pruned_node_indices)
 
+    def extend_leaf_indices(self, leaf_node_indices: List[int]):
+        self.leaf_node_indices.extend(leaf_node_indices)
+
     def clear_leaves(self):
         self.leaf_node_selects = []
         self.leaf_node_indices = []
@@ -46,3 +52,8 @@ class LeafActor:
     def compute_leaf_weights(self, reg_lambda, lr, g, h):
         s = np.concatenate(self.leaf_node_selects, axis=0)
         return compute_weight_from_node_select(s, g, h, reg_lambda, lr)
+
+    def compute_leaf_weights_by_assignment(self, reg_lambda, lr, g, h, node_assignment):
+        return compute_weight_from_node_assignment(
+            node_assignment, self.leaf_node_indices, g, h, reg_lambda, lr
+        )
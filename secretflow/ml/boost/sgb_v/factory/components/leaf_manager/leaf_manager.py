@@ -78,6 +78,12 @@ class LeafManager(Component):
             'LeafActor', 'extend_leaves', pruned_node_selects, pruned_node_indices
         )
 
+    def extend_leaf_indices(self, leaf_node_indices: List[int]):
+        """samples of the leaves are given by node assignment when computing weights."""
+        self.leaf_actor.invoke_class_method(
+            'LeafActor', 'extend_leaf_indices', leaf_node_indices
+        )
+
     def get_leaf_selects(self):
         return self.leaf_actor.invoke_class_method('LeafActor', 'get_leaf_selects')
 
@@ -95,3 +101,16 @@ class LeafManager(Component):
             g,
             h,
         )
+
+    def compute_leaf_weights_by_assignment(self, g, h, node_assignment):
+        reg_lambda = self.params.reg_lambda
+        lr = self.params.learning_rate
+        return self.leaf_actor.invoke_class_method(
+            'LeafActor',
+            'compute_leaf_weights_by_assignment',
+            reg_lambda,
+            lr,
+            g,
+            h,
+            node_assignment,
+        )
@@ -14,7 +14,7 @@
 
 from dataclasses import dataclass
 
-from typing import Union
+from typing import Dict, Union
 
 from secretflow.data import FedNdarray
 from secretflow.device import PYUObject
@@ -81,6 +81,15 @@ class ModelBuilder(Component):
     def insert_tree(self, tree: DistributedTree):
         self.model._insert_distributed_tree(tree)
 
+    def restore_trees(self, model: SgbModel):
+        """insert trees of a model saved before, to continue training on them."""
+        for tree in model.trees:
+            self.insert_tree(tree)
+
+    def save_model(self, device_path_dict: Dict):
+        self.model.sync_partition_columns_to_all_distributed_trees()
+        self.model.save_model(device_path_dict)
+
     def set_parition_shapes(self, x: FedNdarray):
         shapes = x.partition_shape()
         self.model.partition_column_counts = {
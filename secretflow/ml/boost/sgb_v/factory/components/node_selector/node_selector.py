@@ -11,31 +11,53 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from dataclasses import dataclass
 from typing import List, Tuple, Union
 
 import numpy as np
 
-from secretflow.device import PYUObject
+from secretflow.device import PYU, PYUObject
 
-from ....core.pure_numpy_ops.node_select import get_child_select, root_select
-from ..component import Component, Devices
+from ....core.pure_numpy_ops.node_select import (
+    apply_node_assignment_delta,
+    get_child_select,
+    pick_children_nodes,
+    root_assignment,
+    root_select,
+    update_node_assignment,
+)
+from ..component import Component, Devices, print_params
+
+
+@dataclass
+class NodeSelectorParams:
+    """
+    'label_holder_feature_only': bool. if true, only label holder splits nodes,
+        non-label holders will not receive the node assignment of samples.
+        default: False
+    """
+
+    label_holder_feature_only: bool = False
 
 
 class NodeSelector(Component):
     def __init__(self) -> None:
-        return
+        self.params = NodeSelectorParams()
 
     def show_params(self):
-        return
+        print_params(self.params)
 
-    def set_params(self, _: dict):
-        return
+    def set_params(self, params: dict):
+        self.params.label_holder_feature_only = bool(
+            params.get('label_holder_feature_only', False)
+        )
 
-    def get_params(self, _: dict):
-        return
+    def get_params(self, params: dict):
+        params['label_holder_feature_only'] = self.params.label_holder_feature_only
 
     def set_devices(self, devices: Devices):
         self.label_holder = devices.label_holder
+        self.workers = devices.workers
 
     def set_actors(self, _):
         return
@@ -43,9 +65,78 @@ class NodeSelector(Component):
     def del_actors(self):
         return
 
+    def splitting_workers(self) -> List[PYU]:
+        """workers which split nodes."""
+        if self.params.label_holder_feature_only:
+            return [self.label_holder]
+        return self.workers
+
     def root_select(self, sample_num):
         return root_select(samples=sample_num)
 
+    def root_assignments(self, sample_num: int, dtype: np.dtype) -> List[PYUObject]:
+        """node assignment of the root at each worker, all samples are in node 0."""
+        return [worker(root_assignment)(sample_num, dtype) for worker in self.workers]
+
+    def pick_children_nodes(
+        self, node_assignment: PYUObject, node_indices: Union[List[int], PYUObject]
+    ) -> Tuple[PYUObject, PYUObject, PYUObject]:
+        return self.label_holder(pick_children_nodes, num_returns=3)(
+            node_assignment, node_indices
+        )
+
+    def update_node_assignments(
+        self,
+        node_assignments: List[PYUObject],
+        left_bits_each_party: List[PYUObject],
+        gain_is_cost_effective: List[bool],
+        split_node_indices: Union[List[int], PYUObject],
+    ) -> Tuple[List[PYUObject], PYUObject, PYUObject]:
+        """
+        move samples of split nodes into their children at all workers.
+
+        Args:
+            node_assignments: List[PYUObject]. node index of each sample at each worker.
+            left_bits_each_party: List[PYUObject]. packed bits of samples going to
+                left children of nodes split by each party, None if the party
+                does not split nodes.
+            gain_is_cost_effective: List[bool]. indicate whether node should be split.
+            split_node_indices: List[int]. node indices at the current level.
+
+        Return:
+            node assignments of the next level at each worker. if label_holder_feature_only,
+                node assignments of non-label holders are unchanged.
+            node indices for the next level
+            node indices for pruned nodes
+        """
+        label_holder_index = self.workers.index(self.label_holder)
+        (
+            label_holder_assignment,
+            delta,
+            child_node_indices,
+            pruned_node_indices,
+        ) = self.label_holder(update_node_assignment, num_returns=4)(
+            node_assignments[label_holder_index],
+            [
+                bits.to(self.label_holder)
+                for bits in left_bits_each_party
+                if bits is not None
+            ],
+            gain_is_cost_effective,
+            split_node_indices,
+        )
+        new_node_assignments = []
+        for worker, node_assignment in zip(self.workers, node_assignments):
+            if worker == self.label_holder:
+                node_assignment = label_holder_assignment
+            elif not self.params.label_holder_feature_only:
+                # other workers only receive the children bits of samples in split nodes.
+                node_assignment = worker(apply_node_assignment_delta)(
+                    node_assignment, delta.to(worker)
+                )
+            new_node_assignments.append(node_assignment)
+        return new_node_assignments, child_node_indices, pruned_node_indices
+
     def is_list_empty(self, any_list: Union[PYUObject, List]) -> PYUObject:
         return self.label_holder(lambda any_list: len(any_list) == 0)(any_list)
 
@@ -17,6 +17,12 @@ from typing import List, Tuple, Union
 
 import numpy as np
 
+from secretflow.ml.boost.core.checkpoint import (
+    load_order_map_cache,
+    save_order_map_cache,
+)
+
+from ....core.pure_numpy_ops.node_select import node_positions
 from .order_map_context import OrderMapContext
 
 
@@ -26,13 +32,39 @@ class OrderMapActor:
         self.idx = idx
         self.ordermap_context = OrderMapContext()
 
-    def build_order_map(self, x: np.ndarray, buckets: int, seed: int) -> np.ndarray:
+    def build_order_map(
+        self,
+        x: np.ndarray,
+        buckets: int,
+        seed: int,
+        cache_root: Union[str, None] = None,
+        load_cache: bool = False,
+    ) -> np.ndarray:
         """
         Set up global context.
+
+        If cache_root is not None, maps are cached under it after built.
+        If load_cache is True, maps cached before are used instead of building
+        them again, when they match the shape of x and buckets.
         """
         np.random.seed(seed)
+        cache = None
+        if cache_root is not None and load_cache:
+            cache = load_order_map_cache(cache_root, x.shape, buckets)
+        if cache is not None:
+            self.ordermap_context.set_maps(*cache, buckets)
+            return self.ordermap_context.get_order_map()
+
         x = np.array(x, order='F')
         self.ordermap_context.build_maps(x, buckets)
+        if cache_root is not None:
+            save_order_map_cache(
+                cache_root,
+                self.ordermap_context.get_order_map(),
+                self.ordermap_context.get_split_points(),
+                self.ordermap_context.get_feature_buckets(),
+                buckets,
+            )
         return self.ordermap_context.get_order_map()
 
     def get_features(self) -> int:
@@ -77,6 +109,47 @@ class OrderMapActor:
             for split_feature_bucket in split_feature_buckets
         ]
 
+    def batch_compute_left_child_bits(
+        self,
+        split_feature_buckets: List[Union[None, Tuple[int, int]]],
+        node_indices: List[int],
+        node_assignment: np.ndarray,
+        sampled_indices: Union[List[int], None] = None,
+    ) -> np.ndarray:
+        """Compute the left children of all nodes split by this party at once.
+
+        Args:
+            split_feature_buckets (List[Union[None, Tuple[int, int]]]): (feature, split_point_index)
+                of each node, None if the node is not split by this party.
+            node_indices (List[int]): node indices at the current level.
+            node_assignment (np.ndarray): node index of each sample.
+            sampled_indices (Union[List[int], None], optional): samples in original node.
+                Defaults to None. None means all.
+
+        Returns:
+            np.ndarray: packed bits, bit i is 1 if sample i is in a node split by
+                this party and goes to the left child.
+        """
+        features = np.array(
+            [-1 if q is None else q[0] for q in split_feature_buckets], dtype=np.int64
+        )
+        split_points = np.array(
+            [-1 if q is None else q[1] for q in split_feature_buckets], dtype=np.int64
+        )
+        positions = node_positions(node_assignment, node_indices)
+        rows = np.flatnonzero(positions >= 0)
+        rows = rows[features[positions[rows]] >= 0]
+        positions = positions[rows]
+        order_map = self.ordermap_context.get_order_map()
+        map_rows = (
+            rows if sampled_indices is None else np.asarray(sampled_indices)[rows]
+        )
+        go_left = np.zeros(node_assignment.size, dtype=np.uint8)
+        go_left[rows] = (
+            order_map[map_rows, features[positions]] <= split_points[positions]
+        )
+        return np.packbits(go_left)
+
     def compute_left_child_selects(
         self,
         feature: int,
@@ -66,6 +66,21 @@ class OrderMapContext:
 
         self.order_map_shape = self.order_map.shape
 
+    def set_maps(
+        self,
+        order_map: np.ndarray,
+        split_points: List[List[float]],
+        feature_buckets: List[int],
+        buckets: int,
+    ) -> None:
+        """set maps built before, instead of building them from dataset."""
+        self.order_map = order_map
+        self.split_points = split_points
+        self.feature_buckets = feature_buckets
+        self.features = order_map.shape[1]
+        self.buckets = buckets
+        self.order_map_shape = self.order_map.shape
+
     def get_order_map(self) -> np.ndarray:
         return self.order_map
 
@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Union
 
 from secretflow.data import FedNdarray, PartitionWay
-from secretflow.device import PYUObject
+from secretflow.device import PYU, PYUObject
 from secretflow.ml.boost.sgb_v.core.params import default_params
 from secretflow.ml.boost.sgb_v.factory.sgb_actor import SGBActor
 
@@ -85,7 +85,23 @@ class OrderMapManager(Component):
         del self.order_map_actors
 
     @LoggingTools.enable_logging
-    def build_order_map(self, x: FedNdarray) -> FedNdarray:
+    def build_order_map(
+        self,
+        x: FedNdarray,
+        cache_roots: Dict[PYU, str] = None,
+        load_cache: bool = False,
+    ) -> FedNdarray:
+        """Build order maps of all workers.
+
+        Args:
+            x (FedNdarray): dataset.
+            cache_roots (Dict[PYU, str]): maps of a worker are cached under
+                its root if provided.
+            load_cache (bool): if True, use the maps cached before instead of
+                quantizing the dataset again.
+        """
+        if cache_roots is None:
+            cache_roots = {}
         # we assumed x's devices match when setting up devices.
         buckets, seed = self.buckets, self.params.seed
         self.order_map = FedNdarray(
@@ -96,6 +112,8 @@ class OrderMapManager(Component):
                     x.partitions[order_map_actor.device].data,
                     buckets,
                     seed,
+                    cache_roots.get(order_map_actor.device),
+                    load_cache,
                 )
                 for order_map_actor in self.order_map_actors
             },
@@ -162,6 +180,36 @@ class OrderMapManager(Component):
             )
         ]
 
+    def batch_compute_left_child_bits_each_party(
+        self,
+        split_feature_buckets_each_party: List[PYUObject],
+        node_indices: Union[List[int], PYUObject],
+        node_assignments: List[PYUObject],
+        sampled_indices: Union[List[int], None] = None,
+        splitting_workers: Union[List[PYU], None] = None,
+    ) -> List[PYUObject]:
+        """splitting_workers: workers which split nodes, None means all.
+        bits of other workers are None."""
+        return [
+            actor.invoke_class_method(
+                'OrderMapActor',
+                'batch_compute_left_child_bits',
+                queries,
+                node_indices.to(actor.device)
+                if isinstance(node_indices, PYUObject)
+                else node_indices,
+                node_assignment,
+                sampled_indices,
+            )
+            if splitting_workers is None or actor.device in splitting_workers
+            else None
+            for actor, queries, node_assignment in zip(
+                self.order_map_actors,
+                split_feature_buckets_each_party,
+                node_assignments,
+            )
+        ]
+
 
 def eps_inverse(eps):
     return math.ceil(1.0 / eps)
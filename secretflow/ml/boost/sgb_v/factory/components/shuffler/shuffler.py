@@ -71,6 +71,14 @@ class Shuffler(Component):
             'WorkerShuffler', 'create_shuffle_mask', key, bucket_list
         )
 
+    def create_shuffle_masks(
+        self, worker_index: int, keys: List[int], bucket_list: List[PYUObject]
+    ) -> PYUObject:
+        """create shuffle masks of keys in one call, same as create_shuffle_mask for each key in order."""
+        return self.worker_shufflers[worker_index].invoke_class_method(
+            'WorkerShuffler', 'create_shuffle_masks', keys, bucket_list
+        )
+
     def unshuffle_split_buckets(
         self, split_buckets_parition_wise: List[PYUObject]
     ) -> List[PYUObject]:
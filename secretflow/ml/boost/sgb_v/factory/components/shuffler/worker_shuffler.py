@@ -36,6 +36,11 @@ class WorkerShuffler:
         self.shuffler.create_shuffle_mask(key, bucket_list)
         return self.shuffler.get_shuffling_indices(key)
 
+    def create_shuffle_masks(
+        self, keys: List[int], bucket_list: List[PYUObject]
+    ) -> List[List[int]]:
+        return [self.create_shuffle_mask(key, bucket_list) for key in keys]
+
     def is_shuffled(self) -> bool:
         return self.shuffler.is_shuffled()
 
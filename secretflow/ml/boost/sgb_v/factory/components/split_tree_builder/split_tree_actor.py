@@ -123,3 +123,27 @@ class SplitTreeActor:
                 lchild_selects.append(np.array([], dtype=np.uint8))
 
         return lchild_selects
+
+    def insert_split_nodes_list_wise(
+        self,
+        split_features: List[Tuple[int, int]],
+        split_points: List[float],
+        gain_is_cost_effective: List[bool],
+        node_indices: List[int],
+    ):
+        """
+        record split info only, children are given by node assignment.
+        """
+        for key, s in enumerate(split_points):
+            # pruning
+            if not gain_is_cost_effective[key]:
+                continue
+
+            if s is not None:
+                self.tree.insert_split_node(
+                    split_features[key][0],
+                    s,
+                    node_indices[key],
+                )
+            else:
+                self.tree.insert_split_node(-1, float("inf"), node_indices[key])
@@ -190,6 +190,34 @@ class SplitTreeBuilder(Component):
 
         return lchild_selects
 
+    def insert_split_nodes_list_wise_each_party(
+        self,
+        split_features: List[PYUObject],
+        split_points: List[PYUObject],
+        gain_is_cost_effective: List[bool],
+        node_indices: Union[List[int], PYUObject],
+    ):
+        """insert split points to split trees, samples of the children are
+        computed with node assignment, see OrderMapManager.batch_compute_left_child_bits_each_party.
+
+        Args:
+            split_features (List[PYUObject]): party wise. each PYUObject is List[Tuple[int, int]]. len = node indices length.
+            split_points (List[PYUObject]): : party wise. each PYUObject is List[float]. len = node indices length.
+            gain_is_cost_effective (List[bool]): if gain is cost effective
+            node_indices (Union[List[int], PYUObject]): node indices.
+        """
+        for i, actor in enumerate(self.split_tree_builder_actors):
+            actor.invoke_class_method(
+                'SplitTreeActor',
+                'insert_split_nodes_list_wise',
+                split_features[i],
+                split_points[i],
+                gain_is_cost_effective,
+                node_indices.to(self.workers[i])
+                if isinstance(node_indices, PYUObject)
+                else node_indices,
+            )
+
     def insert_split_trees_into_distributed_tree(
         self, distributed_tree: DistributedTree, leaf_node_indices: PYUObject
     ):
@@ -23,6 +23,7 @@ from secretflow.ml.boost.sgb_v.core.params import default_params
 from secretflow.ml.boost.sgb_v.factory.sgb_actor import SGBActor
 
 from ....core.distributed_tree.distributed_tree import DistributedTree
+from ....core.pure_numpy_ops.node_select import node_assignment_dtype
 from ..bucket_sum_calculator import BucketSumCalculator
 from ..component import Devices, print_params
 from ..gradient_encryptor import GradientEncryptor
@@ -171,7 +172,9 @@ class LevelWiseTreeTrainer(TreeTrainer):
         logging.debug("g h scaled.")
 
         gh = self.components.gradient_encryptor.pack(g, h)
-        encrypted_gh = self.components.gradient_encryptor.encrypt(gh, cur_tree_num)
+        encrypted_gh = self.components.gradient_encryptor.encrypt(
+            gh, cur_tree_num, self.node_select_shape[1]
+        )
         self.encrypted_gh_dict = self.components.gradient_encryptor.cache_to_workers(
             encrypted_gh, gh
         )
@@ -194,31 +197,38 @@ class LevelWiseTreeTrainer(TreeTrainer):
         logging.info("begin train tree.")
         row_num = self.node_select_shape[1]
         g, h = self.g, self.h
-        root_select = self.components.node_selector.root_select(row_num)
+        # each worker keeps the node index of each sample, instead of a select per node.
+        node_assignments = self.components.node_selector.root_assignments(
+            row_num, node_assignment_dtype(self.params.max_depth)
+        )
 
         # level wise train begins
-        split_node_selects = root_select
         split_node_indices = [0]
         logging.debug("beging level wise training.")
         for level in range(self.params.max_depth):
             logging.debug(f"training level {level}.")
-            split_node_selects, split_node_indices = self._train_level(
-                split_node_selects,
+            node_assignments, split_node_indices = self._train_level(
+                node_assignments,
                 split_node_indices,
                 level,
                 cur_tree_num,
                 order_map_manager,
             )
-            if reveal(self.components.node_selector.is_list_empty(split_node_indices)):
+            if len(split_node_indices) == 0:
                 # pruned all nodes
                 break
+        # no-op if prefetched at the last level
+        self.components.gradient_encryptor.prefetch_encrypted_zeros(
+            row_num, cur_tree_num + 1
+        )
 
         # leaf nodes
         # label_holder calc weights
-        self.components.leaf_manager.extend_leaves(
-            split_node_selects, split_node_indices
+        self.components.leaf_manager.extend_leaf_indices(split_node_indices)
+        label_holder_index = self.workers.index(self.label_holder)
+        weight = self.components.leaf_manager.compute_leaf_weights_by_assignment(
+            g, h, node_assignments[label_holder_index]
         )
-        weight = self.components.leaf_manager.compute_leaf_weights(g, h)
         leaf_node_indices = self.components.leaf_manager.get_leaf_indices()
         tree = DistributedTree()
         tree.set_enable_packbits(
@@ -233,19 +243,24 @@ class LevelWiseTreeTrainer(TreeTrainer):
     @LoggingTools.enable_logging
     def _train_level(
         self,
-        split_node_selects: PYUObject,
-        split_node_indices: Union[List[int], PYUObject],
+        node_assignments: List[PYUObject],
+        split_node_indices: List[int],
         level: int,
         tree_num: int,
         order_map_manager: OrderMapManager,
-    ) -> Tuple[PYUObject, PYUObject, PYUObject, PYUObject]:
+    ) -> Tuple[List[PYUObject], List[int]]:
         last_level = level == (self.params.max_depth - 1)
+        if last_level:
+            # overlaps with waiting for bucket sums of the last level.
+            self.components.gradient_encryptor.prefetch_encrypted_zeros(
+                self.node_select_shape[1], tree_num + 1
+            )
 
         (
             label_holder_split_buckets,
             gain_is_cost_effective,
         ) = self._find_best_split_bucket(
-            split_node_selects, last_level, tree_num, level
+            node_assignments, split_node_indices, last_level, tree_num, level
         )
 
         # split not in party will be marked as -1
@@ -265,37 +280,43 @@ class LevelWiseTreeTrainer(TreeTrainer):
                 unmasked_split_buckets_viewed_each_party
             )
         )
-        left_selects_each_party = (
-            order_map_manager.batch_compute_left_child_selects_each_party(
-                split_feature_buckets_each_party, self.row_choices
+        left_bits_each_party = (
+            order_map_manager.batch_compute_left_child_bits_each_party(
+                split_feature_buckets_each_party,
+                split_node_indices,
+                node_assignments,
+                self.row_choices,
+                self.components.node_selector.splitting_workers(),
             )
         )
         split_points = order_map_manager.batch_query_split_points_each_party(
             split_feature_buckets_each_party
         )
-        select_shape = self.node_select_shape
-        lchild_ss = self.components.split_tree_builder.do_split_list_wise_each_party(
+        self.components.split_tree_builder.insert_split_nodes_list_wise_each_party(
             split_feature_buckets_each_party,
             split_points,
-            left_selects_each_party,
             gain_is_cost_effective,
             split_node_indices,
-            select_shape,
         )
         (
-            childs_s,
+            node_assignments,
             split_node_indices,
-            pruned_s,
             pruned_node_indices,
-        ) = self.components.node_selector.get_child_select(
-            split_node_selects, lchild_ss, gain_is_cost_effective, split_node_indices
+        ) = self.components.node_selector.update_node_assignments(
+            node_assignments,
+            left_bits_each_party,
+            gain_is_cost_effective,
+            split_node_indices,
         )
-        self.components.leaf_manager.extend_leaves(pruned_s, pruned_node_indices)
-        return childs_s, split_node_indices
+        # all parties knows the shape of tree, so this is fine.
+        split_node_indices = reveal(split_node_indices)
+        self.components.leaf_manager.extend_leaf_indices(pruned_node_indices)
+        return node_assignments, split_node_indices
 
     def _find_best_split_bucket(
         self,
-        split_node_selects: PYUObject,
+        node_assignments: List[PYUObject],
+        split_node_indices: List[int],
         is_last_level: bool,
         tree_num: int,
         level: int,
@@ -305,7 +326,8 @@ class LevelWiseTreeTrainer(TreeTrainer):
         and find best split bucket for each node which has the max split gain.
 
         Args:
-            split_node_selects: PYUObject. List[np.ndarray] at label_holder. Sample select indexes of each node from same tree level.
+            node_assignments: List[PYUObject]. node index of each sample at each worker.
+            split_node_indices: List[int]. node indices from same tree level.
             last_level: bool. if this split is last level, next level is leaf nodes.
             tree_num: int. which tree is training
             level: int. which level is training
@@ -315,13 +337,16 @@ class LevelWiseTreeTrainer(TreeTrainer):
         """
 
         # only compute the gradient sums of left or right children node. (choose fewer ones)
+        label_holder_index = self.workers.index(self.label_holder)
         (
-            children_split_node_selects,
+            children_node_indices,
             is_lefts,
             node_num,
-        ) = self.components.node_selector.pick_children_node_ss(split_node_selects)
+        ) = self.components.node_selector.pick_children_nodes(
+            node_assignments[label_holder_index], split_node_indices
+        )
         # all parties knows the shape of tree, and which nodes in them, so this is fine.
-        is_lefts = reveal(is_lefts)
+        children_node_indices, is_lefts = reveal((children_node_indices, is_lefts))
 
         (
             level_nodes_G,
@@ -329,14 +354,14 @@ class LevelWiseTreeTrainer(TreeTrainer):
         ) = self.components.bucket_sum_calculator.calculate_bucket_sum_level_wise(
             self.components.shuffler,
             self.encrypted_gh_dict,
-            children_split_node_selects,
+            node_assignments,
+            children_node_indices,
             is_lefts,
             self.order_map_sub,
             self.bucket_num,
             self.bucket_lists,
             self.components.gradient_encryptor,
             node_num,
-            self.node_select_shape,
         )
         level_nodes_G, level_nodes_H = self.components.loss_computer.reverse_scale_gh(
             level_nodes_G, level_nodes_H
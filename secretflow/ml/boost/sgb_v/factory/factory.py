@@ -142,3 +142,18 @@ class SGBFactory:
     ) -> SgbModel:
         self.set_params(params)
         return self.fit(dtrain, label)
+
+    def resume(
+        self,
+        params: dict,
+        dtrain: Union[FedNdarray, VDataFrame],
+        label: Union[FedNdarray, VDataFrame],
+    ) -> SgbModel:
+        """Resume a training from the last checkpoint under checkpoint_paths.
+
+        params, dtrain and label should be the same as the interrupted training.
+        If there is no checkpoint, training starts from the first tree.
+        """
+        self.set_params(params)
+        booster = self._produce()
+        return booster.fit(dtrain, label, resume=True)
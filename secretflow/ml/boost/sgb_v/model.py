@@ -14,9 +14,10 @@
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 import jax.numpy as jnp
+import numpy as np
 
 from secretflow.data import FedNdarray, PartitionWay
 from secretflow.data.vertical import VDataFrame
@@ -28,11 +29,33 @@ from .core.distributed_tree.distributed_tree import (
     from_dict as dt_from_dict,
 )
 from .core.params import RegType
-from .core.pure_numpy_ops.pred import sigmoid
+from .core.pure_numpy_ops.pred import (
+    predict_forest_leaf_select,
+    predict_forest_weight,
+    sigmoid,
+)
 
 common_path_postfix = "/common.json"
 leaf_weight_postfix = "/leaf_weight.json"
 split_tree_postfix = "/split_tree.json"
+# max num of leaf selects (samples * leaves of a group of trees) in one predict
+# call, which bounds the memory of leaf selects at each party. A group has at
+# least one tree, so a single tree with more selects is predicted in one call.
+_MAX_BATCH_LEAF_SELECTS = 1 << 28
+
+
+def _tree_groups(leaf_counts: List[int], rows: int) -> List[Tuple[int, int]]:
+    """Split trees into consecutive groups [start, end) whose leaf selects of
+    rows samples are at most _MAX_BATCH_LEAF_SELECTS, there are at most as many
+    groups as trees."""
+    groups, start, leaves = [], 0, 0
+    for i, count in enumerate(leaf_counts):
+        if i > start and (leaves + count) * rows > _MAX_BATCH_LEAF_SELECTS:
+            groups.append((start, i))
+            start, leaves = i, 0
+        leaves += count
+    groups.append((start, len(leaf_counts)))
+    return groups
 
 
 class SgbModel:
@@ -58,10 +81,86 @@ class SgbModel:
     def _insert_distributed_tree(self, tree: DistributedTree):
         self.trees.append(tree)
 
+    def _predict_forest(
+        self, x: Dict[PYU, PYUObject], batch_size: int = None
+    ) -> PYUObject:
+        """sum of all trees' pred.
+
+        Trees are split into groups to bound the memory of leaf selects, and
+        rows are split into batches only if batch_size is set. For each batch
+        and group, each party evaluates its split trees in one call and sends
+        one bit-packed leaf select to label holder, which computes the weights
+        of the trees in one matmul. So the number of calls does not grow with
+        rows, and is bounded by the number of trees.
+        """
+        leaf_counts = reveal(
+            self.label_holder(lambda *weights: [w.size for w in weights])(
+                *[tree.leaf_weight for tree in self.trees]
+            )
+        )
+        device = next(iter(x))
+        samples = reveal(device(lambda x: x.shape[0])(x[device].data))
+        if batch_size is None:
+            batch_size = max(samples, 1)
+        assert batch_size > 0, f"batch_size should be positive, got {batch_size}"
+        batches = [
+            (start, min(start + batch_size, samples))
+            for start in range(0, samples, batch_size)
+        ] or [(0, samples)]
+        groups = _tree_groups(leaf_counts, min(batch_size, max(samples, 1)))
+
+        def _group_weights(*weights):
+            return [
+                np.concatenate([w.reshape(-1) for w in weights[start:end]])
+                for start, end in groups
+            ]
+
+        group_weights = self.label_holder(_group_weights, num_returns=len(groups))(
+            *[tree.leaf_weight for tree in self.trees]
+        )
+        if len(groups) == 1:
+            group_weights = [group_weights]
+
+        devices = [
+            device for device in self.trees[0].split_tree_dict.keys() if device in x
+        ]
+        split_trees = {
+            device: [tree.split_tree_dict[device] for tree in self.trees]
+            for device in devices
+        }
+
+        preds = []
+        for start, end in batches:
+            pred = None
+            for (tree_start, tree_end), weights in zip(groups, group_weights):
+                selects = []
+                for device in devices:
+                    s = device(predict_forest_leaf_select)(
+                        x[device].data,
+                        start,
+                        end,
+                        device != self.label_holder,
+                        *split_trees[device][tree_start:tree_end],
+                    )
+                    selects.append(s.to(self.label_holder))
+                if pred is None:
+                    pred = self.label_holder(predict_forest_weight)(selects, weights)
+                else:
+                    pred = self.label_holder(
+                        lambda selects, weights, pred: pred
+                        + predict_forest_weight(selects, weights)
+                    )(selects, weights, pred)
+            preds.append(pred)
+
+        if len(preds) == 1:
+            return preds[0]
+        return self.label_holder(lambda *preds: np.concatenate(preds, axis=0))(*preds)
+
     def predict(
         self,
         dtrain: Union[FedNdarray, VDataFrame, Dict[PYU, PYUObject]],
         to_pyu: PYU = None,
+        batch_size: int = None,
     ) -> Union[PYUObject, FedNdarray]:
         """
         predict on dtrain with this model.
@@ -75,21 +174,23 @@ class SgbModel:
                 if not None predict result is reveal to to_pyu device and save as FedNdarray
                 otherwise, keep predict result in plaintext and save as PYUObject in label_holder device.
 
+            batch_size: Optional. predict in row batches of this size. If None,
+                all rows are predicted at once. Either way, trees are predicted
+                in groups of at most 2^28 leaf selects (or one tree) at a time.
+
         Return:
             Pred values store in pyu object or FedNdarray.
         """
         if len(self.trees) == 0:
             return None
 
-        pred = 0
         if isinstance(dtrain, dict):
             x = dtrain
         else:
             x, _ = prepare_dataset(dtrain)
             x = x.partitions
 
-        for tree in self.trees:
-            pred = self.label_holder(lambda x, y: jnp.add(x, y))(tree.predict(x), pred)
+        pred = self._predict_forest(x, batch_size)
 
         pred = self.label_holder(lambda x, y: jnp.add(x, y).reshape(-1, 1))(
             pred, self.base
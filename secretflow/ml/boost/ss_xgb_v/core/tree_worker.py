@@ -19,6 +19,10 @@ import numpy as np
 from heu import numpy as hnp
 
 from secretflow.device import PYUObject, proxy
+from secretflow.ml.boost.core.checkpoint import (
+    load_order_map_cache,
+    save_order_map_cache,
+)
 from secretflow.ml.boost.core.order_map_tools import qcut
 
 from .xgb_tree import XgbTree
@@ -93,15 +97,42 @@ class XgbTreeWorker:
             feature_bucket_pos += feature_bucket
         return buckets_map
 
-    def global_setup(self, x: np.ndarray, buckets: int, seed: int):
+    def global_setup(
+        self,
+        x: np.ndarray,
+        buckets: int,
+        seed: int,
+        cache_root: str = None,
+        load_cache: bool = False,
+    ):
         '''
         Set up global context.
+
+        If cache_root is not None, maps are cached under it after built.
+        If load_cache is True, maps cached before are used instead of building
+        them again, when they match the shape of x and buckets.
         '''
         np.random.seed(seed)
-        x = np.array(x, order='F')
         # max buckets in each feature.
         self.buckets = buckets
+        cache = None
+        if cache_root is not None and load_cache:
+            cache = load_order_map_cache(cache_root, x.shape, buckets)
+        if cache is not None:
+            self.order_map, self.split_points, self.feature_buckets = cache
+            self.features = self.order_map.shape[1]
+            return
+
+        x = np.array(x, order='F')
         self._build_maps(x)
+        if cache_root is not None:
+            save_order_map_cache(
+                cache_root,
+                self.order_map,
+                self.split_points,
+                self.feature_buckets,
+                buckets,
+            )
 
     def update_buckets_count(
         self, buckets_count: List[Tuple[int, int]], buckets_choices: np.ndarray
@@ -13,13 +13,15 @@
 # limitations under the License.
 import logging
 import math
+import os
 import time
-from typing import Dict, List, Tuple, Union
+from typing import Callable, Dict, List, Tuple, Union
 
 import jax.numpy as jnp
 import numpy as np
 
 import secretflow as sf
+import secretflow.distributed as sfd
 from secretflow.data import FedNdarray, PartitionWay
 from secretflow.data.vertical import VDataFrame
 from secretflow.device import (
@@ -30,12 +32,23 @@ from secretflow.device import (
     SPUObject,
     wait,
 )
+from secretflow.ml.boost.core.checkpoint import (
+    checkpoint_dir,
+    commit_checkpoint,
+    latest_checkpoint,
+    pickle_dump,
+    pickle_load,
+)
 from secretflow.ml.boost.core.data_preprocess import prepare_dataset, validate
 
 from .core import node_split as split_fn
 from .core.node_split import RegType
 from .core.tree_worker import XgbTreeWorker as Worker
 
+# trees are saved once under the checkpoint root of each party, and shared by
+# all checkpoints after them.
+TREES_DIR = "trees"
+
 
 class XgbModel:
     """
@@ -216,6 +229,12 @@ class Xgb:
         self.buckets = math.ceil(1.0 / sketch)
         self.seed = int(params.pop("seed", 42))
 
+        checkpoint_paths = params.pop("checkpoint_paths", {})
+        self.checkpoint_interval = int(params.pop("checkpoint_interval", 10))
+        assert (
+            1 <= self.checkpoint_interval <= 1024
+        ), f"checkpoint_interval should in [1, 1024], got {self.checkpoint_interval}"
+
         assert len(params) == 0, f"Unknown params {list(params.keys())}"
 
         all_features = x_shape[1]
@@ -226,6 +245,7 @@ class Xgb:
 
         self.workers = [Worker(idx, device=pyu) for idx, pyu in enumerate(x.partitions)]
         self.fragment_count = fragment_count
+        self.checkpoint_roots = self._checkpoint_roots(checkpoint_paths)
 
         logging.info(f"fragment_count {fragment_count}")
 
@@ -247,7 +267,82 @@ class Xgb:
         wait(self.y)
         logging.info(f"prepare time {time.time() - start}s")
 
-    def _global_setup(self) -> None:
+    def _checkpoint_roots(self, checkpoint_paths: Dict[str, str]) -> Dict[PYU, str]:
+        if len(checkpoint_paths) == 0:
+            return {}
+        parties = [worker.device.party for worker in self.workers]
+        for spu in self.spu:
+            parties.extend(p for p in spu.actors.keys() if p not in parties)
+        missing = [p for p in parties if p not in checkpoint_paths]
+        assert len(missing) == 0, f"checkpoint paths of {missing} must be provided"
+        return {PYU(p): checkpoint_paths[p] for p in parties}
+
+    def _spu_paths(self, spu: SPU, path_fn: Callable[[str], str]) -> List[str]:
+        # paths of shares at checkpoint roots of spu parties, in the order of actors.
+        return [path_fn(self.checkpoint_roots[PYU(p)]) for p in spu.actors.keys()]
+
+    def _save_checkpoint(self, model: XgbModel) -> None:
+        start = time.time()
+        tree_num = len(model.trees)
+        dones = []
+        shares = []
+        # trees before the last checkpoint have been saved.
+        for idx in range(self.saved_trees, tree_num):
+            for device, tree in model.trees[idx].items():
+                path = os.path.join(
+                    self.checkpoint_roots[device], TREES_DIR, f"tree_{idx}.pkl"
+                )
+                dones.append(device(pickle_dump)(path, tree))
+            paths = self._spu_paths(
+                self.spu[0],
+                lambda root: os.path.join(root, TREES_DIR, f"weight_{idx}.share"),
+            )
+            shares.extend(self.spu[0].dump(model.weights[idx], paths))
+        for f_idx, pred in enumerate(self.pred):
+            spu = self.spu[f_idx % self.spus]
+            paths = self._spu_paths(
+                spu,
+                lambda root: os.path.join(
+                    checkpoint_dir(root, tree_num), f"pred_{f_idx}.share"
+                ),
+            )
+            shares.extend(spu.dump(pred, paths))
+        wait(dones)
+        sfd.get(shares)
+        commit_checkpoint(self.checkpoint_roots, tree_num)
+        self.saved_trees = tree_num
+        logging.info(
+            f"checkpoint of {tree_num} trees saved, time {time.time() - start}s"
+        )
+
+    def _restore_checkpoint(self, model: XgbModel, tree_num: int) -> None:
+        for idx in range(tree_num):
+            tree = {}
+            for worker in self.workers:
+                device = worker.device
+                path = os.path.join(
+                    self.checkpoint_roots[device], TREES_DIR, f"tree_{idx}.pkl"
+                )
+                tree[device] = device(pickle_load)(path)
+            model.trees.append(tree)
+            paths = self._spu_paths(
+                self.spu[0],
+                lambda root: os.path.join(root, TREES_DIR, f"weight_{idx}.share"),
+            )
+            model.weights.append(self.spu[0].load(paths))
+        self.pred = []
+        for f_idx in range(self.fragment_count):
+            spu = self.spu[f_idx % self.spus]
+            paths = self._spu_paths(
+                spu,
+                lambda root: os.path.join(
+                    checkpoint_dir(root, tree_num), f"pred_{f_idx}.share"
+                ),
+            )
+            self.pred.append(spu.load(paths))
+        self.saved_trees = tree_num
+
+    def _global_setup(self, load_cache: bool = False) -> None:
         start = time.time()
         dones = []
         for idx, worker in enumerate(self.workers):
@@ -255,6 +350,8 @@ class Xgb:
                 self.x[worker.device].data,
                 self.buckets,
                 self.seed + idx,
+                self.checkpoint_roots.get(worker.device),
+                load_cache,
             )
             dones.append(done)
         wait(dones)
@@ -282,6 +379,7 @@ class Xgb:
                 )
         logging.info(f"build & infeed bucket_map time {time.time() - start}s")
 
+    def _init_pred(self) -> None:
         start = time.time()
         self.pred = []
         for f_idx in range(self.fragment_count):
@@ -403,14 +501,62 @@ class Xgb:
                 default: 0
             'seed': Pseudorandom number generator seed.
                 default: 42
+            'checkpoint_paths': {party : directory to save checkpoints of this party}.
+                If not empty, directories of all data holders and spu parties must be provided.
+                Boosting state is saved periodically, and the quantization of dataset is cached,
+                so the training could be resumed by Xgb.resume.
+                default: {}
+            'checkpoint_interval': Save a checkpoint every this number of trees.
+                default: 10
+                range: [1, 1024]
 
         Return:
             XgbModel
         """
+        return self._fit(params, dtrain, label, resume=False)
+
+    def resume(
+        self,
+        params: Dict,
+        dtrain: Union[FedNdarray, VDataFrame],
+        label: Union[FedNdarray, VDataFrame],
+    ) -> XgbModel:
+        """resume a training from the last checkpoint under checkpoint_paths.
+
+        params, dtrain and label should be the same as the interrupted training,
+        see train for details. Bucket maps are built from the cached quantization
+        of dataset. Random states of row and column sampling are not restored,
+        so a resumed training may differ from an uninterrupted one when sampling.
+        If there is no checkpoint, training starts from the first tree.
+
+        Return:
+            XgbModel
+        """
+        return self._fit(params, dtrain, label, resume=True)
+
+    def _fit(
+        self,
+        params: Dict,
+        dtrain: Union[FedNdarray, VDataFrame],
+        label: Union[FedNdarray, VDataFrame],
+        resume: bool,
+    ) -> XgbModel:
         self._prepare(params, dtrain, label)
-        self._global_setup()
+        start_tree = 0
+        if resume:
+            assert (
+                len(self.checkpoint_roots) > 0
+            ), "checkpoint_paths must be provided to resume training"
+            start_tree = latest_checkpoint(self.checkpoint_roots)
+        self._global_setup(load_cache=resume)
 
         model = XgbModel(self.spu[0], self.obj, self.base)
+        self.saved_trees = 0
+        if start_tree > 0:
+            self._restore_checkpoint(model, start_tree)
+            logging.info(f"resume training from checkpoint of {start_tree} trees")
+        else:
+            self._init_pred()
         while len(model.trees) < self.trees:
             start = time.time()
 
@@ -429,6 +575,11 @@ class Xgb:
             if len(model.trees) < self.trees:
                 self._update_pred(tree, weight)
                 wait(self.pred)
+                if (
+                    len(self.checkpoint_roots) > 0
+                    and len(model.trees) % self.checkpoint_interval == 0
+                ):
+                    self._save_checkpoint(model)
             else:
                 wait(list(tree.values()) + [weight])
 
@@ -0,0 +1,144 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import uuid
+from typing import Any, Dict, Hashable, List, Tuple
+
+from secretflow.device import PYU, SPU, SPUObject, wait
+
+
+def _remove_dir(path: str):
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class SPUBatchCache:
+    def __init__(
+        self, spu: SPU, max_resident_batches: int = None, spill_dir: str = None
+    ):
+        """Cache of infeed batches in SPU, which keeps at most max_resident_batches
+        batches in SPU runtime and spills the others to local disk.
+
+        Batches are read cyclically in training, so the first
+        max_resident_batches batches stay resident and the following ones are
+        spilled when they are put. When a spilled batch is got, the next
+        spilled batch is loaded in advance, so at most two spilled batches are
+        in memory at the same time.
+
+        Args:
+            spu: the SPU device of the batches.
+            max_resident_batches: Optional. Num of batches kept in SPU runtime.
+                None means no limit and nothing is spilled.
+            spill_dir: Optional. Directory of spilled shares on each SPU node,
+                a temp directory if not provided.
+        """
+        assert (
+            max_resident_batches is None or max_resident_batches >= 0
+        ), f'max_resident_batches should be non-negative, got {max_resident_batches}'
+        self.spu = spu
+        self.max_resident_batches = max_resident_batches
+        if spill_dir is None:
+            spill_dir = tempfile.gettempdir()
+        self.spill_dir = os.path.join(spill_dir, f'spu_batch_cache_{uuid.uuid4().hex}')
+        # key -> batch
+        self._resident: Dict[Hashable, Tuple] = {}
+        # key -> (batch with SPUObject replaced by paths, SPUObject indices)
+        self._spilled: Dict[Hashable, Tuple[Tuple, List[int]]] = {}
+        # keys in put order.
+        self._keys: List[Hashable] = []
+        # (key, batch) loaded in advance.
+        self._prefetched: Tuple[Hashable, Tuple] = None
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable):
+        return key in self._resident or key in self._spilled
+
+    def __setitem__(self, key: Hashable, batch: Tuple):
+        assert key not in self, f'batch {key} is already in cache'
+        self._keys.append(key)
+        if (
+            self.max_resident_batches is None
+            or len(self._resident) < self.max_resident_batches
+        ):
+            self._resident[key] = batch
+        else:
+            self._spill(key, batch)
+
+    def __getitem__(self, key: Hashable) -> Tuple:
+        if key in self._resident:
+            return self._resident[key]
+        if key not in self._spilled:
+            raise KeyError(key)
+
+        if self._prefetched is not None and self._prefetched[0] == key:
+            batch = self._prefetched[1]
+        else:
+            batch = self._load(key)
+        self._prefetched = None
+
+        next_key = self._next_spilled_key(key)
+        if next_key is not None and next_key != key:
+            # SPU actors run tasks in order, the load is scheduled before the
+            # computation on the next batch without blocking driver.
+            self._prefetched = (next_key, self._load(next_key))
+        return batch
+
+    def _paths(self, key: Hashable, idx: int) -> List[str]:
+        return [
+            os.path.join(self.spill_dir, f'{key}_{idx}_{rank}.share')
+            for rank in range(self.spu.world_size)
+        ]
+
+    def _spill(self, key: Hashable, batch: Tuple):
+        spilled = list(batch)
+        spu_indices = []
+        for idx, value in enumerate(batch):
+            if isinstance(value, SPUObject):
+                paths = self._paths(key, idx)
+                self.spu.dump(value, paths)
+                spilled[idx] = paths
+                spu_indices.append(idx)
+        # SPU actors run tasks in order, the shares are released when batch is
+        # collected, after being dumped.
+        self._spilled[key] = (tuple(spilled), spu_indices)
+
+    def _load(self, key: Hashable) -> Tuple:
+        spilled, spu_indices = self._spilled[key]
+        batch = list(spilled)
+        for idx in spu_indices:
+            batch[idx] = self.spu.load(spilled[idx])
+        return tuple(batch)
+
+    def _next_spilled_key(self, key: Hashable) -> Any:
+        pos = self._keys.index(key)
+        for i in range(1, len(self._keys) + 1):
+            k = self._keys[(pos + i) % len(self._keys)]
+            if k in self._spilled:
+                return k
+        return None
+
+    def clear(self):
+        """Release all batches and remove spilled files."""
+        had_spilled = len(self._spilled) > 0
+        self._resident.clear()
+        self._spilled.clear()
+        self._keys.clear()
+        self._prefetched = None
+        if had_spilled:
+            parties = sorted({node['party'] for node in self.spu.cluster_def['nodes']})
+            wait([PYU(party)(_remove_dir)(self.spill_dir) for party in parties])
@@ -24,6 +24,7 @@ from secretflow.data import FedNdarray, PartitionWay
 from secretflow.data.vertical import VDataFrame
 from secretflow.device import PYU, SPU, PYUObject, SPUObject, wait
 from secretflow.device.driver import reveal
+from secretflow.ml.linear.spu_batch_cache import SPUBatchCache
 from secretflow.stats.core.utils import newton_matrix_inverse
 
 from .core import Distribution, Linker, get_dist, get_link
@@ -236,8 +237,24 @@ def _irls_update_w(
 
 
 class SSGLM:
-    def __init__(self, spu: SPU) -> None:
+    def __init__(
+        self,
+        spu: SPU,
+        max_resident_batches: int = None,
+        batch_cache_dir: str = None,
+    ) -> None:
+        """
+        Args:
+            spu: secure device.
+            max_resident_batches: Optional. Max num of infeed batches kept in
+                SPU runtime during training, the others are spilled to local
+                disk of SPU nodes. None means no limit.
+            batch_cache_dir: Optional. Directory of spilled batches, a temp
+                directory if not provided.
+        """
         self.spu = spu
+        self.max_resident_batches = max_resident_batches
+        self.batch_cache_dir = batch_cache_dir
 
     def _prepare_dataset(
         self, ds: Union[FedNdarray, VDataFrame]
@@ -451,6 +468,7 @@ class SSGLM:
             spu_w = None
 
         self.batch_cache[infeed_step] = (spu_x, spu_y, spu_o, spu_w)
+        return spu_x, spu_y, spu_o, spu_w
 
     def _get_sgd_learning_rate(self, epoch_idx: int):
         if self.decay_rate is not None:
@@ -464,8 +482,10 @@ class SSGLM:
     def _epoch(self, spu_model: SPUObject, epoch_idx: int) -> SPUObject:
         for infeed_step in range(self.infeed_total_batch):
             if epoch_idx == 0:
-                self._build_batch_cache(infeed_step)
-            spu_x, spu_y, spu_o, spu_w = self.batch_cache[infeed_step]
+                # use the batch directly, which may be spilled in cache.
+                spu_x, spu_y, spu_o, spu_w = self._build_batch_cache(infeed_step)
+            else:
+                spu_x, spu_y, spu_o, spu_w = self.batch_cache[infeed_step]
 
             if epoch_idx < self.irls_epochs:
                 spu_model = self._irls_step(spu_model, spu_x, spu_y, spu_o, spu_w)
@@ -528,7 +548,9 @@ class SSGLM:
 
         spu_w = None
 
-        self.batch_cache = {}
+        self.batch_cache = SPUBatchCache(
+            self.spu, self.max_resident_batches, self.batch_cache_dir
+        )
         for epoch_idx in range(self.epochs):
             start = time.time()
             old_w = spu_w
@@ -539,7 +561,7 @@ class SSGLM:
                 logging.info("early stop")
                 break
 
-        self.batch_cache = {}
+        self.batch_cache.clear()
         self.spu_w = spu_w
 
     def fit_irls(
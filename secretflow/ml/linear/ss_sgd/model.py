@@ -34,6 +34,7 @@ from secretflow.device import (
 )
 from secretflow.device.driver import reveal
 from secretflow.ml.linear.linear_model import LinearModel, RegType
+from secretflow.ml.linear.spu_batch_cache import SPUBatchCache
 from secretflow.utils.sigmoid import SigType, sigmoid
 
 
@@ -269,6 +270,11 @@ class SSRegression:
     Args:
 
         spu: secure device.
+        max_resident_batches: Optional. Max num of infeed batches kept in SPU
+            runtime during training, the others are spilled to local disk of
+            SPU nodes. None means no limit.
+        batch_cache_dir: Optional. Directory of spilled batches, a temp
+            directory if not provided.
 
     Notes:
         training dataset should be normalized or standardized,
@@ -276,8 +282,15 @@ class SSRegression:
 
     """
 
-    def __init__(self, spu: SPU) -> None:
+    def __init__(
+        self,
+        spu: SPU,
+        max_resident_batches: int = None,
+        batch_cache_dir: str = None,
+    ) -> None:
         self.spu = spu
+        self.max_resident_batches = max_resident_batches
+        self.batch_cache_dir = batch_cache_dir
 
     def _prepare_dataset(
         self, ds: Union[FedNdarray, VDataFrame]
@@ -547,7 +560,9 @@ class SSRegression:
             base=0, num_feat=self.num_feat
         )
 
-        self.batch_cache = {}
+        self.batch_cache = SPUBatchCache(
+            self.spu, self.max_resident_batches, self.batch_cache_dir
+        )
         self.dk_norm_dict = {}
         for epoch_idx in range(epochs):
             start = time.time()
@@ -559,7 +574,7 @@ class SSRegression:
                 logging.info(f"early stop in {epoch_idx} epoch.")
                 break
 
-        self.batch_cache = {}
+        self.batch_cache.clear()
         self.dk_norm_dict = {}
         self.spu_w = spu_w
 
@@ -26,17 +26,40 @@ from typing import Callable, Dict, List, Tuple, Union
 
 import numpy as np
 
+import secretflow.distributed as sfd
 from secretflow.data.horizontal import HDataFrame
 from secretflow.data.ndarray import FedNdarray
 from secretflow.device import PYU, reveal, wait
 from secretflow.device.device.pyu import PYUObject
+from secretflow.distributed.primitive import DISTRIBUTION_MODE
 from secretflow.ml.nn.fl.compress import COMPRESS_STRATEGY, do_compress
 from secretflow.ml.nn.fl.strategy_dispatcher import dispatch_strategy
 from secretflow.ml.nn.metrics import Metric, aggregate_metrics
+from secretflow.security.aggregation import SecureAggregator, SPUAggregator
 from secretflow.utils.compressor import sparse_encode
 from secretflow.utils.random import global_random
 from secretflow.ml.nn.callbacks.callbacklist import CallbackList
 
+# Strategies supported by asynchronous training, whose train_step returns the
+# model weights or the updates of model weights after local training.
+_ASYNC_WEIGHT_STRATEGIES = ("fed_avg_w", "fed_prox")
+_ASYNC_UPDATE_STRATEGIES = ("fed_avg_u",)
+
+
+def _add_weights(weights: List[np.ndarray], updates: List[np.ndarray]):
+    return [
+        np.asarray(np.add(w, u), dtype=np.asarray(w).dtype)
+        for w, u in zip(weights, updates)
+    ]
+
+
+def _subtract_weights(weights: List[np.ndarray], base: List[np.ndarray]):
+    return [np.subtract(w, b) for w, b in zip(weights, base)]
+
+
+def _scale_weights(updates: List[np.ndarray], scale: float):
+    return [np.multiply(u, scale) for u in updates]
+
 
 class FLModel:
     def __init__(
@@ -352,6 +375,8 @@ class FLModel:
         audit_log_dir=None,
         dataset_builder: Dict[PYU, Callable] = None,
         wait_steps=100,
+        async_buffer_size: int = None,
+        staleness_exponent: float = 0.5,
     ) -> Dict:
         """Horizontal federated training interface
 
@@ -378,6 +403,15 @@ class FLModel:
             audit_log_dir: path of audit log dir, checkpoint will be save if audit_log_dir is not None
             dataset_builder: Callable function about hot to build the dataset. must return (dataset, steps_per_epoch)
             wait_steps: A step size to indicate how many concurrent tasks should be waited, which could prevent the stuck of ray when more tasks join (default 100).
+            async_buffer_size: Optional. If specified, train asynchronously in FedBuff style: a global model is kept
+                on the aggregation device, the average change of client models is added to it whenever
+                async_buffer_size clients have finished a local round, and those clients start their next local round
+                with the new global model immediately, without waiting for the others. The last local rounds of an
+                epoch are aggregated from all clients together. Only supported with aggregator, strategy fed_avg_w,
+                fed_avg_u or fed_prox in simulation or debug mode. Must be at least 2 with a secure aggregator.
+            staleness_exponent: In asynchronous training, the change of a client model is scaled by
+                (1 + staleness) ** -staleness_exponent, where staleness is num of global model updates since the
+                client received the global model.
         Returns:
             A history object. It's history.global_history attribute is a
             aggregated record of training loss values and metrics, while
@@ -402,6 +436,29 @@ class FLModel:
             assert (
                 isinstance(dp_spent_step_freq, int) and dp_spent_step_freq >= 1
             ), 'dp_spent_step_freq should be a integer and greater than or equal to 1!'
+        if async_buffer_size is not None:
+            assert (
+                isinstance(async_buffer_size, int) and async_buffer_size >= 1
+            ), 'async_buffer_size should be a integer and greater than or equal to 1!'
+            # waiting for the first finished clients relies on sfd.wait_ready.
+            assert (
+                sfd.get_distribution_mode() != DISTRIBUTION_MODE.PRODUCTION
+            ), 'Asynchronous training is not supported in production mode.'
+            assert (
+                self._aggregator is not None
+            ), 'Asynchronous training requires an aggregator.'
+            assert (
+                self.strategy in _ASYNC_WEIGHT_STRATEGIES + _ASYNC_UPDATE_STRATEGIES
+            ), f'Asynchronous training does not support strategy {self.strategy}.'
+            assert async_buffer_size <= len(
+                self._workers
+            ), f'async_buffer_size should not be greater than num of clients {len(self._workers)}.'
+            if isinstance(self._aggregator, (SecureAggregator, SPUAggregator)):
+                # the average of a single update is the update itself.
+                assert (
+                    async_buffer_size >= 2
+                ), 'async_buffer_size should be at least 2 with a secure aggregator.'
+            assert staleness_exponent >= 0, 'staleness_exponent should be non-negative!'
 
         # build dataset
         if isinstance(x, Dict):
@@ -464,116 +521,141 @@ class FLModel:
         server_weight = None
         if self.server and isinstance(initial_weight, PYUObject):
             server_weight = initial_weight
+        if async_buffer_size is not None:
+            # the global model of asynchronous training.
+            global_params = initial_weight
+            if not isinstance(global_params, PYUObject):
+                assert (
+                    self.server is not None
+                ), 'Asynchronous training keeps the global model on server, which should be specified.'
+                global_params = global_params.to(self.server)
         callbacks.on_train_begin()
         model_params = None
         model_params_list = None
+        num_aggregations = 0
         for epoch in range(epochs):
             res = []
             report_list = []
             # do train
             report_list.append(f"epoch: {epoch+1}/{epochs} - ")
             callbacks.on_epoch_begin(epoch=epoch)
-            for step in range(0, train_steps_per_epoch, aggregate_freq):
-                callbacks.on_train_batch_begin(batch=step)
-                client_param_list, sample_num_list = [], []
-                for idx, device in enumerate(self._workers.keys()):
-                    client_params = (
-                        model_params_list[idx].to(device)
-                        if model_params_list is not None
-                        else None
-                    )
-                    # refresh data-iter
-                    if step == 0:
-                        self.kwargs["refresh_data"] = True
+            if async_buffer_size is not None:
+                global_params, num_aggregations = self._async_train_epoch(
+                    epoch,
+                    train_steps_per_epoch,
+                    aggregate_freq,
+                    async_buffer_size,
+                    staleness_exponent,
+                    callbacks,
+                    global_params,
+                    num_aggregations,
+                    dp_spent_step_freq,
+                )
+            else:
+                for step in range(0, train_steps_per_epoch, aggregate_freq):
+                    callbacks.on_train_batch_begin(batch=step)
+                    client_param_list, sample_num_list = [], []
+                    for idx, device in enumerate(self._workers.keys()):
+                        client_params = (
+                            model_params_list[idx].to(device)
+                            if model_params_list is not None
+                            else None
+                        )
+                        # refresh data-iter
+                        if step == 0:
+                            self.kwargs["refresh_data"] = True
+                        else:
+                            self.kwargs["refresh_data"] = False
+
+                        client_params, sample_num = self._workers[device].train_step(
+                            client_params,
+                            epoch * train_steps_per_epoch + step,
+                            aggregate_freq
+                            if step + aggregate_freq < train_steps_per_epoch
+                            else train_steps_per_epoch - step,
+                            **self.kwargs,
+                        )
+                        client_param_list.append(client_params)
+                        sample_num_list.append(sample_num)
+                        res.append(client_params)
+                    if self._aggregator is not None:
+                        model_params = self._aggregator.average(
+                            client_param_list, axis=0, weights=sample_num_list
+                        )
                     else:
-                        self.kwargs["refresh_data"] = False
-
-                    client_params, sample_num = self._workers[device].train_step(
-                        client_params,
-                        epoch * train_steps_per_epoch + step,
-                        aggregate_freq
-                        if step + aggregate_freq < train_steps_per_epoch
-                        else train_steps_per_epoch - step,
-                        **self.kwargs,
-                    )
-                    client_param_list.append(client_params)
-                    sample_num_list.append(sample_num)
-                    res.append(client_params)
-                if self._aggregator is not None:
-                    model_params = self._aggregator.average(
-                        client_param_list, axis=0, weights=sample_num_list
-                    )
-                else:
-                    if self.server is not None:
-                        # server will do aggregation
-                        model_params_list = [
-                            param.to(self.server) for param in client_param_list
-                        ]
-                        model_params_list = self.server(
-                            self.server_agg_method,
-                            num_returns=len(
-                                self.device_list,
-                            ),
-                        )(model_params_list)
+                        if self.server is not None:
+                            # server will do aggregation
+                            model_params_list = [
+                                param.to(self.server) for param in client_param_list
+                            ]
+                            model_params_list = self.server(
+                                self.server_agg_method,
+                                num_returns=len(
+                                    self.device_list,
+                                ),
+                            )(model_params_list)
+                            model_params_list = [
+                                params.to(device)
+                                for device, params in zip(
+                                    self.device_list, model_params_list
+                                )
+                            ]
+                        else:
+                            raise Exception(
+                                "Aggregation can be on either an aggregator or a server, but not none at the same time"
+                            )
+
+                    # Do weight sparsify
+                    if self.strategy in COMPRESS_STRATEGY and server_weight:
+                        if self._res:
+                            self._res.to(self.server)
+                        agg_update = model_params.to(self.server)
+                        server_weight = server_weight.to(self.server)
+                        server_weight, model_params, self._res = self.server(
+                            do_compress, num_returns=3
+                        )(
+                            self.strategy,
+                            self.kwargs.get('sparsity', 0.0),
+                            server_weight,
+                            agg_update,
+                            self._res,
+                        )
+                        # Do sparse matrix encoding
+                        if self.strategy == 'fed_stc':
+                            model_params = model_params.to(self.server)
+                            model_params = self.server(sparse_encode, num_return=1)(
+                                data=model_params,
+                                encode_method='coo',
+                            )
+
+                    # DP operation
+                    if dp_spent_step_freq is not None and self.dp_strategy is not None:
+                        current_dp_step = math.ceil(
+                            epoch * train_steps_per_epoch / aggregate_freq
+                        ) + int(step / aggregate_freq)
+                        if current_dp_step % dp_spent_step_freq == 0:
+                            privacy_spent = self.dp_strategy.get_privacy_spent(
+                                current_dp_step
+                            )
+                            logging.debug(f'DP privacy accountant {privacy_spent}')
+                    if len(res) == wait_steps:
+                        wait(res)
+                        res = []
+                    if self._aggregator is not None:
+                        model_params_list = [model_params for _ in self.device_list]
                         model_params_list = [
                             params.to(device)
                             for device, params in zip(
                                 self.device_list, model_params_list
                             )
                         ]
-                    else:
-                        raise Exception(
-                            "Aggregation can be on either an aggregator or a server, but not none at the same time"
-                        )
+                    callbacks.on_train_batch_end(batch=step)
 
-                # Do weight sparsify
-                if self.strategy in COMPRESS_STRATEGY and server_weight:
-                    if self._res:
-                        self._res.to(self.server)
-                    agg_update = model_params.to(self.server)
-                    server_weight = server_weight.to(self.server)
-                    server_weight, model_params, self._res = self.server(
-                        do_compress, num_returns=3
-                    )(
-                        self.strategy,
-                        self.kwargs.get('sparsity', 0.0),
-                        server_weight,
-                        agg_update,
-                        self._res,
-                    )
-                    # Do sparse matrix encoding
-                    if self.strategy == 'fed_stc':
-                        model_params = model_params.to(self.server)
-                        model_params = self.server(sparse_encode, num_return=1)(
-                            data=model_params,
-                            encode_method='coo',
-                        )
-
-                # DP operation
-                if dp_spent_step_freq is not None and self.dp_strategy is not None:
-                    current_dp_step = math.ceil(
-                        epoch * train_steps_per_epoch / aggregate_freq
-                    ) + int(step / aggregate_freq)
-                    if current_dp_step % dp_spent_step_freq == 0:
-                        privacy_spent = self.dp_strategy.get_privacy_spent(
-                            current_dp_step
-                        )
-                        logging.debug(f'DP privacy accountant {privacy_spent}')
-                if len(res) == wait_steps:
-                    wait(res)
-                    res = []
-                if self._aggregator is not None:
-                    model_params_list = [model_params for _ in self.device_list]
-                    model_params_list = [
-                        params.to(device)
-                        for device, params in zip(self.device_list, model_params_list)
-                    ]
-                callbacks.on_train_batch_end(batch=step)
-
-            # last batch
-            for idx, device in enumerate(self._workers.keys()):
-                client_params = model_params_list[idx].to(device)
-                self._workers[device].apply_weights(client_params)
+            # last batch, clients of asynchronous training hold the global model already.
+            if async_buffer_size is None:
+                for idx, device in enumerate(self._workers.keys()):
+                    client_params = model_params_list[idx].to(device)
+                    self._workers[device].apply_weights(client_params)
             model_params_list = None
 
             local_metrics_obj = []
@@ -615,6 +697,144 @@ class FLModel:
         callbacks.on_train_end()
         return callbacks.history
 
+    def _async_train_epoch(
+        self,
+        epoch: int,
+        train_steps_per_epoch: int,
+        aggregate_freq: int,
+        buffer_size: int,
+        staleness_exponent: float,
+        callbacks: CallbackList,
+        global_params: PYUObject,
+        num_aggregations: int,
+        dp_spent_step_freq: int = None,
+    ) -> Tuple[PYUObject, int]:
+        """Train an epoch asynchronously in FedBuff style.
+
+        Each client runs its local rounds of the epoch one by one from the
+        global model it received last, and reports the change of its model
+        scaled by (1 + staleness) ** -staleness_exponent. Whenever buffer_size
+        clients have reported, the weighted average of their changes is added
+        to the global model and these clients start their next rounds with it.
+
+        The last rounds of all clients are aggregated together, so stragglers
+        are merged into the last aggregation of the epoch. When fewer than
+        buffer_size clients could report before their last rounds, they keep
+        training locally until their last rounds.
+
+        Returns:
+            the global params, and num of aggregations.
+        """
+        is_update = self.strategy in _ASYNC_UPDATE_STRATEGIES
+        global_device = global_params.device
+        round_steps = list(range(0, train_steps_per_epoch, aggregate_freq))
+        next_round = {device: 0 for device in self._workers}
+        done_steps = {device: 0 for device in self._workers}
+        # device -> (global params the client model started from, its version)
+        bases = {}
+        # device -> updates of the finished local rounds since its base,
+        # only for update strategies.
+        carried = {}
+        # device -> (client params, sample num) of the running round
+        running = {}
+        # reported (device, change of client model, sample num)
+        pending, finals = [], []
+        version = 0
+
+        def _start_round(device, params):
+            step = round_steps[next_round[device]]
+            next_round[device] += 1
+            # refresh data-iter
+            self.kwargs["refresh_data"] = step == 0
+            worker = self._workers[device]
+            if params is not None and is_update:
+                worker.set_weights(params)
+                params = None
+            running[device] = worker.train_step(
+                params,
+                epoch * train_steps_per_epoch + step,
+                min(aggregate_freq, train_steps_per_epoch - step),
+                **self.kwargs,
+            )
+
+        def _sync(device):
+            bases[device] = (global_params.to(device), version)
+            carried[device] = None
+
+        def _aggregate(reports):
+            nonlocal global_params, version, num_aggregations
+            callbacks.on_train_batch_begin(batch=min(done_steps.values()))
+            changes, sample_nums = [], []
+            for device, change, sample_num in reports:
+                staleness = version - bases[device][1]
+                changes.append(
+                    device(_scale_weights)(
+                        change, (1 + staleness) ** (-staleness_exponent)
+                    )
+                )
+                sample_nums.append(sample_num)
+            avg_change = self._aggregator.average(changes, axis=0, weights=sample_nums)
+            global_params = global_device(_add_weights)(
+                global_params, avg_change.to(global_device)
+            )
+            version += 1
+
+            # DP operation
+            num_aggregations += 1
+            if dp_spent_step_freq is not None and self.dp_strategy is not None:
+                if num_aggregations % dp_spent_step_freq == 0:
+                    privacy_spent = self.dp_strategy.get_privacy_spent(num_aggregations)
+                    logging.debug(f'DP privacy accountant {privacy_spent}')
+            callbacks.on_train_batch_end(batch=min(done_steps.values()))
+
+        for device in self._workers:
+            _sync(device)
+            _start_round(device, bases[device][0])
+        while running:
+            devices = list(running)
+            device = devices[
+                sfd.wait_ready([running[d][0].data for d in devices], num_returns=1)[0]
+            ]
+            client_params, sample_num = running.pop(device)
+            done_steps[device] = min(
+                round_steps[next_round[device] - 1] + aggregate_freq,
+                train_steps_per_epoch,
+            )
+            if is_update:
+                change = (
+                    client_params
+                    if carried[device] is None
+                    else device(_add_weights)(carried[device], client_params)
+                )
+            else:
+                change = device(_subtract_weights)(client_params, bases[device][0])
+            if next_round[device] == len(round_steps):
+                finals.append((device, change, sample_num))
+            else:
+                pending.append((device, change, sample_num))
+
+            if len(pending) >= buffer_size:
+                _aggregate(pending)
+                for device, _, _ in pending:
+                    _sync(device)
+                    _start_round(device, bases[device][0])
+                pending = []
+                continue
+            contributors = len(pending) + sum(
+                next_round[d] < len(round_steps) for d in running
+            )
+            if pending and contributors < buffer_size:
+                # no more buffers could be filled before the last rounds.
+                for device, change, _ in pending:
+                    carried[device] = change
+                    _start_round(device, None)
+                pending = []
+
+        _aggregate(finals)
+        for device, worker in self._workers.items():
+            worker.set_weights(global_params.to(device))
+        return global_params, num_aggregations
+
     def predict(
         self,
         x: Union[HDataFrame, FedNdarray, Dict],
@@ -15,6 +15,7 @@
 """Aggregation Layer for SLModel
 
 """
+from functools import partial
 from typing import Dict, List, Tuple, Union
 
 import jax.numpy as jnp
@@ -72,6 +73,8 @@ class AggLayer(object):
         self.losses = None
         self.fuse_sparse_masks = None
         self.is_compressed = None
+        # states of each step in forward_steps, used by backward_steps.
+        self.steps_states = None
 
     def get_parties(self):
         return self.parties
@@ -153,6 +156,43 @@ class AggLayer(object):
             losses=losses,
         )
 
+    @staticmethod
+    def pack_steps(*f_datas):
+        """Pack hiddens and reg losses of several steps of a party, so that they
+        are transferred at once."""
+        hiddens = [
+            AggLayer.convert_to_ndarray(AggLayer.get_hiddens(f)) for f in f_datas
+        ]
+        losses = [AggLayer.get_reg_loss(f) for f in f_datas]
+        return hiddens, losses
+
+    @staticmethod
+    def unpack_forward_steps(agg_hiddens, backend, party_losses):
+        return [
+            AggLayer.set_forward_data(
+                AggLayer.convert_to_tensor(agg_hidden, backend),
+                [losses[i] for losses in party_losses],
+            )
+            for i, agg_hidden in enumerate(agg_hiddens)
+        ]
+
+    @staticmethod
+    def unpack_gradient_steps(gradients, backend):
+        return [AggLayer.convert_to_tensor(g, backend) for g in gradients]
+
+    @staticmethod
+    def agg_forward_steps(agg_forward, *party_hiddens):
+        return [agg_forward(*hiddens) for hiddens in zip(*party_hiddens)]
+
+    @staticmethod
+    def agg_backward_steps(agg_backward, gradients, party_hiddens, parties_num):
+        # gradients of each party, each of which is a list of steps
+        steps_gradients = [
+            agg_backward(gradient, inputs=list(hiddens), parties_num=parties_num)
+            for gradient, hiddens in zip(gradients, zip(*party_hiddens))
+        ]
+        return [list(party_gradients) for party_gradients in zip(*steps_gradients)]
+
     @staticmethod
     def decompress_hiddens(data, compressor):
         def _decompress_hiddens(datum):
@@ -405,6 +445,105 @@ class AggLayer(object):
                 )
             return compute_data
 
+    def _batch_on_spu(self) -> bool:
+        return self.agg_method is not None and isinstance(self.device_agg, SPU)
+
+    def forward_steps(
+        self,
+        datas: List[Dict[PYU, DeviceObject]],
+    ) -> List[DeviceObject]:
+        """Forward aggregate the embeddings of several consecutive steps.
+
+        When aggregating on SPU, the hiddens of all steps of a party are infeed
+        to SPU at once and aggregated in one SPU program, which amortizes the
+        per-step fixed cost of transfers and SPU programs. Since the tasks are
+        scheduled asynchronously, the transfers of following steps overlap with
+        the aggregation of current steps. Otherwise the steps are forwarded one
+        by one.
+
+        Args:
+            datas: ForwardData dicts of steps.
+        Returns:
+            aggregated ForwardData of steps on device_y.
+        """
+        assert datas, 'Data to aggregate should not be None or empty!'
+        if not self._batch_on_spu():
+            agg_datas = []
+            self.steps_states = []
+            for data in datas:
+                agg_datas.append(self.forward(data))
+                self.steps_states.append(
+                    (self.hiddens, self.fuse_sparse_masks, self.is_compressed)
+                )
+            return agg_datas
+
+        party_hiddens, party_losses = [], []
+        for device in datas[0]:
+            if device not in self.parties:
+                continue
+            hiddens, losses = device(self.pack_steps, num_returns=2)(
+                *[data[device] for data in datas]
+            )
+            party_hiddens.append(hiddens.to(self.device_agg))
+            party_losses.append(losses.to(self.device_y))
+        self.steps_states = party_hiddens
+
+        agg_hiddens = self.device_agg(
+            partial(self.agg_forward_steps, self.agg_method.forward)
+        )(*party_hiddens)
+        agg_datas = self.device_y(self.unpack_forward_steps, num_returns=len(datas))(
+            agg_hiddens.to(self.device_y), self.backend, party_losses
+        )
+        return [agg_datas] if len(datas) == 1 else agg_datas
+
+    def backward_steps(
+        self,
+        gradients: List[DeviceObject],
+    ) -> List[Dict[PYU, DeviceObject]]:
+        """Backward the gradients of the steps of last forward_steps.
+
+        When aggregating on SPU, the gradients of all steps are infeed at once,
+        and computed in one SPU program.
+
+        Args:
+            gradients: gradients of steps calculated from fusenet.
+        Returns:
+            gradients of steps to each party.
+        """
+        assert self.steps_states is not None, 'forward_steps should be called first'
+        if not self._batch_on_spu():
+            scatter_gs = []
+            for state, gradient in zip(self.steps_states, gradients):
+                self.hiddens, self.fuse_sparse_masks, self.is_compressed = state
+                scatter_gs.append(self.backward(gradient))
+            self.steps_states = None
+            return scatter_gs
+
+        steps_num = len(gradients)
+        gradients = self.device_y(
+            lambda *gs: [AggLayer.convert_to_ndarray(g) for g in gs]
+        )(*gradients).to(self.device_agg)
+        p_gradients = self.device_agg(
+            partial(self.agg_backward_steps, self.agg_method.backward),
+            static_argnames='parties_num',
+            num_returns_policy=sf.device.SPUCompilerNumReturnsPolicy.FROM_USER,
+            user_specified_num_returns=len(self.parties),
+        )(gradients, self.steps_states, parties_num=len(self.parties))
+        if not isinstance(p_gradients, (List, Tuple)):
+            p_gradients = [p_gradients]
+        self.steps_states = None
+
+        scatter_gs = [{} for _ in range(steps_num)]
+        for p, d in zip(self.parties, p_gradients):
+            steps_gradients = p(self.unpack_gradient_steps, num_returns=steps_num)(
+                d.to(p), self.backend
+            )
+            if steps_num == 1:
+                steps_gradients = [steps_gradients]
+            for scatter_g, gradient in zip(scatter_gs, steps_gradients):
+                scatter_g[p] = gradient
+        return scatter_gs
+
     def backward(
         self,
         gradient: DeviceObject,
@@ -11,6 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from .pipeline import PYUPipelineTorchModel
+from .split_async import PYUSLAsyncTorchModel
 from .split_nn import PYUSLTorchModel
+from .split_state_async import PYUSLStateAsyncTorchModel
 
-__all__ = [PYUSLTorchModel]
+__all__ = [
+    PYUSLTorchModel,
+    PYUSLAsyncTorchModel,
+    PYUSLStateAsyncTorchModel,
+    PYUPipelineTorchModel,
+]
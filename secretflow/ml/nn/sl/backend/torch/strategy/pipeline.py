@@ -0,0 +1,150 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""pipeline split learning strategy
+
+The backward of a step lags pipeline_size - 1 steps behind its forward, so the
+base net forward of the next steps overlaps with the fuse net of the current
+step. The base net weights of each in-flight step are stashed, so that the
+gradients are computed with the same weights as the forward.
+"""
+from typing import Callable, Dict, List, Optional, Union
+
+import torch
+
+from secretflow.device import PYUObject, proxy
+from secretflow.ml.nn.sl.backend.torch.strategy.split_nn import SLTorchModel
+from secretflow.ml.nn.sl.strategy_dispatcher import register_strategy
+from secretflow.ml.nn.utils import TorchModel
+from secretflow.security.privacy import DPStrategy
+from secretflow.utils.communicate import ForwardData
+
+
+class PipelineTorchModel(SLTorchModel):
+    def __init__(
+        self,
+        builder_base: Callable[[], TorchModel],
+        builder_fuse: Callable[[], TorchModel],
+        dp_strategy: DPStrategy,
+        random_seed: int = None,
+        pipeline_size: int = 1,
+        **kwargs,
+    ):
+        super().__init__(
+            builder_base,
+            builder_fuse,
+            dp_strategy,
+            random_seed,
+            **kwargs,
+        )
+        self.pipeline_size = pipeline_size
+
+        # (hidden, stashed weights) of in-flight steps.
+        self.hidden_list = []
+        # (label, sample weight) of in-flight steps.
+        self._pre_train_y = []
+
+    def reset_data_iter(self, stage):
+        super().reset_data_iter(stage)
+        # in-flight steps only exist in training.
+        if stage == "train":
+            self.hidden_list = []
+            self._pre_train_y = []
+
+    def get_batch_data(self, stage="train"):
+        data_x = super().get_batch_data(stage)
+        if stage == "train" and self.model_fuse is not None:
+            self._pre_train_y.append((self.train_y, self.train_sample_weight))
+        return data_x
+
+    def base_forward_internal(self, data_x, params: Dict[str, torch.Tensor] = None):
+        if params is None:
+            h = self.model_base(data_x)
+        else:
+            h = torch.func.functional_call(self.model_base, params, (data_x,))
+
+        # Embedding differential privacy
+        if self.embedding_dp is not None:
+            if isinstance(h, List):
+                h = [self.embedding_dp(hi) for hi in h]
+            else:
+                h = self.embedding_dp(h)
+
+        return h
+
+    def base_forward(self) -> Optional[ForwardData]:
+        """compute hidden embedding
+        Returns: hidden embedding
+        """
+        if not self.model_base:
+            return None
+        if not self.model_base.training:
+            self._h = self.base_forward_internal(self._data_x)
+            return
+
+        # The weights are updated in place by the backward of previous steps
+        # before the backward of this step, so compute on a stashed copy.
+        params = {
+            name: p.detach().clone().requires_grad_(p.requires_grad)
+            for name, p in self.model_base.named_parameters()
+        }
+        self._h = self.base_forward_internal(self._data_x, params)
+        self.hidden_list.append((self._h, params))
+
+    def base_backward(self):
+        """backward on fusenet
+
+        Args:
+            gradient: gradient of fusenet hidden layer
+        """
+        return_hiddens = []
+        gradient = self._gradient
+        h, params = self.hidden_list.pop(0)
+
+        if len(gradient) == len(h):
+            for i in range(len(gradient)):
+                return_hiddens.append(self.fuse_op.apply(h[i], gradient[i]))
+        else:
+            gradient = (
+                gradient[0]
+                if isinstance(gradient[0], torch.Tensor)
+                else torch.tensor(gradient[0])
+            )
+            return_hiddens.append(self.fuse_op.apply(h, gradient))
+
+        # apply gradients of the stashed weights to base net
+        self.optim_base.zero_grad()
+        for rh in return_hiddens:
+            if rh.requires_grad:
+                rh.sum().backward(retain_graph=True)
+        for name, p in self.model_base.named_parameters():
+            p.grad = params[name].grad
+        self.optim_base.step()
+
+        self.kwargs = {}
+
+    def fuse_net(
+        self,
+        forward_data: Union[List[ForwardData], ForwardData],
+        _num_returns=2,
+    ):
+        # labels of the step which the hiddens belong to.
+        self.train_y, self.train_sample_weight = self._pre_train_y.pop(0)
+        return super().fuse_net(forward_data, _num_returns)
+
+
+@register_strategy(strategy_name='pipeline', backend='torch')
+@proxy(PYUObject)
+class PYUPipelineTorchModel(PipelineTorchModel):
+    pass
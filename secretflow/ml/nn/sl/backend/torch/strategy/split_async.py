@@ -0,0 +1,144 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Async split learning strategy
+
+"""
+
+from typing import Callable, List
+
+import torch
+
+from secretflow.device import PYUObject, proxy
+from secretflow.ml.nn.sl.backend.torch.strategy.split_nn import SLTorchModel
+from secretflow.ml.nn.sl.strategy_dispatcher import register_strategy
+from secretflow.ml.nn.utils import TorchModel
+from secretflow.security.privacy import DPStrategy
+
+
+class SLAsyncTorchModel(SLTorchModel):
+    def __init__(
+        self,
+        builder_base: Callable[[], TorchModel],
+        builder_fuse: Callable[[], TorchModel],
+        dp_strategy: DPStrategy,
+        base_local_steps: int = 1,
+        fuse_local_steps: int = 1,
+        bound_param: float = 0.0,
+        random_seed: int = None,
+        **kwargs,
+    ):
+        super().__init__(
+            builder_base,
+            builder_fuse,
+            dp_strategy,
+            random_seed,
+            **kwargs,
+        )
+        self.base_local_steps = base_local_steps
+        self.fuse_local_steps = fuse_local_steps
+        self.bound_param = bound_param
+
+    def base_forward_internal(self, data_x, use_dp: bool = True):
+        h = self.model_base(data_x)
+
+        # Embedding differential privacy
+        if use_dp and self.embedding_dp is not None:
+            if isinstance(h, List):
+                h = [self.embedding_dp(hi) for hi in h]
+            else:
+                h = self.embedding_dp(h)
+        return h
+
+    def base_backward(self):
+        """backward on fusenet
+
+        Args:
+            gradient: gradient of fusenet hidden layer
+        """
+        gradient = self._gradient
+        for local_step in range(self.base_local_steps):
+            return_hiddens = []
+            if local_step == 0 and self._h is not None:
+                h = self._h
+            else:
+                h = self.base_forward_internal(self._data_x, use_dp=False)
+
+            if len(gradient) == len(h):
+                for i in range(len(gradient)):
+                    return_hiddens.append(self.fuse_op.apply(h[i], gradient[i]))
+            else:
+                gradient = (
+                    gradient[0]
+                    if isinstance(gradient[0], torch.Tensor)
+                    else torch.tensor(gradient[0])
+                )
+                return_hiddens.append(self.fuse_op.apply(h, gradient))
+
+            # apply gradients for base net
+            self.optim_base.zero_grad()
+            for rh in return_hiddens:
+                if rh.requires_grad:
+                    rh.sum().backward(retain_graph=True)
+            self.optim_base.step()
+
+        # clear intermediate results
+        self.tape = None
+        self._h = None
+        self._data_x = None
+        self.kwargs = {}
+
+    def fuse_net_internal(self, hiddens, train_y, train_sample_weight, logs):
+        is_single = not isinstance(hiddens, List) or len(hiddens) == 1
+        if not isinstance(hiddens, List):
+            hiddens = [hiddens]
+        origin_hiddens = [h.detach().clone() for h in hiddens]
+        lr = self.optim_fuse.param_groups[0]['lr']
+        accumulated_gradients = None
+        for local_step in range(self.fuse_local_steps):
+            hiddens_grad = super().fuse_net_internal(
+                hiddens, train_y, train_sample_weight, logs
+            )
+            if not isinstance(hiddens_grad, List):
+                hiddens_grad = [hiddens_grad]
+            # accumulate gradients of embeddings
+            if accumulated_gradients is None:
+                accumulated_gradients = hiddens_grad
+            else:
+                accumulated_gradients = [
+                    acc_g + h_g
+                    for acc_g, h_g in zip(accumulated_gradients, hiddens_grad)
+                ]
+            # update embeddings
+            if self.fuse_local_steps > 1 and local_step < self.fuse_local_steps - 1:
+                if local_step > 0:
+                    hiddens_grad = [
+                        grad + self.bound_param * (h.detach() - origin_h)
+                        for grad, h, origin_h in zip(
+                            hiddens_grad, hiddens, origin_hiddens
+                        )
+                    ]
+                hiddens = [
+                    (h.detach() - lr * h_grad).detach()
+                    for h, h_grad in zip(hiddens, hiddens_grad)
+                ]
+
+        return accumulated_gradients[0] if is_single else accumulated_gradients
+
+
+@register_strategy(strategy_name='split_async', backend='torch')
+@proxy(PYUObject)
+class PYUSLAsyncTorchModel(SLAsyncTorchModel):
+    pass
@@ -0,0 +1,112 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Stateful async split learning strategy
+Reference:
+    [1] Chen, X., Li, J., & Chakrabarti, C. Communication and computation reduction for split learning using asynchronous training[C]. arXiv preprint arXiv:2107.09786, 2021.(https://arxiv.org/abs/2107.09786)
+"""
+
+from typing import Callable, List
+
+from secretflow.device import PYUObject, proxy
+from secretflow.ml.nn.sl.backend.torch.strategy.split_nn import SLTorchModel
+from secretflow.ml.nn.sl.strategy_dispatcher import register_strategy
+from secretflow.ml.nn.utils import TorchModel
+from secretflow.security.privacy import DPStrategy
+
+
+class SLStateAsyncTorchModel(SLTorchModel):
+    def __init__(
+        self,
+        builder_base: Callable[[], TorchModel],
+        builder_fuse: Callable[[], TorchModel],
+        dp_strategy: DPStrategy,
+        loss_thres: float = 0.01,
+        split_steps: int = 1,
+        max_fuse_local_steps: int = 1,
+        random_seed: int = None,
+        **kwargs,
+    ):
+        super().__init__(
+            builder_base,
+            builder_fuse,
+            dp_strategy,
+            random_seed,
+            **kwargs,
+        )
+        assert (
+            max_fuse_local_steps > 0
+        ), f'state async max_fuse_local_steps should greater than 0'
+        self.loss_thres = loss_thres
+        self.split_steps = split_steps
+        self.max_fuse_local_steps = max_fuse_local_steps
+        # SplitAT state
+        self.count = 0
+        self.total_loss = 0
+        self.last_update_loss = 0
+        self.state = 'A'
+        self.skip_gradient = False
+
+    def fuse_net_internal(self, hiddens, train_y, train_sample_weight, logs):
+        cnt = 0
+        while cnt <= self.max_fuse_local_steps:
+            cnt += 1
+            # fuse net may be trained several times on the same hiddens.
+            for h in hiddens if isinstance(hiddens, List) else [hiddens]:
+                h.grad = None
+            gradient = super().fuse_net_internal(
+                hiddens, train_y, train_sample_weight, logs
+            )
+            self._update_state(float(logs["train_loss"]))
+            if self.state != 'C':
+                break
+        self.skip_gradient = self.state != 'A'
+        # Here we refer to the definition of the state in the paper
+        # *Communication and Computation Reduction for Split Learning using Asynchronous Training*
+        # | State | Hidden         | Gradient       |
+        # |-------|----------------|----------------|
+        # | A     | client->server | server->client |
+        # | B     | client->server | None           |
+        # | C     | None           | None           |
+        return gradient if self.state == 'A' else []
+
+    def _update_state(self, loss: float):
+        self.total_loss += loss
+        self.count += 1
+        if self.count >= self.split_steps:
+            avg_loss = self.total_loss / self.count
+            delta = abs(self.last_update_loss - avg_loss)
+            if delta >= self.loss_thres:
+                self.state = 'A'
+            else:
+                if self.state == 'A':
+                    self.state = 'B'
+                else:
+                    self.state = 'C'
+            if self.state == 'A':
+                self.last_update_loss = avg_loss
+            self.total_loss = 0
+            self.count = 0
+
+    def get_skip_gradient(self):
+        return self.skip_gradient
+
+
+@register_strategy(
+    strategy_name='split_state_async', backend='torch', check_skip_grad=True
+)
+@proxy(PYUObject)
+class PYUSLStateAsyncTorchModel(SLStateAsyncTorchModel):
+    pass
@@ -12,14 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 
+from secretflow.device import PYU
+from secretflow.device.link import Communicator
 from secretflow.utils.communicate import ForwardData
 
 
+def _split_gradient(gradient, parties: List[PYU], basenet_output_num: Dict[PYU, int]):
+    """Split the gradient of fuse net to parties, same as the legacy mode of
+    AggLayer.backward."""
+    if sum(basenet_output_num[p] for p in parties) == 1:
+        p_gradient = gradient
+    else:
+        p_gradient = []
+        start_idx = 0
+        for p in parties:
+            p_gradient.append(gradient[start_idx : start_idx + basenet_output_num[p]])
+            start_idx += basenet_output_num[p]
+    if len(parties) == 1:
+        # handle single feature mode
+        if isinstance(p_gradient, List) and len(p_gradient) == 1:
+            p_gradient = p_gradient[0]
+        return [p_gradient]
+    return p_gradient
+
+
 class SLBaseModel(ABC):
     def __init__(self):
         pass
@@ -148,3 +169,68 @@ class SLBaseModel(ABC):
     @abstractmethod
     def get_skip_gradient(self):
         pass
+
+    def set_communicator(self, comm: Communicator):
+        """Set the communicator to exchange hiddens and gradients with the
+        other workers directly, which is required by fused_train_steps."""
+        self._comm = comm
+
+    def fused_train_steps(
+        self,
+        device: PYU,
+        device_y: PYU,
+        workers: List[PYU],
+        parties: List[PYU],
+        basenet_output_num: Dict[PYU, int],
+        start_step: int,
+        num_steps: int,
+        key_prefix: str = '',
+    ):
+        """Run num_steps training steps in this worker without the driver.
+
+        The hiddens are sent to device_y, which runs the fuse net and sends the
+        gradients back to parties, all through the communicator. Only
+        applicable to the legacy mode of AggLayer (no agg method or compressor).
+
+        Args:
+            device: the device of this worker.
+            device_y: the device with label.
+            workers: devices of all workers, in the order of fuse net inputs.
+            parties: devices with base net, in the order of fuse net outputs.
+            basenet_output_num: num of base net outputs of each party.
+            start_step: global index of the first step, used in message keys.
+            num_steps: num of steps to run.
+            key_prefix: prefix of message keys, unique for each fit.
+        """
+        assert getattr(self, '_comm', None) is not None, 'communicator is not set'
+
+        def _key(name, src, step):
+            return f'{key_prefix};{name};{src};{step}'
+
+        for step in range(start_step, start_step + num_steps):
+            self.get_batch_data(stage="train")
+            self.base_forward()
+            f_data = self.pack_forward_data()
+            if device != device_y:
+                self._comm.send(device_y, f_data, _key('hidden', device, step))
+                if device in parties:
+                    gradient = self._comm.recv(device_y, _key('gradient', device, step))
+                    self.recv_gradient(gradient)
+                    self.base_backward()
+                continue
+
+            f_datas = [
+                f_data if w == device else self._comm.recv(w, _key('hidden', w, step))
+                for w in workers
+            ]
+            gradient = self.fuse_net(f_datas)
+            p_gradient = _split_gradient(gradient, parties, basenet_output_num)
+            own_gradient = None
+            for p, g in zip(parties, p_gradient):
+                if p == device:
+                    own_gradient = g
+                else:
+                    self._comm.send(p, g, _key('gradient', p, step))
+            if device in parties:
+                self.recv_gradient(own_gradient)
+                self.base_backward()
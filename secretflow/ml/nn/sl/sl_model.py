@@ -32,6 +32,7 @@ from secretflow.data.ndarray import FedNdarray
 from secretflow.data.vertical import VDataFrame
 from secretflow.device import PYU, Device, reveal, wait
 from secretflow.device.device.pyu import PYUObject
+from secretflow.device.link import create_communicators
 from secretflow.ml.nn.callbacks.callbacklist import CallbackList
 from secretflow.ml.nn.sl.agglayer.agg_layer import AggLayer
 from secretflow.ml.nn.sl.agglayer.agg_method import AggMethod
@@ -74,6 +75,13 @@ class SLModel:
             max_fuse_local_steps: Only for 'split_state_async' strategy, Maximum number of rounds for fuse local update in splitStateAS strategy?
             compressor: Define strategy tensor compression algorithms to speed up transmission.
             device_agg: The party do aggregation, it can be a PYU, SPU, etc.
+            agg_batch_steps: Number of consecutive steps whose hiddens are aggregated
+                together, default 1. With agg_method on SPU, the hiddens and
+                gradients of these steps are transferred to SPU at once and
+                aggregated in one SPU program, which amortizes the per-step fixed
+                cost of SPU. In training, the base nets forward these steps before
+                their backward, so it needs the 'pipeline' strategy with
+                pipeline_size >= agg_batch_steps.
             **kwargs: For custom strategies.
         """
 
@@ -82,8 +90,13 @@ class SLModel:
         self.simulation = kwargs.pop('simulation', False)
         self.device_agg = kwargs.pop('device_agg', None)
         self.compressor = kwargs.pop('compressor', None)
+        self.agg_batch_steps = kwargs.pop('agg_batch_steps', 1)
+        assert (
+            isinstance(self.agg_batch_steps, int) and self.agg_batch_steps >= 1
+        ), f"invalid agg batch steps: {self.agg_batch_steps}"
         self.base_model_dict = base_model_dict
         self.backend = backend
+        self.strategy = strategy
         self.num_parties = len(base_model_dict)
         self.agglayer = AggLayer(
             device_agg=self.device_agg if self.device_agg else self.device_y,
@@ -298,6 +311,113 @@ class SLModel:
 
         return steps_per_epoch
 
+    def _init_fused_communicators(self):
+        if getattr(self, '_fused_communicators', None) is not None:
+            return
+        self._fused_communicators = create_communicators(list(self._workers.keys()))
+        wait(
+            [
+                worker.set_communicator(self._fused_communicators[device])
+                for device, worker in self._workers.items()
+            ]
+        )
+
+    def _fused_train_steps(
+        self, start_step: int, num_steps: int, key_prefix: str
+    ) -> List[PYUObject]:
+        workers = list(self._workers.keys())
+        parties = self.agglayer.get_parties()
+        return [
+            worker.fused_train_steps(
+                device,
+                self.device_y,
+                workers,
+                parties,
+                self.basenet_output_num,
+                start_step,
+                num_steps,
+                key_prefix,
+            )
+            for device, worker in self._workers.items()
+        ]
+
+    def _fit_fused_epoch(
+        self,
+        epoch: int,
+        steps_per_epoch: int,
+        fused_steps: int,
+        key_prefix: str,
+        callbacks: CallbackList,
+        wait_steps: int,
+    ) -> List[PYUObject]:
+        """Train an epoch by running fused_steps steps in every remote call."""
+        res = []
+        for start_step in range(0, steps_per_epoch, fused_steps):
+            num_steps = min(fused_steps, steps_per_epoch - start_step)
+            callbacks.on_train_batch_begin(start_step)
+            res.extend(
+                self._fused_train_steps(
+                    epoch * steps_per_epoch + start_step, num_steps, key_prefix
+                )
+            )
+            callbacks.on_train_batch_end(start_step + num_steps - 1)
+            if len(res) >= wait_steps:
+                wait(res)
+                res = []
+            if callbacks.stop_training[0]:
+                break
+        return res
+
+    def _fit_agg_batch_epoch(
+        self, steps_per_epoch: int, callbacks: CallbackList, wait_steps: int
+    ) -> List[PYUObject]:
+        """Train an epoch by aggregating every agg_batch_steps steps at once."""
+        res = []
+        for start_step in range(0, steps_per_epoch, self.agg_batch_steps):
+            steps = range(
+                start_step, min(start_step + self.agg_batch_steps, steps_per_epoch)
+            )
+            f_datas_steps = []
+            for step in steps:
+                f_datas = {}
+                callbacks.on_train_batch_begin(step)
+                callbacks.on_before_base_forward()
+                for device, worker in self._workers.items():
+                    # 1. Local calculation of basenet
+                    worker.get_batch_data(stage="train")
+                    worker.base_forward()
+                    f_data = worker.pack_forward_data()
+                    f_datas[device] = f_data
+                f_datas_steps.append(f_datas)
+
+            # do agglayer forward of all steps at once
+            agg_hiddens_steps = self.agglayer.forward_steps(f_datas_steps)
+
+            # 3. Fusenet do local calculates and return gradients
+            gradients_steps = [
+                self._workers[self.device_y].fuse_net(agg_hiddens)
+                for agg_hiddens in agg_hiddens_steps
+            ]
+
+            # do agglayer backward of all steps at once
+            scatter_gradients_steps = self.agglayer.backward_steps(gradients_steps)
+            for step, gradients, scatter_gradients in zip(
+                steps, gradients_steps, scatter_gradients_steps
+            ):
+                callbacks.after_agglayer_backward(scatter_gradients)
+                for device, worker in self._workers.items():
+                    if device in scatter_gradients.keys():
+                        worker.recv_gradient(scatter_gradients[device])
+                        worker.base_backward()
+                callbacks.on_train_batch_end(step)
+                res.append(gradients)
+            if len(res) >= wait_steps:
+                wait(res)
+                res = []
+            if callbacks.stop_training[0]:
+                break
+        return res
+
     def fit(
         self,
         x: Union[
@@ -322,6 +442,7 @@ class SLModel:
         early_stopping_batch_step: int = 0,
         early_stopping_warmup_step: int = 0,
         random_seed: int = None,
+        fused_steps: int = 1,
     ):
         """Vertical split learning training interface
 
@@ -357,6 +478,14 @@ class SLModel:
             audit_log_params: Kwargs for saving audit model, eg: {'save_traces'=True, 'save_format'='h5'}
             random_seed: seed for prg, will only affect dataset shuffle
             dtypes: Dict[PYU, Dict[str, Dtype]]
+            fused_steps: Number of training steps each worker runs in one remote
+                call. When > 1, workers exchange hiddens and gradients with each
+                other directly and the driver only schedules every fused_steps
+                steps, which cuts the scheduling overhead of small batches.
+                Only available without agg_method, compressor, pipeline and
+                early stopping batch step, and the callbacks inside a step
+                (e.g. on_before_base_forward, after_agglayer_backward) are not
+                called.
         """
         if random_seed is None:
             random_seed = global_random(self.device_y, 100000)
@@ -372,6 +501,31 @@ class SLModel:
         assert isinstance(validation_freq, int) and validation_freq >= 1
         if dp_spent_step_freq is not None:
             assert isinstance(dp_spent_step_freq, int) and dp_spent_step_freq >= 1
+        assert isinstance(fused_steps, int) and fused_steps >= 1
+        if fused_steps > 1:
+            assert (
+                self.agglayer.agg_method is None and self.compressor is None
+            ), f"fused_steps is not supported with agg_method or compressor"
+            assert (
+                self.pipeline_size == 1 and not self.check_skip_grad
+            ), f"fused_steps is not supported with pipeline or skipping gradients"
+            assert (
+                early_stopping_batch_step == 0
+            ), f"fused_steps is not supported with early_stopping_batch_step"
+        if self.agg_batch_steps > 1:
+            assert (
+                fused_steps == 1
+            ), f"fused_steps is not supported with agg_batch_steps"
+            # base net states of the steps are stashed by pipeline strategy only.
+            assert (
+                self.strategy == 'pipeline'
+            ), f"agg_batch_steps {self.agg_batch_steps} needs pipeline strategy, got {self.strategy}"
+            assert (
+                self.pipeline_size >= self.agg_batch_steps
+            ), f"agg_batch_steps {self.agg_batch_steps} needs pipeline_size >= agg_batch_steps, got {self.pipeline_size}"
+            assert (
+                not self.check_skip_grad and early_stopping_batch_step == 0
+            ), f"agg_batch_steps is not supported with skipping gradients or early_stopping_batch_step"
 
         # get basenet ouput num
         self.basenet_output_num = {
@@ -469,6 +623,10 @@ class SLModel:
 
         callbacks.on_train_begin()
 
+        if fused_steps > 1:
+            self._init_fused_communicators()
+            fused_key_prefix = str(global_random(self.device_y, 100000000))
+
         for epoch in range(epochs):
             res = []
             report_list = []
@@ -476,8 +634,24 @@ class SLModel:
             self._workers[self.device_y].reset_metrics()
             callbacks.on_epoch_begin(epoch=epoch)
             [worker.reset_data_iter(stage="train") for worker in self._workers.values()]
+            # fused steps and agg batch steps run their own loops, the loop
+            # below schedules every step from the driver.
             f_data_buf = [None] * (self.pipeline_size - 1)
-            for step in range(0, steps_per_epoch + self.pipeline_size - 1):
+            train_steps = range(0, steps_per_epoch + self.pipeline_size - 1)
+            if fused_steps > 1:
+                res = self._fit_fused_epoch(
+                    epoch,
+                    steps_per_epoch,
+                    fused_steps,
+                    fused_key_prefix,
+                    callbacks,
+                    wait_steps,
+                )
+                f_data_buf, train_steps = [], range(0)
+            elif self.agg_batch_steps > 1:
+                res = self._fit_agg_batch_epoch(steps_per_epoch, callbacks, wait_steps)
+                f_data_buf, train_steps = [], range(0)
+            for step in train_steps:
                 if step < steps_per_epoch:
                     f_datas = {}
                     callbacks.on_train_batch_begin(step)
@@ -698,25 +872,35 @@ class SLModel:
         res = []
         callbacks.on_predict_begin()
         [worker.reset_data_iter(stage="eval") for worker in self._workers.values()]
-        for step in range(0, predict_steps):
-            callbacks.on_predict_batch_begin(step)
-            forward_data_dict = {}
-            for device, worker in self._workers.items():
-                if device not in self.base_model_dict:
-                    continue
-                worker.get_batch_data(stage="eval")
-                worker.base_forward()
-                f_data = worker.pack_forward_data()
-                forward_data_dict[device] = f_data
-
-            agg_hiddens = self.agglayer.forward(forward_data_dict)
+        for start_step in range(0, predict_steps, self.agg_batch_steps):
+            steps = range(
+                start_step, min(start_step + self.agg_batch_steps, predict_steps)
+            )
+            forward_data_steps = []
+            for step in steps:
+                callbacks.on_predict_batch_begin(step)
+                forward_data_dict = {}
+                for device, worker in self._workers.items():
+                    if device not in self.base_model_dict:
+                        continue
+                    worker.get_batch_data(stage="eval")
+                    worker.base_forward()
+                    f_data = worker.pack_forward_data()
+                    forward_data_dict[device] = f_data
+                forward_data_steps.append(forward_data_dict)
+
+            if self.agg_batch_steps > 1:
+                agg_hiddens_steps = self.agglayer.forward_steps(forward_data_steps)
+            else:
+                agg_hiddens_steps = [self.agglayer.forward(forward_data_steps[0])]
 
-            y_pred = self._workers[self.device_y].predict(agg_hiddens)
-            result.append(y_pred)
+            for step, agg_hiddens in zip(steps, agg_hiddens_steps):
+                y_pred = self._workers[self.device_y].predict(agg_hiddens)
+                result.append(y_pred)
 
-            callbacks.on_predict_batch_end(batch=step)
-            res.append(y_pred)
-            if len(res) == wait_steps:
+                callbacks.on_predict_batch_end(batch=step)
+                res.append(y_pred)
+            if len(res) >= wait_steps:
                 wait(res)
                 res = []
         wait(res)
@@ -792,21 +976,31 @@ class SLModel:
         callbacks.on_test_begin()
         [worker.reset_data_iter(stage="eval") for worker in self._workers.values()]
         wait_steps = min(min(self.get_cpus()) * 2, 100)
-        for step in range(0, evaluate_steps):
-            callbacks.on_test_batch_begin(step)
-            f_datas = {}  # driver端
-            for device, worker in self._workers.items():
-                worker.get_batch_data(stage="eval")
-                worker.base_forward()
-                f_data = worker.pack_forward_data()
-                f_datas[device] = f_data
-
-            agg_hiddens = self.agglayer.forward(f_datas)
-
-            metrics = self._workers[self.device_y].evaluate(agg_hiddens)
-            if (step + 1) % wait_steps == 0:
-                wait(metrics)
-            callbacks.on_test_batch_end(batch=step)
+        for start_step in range(0, evaluate_steps, self.agg_batch_steps):
+            steps = range(
+                start_step, min(start_step + self.agg_batch_steps, evaluate_steps)
+            )
+            f_datas_steps = []
+            for step in steps:
+                callbacks.on_test_batch_begin(step)
+                f_datas = {}  # driver端
+                for device, worker in self._workers.items():
+                    worker.get_batch_data(stage="eval")
+                    worker.base_forward()
+                    f_data = worker.pack_forward_data()
+                    f_datas[device] = f_data
+                f_datas_steps.append(f_datas)
+
+            if self.agg_batch_steps > 1:
+                agg_hiddens_steps = self.agglayer.forward_steps(f_datas_steps)
+            else:
+                agg_hiddens_steps = [self.agglayer.forward(f_datas_steps[0])]
+
+            for step, agg_hiddens in zip(steps, agg_hiddens_steps):
+                metrics = self._workers[self.device_y].evaluate(agg_hiddens)
+                if (step + 1) % wait_steps == 0:
+                    wait(metrics)
+                callbacks.on_test_batch_end(batch=step)
 
         callbacks.on_test_end(metrics)
         return metrics
@@ -12,17 +12,59 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import logging
 from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 import secretflow.utils.ndarray_encoding as ndarray_encoding
-from secretflow.device import PYU, DeviceObject, PYUObject, proxy, reveal
+import secretflow.distributed as sfd
+from secretflow.device import PYU, DeviceObject, PYUObject, proxy, reveal, wait
+from secretflow.distributed.primitive import DISTRIBUTION_MODE
 from secretflow.security.aggregation import Aggregator
 from secretflow.security.aggregation._utils import is_nesting_list
 from secretflow.security.diffie_hellman import DiffieHellman
 
+# Num of elements masked at a time, which bounds the memory of masks.
+_MASK_CHUNK_SIZE = 1 << 20
+# Max num of chunks being masked and aggregated in chunked aggregation.
+_MAX_INFLIGHT_CHUNKS = 4
+
+
+def _pair_key(secret: str) -> int:
+    """128 bits Philox key derived from the Diffie-Hellman secret of two parties."""
+    return int.from_bytes(hashlib.sha256(secret.encode()).digest()[:16], 'little')
+
+
+def _prg(key: int, round_id: int, tensor_idx: int, start: int, stop: int) -> np.ndarray:
+    """Counter mode PRG based on Philox.
+
+    Returns elements [start, stop) of the uint64 stream of (key, round_id,
+    tensor_idx). Any element is generated from its counter directly, so the
+    stream is the same no matter how it is chunked.
+    """
+    # Philox generates 4 uint64 per counter.
+    base = start - start % 4
+    bit_generator = np.random.Philox(
+        counter=[base // 4, tensor_idx, round_id, 0], key=key
+    )
+    return bit_generator.random_raw(stop - base)[start - base :]
+
+
+def _flat_ranges(sizes: List[int], start: int, stop: int):
+    """Split range [start, stop) of the concatenation of flattened tensors into
+    (tensor index, start, stop) of each tensor.
+    """
+    offset = 0
+    for idx, size in enumerate(sizes):
+        if offset >= stop:
+            break
+        if offset + size > start:
+            yield idx, max(start - offset, 0), min(stop - offset, size)
+        offset += size
+
 
 @proxy(PYUObject)
 class _Masker:
@@ -37,29 +79,23 @@ class _Masker:
 
     def gen_rng(self, pub_keys: Dict[str, int]) -> None:
         assert pub_keys, f'Public keys is None or empty.'
-        self._rngs = {
-            party: np.random.default_rng(
-                int(self._dh.generate_secret(self._pri_key, peer_pub_key), base=16)
-            )
+        self._keys = {
+            party: _pair_key(self._dh.generate_secret(self._pri_key, peer_pub_key))
             for party, peer_pub_key in pub_keys.items()
             if party != self._party
         }
 
-    def mask(
+    def _check(
         self,
         data: Union[
             List[Union[pd.DataFrame, pd.Series, np.ndarray]],
             Union[pd.DataFrame, pd.Series, np.ndarray],
         ],
-        weight=None,
-    ) -> Tuple[Union[List[np.ndarray], np.ndarray], np.dtype]:
+    ) -> Tuple[List[np.ndarray], np.dtype]:
         assert data is not None, 'Data shall not be None or empty.'
-        is_list = isinstance(data, list)
-        if not is_list:
+        if not isinstance(data, list):
             data = [data]
-        if weight is None:
-            weight = 1
-        masked_data = []
+        arrays = []
         dtype = None
         for datum in data:
             if isinstance(datum, (pd.DataFrame, pd.Series)):
@@ -73,38 +109,146 @@ class _Masker:
                 assert (
                     datum.dtype == dtype
                 ), f'Data should have same dtypes but got {datum.dtype} {dtype}.'
-            is_float = np.issubdtype(datum.dtype, np.floating)
-            if not is_float:
+            if not np.issubdtype(datum.dtype, np.floating):
                 assert np.issubdtype(
                     datum.dtype, np.integer
                 ), f'Data type are neither integer nor float.'
-                if datum.dtype != np.int64:
-                    datum = datum.astype(np.int64)
-            # Do mulitple before encoding to finite field.
-            masked_datum: np.ndarray = (
-                ndarray_encoding.encode(datum * weight, self._fxp_bits)
-                if is_float
-                else datum * weight
+            arrays.append(datum)
+        return arrays, dtype
+
+    def _encode(self, datum: np.ndarray, weight) -> np.ndarray:
+        # Do mulitple before encoding to finite field.
+        if np.issubdtype(datum.dtype, np.floating):
+            return ndarray_encoding.encode(datum * weight, self._fxp_bits)
+        if datum.dtype != np.int64:
+            datum = datum.astype(np.int64)
+        return datum * weight
+
+    def _add_masks(
+        self,
+        masked: np.ndarray,
+        parties: List[str],
+        round_id: int,
+        tensor_idx: int,
+        start: int,
+    ):
+        """Add pairwise masks to elements [start, start + len(masked)) of the
+        flattened tensor in place.
+        """
+        for party, key in self._keys.items():
+            # only masks with the parties in this aggregation cancel out.
+            if parties is not None and party not in parties:
+                continue
+            mask = _prg(key, round_id, tensor_idx, start, start + masked.size).view(
+                masked.dtype
             )
-            for party, rng in self._rngs.items():
-                if party == self._party:
-                    continue
-                mask = rng.integers(
-                    low=np.iinfo(np.int64).min,
-                    high=np.iinfo(np.int64).max,
-                    size=masked_datum.shape,
-                ).astype(masked_datum.dtype)
-                if party > self._party:
-                    masked_datum += mask
-                else:
-                    masked_datum -= mask
+            if party > self._party:
+                masked += mask
+            else:
+                masked -= mask
 
+    def mask(
+        self,
+        data: Union[
+            List[Union[pd.DataFrame, pd.Series, np.ndarray]],
+            Union[pd.DataFrame, pd.Series, np.ndarray],
+        ],
+        weight=None,
+        parties: List[str] = None,
+        round_id: int = 0,
+    ) -> Tuple[Union[List[np.ndarray], np.ndarray], np.dtype]:
+        is_list = isinstance(data, list)
+        arrays, dtype = self._check(data)
+        if weight is None:
+            weight = 1
+        masked_data = []
+        for tensor_idx, datum in enumerate(arrays):
+            masked_datum = self._encode(datum, weight)
+            flat = masked_datum.reshape(-1)
+            for start in range(0, flat.size, _MASK_CHUNK_SIZE):
+                self._add_masks(
+                    flat[start : start + _MASK_CHUNK_SIZE],
+                    parties,
+                    round_id,
+                    tensor_idx,
+                    start,
+                )
             masked_data.append(masked_datum)
         if is_list:
             return masked_data, dtype
         else:
             return masked_data[0], dtype
 
+    def meta(
+        self,
+        data: Union[
+            List[Union[pd.DataFrame, pd.Series, np.ndarray]],
+            Union[pd.DataFrame, pd.Series, np.ndarray],
+        ],
+    ) -> Tuple[bool, List[Tuple[int, ...]], np.dtype]:
+        """Whether data is a list, shapes and dtype of data."""
+        arrays, dtype = self._check(data)
+        return isinstance(data, list), [datum.shape for datum in arrays], dtype
+
+    def mask_chunk(
+        self,
+        data: Union[
+            List[Union[pd.DataFrame, pd.Series, np.ndarray]],
+            Union[pd.DataFrame, pd.Series, np.ndarray],
+        ],
+        start: int,
+        stop: int,
+        weight=None,
+        parties: List[str] = None,
+        round_id: int = 0,
+    ) -> np.ndarray:
+        """Masked elements [start, stop) of the concatenation of flattened data,
+        with the same masks as mask.
+        """
+        arrays, _ = self._check(data)
+        if weight is None:
+            weight = 1
+        chunks = []
+        for tensor_idx, t_start, t_stop in _flat_ranges(
+            [datum.size for datum in arrays], start, stop
+        ):
+            masked = self._encode(
+                arrays[tensor_idx].reshape(-1)[t_start:t_stop], weight
+            )
+            self._add_masks(masked, parties, round_id, tensor_idx, t_start)
+            chunks.append(masked)
+        return np.concatenate(chunks)
+
+
+def _sum_chunks(*masked_chunks: np.ndarray) -> np.ndarray:
+    return np.sum(masked_chunks, axis=0)
+
+
+def _sum_weights(weights: List, data_num: int):
+    return np.sum(weights, axis=0) if weights else data_num
+
+
+def _assemble_chunks(
+    *chunk_sums: np.ndarray,
+    is_list: bool,
+    shapes: List[Tuple[int, ...]],
+    dtype: np.dtype,
+    fxp_bits: int,
+    sum_weights,
+):
+    flat = np.concatenate(chunk_sums)
+    if np.issubdtype(dtype, np.floating):
+        flat = ndarray_encoding.decode(flat, fxp_bits)
+    if sum_weights is not None:
+        flat = flat / sum_weights
+    results = []
+    offset = 0
+    for shape in shapes:
+        size = int(np.prod(shape))
+        results.append(flat[offset : offset + size].reshape(shape))
+        offset += size
+    return results if is_list else results[0]
+
 
 class SecureAggregator(Aggregator):
     """The secure aggregation implementation of `Masking with One-Time Pads`.
@@ -144,12 +288,25 @@ class SecureAggregator(Aggregator):
         and does not support client dropping. For more information, please refer to
         `Practical Secure Aggregation for Privacy-Preserving Machine Learning <https://eprint.iacr.org/2017/281.pdf>`_
 
+        Data of a subset of participants (at least two) can be aggregated too, e.g.
+        in asynchronous federated learning. Each participant only masks with the
+        other participants of the subset.
+
+        Masks are generated by a counter mode PRG (Philox) keyed by the pairwise
+        secrets, and the masks of each aggregation round are different. With
+        chunk_size, data is masked, sent and summed chunk by chunk, so the memory
+        of masking and aggregation is bounded by chunks instead of data size *
+        num of participants. With dropout_timeout, participants whose data is not
+        ready in time or failed are excluded before masking, so the round goes on
+        with the others. Dropout after masking is not tolerated, since revealing
+        the masks with the dropped participant is insecure without double masking.
+        dropout_timeout is only available in simulation and debug mode.
+
     Warnings:
-        The SecureAggregator uses :py:meth:`numpy.random.PCG64`. There are many
-        discussions of whether PCG is a CSPRNG
-        (e.g. https://crypto.stackexchange.com/questions/77101/is-the-pcg-prng-a-csprng-or-why-not),
-        we prefer a conservative strategy unless a further security analysis came
-        up. Therefore we recommend users to use a standardized CSPRNG in industrial
+        The SecureAggregator uses :py:meth:`numpy.random.Philox`, which is a
+        counter-based PRNG but not a standardized CSPRNG, we prefer a
+        conservative strategy unless a further security analysis came up.
+        Therefore we recommend users to use a standardized CSPRNG in industrial
         scenarios.
 
     Examples:
@@ -170,13 +327,31 @@ class SecureAggregator(Aggregator):
         dtype=float32)
     """
 
-    def __init__(self, device: PYU, participants: List[PYU], fxp_bits: int = 18):
+    def __init__(
+        self,
+        device: PYU,
+        participants: List[PYU],
+        fxp_bits: int = 18,
+        chunk_size: int = None,
+        dropout_timeout: float = None,
+    ):
         assert len(set(participants)) == len(
             participants
         ), 'Should not have duplicated devices.'
+        assert (
+            chunk_size is None or chunk_size > 0
+        ), f'chunk_size should be positive, got {chunk_size}'
+        assert (
+            dropout_timeout is None
+            or sfd.get_distribution_mode() != DISTRIBUTION_MODE.PRODUCTION
+        ), 'dropout_timeout is not supported in production mode.'
         self._device = device
         self._participants = set(participants)
         self._fxp_bits = fxp_bits
+        self._chunk_size = chunk_size
+        self._dropout_timeout = dropout_timeout
+        # masks of each aggregation are different.
+        self._round_id = 0
         self._maskers = {
             pyu: _Masker(pyu.party, self._fxp_bits, device=pyu) for pyu in participants
         }
@@ -186,15 +361,103 @@ class SecureAggregator(Aggregator):
         for masker in self._maskers.values():
             masker.gen_rng(pub_keys)
 
-    def _check_data(self, data: List[PYUObject]):
+    def _next_round_id(self) -> int:
+        round_id = self._round_id
+        self._round_id += 1
+        return round_id
+
+    def _drop_out(
+        self, data: List[PYUObject], weights=None
+    ) -> Tuple[List[PYUObject], Any]:
+        """Exclude the data which is not ready in dropout_timeout or failed, so
+        that the others are aggregated without restarting.
+        """
+        if self._dropout_timeout is None:
+            return data, weights
+        ready = set(
+            sfd.wait_ready(
+                [datum.data for datum in data],
+                num_returns=len(data),
+                timeout=self._dropout_timeout,
+            )
+        )
+        alive = []
+        for idx, datum in enumerate(data):
+            if idx not in ready:
+                continue
+            try:
+                reveal(datum.device(lambda _: None)(datum))
+                alive.append(idx)
+            except Exception:
+                pass
+        if len(alive) < len(data):
+            dropped = [
+                datum.device.party for idx, datum in enumerate(data) if idx not in alive
+            ]
+            logging.warning(
+                f'Parties {dropped} dropped out of secure aggregation round {self._round_id}.'
+            )
+        if isinstance(weights, (list, tuple, np.ndarray)):
+            weights = [weights[idx] for idx in alive]
+        return [data[idx] for idx in alive], weights
+
+    def _chunked_aggregate(
+        self,
+        data: List[PYUObject],
+        weights: List,
+        sum_weights,
+        parties: List[str],
+        round_id: int,
+    ):
+        """Mask and aggregate data chunk by chunk.
+
+        Each chunk of all parties is summed as soon as it is masked, so neither
+        the parties nor the aggregator hold all masked data at the same time.
+        """
+        metas = reveal([self._maskers[datum.device].meta(datum) for datum in data])
+        for meta in metas[1:]:
+            assert (
+                meta == metas[0]
+            ), f'Data should have same structure but got {meta} {metas[0]}.'
+        is_list, shapes, dtype = metas[0]
+        total_size = sum(int(np.prod(shape)) for shape in shapes)
+
+        chunk_sums = []
+        for start in range(0, total_size, self._chunk_size):
+            stop = min(start + self._chunk_size, total_size)
+            masked_chunks = [
+                self._maskers[datum.device]
+                .mask_chunk(datum, start, stop, weight, parties, round_id)
+                .to(self._device)
+                for datum, weight in zip(data, weights)
+            ]
+            chunk_sums.append(self._device(_sum_chunks)(*masked_chunks))
+            if len(chunk_sums) % _MAX_INFLIGHT_CHUNKS == 0:
+                # bound num of masked chunks in flight.
+                wait(chunk_sums[-1])
+        return self._device(_assemble_chunks)(
+            *chunk_sums,
+            is_list=is_list,
+            shapes=shapes,
+            dtype=dtype,
+            fxp_bits=self._fxp_bits,
+            sum_weights=sum_weights,
+        )
+
+    def _check_data(self, data: List[PYUObject]) -> List[str]:
         assert data, f'The data should not be None or empty.'
-        assert len(data) == len(
-            self._maskers
-        ), f'Length of the data not equals devices: {len(data)} vs {len(self._maskers)}'
+        assert len(data) > 1 or len(self._maskers) == 1, (
+            f'Data of at least two participants should be aggregated, '
+            f'otherwise it is revealed.'
+        )
         devices_of_data = set(datum.device for datum in data)
-        assert (
-            devices_of_data == self._participants
+        assert len(devices_of_data) == len(
+            data
+        ), 'Should not have duplicated devices of the data.'
+        assert devices_of_data.issubset(
+            self._participants
         ), 'Devices of the data must be corresponding with this aggregator.'
+        return [datum.device.party for datum in data]
 
     @classmethod
     def _is_list(cls, masked_data: Union[List, Any]) -> bool:
@@ -227,11 +490,19 @@ class SecureAggregator(Aggregator):
                 result = np.sum(masked_data, axis=axis)
                 return ndarray_encoding.decode(result, fxp_bits) if is_float else result
 
-        self._check_data(data)
+        data, _ = self._drop_out(data)
+        parties = self._check_data(data)
+        round_id = self._next_round_id()
+        if self._chunk_size is not None and axis == 0:
+            return self._chunked_aggregate(
+                data, [None] * len(data), None, parties, round_id
+            )
         masked_data = [None] * len(data)
         dtypes = [None] * len(data)
         for i, datum in enumerate(data):
-            masked_data[i], dtypes[i] = self._maskers[datum.device].mask(datum)
+            masked_data[i], dtypes[i] = self._maskers[datum.device].mask(
+                datum, parties=parties, round_id=round_id
+            )
         masked_data = [d.to(self._device) for d in masked_data]
         dtypes = [dtype.to(self._device) for dtype in dtypes]
         return self._device(_sum)(*masked_data, dtypes=dtypes, fxp_bits=self._fxp_bits)
@@ -264,7 +535,9 @@ class SecureAggregator(Aggregator):
                     )
                 return np.sum(masked_data, axis=axis) / sum_weights
 
-        self._check_data(data)
+        data, weights = self._drop_out(data, weights)
+        parties = self._check_data(data)
+        round_id = self._next_round_id()
         masked_data = [None] * len(data)
         dtypes = [None] * len(data)
         _weights = []
@@ -280,15 +553,21 @@ class SecureAggregator(Aggregator):
                     _weights.append(w.to(self._device))
                 else:
                     _weights.append(w)
-            for i, (datum, weight) in enumerate(zip(data, weights)):
-                masked_data[i], dtypes[i] = self._maskers[datum.device].mask(
-                    datum, weight
-                )
+            data_weights = list(weights)
         else:
-            for i, datum in enumerate(data):
-                masked_data[i], dtypes[i] = self._maskers[datum.device].mask(
-                    datum, weights
-                )
+            data_weights = [weights] * len(data)
+        if self._chunk_size is not None and axis == 0:
+            return self._chunked_aggregate(
+                data,
+                data_weights,
+                self._device(_sum_weights)(_weights, len(data)),
+                parties,
+                round_id,
+            )
+        for i, (datum, weight) in enumerate(zip(data, data_weights)):
+            masked_data[i], dtypes[i] = self._maskers[datum.device].mask(
+                datum, weight, parties, round_id
+            )
         masked_data = [d.to(self._device) for d in masked_data]
         dtypes = [dtype.to(self._device) for dtype in dtypes]
         return self._device(_average)(
@@ -0,0 +1,171 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# This is a single party based table statistics calculation
+
+from typing import Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from secretflow.data.core.arrow.util import MomentAccumulator
+
+# Rows and columns of each block in a scan.
+# The block shape is fixed so that the result of a column does not depend on
+# the other columns in the same table.
+STATS_BLOCK_ROWS = 1 << 16
+STATS_BLOCK_COLS = 64
+
+
+def _arrow_block(table: pa.Table, start: int, stop: int) -> np.ndarray:
+    """Rows [start, stop) of an arrow table of numeric columns as float64,
+    nulls are NaN."""
+    block = table.slice(start, stop - start)
+    arrays = []
+    for col in block.columns:
+        if pa.types.is_boolean(col.type):
+            col = pc.cast(col, pa.int8())
+        arrays.append(np.asarray(col.to_numpy(zero_copy_only=False), dtype=np.float64))
+    return np.column_stack(arrays)
+
+
+def table_statistics_core(
+    data: Union[pd.DataFrame, pa.Table],
+    block_rows: int = STATS_BLOCK_ROWS,
+    block_cols: int = STATS_BLOCK_COLS,
+) -> pd.DataFrame:
+    """Compute all statistics of table_statistics for each column in one scan.
+
+    Args:
+        data: pd.DataFrame or pa.Table, an arrow table is scanned block by
+            block without converting to pandas.
+        block_rows: rows of each block in a scan.
+        block_cols: columns of each block in a scan.
+
+    Returns:
+        pd.DataFrame, index is the columns of data and columns are statistics.
+    """
+    arrow_part = None
+    if isinstance(data, pa.Table):
+        from secretflow.data.core.arrow import PaPartDataFrame
+
+        arrow_part = PaPartDataFrame(data)
+        # dtypes of the table in pandas, e.g. int columns with nulls are float.
+        dtypes = pd.Series(arrow_part.dtypes(), index=data.column_names)
+        columns = pd.Index(data.column_names)
+        total = data.num_rows
+    else:
+        dtypes = data.dtypes
+        columns = data.columns
+        total = data.shape[0]
+    numeric_cols = [c for c, t in dtypes.items() if pd.api.types.is_numeric_dtype(t)]
+    # pandas select_dtypes("number") excludes bool columns.
+    bool_cols = [c for c, t in dtypes.items() if pd.api.types.is_bool_dtype(t)]
+
+    acc = MomentAccumulator(len(numeric_cols))
+    for col_start in range(0, len(numeric_cols), block_cols):
+        col_end = min(col_start + block_cols, len(numeric_cols))
+        cols = numeric_cols[col_start:col_end]
+        block_acc = MomentAccumulator(len(cols))
+        # select the columns once, not per row block.
+        selected = data.select(cols) if arrow_part is not None else data[cols]
+        for row_start in range(0, total, block_rows):
+            if arrow_part is not None:
+                block = _arrow_block(
+                    selected, row_start, min(row_start + block_rows, total)
+                )
+            else:
+                block = selected.iloc[row_start : row_start + block_rows].to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                )
+            block_acc.update(block)
+        for attr in ('n', 'sum', 'mean', 'm2', 'm3', 'm4', 'min', 'max'):
+            getattr(acc, attr)[col_start:col_end] = getattr(block_acc, attr)
+
+    n, mean, m2, m3, m4 = acc.n, acc.mean, acc.m2, acc.m3, acc.m4
+    with np.errstate(divide='ignore', invalid='ignore'):
+        empty = n == 0
+        mean = np.where(empty, np.nan, mean)
+        var = np.where(n > 1, m2 / (n - 1), np.nan)
+        std = np.sqrt(var)
+        sem = std / np.sqrt(n)
+        # same as bias corrected skew and kurtosis in pandas.
+        skew = np.where(
+            m2 == 0, 0.0, n * np.sqrt(n - 1) / (n - 2) * m3 / np.power(m2, 1.5)
+        )
+        skew = np.where(n < 3, np.nan, skew)
+        kurt_denom = (n - 2) * (n - 3) * m2 * m2
+        kurt = np.where(
+            kurt_denom == 0,
+            0.0,
+            n * (n + 1) * (n - 1) * m4 / kurt_denom
+            - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)),
+        )
+        kurt = np.where(n < 4, np.nan, kurt)
+        central_moment_2 = np.where(empty, np.nan, m2 / n)
+        central_moment_3 = np.where(empty, np.nan, m3 / n)
+        central_moment_4 = np.where(empty, np.nan, m4 / n)
+    moment_2 = central_moment_2 + mean**2
+    moment_3 = central_moment_3 + 3 * mean * central_moment_2 + mean**3
+    moment_4 = (
+        central_moment_4
+        + 4 * mean * central_moment_3
+        + 6 * mean**2 * central_moment_2
+        + mean**4
+    )
+
+    def _series(values, exclude_bool=False):
+        s = pd.Series(values, index=numeric_cols, dtype=np.float64)
+        if exclude_bool and bool_cols:
+            s[bool_cols] = np.nan
+        return s.reindex(columns)
+
+    if arrow_part is not None:
+        quantiles = arrow_part[numeric_cols].quantile([0.25, 0.5, 0.75])
+        count = arrow_part.count()
+    else:
+        quantiles = data[numeric_cols].quantile([0.25, 0.5, 0.75])
+        count = data.count()
+    count_na = total - count
+
+    result = pd.DataFrame(index=columns)
+    result["datatype"] = dtypes
+    result["total_count"] = total
+    result["count(non-NA count)"] = count
+    result["count_na(NA count)"] = count_na
+    result["na_ratio"] = count_na / total
+    result["min"] = _series(np.where(empty, np.nan, acc.min))
+    result["max"] = _series(np.where(empty, np.nan, acc.max))
+    result["mean"] = _series(mean)
+    result["var(variance)"] = _series(var)
+    result["std(standard deviation)"] = _series(std)
+    result["sem(standard error)"] = _series(sem)
+    result["skew"] = _series(skew)
+    result["kurtosis"] = _series(kurt)
+    result["q1(first quartile)"] = quantiles.loc[0.25]
+    result["q2(second quartile, median)"] = quantiles.loc[0.5]
+    result["q3(third quartile)"] = quantiles.loc[0.75]
+    result["moment_2"] = _series(moment_2, exclude_bool=True)
+    result["moment_3"] = _series(moment_3, exclude_bool=True)
+    result["moment_4"] = _series(moment_4, exclude_bool=True)
+    result["central_moment_2"] = _series(central_moment_2)
+    result["central_moment_3"] = _series(central_moment_3)
+    result["central_moment_4"] = _series(central_moment_4)
+    result["sum"] = _series(acc.sum)
+    result["sum_2"] = _series(np.where(empty, 0.0, moment_2 * n), exclude_bool=True)
+    result["sum_3"] = _series(np.where(empty, 0.0, moment_3 * n), exclude_bool=True)
+    result["sum_4"] = _series(np.where(empty, 0.0, moment_4 * n), exclude_bool=True)
+    return result
@@ -84,22 +84,19 @@ def ordinal_encoded_groupby_value_agg_pairs(
     """apply ordinal encoder df before doing groupby
     df columns must be of unifrom type"""
     values = unique_list([pair[0] for pair in value_agg_pairs])
+    aggs = unique_list([pair[1] for pair in value_agg_pairs])
 
     logging.info("ordinal_encoded_groupby begin")
     df_groupby, encoder = ordinal_encoded_groupby(df, by, values, spu, max_group_size)
     logging.info("ordinal_encoded_groupby complete")
-    results = {}
-    for value, agg in value_agg_pairs:
-        stat = getattr(
-            df_groupby,
-            agg,
-        )([value])
-        logging.info(f" {value, agg} stats computed")
-        results[(value, agg)] = ordinal_encoded_postprocess(
-            df, stat, encoder, by, [value]
-        )
-        logging.info(f" {value, agg} postprocessed")
-    return results
+    stats = _ordinal_encoded_groupby_multi_agg(
+        df, df_groupby, encoder, by, values, aggs
+    )
+    logging.info(f"{aggs} stats computed")
+    return {
+        (value, agg): stats[(value, agg)].to_frame(value)
+        for value, agg in value_agg_pairs
+    }
 
 
 def ordinal_encoded_groupby_aggs(
@@ -111,14 +108,23 @@ def ordinal_encoded_groupby_aggs(
     max_group_size: int = None,
 ):
     df_groupby, encoder = ordinal_encoded_groupby(df, by, values, spu, max_group_size)
-    results = {}
-    for agg in aggs:
-        stat = getattr(
-            df_groupby,
-            agg,
-        )()
+    stats = _ordinal_encoded_groupby_multi_agg(
+        df, df_groupby, encoder, by, values, aggs
+    )
+    return {agg: stats.xs(agg, axis=1, level=1)[values] for agg in aggs}
 
-        stat = ordinal_encoded_postprocess(df, stat, encoder, by, values)
-        results[agg] = stat
 
-    return results
+def _ordinal_encoded_groupby_multi_agg(
+    df: VDataFrame,
+    df_groupby: DataFrameGroupBy,
+    encoder: VOrdinalEncoder,
+    by: List[str],
+    values: List[str],
+    aggs: List[str],
+) -> pd.DataFrame:
+    """compute all aggs in one pass and decode the group keys once."""
+    stats = df_groupby.agg(aggs, values)
+    stats.index = ordinal_encoded_postprocess(
+        df, pd.DataFrame(index=stats.index), encoder, by, []
+    ).index
+    return stats
@@ -16,6 +16,7 @@ from typing import Any, List
 
 from secretflow.utils.compressor import SparseCompressor, CompressedData
 from secretflow.utils.compressor.base import Compressor
+from secretflow.utils.compressor.packing import pack_array, unpack_array
 from secretflow.utils.compressor.quantized_compressor import (
     QuantizedCompressor,
     QuantizedCompressedData,
@@ -34,6 +35,20 @@ class MixedCompressedData(CompressedData):
         super().__init__(compressed_data)
         self.compressed_participants: list = compressed_participants
 
+    def __getstate__(self):
+        # the quantized values are held here, bit-pack them like
+        # QuantizedCompressedData, while indices are encoded by the sparse
+        # participant.
+        state = self.__dict__.copy()
+        quant_bits = getattr(self.compressed_participants[-1], 'quant_bits', None)
+        if quant_bits is not None:
+            state['compressed_data'] = pack_array(self.compressed_data, quant_bits)
+        return state
+
+    def __setstate__(self, state):
+        state['compressed_data'] = unpack_array(state['compressed_data'])
+        self.__dict__.update(state)
+
     def get_sparse_mask(self):
         return self.compressed_participants[0].get_sparse_mask()
 
@@ -0,0 +1,143 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact wire format of compressed data.
+
+Quantized values are bit-packed with quant_bits bits per value, and sparse
+indices are delta encoded with zigzag varints. The encodings are applied when
+compressed data is serialized, so the in-memory data is unchanged.
+"""
+
+from typing import Any, Tuple
+
+import numpy as np
+
+
+def pack_bits(values: np.ndarray, bits: int) -> np.ndarray:
+    """Pack non-negative integers less than 2**bits into uint8 array, the bits
+    of values are concatenated in little endian order.
+    """
+    values = np.asarray(values).reshape(-1)
+    if 8 % bits == 0:
+        per_byte = 8 // bits
+        padded = np.zeros(-(-len(values) // per_byte) * per_byte, dtype=np.uint8)
+        padded[: len(values)] = values
+        shifts = np.arange(per_byte, dtype=np.uint8) * bits
+        return np.bitwise_or.reduce(padded.reshape(-1, per_byte) << shifts, axis=1)
+    values = values.astype(np.uint64)
+    bit_matrix = (values[:, None] >> np.arange(bits, dtype=np.uint64)) & 1
+    return np.packbits(bit_matrix.astype(np.uint8).reshape(-1), bitorder='little')
+
+
+def unpack_bits(packed: np.ndarray, bits: int, count: int) -> np.ndarray:
+    """Unpack count integers from the output of pack_bits, as uint64."""
+    packed = np.asarray(packed, dtype=np.uint8)
+    if 8 % bits == 0:
+        per_byte = 8 // bits
+        shifts = np.arange(per_byte, dtype=np.uint8) * bits
+        values = (packed[:, None] >> shifts) & np.uint8((1 << bits) - 1)
+        return values.reshape(-1)[:count].astype(np.uint64)
+    bit_matrix = np.unpackbits(packed, count=count * bits, bitorder='little')
+    bit_matrix = bit_matrix.reshape(count, bits).astype(np.uint64)
+    return np.bitwise_or.reduce(
+        bit_matrix << np.arange(bits, dtype=np.uint64), axis=1
+    ).astype(np.uint64)
+
+
+def varint_encode(values: np.ndarray) -> bytes:
+    """Encode unsigned integers as LEB128 varints."""
+    values = np.asarray(values, dtype=np.uint64).reshape(-1)
+    nbytes = np.ones(len(values), dtype=np.int64)
+    rest = values >> np.uint64(7)
+    while rest.any():
+        nbytes += rest > 0
+        rest >>= np.uint64(7)
+    positions = np.arange(nbytes.max() if len(values) else 0)
+    groups = (values[:, None] >> (positions * 7).astype(np.uint64)) & np.uint64(0x7F)
+    groups = groups.astype(np.uint8)
+    groups[positions < nbytes[:, None] - 1] |= 0x80
+    return groups[positions < nbytes[:, None]].tobytes()
+
+
+def varint_decode(buffer: bytes) -> np.ndarray:
+    """Decode the output of varint_encode, as uint64."""
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if len(data) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    ends = np.flatnonzero(data < 0x80)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    positions = np.arange(len(data)) - np.repeat(starts, ends - starts + 1)
+    parts = (data & 0x7F).astype(np.uint64) << (positions * 7).astype(np.uint64)
+    return np.bitwise_or.reduceat(parts, starts)
+
+
+def encode_indices(indices: Tuple[np.ndarray, ...], shape: Tuple[int, ...]) -> bytes:
+    """Encode coordinates of a sparse matrix as zigzag varints of the deltas of
+    flat indices, which takes about one byte per index when they are sorted.
+    """
+    flat = np.ravel_multi_index(indices, shape).astype(np.int64)
+    deltas = np.diff(flat, prepend=np.int64(0))
+    zigzag = (deltas << 1) ^ (deltas >> 63)
+    return varint_encode(zigzag.view(np.uint64))
+
+
+def decode_indices(buffer: bytes, shape: Tuple[int, ...]) -> Tuple[np.ndarray, ...]:
+    """Decode the output of encode_indices."""
+    zigzag = varint_decode(buffer)
+    deltas = (zigzag >> np.uint64(1)).view(np.int64) ^ -(zigzag & np.uint64(1)).view(
+        np.int64
+    )
+    return np.unravel_index(np.cumsum(deltas), shape)
+
+
+class PackedArray:
+    """Integer array bit-packed with bits per value, offset by its min value."""
+
+    def __init__(self, data: np.ndarray, bits: int, low: int):
+        self.dtype = data.dtype.str
+        self.shape = data.shape
+        self.bits = bits
+        self.low = low
+        self.buffer = pack_bits(data.reshape(-1).astype(np.int64) - low, bits).tobytes()
+
+    def unpack(self) -> np.ndarray:
+        values = unpack_bits(
+            np.frombuffer(self.buffer, dtype=np.uint8),
+            self.bits,
+            int(np.prod(self.shape)),
+        )
+        values = values.astype(np.int64) + self.low
+        return values.astype(np.dtype(self.dtype)).reshape(self.shape)
+
+
+def pack_array(data: Any, bits: int) -> Any:
+    """Bit-pack an integer array whose values span less than 2**bits, other
+    data or arrays already stored in bits per value are returned as is.
+    """
+    if (
+        not isinstance(data, np.ndarray)
+        or not np.issubdtype(data.dtype, np.integer)
+        or data.size == 0
+        or bits >= data.dtype.itemsize * 8
+    ):
+        return data
+    low, high = int(data.min()), int(data.max())
+    if high - low >= 1 << bits:
+        return data
+    return PackedArray(data, bits, low)
+
+
+def unpack_array(data: Any) -> Any:
+    """Inverse of pack_array."""
+    return data.unpack() if isinstance(data, PackedArray) else data
@@ -16,6 +16,7 @@ import logging
 
 from secretflow.utils.compressor import CompressedData
 from secretflow.utils.compressor.base import Compressor
+from secretflow.utils.compressor.packing import pack_array, unpack_array
 
 
 class QuantizedCompressedData(CompressedData):
@@ -24,6 +25,17 @@ class QuantizedCompressedData(CompressedData):
         self.quant_bits = quant_bits
         self.origin_type = origin_type
 
+    def __getstate__(self):
+        # values are stored in a full byte dtype in memory, bit-pack them with
+        # quant_bits bits per value on the wire.
+        state = self.__dict__.copy()
+        state['compressed_data'] = pack_array(self.compressed_data, self.quant_bits)
+        return state
+
+    def __setstate__(self, state):
+        state['compressed_data'] = unpack_array(state['compressed_data'])
+        self.__dict__.update(state)
+
 
 class QuantizedCompressor(Compressor):
     """Abstract base class for quantized compressor"""
@@ -50,9 +62,9 @@ class QuantizedCompressor(Compressor):
         if quant_bits in recommend_bits:
             return recommend_bits[quant_bits]
         else:
-            logging.warning(
-                f"It is recommended to use 8/16/32/64 as the compression bits (got {self.quant_bits}),"
-                f"That will loss accuracy but not save communication traffic."
+            logging.info(
+                f"The compression bits {self.quant_bits} is not one of 8/16/32/64, "
+                f"the quantized data is bit-packed when sent to other parties."
             )
             for i in range(64):
                 if (quant_bits + i) in recommend_bits:
@@ -14,6 +14,7 @@
 from abc import abstractmethod
 
 from secretflow.utils.compressor.base import Compressor, CompressedData
+from secretflow.utils.compressor.packing import decode_indices, encode_indices
 from scipy import sparse
 import numpy as np
 from typing import List
@@ -37,6 +38,22 @@ class SparseCompressedData(CompressedData):
             (self.compressed_data, (self.row, self.col)), shape=self.shape
         ).tocsr()
 
+    def __getstate__(self):
+        # delta encode the coordinates with varints on the wire.
+        state = self.__dict__.copy()
+        if self.row is not None:
+            state['indices'] = encode_indices(
+                (state.pop('row'), state.pop('col')), self.shape
+            )
+        return state
+
+    def __setstate__(self, state):
+        if 'indices' in state:
+            state['row'], state['col'] = decode_indices(
+                state.pop('indices'), state['shape']
+            )
+        self.__dict__.update(state)
+
     def get_sparse_mask(self):
         """We can simply use self.to_csr() != 0 to get a sparse_mask in sparse compressor. However, when use mixed
         compressor, the stored data is processed by quantized compressors or other, which may lead to 0 in data and
@@ -88,7 +105,7 @@ class RandomSparse(SparseCompressor):
         data_len = data_flat.shape[0]
         mask_num = round((1 - self.sparse_rate) * data_len)
         rng = np.random.default_rng()
-        mask_index = rng.choice(data_len, mask_num, replace=False)
+        mask_index = np.sort(rng.choice(data_len, mask_num, replace=False))
         row, col = np.unravel_index(mask_index, data_shape)
         target_data = data_flat[mask_index]
         return SparseCompressedData(target_data, self.sparse_rate, row, col, data_shape)
@@ -105,7 +122,9 @@ class TopkSparse(SparseCompressor):
         data_flat = data.flatten()
         data_len = data_flat.shape[0]
         mask_num = round((1 - self.sparse_rate) * data_len)
-        mask_index = np.argpartition(np.abs(data), -mask_num, axis=None)[-mask_num:]
+        mask_index = np.sort(
+            np.argpartition(np.abs(data), -mask_num, axis=None)[-mask_num:]
+        )
         row, col = np.unravel_index(mask_index, data_shape)
         target_data = data_flat[mask_index]
         return SparseCompressedData(target_data, self.sparse_rate, row, col, data_shape)
@@ -39,6 +39,53 @@ def zeros(shape):
     return BigintNdArray([0] * math.prod(shape), shape)
 
 
+def from_bytes(
+    buf, bytes_per_int: int, shape: tuple, byteorder='little', signed=True
+) -> np.ndarray:
+    """Convert a buffer of fixed-size integers to numpy array in bulk.
+
+    Integers of 8 bytes or less are viewed as numpy integer dtype without copy.
+    128-bit integers are viewed as two 64-bit words and combined into a numpy
+    array of python ints.
+
+    Args:
+        buf: bytes-like object, whose size should be bytes_per_int * prod(shape).
+        bytes_per_int: size of each integer.
+        shape: shape of the result.
+        byteorder: 'little' or 'big'.
+        signed: whether integers are signed.
+
+    Returns:
+        np.ndarray: int array if bytes_per_int <= 8 else object array.
+    """
+    items = math.prod(shape)
+    assert (
+        len(buf) == items * bytes_per_int
+    ), f"buffer size {len(buf)} != {items} * {bytes_per_int}"
+    endian = '<' if byteorder == 'little' else '>'
+    kind = 'i' if signed else 'u'
+    if bytes_per_int in (1, 2, 4, 8):
+        return np.frombuffer(buf, dtype=f'{endian}{kind}{bytes_per_int}').reshape(
+            shape
+        )
+
+    if bytes_per_int == 16:
+        words = [('lo', f'{endian}u8'), ('hi', f'{endian}{kind}8')]
+        if byteorder != 'little':
+            words.reverse()
+        view = np.frombuffer(buf, dtype=np.dtype(words))
+        res = (view['hi'].astype(object) << 64) | view['lo'].astype(object)
+        return res.reshape(shape)
+
+    return np.array(
+        [
+            int.from_bytes(buf[i : i + bytes_per_int], byteorder, signed=signed)
+            for i in range(0, len(buf), bytes_per_int)
+        ],
+        dtype=object,
+    ).reshape(shape)
+
+
 class BigintNdArray:
     def __init__(self, data, shape):
         assert len(data) == math.prod(shape), f"{len(data)} != {math.prod(shape)}"
@@ -0,0 +1,73 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pandas as pd
+
+from secretflow.component.component import CompEvalContext, CompSession
+from secretflow.component.data_utils import (
+    VerticalTableWrapper,
+    dump_vertical_table,
+    load_table,
+)
+from secretflow.data import partition
+from secretflow.data.vertical import VDataFrame
+from secretflow.device import PYU
+from secretflow.spec.v1.data_pb2 import SystemInfo, TableSchema
+
+
+def test_session_table_should_be_readable_by_path(comp_prod_sf_cluster_config):
+    uri = "test_comp_session/table.csv"
+    storage_config, sf_cluster_config = comp_prod_sf_cluster_config
+    self_party = sf_cluster_config.private_config.self_party
+    local_fs_wd = storage_config.local_fs.wd
+
+    dfs = {
+        "alice": pd.DataFrame({"id1": ["K1", "K2", "K3"], "a": [1.0, 2.0, 3.0]}),
+        "bob": pd.DataFrame({"id2": ["K1", "K2", "K3"], "b": [4.0, 5.0, 6.0]}),
+    }
+    meta = VerticalTableWrapper(
+        line_count=3,
+        schema_map={
+            "alice": TableSchema(
+                ids=["id1"], id_types=["str"], features=["a"], feature_types=["float"]
+            ),
+            "bob": TableSchema(
+                ids=["id2"], id_types=["str"], features=["b"], feature_types=["float"]
+            ),
+        },
+    )
+
+    with CompSession(sf_cluster_config) as session:
+        ctx = CompEvalContext(local_fs_wd=local_fs_wd, session=session)
+        v_data = VDataFrame(
+            {
+                PYU(p): partition(data=PYU(p)(lambda df=df: df)())
+                for p, df in dfs.items()
+            }
+        )
+        if self_party in dfs:
+            os.makedirs(os.path.join(local_fs_wd, "test_comp_session"), exist_ok=True)
+        dist_data = dump_vertical_table(ctx, v_data, uri, meta, SystemInfo())
+
+        # the table is written through, readers by path see it in the session.
+        if self_party in dfs:
+            pd.testing.assert_frame_equal(
+                pd.read_csv(os.path.join(local_fs_wd, uri)), dfs[self_party]
+            )
+        # following components load the table kept in memory.
+        assert session.get_table("alice", uri) is not None
+        loaded = load_table(ctx, dist_data, load_features=True, load_ids=True)
+        assert loaded.columns == ["id1", "a", "id2", "b"]
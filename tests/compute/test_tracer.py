@@ -0,0 +1,52 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import secretflow.compute as sc
+
+
+def _trace(df: pd.DataFrame) -> sc.Table:
+    t = sc.Table.from_pandas(df)
+    a = t.column("a")
+    t = t.append_column("a_eq_1", sc.if_else(sc.equal(a, 1), 1.0, 0.0))
+    # removed later, should not be computed.
+    t = t.append_column("dead", sc.multiply(t.column("b"), 3.0))
+    t = t.append_column("c_in", sc.is_in(t.column("c"), value_set=pa.array(["k"])))
+    t = t.set_column(1, "b_r", sc.round(sc.add(t.column("b"), a), ndigits=2))
+    t = t.remove_column("dead")
+    return t.remove_column("c")
+
+
+def test_trace_runner_should_ok():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "a": rng.integers(0, 5, 100).astype(np.int32),
+            "b": rng.normal(size=100),
+            "c": rng.choice(["k", "m"], 100),
+        }
+    )
+    expected = pd.DataFrame(
+        {
+            "a": df["a"],
+            "b_r": (df["b"] + df["a"]).round(2),
+            "a_eq_1": (df["a"] == 1).astype(float),
+            "c_in": df["c"] == "k",
+        }
+    )
+
+    runner = _trace(df).dump_runner()
+    assert len(runner._compiled.kernels) == 5
+
+    pd.testing.assert_frame_equal(runner.run(df), expected)
+    # runner is dumped into rules by pickle.
+    runner = pickle.loads(pickle.dumps(runner))
+    pd.testing.assert_frame_equal(runner.run(df), expected)
+
+    table = pa.Table.from_pandas(df)
+    pd.testing.assert_frame_equal(runner.run_arrow(table).to_pandas(), expected)
+    batches = list(runner.run_batches(table.to_batches(max_chunksize=7)))
+    assert all(isinstance(b, pa.RecordBatch) for b in batches)
+    pd.testing.assert_frame_equal(pa.Table.from_batches(batches).to_pandas(), expected)
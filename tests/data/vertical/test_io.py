@@ -5,9 +5,14 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from secretflow import reveal
+from secretflow import reveal, wait
 from secretflow.data import partition
-from secretflow.data.vertical import VDataFrame, read_csv
+from secretflow.data.core.io import (
+    csv_to_columnar,
+    read_columnar_wrapper,
+    read_csv_batches_wrapper,
+)
+from secretflow.data.vertical import VDataFrame, read_columnar, read_csv
 
 
 @pytest.fixture(scope="function")
@@ -216,6 +221,34 @@ def test_read_csv_without_psi(prod_env_and_data):
     cleartmp([path1, path2])
 
 
+def test_read_csv_lazy_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    df1 = pd.DataFrame({"c2": ["A5", "A1", "A2", "A6"], "c3": [5, 1, 2, 6]})
+
+    df2 = pd.DataFrame({"c4": ["B3", "B1", "B9", "B4"], "c5": [3, 1, 9, 4]})
+
+    _, path1 = tempfile.mkstemp()
+    _, path2 = tempfile.mkstemp()
+
+    df1.to_csv(path1, index=False)
+    df2.to_csv(path2, index=False)
+
+    filepath = {env.alice: path1, env.bob: path2}
+    df = read_csv(filepath, lazy=True)
+    assert list(df.columns) == ["c2", "c3", "c4", "c5"]
+
+    # only c3 and c5 are read.
+    value = df[["c3", "c5"]].astype(np.float64)
+    pd.testing.assert_series_equal(
+        value.sum(), pd.concat([df1[["c3"]], df2[["c5"]]], axis=1).sum() * 1.0
+    )
+    pd.testing.assert_frame_equal(
+        reveal(df.drop(columns=["c4"]).partitions[env.bob].data), df2[["c5"]]
+    )
+
+    cleartmp([path1, path2])
+
+
 def test_read_csv_without_psi_mismatch_length(prod_env_and_data):
     env, data = prod_env_and_data
     df1 = pd.DataFrame(
@@ -270,3 +303,77 @@ def test_to_csv_should_ok(prod_env_and_data):
     pd.testing.assert_frame_equal(reveal(actual_df.partitions[env.alice].data), df1)
     pd.testing.assert_frame_equal(reveal(actual_df.partitions[env.bob].data), df2)
     cleartmp([path1, path2])
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_to_columnar_and_read_columnar_should_ok(prod_env_and_data, file_format):
+    env, data = prod_env_and_data
+    # GIVEN
+    _, path1 = tempfile.mkstemp()
+    _, path2 = tempfile.mkstemp()
+    file_uris = {env.alice: path1, env.bob: path2}
+    df1 = pd.DataFrame({"c2": ["A5", "A1", "A2", "A6"], "c3": [5, 1, 2, 6]})
+
+    df2 = pd.DataFrame({"c4": ["B3", "B1", "B9", "B4"], "c5": [3, 1, 9, 4]})
+
+    df = VDataFrame(
+        {
+            env.alice: partition(env.alice(lambda df: df)(df1)),
+            env.bob: partition(env.bob(lambda df: df)(df2)),
+        }
+    )
+
+    # WHEN
+    wait(df.to_columnar(file_uris, file_format))
+
+    # THEN
+    actual_df = read_columnar(file_uris, file_format)
+    pd.testing.assert_frame_equal(reveal(actual_df.partitions[env.alice].data), df1)
+    pd.testing.assert_frame_equal(reveal(actual_df.partitions[env.bob].data), df2)
+
+    # only selected columns are read.
+    actual_df = read_columnar(
+        file_uris,
+        file_format,
+        dtypes={env.alice: {"c3": np.float32}, env.bob: {"c4": str}},
+        nrows=2,
+    )
+    pd.testing.assert_frame_equal(
+        reveal(actual_df.partitions[env.alice].data),
+        df1[["c3"]].astype(np.float32).iloc[:2],
+    )
+    pd.testing.assert_frame_equal(
+        reveal(actual_df.partitions[env.bob].data), df2[["c4"]].iloc[:2]
+    )
+    cleartmp([path1, path2])
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_read_csv_batches_and_csv_to_columnar(file_format):
+    df = pd.DataFrame(
+        {
+            "id": [f"{i:04d}" for i in range(1000)],
+            "x": np.arange(1000) * 0.5,
+            "y": np.arange(1000),
+        }
+    )
+    _, csv_path = tempfile.mkstemp()
+    _, columnar_path = tempfile.mkstemp()
+    df.to_csv(csv_path, index=False)
+    dtype = {"id": str, "y": np.float32}
+
+    # small blocks to read in multiple record batches.
+    actual = read_csv_batches_wrapper(
+        csv_path, columns=["y", "id"], dtype=dtype, nrows=300, block_size=1024
+    )
+    pd.testing.assert_frame_equal(
+        actual, pd.read_csv(csv_path, usecols=["y", "id"], dtype=dtype, nrows=300)
+    )
+    with pytest.raises(ValueError, match="not found"):
+        read_csv_batches_wrapper(csv_path, columns=["z"])
+
+    assert csv_to_columnar(
+        csv_path, columnar_path, file_format, dtype={"id": str}, block_size=1024
+    ) == len(df)
+    pd.testing.assert_frame_equal(read_columnar_wrapper(columnar_path, file_format), df)
+    cleartmp([csv_path, columnar_path])
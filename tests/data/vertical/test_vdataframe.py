@@ -1,9 +1,11 @@
+import jax.numpy as jnp
 import numpy as np
 import pandas as pd
 import pytest
 
 from secretflow import reveal
 from secretflow.data import partition
+from secretflow.data.groupby.dataframe_groupby import _groupby_aggs_via_shuffle
 from secretflow.data.vertical import VDataFrame
 from secretflow.utils.errors import NotFoundError
 
@@ -516,3 +518,95 @@ def test_groupby_agg(prod_env_and_data, agg_name):
         value=0, inplace=False
     )
     np.testing.assert_array_almost_equal(our_values, true_values, decimal=decimal)
+
+
+def test_groupby_multi_agg(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    df = data['df'][['a1', 'a2', 'a3', 'b4', 'b5', 'b6']].fillna(value=0, inplace=False)
+    df[["a3", "b4", "b6"]] = (
+        df[["a3", "b4", "b6"]].fillna(value=0, inplace=False).astype(float)
+    )
+    df_cleartext = data['df_cleartext'].fillna(value=0, inplace=False)
+    aggs = ['sum', 'count', 'mean', 'var', 'max', 'min']
+
+    # WHEN
+    our_values = df.groupby(env.spu, ['a3']).agg(aggs, ['b6', 'b4'])
+
+    # THEN
+    true_values = df_cleartext.groupby(['a3'])[['b6', 'b4']].agg(aggs).fillna(value=0)
+    assert list(our_values.columns) == list(true_values.columns)
+    np.testing.assert_array_almost_equal(our_values, true_values, decimal=3)
+
+
+def test_groupby_var_should_be_centered(prod_env_and_data):
+    env, _ = prod_env_and_data
+    # GIVEN
+    rng = np.random.default_rng(0)
+    df_alice = pd.DataFrame({'k': rng.integers(0, 4, 200).astype(float)})
+    df_bob = pd.DataFrame({'v': 1000 + rng.normal(0, 0.5, 200)})
+    df = VDataFrame(
+        {
+            env.alice: partition(data=env.alice(lambda: df_alice)()),
+            env.bob: partition(data=env.bob(lambda: df_bob)()),
+        }
+    )
+
+    # WHEN
+    our_values = df.groupby(env.spu, ['k']).agg(['mean', 'var'], ['v'])
+
+    # THEN
+    true_values = (
+        pd.concat([df_alice, df_bob], axis=1).groupby(['k'])[['v']].agg(['mean', 'var'])
+    )
+    # the naive sum of squares minus sum times mean loses the small variance
+    # of values with a large offset in fixed point.
+    np.testing.assert_allclose(our_values, true_values, atol=0.02)
+
+
+def test_groupby_aggs_should_only_reveal_segment_ends():
+    segment_ids = jnp.array([0, 0, 0, 1, 2, 2])
+    segment_end_marks = jnp.array([0, 0, 1, 1, 0, 1])
+
+    ids, end_marks, keys, values = _groupby_aggs_via_shuffle(
+        [jnp.array([1, 1, 1, 2, 3, 3])],
+        [jnp.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])],
+        segment_end_marks,
+        segment_ids,
+        jnp.array([0.3, 0.1, 0.6, 0.2, 0.5, 0.4]),
+        aggs=('var',),
+    )
+
+    ends = np.asarray(end_marks).astype(bool)
+    # ids of rows in the middle of segments are masked, so the size of groups
+    # is not revealed.
+    np.testing.assert_array_equal(np.asarray(ids)[~ends], 0)
+    order = np.argsort(np.asarray(ids)[ends])
+    np.testing.assert_array_equal(np.asarray(keys)[ends][order, 0], [1, 2, 3])
+    np.testing.assert_allclose(np.asarray(values)[ends][order, 0], [1.0, 0.0, 0.5])
+
+
+def test_lazy_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+
+    def _chain(df):
+        df = df[['a3', 'b4', 'b6']]
+        df = df.subtract(df.mean(numeric_only=True)).fillna(value=0)
+        return df.pow(2)[['a3', 'b4']].round(3)
+
+    # WHEN
+    value = _chain(data['df'].lazy())
+
+    # THEN
+    expected = _chain(data['df'])
+    assert list(value.columns) == list(expected.columns)
+    pd.testing.assert_series_equal(value.mean(), expected.mean())
+    value = value.collect()
+    pd.testing.assert_frame_equal(
+        reveal(value.partitions[env.alice].data),
+        reveal(expected.partitions[env.alice].data),
+    )
+    pd.testing.assert_frame_equal(
+        reveal(value.partitions[env.bob].data),
+        reveal(expected.partitions[env.bob].data),
+    )
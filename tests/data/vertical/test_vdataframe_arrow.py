@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from secretflow import reveal
+from secretflow.data import partition
+from secretflow.data.vertical import VDataFrame
+
+
+@pytest.fixture(scope='function')
+def prod_env_and_data(sf_production_setup_devices):
+    df_alice = pd.DataFrame(
+        {
+            'a1': ['K5', 'K1', None, 'K6'],
+            'a2': ['A5', 'A1', 'A2', 'A6'],
+            'a3': [5, 1, 2, 6],
+        }
+    )
+
+    df_bob = pd.DataFrame(
+        {
+            'b4': [10.2, 20.5, None, -0.4],
+            'b5': ['B3', None, 'B9', 'B4'],
+            'b6': [3, 1, 9, 4],
+        }
+    )
+    table_alice = pa.Table.from_pandas(df_alice, preserve_index=False)
+    table_bob = pa.Table.from_pandas(df_bob, preserve_index=False)
+    df = VDataFrame(
+        {
+            sf_production_setup_devices.alice: partition(
+                data=sf_production_setup_devices.alice(lambda: table_alice)(),
+                backend="arrow",
+            ),
+            sf_production_setup_devices.bob: partition(
+                data=sf_production_setup_devices.bob(lambda: table_bob)(),
+                backend="arrow",
+            ),
+        }
+    )
+
+    yield sf_production_setup_devices, {
+        "df_alice": df_alice,
+        "df_bob": df_bob,
+        "df": df,
+    }
+
+
+def test_columns_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    columns = data['df'].columns
+    # THEN
+    alice_columns = data['df_alice'].columns.to_list()
+    bob_columns = data['df_bob'].columns.to_list()
+    alice_columns.extend(bob_columns)
+    np.testing.assert_equal(columns, alice_columns)
+
+
+def test_statistics_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    for stat in ['min', 'max', 'mean', 'var', 'std', 'sem', 'skew', 'kurtosis']:
+        # WHEN
+        value = getattr(data['df'], stat)(numeric_only=True)
+        # THEN
+        expected_alice = getattr(data['df_alice'], stat)(numeric_only=True)
+        pd.testing.assert_series_equal(value[expected_alice.index], expected_alice)
+        expected_bob = getattr(data['df_bob'], stat)(numeric_only=True)
+        pd.testing.assert_series_equal(value[expected_bob.index], expected_bob)
+
+
+def test_count_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df'].count()
+    # THEN
+    pd.testing.assert_series_equal(
+        value, pd.concat([data['df_alice'].count(), data['df_bob'].count()])
+    )
+
+
+def test_to_pandas_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df'].to_pandas()
+    # THEN
+    pd.testing.assert_frame_equal(
+        reveal(value.partitions[env.alice].data), data['df_alice']
+    )
+    pd.testing.assert_frame_equal(
+        reveal(value.partitions[env.bob].data), data['df_bob']
+    )
+
+
+def test_fillna_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df'].fillna(value={'a1': 'test', 'b4': 0.0, 'b5': 'test'})
+    # THEN
+    pd.testing.assert_frame_equal(
+        reveal(value.to_pandas().partitions[env.alice].data),
+        data['df_alice'].fillna(value={'a1': 'test'}),
+    )
+    pd.testing.assert_frame_equal(
+        reveal(value.to_pandas().partitions[env.bob].data),
+        data['df_bob'].fillna(value={'b4': 0.0, 'b5': 'test'}),
+    )
+
+
+def test_astype_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    df = data['df'][['a3', 'b4']].fillna(value=1)
+    # WHEN
+    new_df = df.astype(np.int32)
+    # THEN
+    pd.testing.assert_frame_equal(
+        reveal(new_df.to_pandas().partitions[env.alice].data),
+        data['df_alice'][['a3']].astype(np.int32),
+    )
+    pd.testing.assert_frame_equal(
+        reveal(new_df.to_pandas().partitions[env.bob].data),
+        data['df_bob'][['b4']].fillna(1).astype(np.int32),
+    )
+
+
+def test_drop_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df'].drop(columns=['a1', 'b5'])
+    # THEN
+    pd.testing.assert_frame_equal(
+        reveal(value.to_pandas().partitions[env.alice].data),
+        data['df_alice'].drop(columns='a1'),
+    )
+    pd.testing.assert_frame_equal(
+        reveal(value.to_pandas().partitions[env.bob].data),
+        data['df_bob'].drop(columns='b5'),
+    )
+
+
+def test_fillna_should_skip_columns_value_not_fit(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df'].fillna(0)
+    # THEN
+    # string columns are left as is.
+    pd.testing.assert_frame_equal(
+        reveal(value.to_pandas().partitions[env.alice].data), data['df_alice']
+    )
+    pd.testing.assert_frame_equal(
+        reveal(value.to_pandas().partitions[env.bob].data),
+        data['df_bob'].fillna(value={'b4': 0}),
+    )
+
+
+def test_apply_func_should_keep_backend(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df'][['a3', 'b6']].apply_func(lambda df: df * 2)
+    # THEN
+    for part in value.partitions.values():
+        assert part.backend == "arrow"
+    pd.testing.assert_frame_equal(
+        reveal(value.to_pandas().partitions[env.alice].data),
+        data['df_alice'][['a3']] * 2,
+    )
@@ -5,6 +5,7 @@ from heu import phe
 import secretflow.device as ft
 from secretflow import reveal
 from secretflow.device.device.heu import HEUMoveConfig
+from secretflow.device.device.heu_object import batch_getitem
 
 
 def _test_device(devices):
@@ -126,3 +127,21 @@ def test_sum_prod(sf_production_setup_devices):
 
 def test_sum_sim(sf_simulation_setup_devices):
     _test_sum(sf_simulation_setup_devices)
+
+
+def _test_batch_getitem(devices):
+    x = ft.with_device(devices.alice)(np.random.rand)(10, 4)
+    y = ft.with_device(devices.alice)(np.random.rand)(8, 4)
+    x_, y_ = x.to(devices.heu), y.to(devices.heu)
+    items = ft.with_device(devices.alice)(lambda: [[0, 2, 4], [1, 3]])()
+
+    packed = batch_getitem([x_, y_], items)
+    assert not packed.is_plain
+    x_part, y_part = reveal(packed.to(devices.alice))
+    x, y = reveal(x), reveal(y)
+    np.testing.assert_almost_equal(x[[0, 2, 4]], x_part, decimal=4)
+    np.testing.assert_almost_equal(y[[1, 3]], y_part, decimal=4)
+
+
+def test_batch_getitem_prod(sf_production_setup_devices):
+    _test_batch_getitem(sf_production_setup_devices)
@@ -0,0 +1,89 @@
+import tempfile
+
+import numpy as np
+import spu
+
+import secretflow as sf
+from secretflow.device.device.spu import SPUValueMeta
+from secretflow.device.device.spu_compile_cache import (
+    SPUCompileCache,
+    make_compile_key,
+)
+
+
+def _meta(shape, dtype=np.float32, vtype=spu.Visibility.VIS_SECRET):
+    return SPUValueMeta(
+        shape, np.dtype(dtype), vtype, spu.spu_pb2.SEMI2K, spu.spu_pb2.FM128, 18
+    )
+
+
+def _add(x, y):
+    return x + y
+
+
+def test_compile_key():
+    copts = spu.spu_pb2.CompilerOptions()
+    key = make_compile_key(_add, copts, [_meta((3, 4)), _meta((3, 4))], {})
+    assert key == make_compile_key(_add, copts, [_meta((3, 4)), _meta((3, 4))], {})
+    assert key != make_compile_key(_add, copts, [_meta((3, 5)), _meta((3, 4))], {})
+    assert key != make_compile_key(
+        _add, copts, [_meta((3, 4), np.int64), _meta((3, 4))], {}
+    )
+    assert key != make_compile_key(
+        _add,
+        copts,
+        [_meta((3, 4), vtype=spu.Visibility.VIS_PUBLIC), _meta((3, 4))],
+        {},
+    )
+    assert key != make_compile_key(
+        lambda x, y: x - y, copts, [_meta((3, 4)), _meta((3, 4))], {}
+    )
+
+    copts.enable_pretty_print = True
+    assert key != make_compile_key(_add, copts, [_meta((3, 4)), _meta((3, 4))], {})
+
+
+def test_compile_cache_lru():
+    cache = SPUCompileCache(capacity=2)
+    cache.put('a', (b'a', None))
+    cache.put('b', (b'b', None))
+    assert cache.get('a') == (b'a', None)
+    cache.put('c', (b'c', None))
+    # 'b' is the least recently used.
+    assert cache.get('b') is None
+    assert cache.get('c') == (b'c', None)
+    assert cache.stats() == {'hits': 2, 'disk_hits': 0, 'misses': 1, 'size': 2}
+
+
+def test_compile_cache_disk():
+    cache_dir = tempfile.mkdtemp()
+    cache = SPUCompileCache(capacity=1, cache_dir=cache_dir)
+    cache.put('a', (b'a', [1, 2]))
+    cache.put('b', (b'b', [3]))
+
+    # a new cache, e.g. after restart.
+    cache = SPUCompileCache(capacity=1, cache_dir=cache_dir)
+    assert cache.get('a') == (b'a', [1, 2])
+    assert cache.get('b') == (b'b', [3])
+    assert cache.get('c') is None
+    assert cache.stats() == {'hits': 2, 'disk_hits': 2, 'misses': 1, 'size': 1}
+
+
+def _test_spu_call_hit_cache(devices):
+    def fn(x, y):
+        return x * y + 1
+
+    stats = devices.spu.compile_cache_stats()
+    x = devices.alice(np.random.rand)(3, 4).to(devices.spu)
+    y = devices.bob(np.random.rand)(3, 4).to(devices.spu)
+    expected = sf.reveal(devices.spu(fn)(x, y))
+    actual = sf.reveal(devices.spu(fn)(x, y))
+    np.testing.assert_almost_equal(expected, actual, decimal=5)
+
+    new_stats = devices.spu.compile_cache_stats()
+    assert new_stats['misses'] == stats['misses'] + 1
+    assert new_stats['hits'] == stats['hits'] + 1
+
+
+def test_spu_call_hit_cache_sim(sf_simulation_setup_devices):
+    _test_spu_call_hit_cache(sf_simulation_setup_devices)
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from interconnection.runtime import data_exchange_pb2 as de
+
+from secretflow.ic.proxy.serializer import (
+    deserialize,
+    deserialize_chunks,
+    serialize,
+    serialize_chunks,
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [True, False, True, True],
+        [1, 2, -3, 4],
+        [0],
+        [100000, -5],
+        [2**40, 1],
+        [],
+    ],
+)
+def test_scalar_list_round_trip(data):
+    assert deserialize(serialize(data)) == data
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        np.array([[1, 2], [3, -4]]),
+        np.arange(12, dtype=np.float32).reshape(3, 4)[:, ::2],
+        np.zeros((0, 3)),
+        np.array(5),
+        np.random.rand(10) > 0.5,
+    ],
+)
+def test_ndarray_round_trip(data):
+    actual = deserialize(serialize(data))
+    assert actual.shape == data.shape
+    np.testing.assert_array_equal(actual, data)
+
+
+def test_ndarray_list_round_trip():
+    data = [np.arange(3), np.arange(6).reshape(2, 3)]
+    actual = deserialize(serialize(data))
+    assert len(actual) == len(data)
+    for a, d in zip(actual, data):
+        np.testing.assert_array_equal(a, d)
+
+
+def test_same_as_protobuf():
+    data = np.arange(6).reshape(2, 3)
+    data_pb = de.DataExchangeProtocol()
+    data_pb.scalar_type = de.SCALAR_TYPE_INT64
+    data_pb.f_ndarray.shape.extend(data.shape)
+    data_pb.f_ndarray.item_buf = data.tobytes()
+    assert serialize(data) == data_pb.SerializeToString()
+
+    data_pb = de.DataExchangeProtocol()
+    data_pb.scalar_type = de.SCALAR_TYPE_BOOL
+    data_pb.f_scalar_list.item_count = 3
+    data_pb.f_scalar_list.item_buf = b'\x01\x00\x01'
+    assert serialize([True, False, True]) == data_pb.SerializeToString()
+
+
+@pytest.mark.parametrize("max_chunk_size", [1, 7, 1024])
+def test_serialize_chunks(max_chunk_size):
+    data = np.random.rand(100)
+    chunks = list(serialize_chunks(data, max_chunk_size))
+    assert all(len(chunk) <= max_chunk_size for chunk in chunks)
+    assert b''.join(chunks) == serialize(data)
+    np.testing.assert_array_equal(deserialize_chunks(chunks), data)
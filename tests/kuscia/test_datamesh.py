@@ -0,0 +1,210 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.flight as flight
+import pytest
+from google.protobuf.any_pb2 import Any
+from kuscia.proto.api.v1alpha1.common_pb2 import FileFormat
+from kuscia.proto.api.v1alpha1.datamesh.flightdm_pb2 import (
+    CommandDomainDataQuery,
+    CommandDomainDataUpdate,
+)
+
+from secretflow import reveal
+from secretflow.data import partition
+from secretflow.data.core.arrow.util import to_record_batches
+from secretflow.kuscia.datamesh import (
+    FlightClientPool,
+    get_csv_from_dp,
+    load_partition_from_dp,
+    put_batches_to_dp,
+    put_data_to_dp,
+    put_partition_to_dp,
+    read_batches_from_dp,
+)
+
+
+class _DataProxy(flight.FlightServerBase):
+    """A local stand-in of datamesh and data proxy.
+
+    A domain data is served as one endpoint per table, writes are collected
+    by the ticket of their endpoint.
+    """
+
+    def __init__(self, tables):
+        super().__init__("grpc://127.0.0.1:0")
+        self.location = flight.Location.for_grpc_tcp("127.0.0.1", self.port)
+        self.tables = tables
+        self.written = {}
+
+    def get_flight_info(self, context, descriptor):
+        command = Any()
+        command.ParseFromString(descriptor.command)
+        if command.Is(CommandDomainDataQuery.DESCRIPTOR):
+            endpoints = [
+                flight.FlightEndpoint(str(i).encode(), [self.location])
+                for i in range(len(self.tables))
+            ]
+            schema = self.tables[0].schema
+        else:
+            update = CommandDomainDataUpdate()
+            command.Unpack(update)
+            endpoints = [
+                flight.FlightEndpoint(update.domaindata_id.encode(), [self.location])
+            ]
+            schema = pa.schema([])
+        return flight.FlightInfo(schema, descriptor, endpoints, -1, -1)
+
+    def do_get(self, context, ticket):
+        table = self.tables[int(ticket.ticket)]
+        return flight.RecordBatchStream(table)
+
+    def do_put(self, context, descriptor, reader, writer):
+        self.written[descriptor.command.decode()] = reader.read_all()
+
+
+def _tables():
+    return [
+        pa.table(
+            {
+                "id": pa.array(range(start, start + 1000)),
+                "name": pa.array([f"x{i}" for i in range(start, start + 1000)]),
+                "score": pa.array([i * 0.5 for i in range(start, start + 1000)]),
+            }
+        )
+        for start in range(0, 5000, 1000)
+    ]
+
+
+@pytest.fixture
+def data_proxy():
+    server = _DataProxy(_tables())
+    client = flight.connect(server.location)
+    yield server, client
+    client.close()
+    server.shutdown()
+
+
+def test_read_batches_from_dp(data_proxy):
+    server, client = data_proxy
+    expected = pa.concat_tables(server.tables)
+
+    with FlightClientPool() as pool:
+        reader = read_batches_from_dp(client, "alice_table", pool, max_workers=2)
+        assert reader.schema.equals(expected.schema)
+        # endpoints are read in parallel but returned in order.
+        assert reader.read_all().equals(expected)
+
+    reader = read_batches_from_dp(client, "alice_table")
+    assert reader.read_all().equals(expected)
+
+
+def test_get_csv_from_dp(data_proxy, tmp_path):
+    server, client = data_proxy
+    path = os.path.join(tmp_path, "alice", "table.csv")
+
+    get_csv_from_dp(client, "alice_table", path)
+    # overwrites previous downloads.
+    get_csv_from_dp(client, "alice_table", path)
+
+    with open(path) as f:
+        assert f.readline() == "id,name,score\n"
+        # formatted by pandas, strings are not quoted.
+        assert f.readline() == "0,x0,0.0\n"
+    pd.testing.assert_frame_equal(
+        pd.read_csv(path),
+        pd.concat([t.to_pandas() for t in server.tables], ignore_index=True),
+    )
+
+
+def test_put_batches_to_dp(data_proxy, tmp_path):
+    server, client = data_proxy
+    df = server.tables[0].to_pandas()
+
+    schema, batches = to_record_batches(df)
+    put_batches_to_dp(client, "alice_output", schema, batches)
+    pd.testing.assert_frame_equal(server.written["alice_output"].to_pandas(), df)
+
+    path = os.path.join(tmp_path, "output.csv")
+    df.to_csv(path, index=False)
+    with FlightClientPool() as pool:
+        put_data_to_dp(client, "alice_csv", path, FileFormat.CSV, pool)
+    pd.testing.assert_frame_equal(server.written["alice_csv"].to_pandas(), df)
+
+
+def test_load_partition_from_dp(data_proxy, sf_simulation_setup_devices):
+    server, _ = data_proxy
+    alice = sf_simulation_setup_devices.alice
+    expected = pa.concat_tables(server.tables).to_pandas()
+
+    for backend in ["arrow", "pandas"]:
+        part = load_partition_from_dp(
+            alice,
+            f"grpc://127.0.0.1:{server.port}",
+            "alice_table",
+            backend=backend,
+            max_workers=2,
+        )
+        assert len(part) == len(expected)
+        pd.testing.assert_frame_equal(reveal(part.to_pandas().data), expected)
+
+
+def test_put_partition_to_dp(data_proxy, sf_simulation_setup_devices):
+    server, _ = data_proxy
+    alice = sf_simulation_setup_devices.alice
+    df = server.tables[0].to_pandas()
+
+    for backend in ["arrow", "pandas"]:
+        part = partition(alice(lambda: df)(), backend=backend)
+        assert reveal(
+            put_partition_to_dp(
+                part, f"grpc://127.0.0.1:{server.port}", f"alice_{backend}"
+            )
+        )
+        pd.testing.assert_frame_equal(
+            server.written[f"alice_{backend}"].to_pandas(), df
+        )
+
+
+def test_load_input_from_dp(data_proxy, sf_simulation_setup_devices, tmp_path):
+    from secretflow.component.component import CompSession
+    from secretflow.kuscia.entry import _load_input_from_dp
+    from secretflow.spec.v1.data_pb2 import DistData, StorageConfig
+
+    server, _ = data_proxy
+    expected = pa.concat_tables(server.tables).to_pandas()
+    session = CompSession(None)
+    data_ref = DistData.DataRef(uri="alice/table.csv", party="alice", format="csv")
+    storage_config = StorageConfig(
+        type="local_fs", local_fs=StorageConfig.LocalFSConfig(wd=str(tmp_path))
+    )
+
+    _load_input_from_dp(
+        session,
+        f"grpc://127.0.0.1:{server.port}",
+        "alice_table",
+        data_ref,
+        storage_config,
+    )
+    part, columns = session.get_table("alice", "alice/table.csv")
+    assert columns == list(expected.columns)
+    pd.testing.assert_frame_equal(reveal(part.to_pandas().data), expected)
+    # the file is still written for components reading it by path.
+    pd.testing.assert_frame_equal(
+        pd.read_csv(os.path.join(tmp_path, "alice", "table.csv")), expected
+    )
@@ -3,6 +3,7 @@ import pandas as pd
 import pytest
 
 from secretflow.ml.boost.homo_boost.tree_core.feature_histogram import (
+    BinnedData,
     FeatureHistogram,
     HistogramBag,
 )
@@ -28,6 +29,20 @@ def gen_data(data_num, feature_num, use_random=False, data_bin_num=10):
     return data
 
 
+def mask_histogram(data, grad, hess, bin_split_points, use_missing):
+    """Cumulative histogram of rows with feature value < each split point."""
+    histogram = []
+    for fid, split_points in enumerate(bin_split_points):
+        f_histogram = []
+        for point in split_points:
+            mask = data[:, fid] < point
+            f_histogram.append([grad[mask].sum(), hess[mask].sum(), mask.sum()])
+        if use_missing:
+            f_histogram.append([grad.sum(), hess.sum(), len(data)])
+        histogram.append(f_histogram)
+    return histogram
+
+
 class TestFeatureHistogram:
     @pytest.fixture()
     def set_up(self):
@@ -138,3 +153,47 @@ class TestFeatureHistogram:
         # test for len
         histogram_len = len(histogram_bag[0])
         np.testing.assert_equal(histogram_len, 10)
+
+    def test_binned_data(self, set_up):
+        data = np.random.random((1000, set_up['feature_num']))
+        data[np.random.random(data.shape) < 0.1] = np.nan
+        grad, hess = np.random.random(1000), np.random.random(1000)
+        bin_split_points = [
+            np.linspace(0.1, 1.0, set_up['data_bin_num'])
+            for _ in range(set_up['feature_num'])
+        ]
+        binned_data = BinnedData(data, grad, hess, bin_split_points)
+
+        # split is same as comparing with split point
+        left_rows, right_rows = binned_data.split_rows(np.arange(1000), 2, 4)
+        np.testing.assert_array_equal(
+            left_rows, np.where(data[:, 2] < bin_split_points[2][4])[0]
+        )
+        np.testing.assert_array_equal(
+            right_rows, np.where(~(data[:, 2] < bin_split_points[2][4]))[0]
+        )
+
+        # histogram of sibling is histogram of parent minus it
+        parent_hist = binned_data.histogram()
+        left_hist = binned_data.histogram(left_rows)
+        np.testing.assert_almost_equal(
+            parent_hist - left_hist, binned_data.histogram(right_rows)
+        )
+
+        # same as the cumulative histogram by masking rows with split points
+        for use_missing in [False, True]:
+            histogram = binned_data.to_feature_histogram(
+                parent_hist, set_up['valid_feature'], use_missing
+            )
+            expect_histogram = mask_histogram(
+                data, grad, hess, bin_split_points, use_missing
+            )
+            np.testing.assert_almost_equal(
+                np.array(histogram), np.array(expect_histogram)
+            )
+            if use_missing:
+                # missing bucket sums up all rows
+                np.testing.assert_almost_equal(
+                    np.array(histogram)[:, -1],
+                    np.tile([grad.sum(), hess.sum(), 1000], (len(histogram), 1)),
+                )
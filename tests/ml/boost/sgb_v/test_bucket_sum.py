@@ -18,6 +18,7 @@ import numpy as np
 
 from secretflow.device.driver import reveal
 from secretflow.ml.boost.sgb_v.core.pure_numpy_ops.bucket_sum import (
+    batch_assignment_sum,
     batch_select_sum,
 )
 
@@ -41,3 +42,24 @@ def test_bucket_sum(sf_production_setup_devices_aby3):
         alice(batch_select_sum)(gh, children_nodes_selects, order_map, bucket_num)
     )
     assert len(result) == node_num
+
+
+def test_batch_assignment_sum():
+    sample_num = 1000
+    feature_num = 10
+    bucket_num = 20
+    node_assignment = np.random.randint(0, 15, sample_num).astype(np.int16)
+    children_node_indices = [7, 10, 12, 14]
+    gh = np.random.random((sample_num, 2))
+    order_map = np.random.randint(0, bucket_num, (sample_num, feature_num))
+
+    children_nodes_selects = [
+        (node_assignment == i).astype(int).reshape(1, -1) for i in children_node_indices
+    ]
+    expected = batch_select_sum(gh, children_nodes_selects, order_map, bucket_num)
+    result = batch_assignment_sum(
+        gh, node_assignment, children_node_indices, order_map, bucket_num
+    )
+    assert len(result) == len(children_node_indices)
+    for r, e in zip(result, expected):
+        np.testing.assert_almost_equal(r, e)
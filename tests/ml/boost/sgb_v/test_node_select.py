@@ -0,0 +1,116 @@
+# Copyright 2023 Ant Group Co., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from secretflow.device import reveal
+from secretflow.ml.boost.sgb_v.core.pure_numpy_ops.boost import (
+    compute_weight_from_node_assignment,
+    compute_weight_from_node_select,
+)
+from secretflow.ml.boost.sgb_v.core.pure_numpy_ops.node_select import (
+    apply_node_assignment_delta,
+    get_child_select,
+    node_assignment_dtype,
+    node_assignment_to_selects,
+    root_assignment,
+    update_node_assignment,
+)
+from secretflow.ml.boost.sgb_v.factory.components.component import Devices
+from secretflow.ml.boost.sgb_v.factory.components.node_selector import NodeSelector
+
+
+def test_node_assignment_should_match_node_selects():
+    samples = 1000
+    order_map = np.random.randint(0, 10, (samples, 3))
+    assignment = root_assignment(samples, node_assignment_dtype(5))
+    assert assignment.dtype == np.int16
+    worker_assignment = assignment.copy()
+    selects = [np.ones((1, samples), dtype=np.int8)]
+    node_indices = [0]
+    leaf_selects, leaf_indices = [], []
+
+    for level in range(4):
+        gains = [i % 3 != 2 for i in range(len(node_indices))]
+        features = [(i % 3, 5) for i in range(len(node_indices))]
+        lchilds = [
+            (order_map[:, f] <= b).astype(np.uint8).reshape(1, -1)
+            for (f, b), gain in zip(features, gains)
+            if gain
+        ]
+        go_left = np.zeros(samples, dtype=np.uint8)
+        for s, (f, b) in zip(
+            node_assignment_to_selects(assignment, node_indices), features
+        ):
+            rows = s.reshape(-1) == 1
+            go_left[rows] = order_map[rows, f] <= b
+
+        childs_s, child_indices, pruned_s, pruned_indices = get_child_select(
+            selects, [lchilds], gains, node_indices
+        )
+        assignment, delta, new_indices, new_pruned = update_node_assignment(
+            assignment, [np.packbits(go_left)], gains, node_indices
+        )
+        worker_assignment = apply_node_assignment_delta(worker_assignment, delta)
+
+        assert new_indices == child_indices
+        assert new_pruned == pruned_indices
+        np.testing.assert_array_equal(worker_assignment, assignment)
+        for s, expected in zip(
+            node_assignment_to_selects(assignment, child_indices), childs_s
+        ):
+            np.testing.assert_array_equal(s.reshape(-1), expected.reshape(-1))
+
+        leaf_selects.extend(pruned_s)
+        leaf_indices.extend(pruned_indices)
+        selects, node_indices = childs_s, child_indices
+    leaf_selects.extend(selects)
+    leaf_indices.extend(node_indices)
+
+    g, h = np.random.rand(samples, 1), np.random.rand(samples, 1)
+    np.testing.assert_almost_equal(
+        compute_weight_from_node_assignment(assignment, leaf_indices, g, h, 0.1, 0.3),
+        compute_weight_from_node_select(
+            np.concatenate([s.reshape(1, -1) for s in leaf_selects], axis=0),
+            g,
+            h,
+            0.1,
+            0.3,
+        ),
+    )
+
+
+def test_label_holder_feature_only_should_keep_passive_assignment(
+    sf_simulation_setup_devices,
+):
+    alice, bob = sf_simulation_setup_devices.alice, sf_simulation_setup_devices.bob
+    samples = 100
+    selector = NodeSelector()
+    selector.set_params({'label_holder_feature_only': True})
+    selector.set_devices(Devices(alice, [alice, bob], None))
+    assert selector.splitting_workers() == [alice]
+
+    node_assignments = selector.root_assignments(samples, node_assignment_dtype(5))
+    go_left = np.arange(samples) % 2
+    left_bits = [alice(lambda: np.packbits(go_left))(), None]
+    node_assignments, child_indices, pruned_indices = selector.update_node_assignments(
+        node_assignments, left_bits, [True], [0]
+    )
+    assert reveal(child_indices) == [1, 2]
+    assert reveal(pruned_indices) == []
+    np.testing.assert_array_equal(reveal(node_assignments[0]), 2 - go_left)
+    # passive party learns nothing about the split.
+    np.testing.assert_array_equal(
+        reveal(node_assignments[1]), np.zeros(samples, dtype=np.int16)
+    )
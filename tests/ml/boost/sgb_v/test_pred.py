@@ -0,0 +1,67 @@
+import numpy as np
+
+from secretflow.ml.boost.sgb_v.core.pure_numpy_ops.pred import (
+    predict_forest_leaf_select,
+    predict_forest_weight,
+    predict_tree_weight,
+)
+from secretflow.ml.boost.sgb_v.model import _MAX_BATCH_LEAF_SELECTS, _tree_groups
+
+
+class _FakeSplitTree:
+    def __init__(self, select):
+        self.select = select
+
+    def predict_leaf_select(self, x):
+        return self.select[: x.shape[0]]
+
+
+def _random_selects(samples, leaves, parties):
+    # every party knows a superset of the real leaf of each sample.
+    leaf = np.random.randint(0, leaves, samples)
+    selects = []
+    for _ in range(parties):
+        s = np.random.randint(0, 2, (samples, leaves)).astype(np.int8)
+        s[np.arange(samples), leaf] = 1
+        selects.append(s)
+    selects[0][:] = 0
+    selects[0][np.arange(samples), leaf] = 1
+    return selects
+
+
+def test_predict_forest_weight():
+    samples, parties = 100, 3
+    leaves = [4, 7, 16]
+    trees_selects = [_random_selects(samples, l, parties) for l in leaves]
+    weights = [np.random.rand(l) for l in leaves]
+
+    expected = sum(predict_tree_weight(s, w) for s, w in zip(trees_selects, weights))
+
+    x = np.zeros((samples, 2))
+    selects = [
+        predict_forest_leaf_select(
+            x,
+            0,
+            samples,
+            p != 0,
+            *[_FakeSplitTree(s[p]) for s in trees_selects],
+        )
+        for p in range(parties)
+    ]
+    assert selects[0].dtype == bool
+    assert selects[1].dtype == np.uint8
+    assert selects[1].shape == (samples, (sum(leaves) + 7) // 8)
+
+    actual = predict_forest_weight(selects, np.concatenate(weights))
+    np.testing.assert_almost_equal(actual, expected)
+
+
+def test_tree_groups():
+    leaf_counts = [8] * 10
+    assert _tree_groups(leaf_counts, 1) == [(0, 10)]
+    rows = _MAX_BATCH_LEAF_SELECTS // 24
+    assert _tree_groups(leaf_counts, rows) == [(0, 3), (3, 6), (6, 9), (9, 10)]
+    # a tree exceeding the cap is still a group of its own.
+    assert _tree_groups(leaf_counts, _MAX_BATCH_LEAF_SELECTS) == [
+        (i, i + 1) for i in range(10)
+    ]
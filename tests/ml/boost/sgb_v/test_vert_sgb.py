@@ -16,8 +16,11 @@ import logging
 import os
 import time
 
+import numpy as np
+
 from secretflow.data import FedNdarray, PartitionWay
 from secretflow.device.driver import reveal
+from secretflow.ml.boost.core.checkpoint import read_checkpoint_tree_num
 from secretflow.ml.boost.sgb_v import Sgb
 from secretflow.ml.boost.sgb_v.model import load_model
 from secretflow.utils.simulation.datasets import load_dermatology, load_linear
@@ -44,6 +47,7 @@ def _run_sgb(
     early_stop_criterion_g_abs_sum=10.0,
     num_boost_round=2,
     num_tree_cap=2,
+    enable_pipelined_encryption=False,
 ):
     test_name = test_name + "_with_method_" + tree_grow_method
     sgb = Sgb(env.heu)
@@ -76,6 +80,7 @@ def _run_sgb(
         'early_stop_criterion_g_abs_sum': early_stop_criterion_g_abs_sum,
         'early_stop_criterion_g_abs_sum_change_ratio': 0.01,
         'enable_packbits': False,
+        'enable_pipelined_encryption': enable_pipelined_encryption,
     }
     model = sgb.train(params, v_data, label_data)
     reveal(model.trees[-1])
@@ -129,6 +134,36 @@ def _run_sgb(
     )
 
 
+def _run_pipelined_encryption(env, v_data, label_data, y, auc_bar):
+    sgb = Sgb(env.heu)
+    sgb.set_params(
+        {
+            'num_boost_round': 4,
+            'max_depth': 3,
+            'sketch_eps': 0.25,
+            'objective': 'logistic',
+            'reg_lambda': 0.1,
+            'rowsample_by_tree': 0.9,
+            'base_score': 0.5,
+            'seed': 42,
+            'first_tree_with_label_holder_feature': True,
+            'enable_pipelined_encryption': True,
+        }
+    )
+    # train with the booster directly to look into its gradient encryptor.
+    booster = sgb._produce()
+    model = booster.fit(v_data, label_data)
+    encryptor = booster.tree_trainer.components.gradient_encryptor
+    logging.info(
+        f"pipelined rows: {encryptor.pipelined_rows}/{encryptor.encrypted_rows}"
+    )
+    # the first tree uses label holder features only, and the second one has
+    # no zeros computed ahead, the others are encrypted with zeros.
+    assert 0 < encryptor.pipelined_rows < encryptor.encrypted_rows
+    yhat = reveal(model.predict(v_data))
+    assert roc_auc_score(y, yhat) > auc_bar
+
+
 def _run_npc_linear(env, test_name, parts, label_device, auc=0.88):
     vdf = load_linear(parts=parts)
 
@@ -143,6 +178,8 @@ def _run_npc_linear(env, test_name, parts, label_device, auc=0.88):
 
     logging.info("running XGB style test")
     _run_sgb(env, test_name, v_data, label_data, y, True, 0.9, 1, auc_bar=auc)
+    logging.info("running XGB style test with pipelined encryption")
+    _run_pipelined_encryption(env, v_data, label_data, y, auc)
     logging.info("running lightGBM style test")
     # test with leaf wise growth and goss: lightGBM style
     _run_sgb(
@@ -204,7 +241,7 @@ def test_2pc_linear_minimal(sf_production_setup_devices_aby3):
     )
 
 
-def test_breast_cancer(sf_production_setup_devices_aby3):
+def _breast_cancer_data(env):
     from sklearn.datasets import load_breast_cancer
 
     ds = load_breast_cancer()
@@ -212,23 +249,20 @@ def test_breast_cancer(sf_production_setup_devices_aby3):
 
     v_data = FedNdarray(
         {
-            sf_production_setup_devices_aby3.alice: (
-                sf_production_setup_devices_aby3.alice(lambda: x[:, :15])()
-            ),
-            sf_production_setup_devices_aby3.bob: (
-                sf_production_setup_devices_aby3.bob(lambda: x[:, 15:])()
-            ),
+            env.alice: (env.alice(lambda: x[:, :15])()),
+            env.bob: (env.bob(lambda: x[:, 15:])()),
         },
         partition_way=PartitionWay.VERTICAL,
     )
     label_data = FedNdarray(
-        {
-            sf_production_setup_devices_aby3.alice: (
-                sf_production_setup_devices_aby3.alice(lambda: y)()
-            )
-        },
+        {env.alice: (env.alice(lambda: y)())},
         partition_way=PartitionWay.VERTICAL,
     )
+    return v_data, label_data, y
+
+
+def test_breast_cancer(sf_production_setup_devices_aby3):
+    v_data, label_data, y = _breast_cancer_data(sf_production_setup_devices_aby3)
 
     _run_sgb(
         sf_production_setup_devices_aby3,
@@ -261,6 +295,94 @@ def test_breast_cancer(sf_production_setup_devices_aby3):
     )
 
 
+def test_breast_cancer_resume(sf_production_setup_devices_aby3, tmp_path):
+    env = sf_production_setup_devices_aby3
+    v_data, label_data, _ = _breast_cancer_data(env)
+    params = {
+        'num_boost_round': 4,
+        'max_depth': 3,
+        'sketch_eps': 0.25,
+        'objective': 'logistic',
+        'seed': 42,
+        'checkpoint_paths': {
+            env.alice.party: str(tmp_path / env.alice.party),
+            env.bob.party: str(tmp_path / env.bob.party),
+        },
+        'checkpoint_interval': 2,
+    }
+    sgb = Sgb(env.heu)
+    checkpoint_roots = list(params['checkpoint_paths'].values())
+
+    # a training without interruption.
+    full_params = {
+        k: v
+        for k, v in params.items()
+        if k not in ('checkpoint_paths', 'checkpoint_interval')
+    }
+    model = sgb.train(full_params, v_data, label_data)
+    yhat = reveal(model.predict(v_data))
+
+    # a training interrupted after the 3rd tree, whose checkpoint is of 2 trees.
+    sgb.train({**params, 'num_boost_round': 3}, v_data, label_data)
+    for party in [env.alice.party, env.bob.party]:
+        assert os.path.isfile(tmp_path / party / "order_map.npz")
+    for root in checkpoint_roots:
+        assert read_checkpoint_tree_num(root) == 2
+        assert sorted(
+            name for name in os.listdir(root) if name.startswith("checkpoint_")
+        ) == ["checkpoint_2"]
+
+    model_resumed = sgb.resume(params.copy(), v_data, label_data)
+    assert len(model_resumed.trees) == 4
+    yhat_resumed = reveal(model_resumed.predict(v_data))
+    np.testing.assert_almost_equal(yhat, yhat_resumed, decimal=5)
+
+
+def test_breast_cancer_predict_calls(sf_production_setup_devices_aby3, monkeypatch):
+    from secretflow.device import PYU
+    from secretflow.ml.boost.sgb_v import model as sgb_model
+
+    env = sf_production_setup_devices_aby3
+    v_data, label_data, _ = _breast_cancer_data(env)
+    params = {
+        'num_boost_round': 4,
+        'max_depth': 3,
+        'sketch_eps': 0.25,
+        'objective': 'logistic',
+        'seed': 42,
+    }
+    model = Sgb(env.heu).train(params, v_data, label_data)
+    x = v_data.partitions
+
+    calls = []
+    origin_call = PYU.__call__
+
+    def counting_call(self, fn, **kwargs):
+        calls.append(fn)
+        return origin_call(self, fn, **kwargs)
+
+    monkeypatch.setattr(PYU, '__call__', counting_call)
+
+    # the old path predicts tree by tree and sums trees at label holder.
+    tree_preds = [tree.predict(x) for tree in model.trees]
+    expected = tree_preds[0]
+    for pred in tree_preds[1:]:
+        expected = model.label_holder(lambda a, b: a + b)(expected, pred)
+    tree_calls = len(calls)
+
+    calls.clear()
+    pred = model._predict_forest(x)
+    assert len(calls) <= tree_calls
+    np.testing.assert_almost_equal(reveal(pred), reveal(expected), decimal=5)
+
+    # a group has one tree at least if its selects exceed the cap.
+    monkeypatch.setattr(sgb_model, '_MAX_BATCH_LEAF_SELECTS', 1)
+    calls.clear()
+    pred = model._predict_forest(x)
+    assert len(calls) <= tree_calls
+    np.testing.assert_almost_equal(reveal(pred), reveal(expected), decimal=5)
+
+
 def test_dermatology(sf_production_setup_devices_aby3):
     vdf = (
         load_dermatology(
@@ -15,10 +15,12 @@
 import os
 import time
 
+import numpy as np
 from sklearn.metrics import mean_squared_error, roc_auc_score
 
 from secretflow.data import FedNdarray, PartitionWay
 from secretflow.device.driver import reveal, wait
+from secretflow.ml.boost.core.checkpoint import read_checkpoint_tree_num
 from secretflow.ml.boost.ss_xgb_v import Xgb
 from secretflow.utils.simulation.datasets import load_dermatology, load_linear
 
@@ -108,7 +110,7 @@ def test_3pc_linear(sf_production_setup_devices_aby3):
     )
 
 
-def test_breast_cancer(sf_production_setup_devices_aby3):
+def _breast_cancer_data(env):
     from sklearn.datasets import load_breast_cancer
 
     ds = load_breast_cancer()
@@ -116,23 +118,20 @@ def test_breast_cancer(sf_production_setup_devices_aby3):
 
     v_data = FedNdarray(
         {
-            sf_production_setup_devices_aby3.alice: (
-                sf_production_setup_devices_aby3.alice(lambda: x[:, :15])()
-            ),
-            sf_production_setup_devices_aby3.bob: (
-                sf_production_setup_devices_aby3.bob(lambda: x[:, 15:])()
-            ),
+            env.alice: (env.alice(lambda: x[:, :15])()),
+            env.bob: (env.bob(lambda: x[:, 15:])()),
         },
         partition_way=PartitionWay.VERTICAL,
     )
     label_data = FedNdarray(
-        {
-            sf_production_setup_devices_aby3.alice: (
-                sf_production_setup_devices_aby3.alice(lambda: y)()
-            )
-        },
+        {env.alice: (env.alice(lambda: y)())},
         partition_way=PartitionWay.VERTICAL,
     )
+    return v_data, label_data, y
+
+
+def test_breast_cancer(sf_production_setup_devices_aby3):
+    v_data, label_data, y = _breast_cancer_data(sf_production_setup_devices_aby3)
 
     _run_xgb(
         sf_production_setup_devices_aby3,
@@ -146,6 +145,50 @@ def test_breast_cancer(sf_production_setup_devices_aby3):
     )
 
 
+def test_breast_cancer_resume(sf_production_setup_devices_aby3, tmp_path):
+    env = sf_production_setup_devices_aby3
+    v_data, label_data, _ = _breast_cancer_data(env)
+    params = {
+        'num_boost_round': 4,
+        'max_depth': 3,
+        'sketch_eps': 0.25,
+        'objective': 'logistic',
+        'reg_lambda': 0.1,
+        'base_score': 0.5,
+        # spu parties save shares of weights and predictions.
+        'checkpoint_paths': {
+            party: str(tmp_path / party) for party in env.spu.actors.keys()
+        },
+        'checkpoint_interval': 2,
+    }
+    xgb = Xgb(env.spu)
+    checkpoint_roots = list(params['checkpoint_paths'].values())
+
+    # a training without interruption.
+    full_params = {
+        k: v
+        for k, v in params.items()
+        if k not in ('checkpoint_paths', 'checkpoint_interval')
+    }
+    model = xgb.train(full_params, v_data, label_data)
+    yhat = reveal(model.predict(v_data))
+
+    # a training interrupted after the 3rd tree, whose checkpoint is of 2 trees.
+    xgb.train({**params, 'num_boost_round': 3}, v_data, label_data)
+    for party in [env.alice.party, env.bob.party]:
+        assert os.path.isfile(tmp_path / party / "order_map.npz")
+    for root in checkpoint_roots:
+        assert read_checkpoint_tree_num(root) == 2
+        assert sorted(
+            name for name in os.listdir(root) if name.startswith("checkpoint_")
+        ) == ["checkpoint_2"]
+
+    model_resumed = xgb.resume(params.copy(), v_data, label_data)
+    assert len(model_resumed.trees) == 4
+    yhat_resumed = reveal(model_resumed.predict(v_data))
+    np.testing.assert_almost_equal(yhat, yhat_resumed, decimal=5)
+
+
 def test_dermatology(sf_production_setup_devices_aby3):
     vdf = load_dermatology(
         parts={
@@ -1,6 +1,8 @@
 import logging
 import time
 
+import numpy as np
+
 from secretflow.data import FedNdarray, PartitionWay
 from secretflow.device.driver import reveal, wait
 from secretflow.ml.linear import SSRegression
@@ -116,6 +118,36 @@ def test_breast_cancer(sf_production_setup_devices_aby3):
     )
 
 
+def test_spill_batch_cache(sf_production_setup_devices_aby3):
+    from sklearn.datasets import load_breast_cancer
+
+    devices = sf_production_setup_devices_aby3
+    ds = load_breast_cancer()
+    x, y = _transform(ds["data"]), ds["target"]
+
+    v_data = FedNdarray(
+        partitions={
+            devices.alice: devices.alice(lambda: x[:, :15])(),
+            devices.bob: devices.bob(lambda: x[:, 15:])(),
+        },
+        partition_way=PartitionWay.VERTICAL,
+    )
+    label_data = FedNdarray(
+        partitions={devices.alice: devices.alice(lambda: y)()},
+        partition_way=PartitionWay.VERTICAL,
+    )
+    _wait_io([v_data, label_data])
+
+    weights = []
+    for max_resident_batches in [None, 0]:
+        reg = SSRegression(devices.spu, max_resident_batches=max_resident_batches)
+        reg.fit(v_data, label_data, 3, 0.3, 128, "t1", "logistic", "l2", 0.5, eps=0)
+        weights.append(reveal(reg.spu_w))
+
+    # every batch is spilled to disk and loaded back in following epochs.
+    np.testing.assert_allclose(weights[0], weights[1], atol=1e-2)
+
+
 def test_linear(sf_production_setup_devices_aby3):
     start = time.time()
     vdf = load_linear(
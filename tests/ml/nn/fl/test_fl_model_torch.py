@@ -12,7 +12,9 @@ import os
 import tempfile
 
 import numpy as np
+import pytest
 import tensorflow as tf
+from sklearn.datasets import load_iris as load_sklearn_iris
 from torch import nn, optim
 from torchmetrics import Accuracy, Precision
 
@@ -22,8 +24,13 @@ from secretflow.ml.nn.fl.compress import COMPRESS_STRATEGY
 from secretflow.ml.nn.fl.utils import metric_wrapper, optim_wrapper
 from secretflow.ml.nn.utils import TorchModel
 from secretflow.preprocessing.encoder import OneHotEncoder
-from secretflow.security.aggregation import PlainAggregator, SparsePlainAggregator
+from secretflow.security.aggregation import (
+    PlainAggregator,
+    SecureAggregator,
+    SparsePlainAggregator,
+)
 from secretflow.security.privacy import DPStrategyFL, GaussianModelDP
+from secretflow.utils.simulation.data.dataframe import create_df
 from secretflow.utils.simulation.datasets import load_iris, load_mnist
 from tests.ml.nn.fl.model_def import ConvNet, ConvRGBNet, MlpNet
 
@@ -331,6 +338,116 @@ class TestFLModelTorchMlp:
             [m.result().numpy() for m in reload_metric],
         )
 
+    @pytest.mark.parametrize("strategy", ["fed_avg_w", "fed_avg_u"])
+    def test_torch_model_mlp_async(self, sf_simulation_setup_devices, strategy):
+        device_list = [
+            sf_simulation_setup_devices.alice,
+            sf_simulation_setup_devices.bob,
+            sf_simulation_setup_devices.davy,
+        ]
+        server = sf_simulation_setup_devices.carol
+
+        # iid and standardized iris, so that every client learns all classes.
+        iris = load_sklearn_iris(as_frame=True).frame
+        features = [c for c in iris.columns if c != 'target']
+        iris[features] = (iris[features] - iris[features].mean()) / iris[features].std()
+        labels = [f'class_{i}' for i in range(3)]
+        iris[labels] = np.eye(3, dtype=np.float32)[iris['target']]
+        hdf = create_df(
+            iris[features + labels].astype(np.float32),
+            parts=device_list,
+            shuffle=True,
+            random_state=1234,
+            aggregator=PlainAggregator(server),
+        )
+        data, label = hdf[features], hdf[labels]
+
+        model_def = TorchModel(
+            model_fn=MlpNet,
+            loss_fn=nn.CrossEntropyLoss,
+            optim_fn=optim_wrapper(optim.Adam, lr=1e-2),
+            metrics=[
+                metric_wrapper(
+                    Accuracy, task="multiclass", num_classes=3, average='micro'
+                ),
+            ],
+        )
+
+        def _fit(aggregator, **kwargs):
+            fl_model = FLModel(
+                server=server,
+                device_list=device_list,
+                model=model_def,
+                aggregator=aggregator,
+                strategy=strategy,
+                backend="torch",
+                random_seed=1234,
+            )
+            history = fl_model.fit(
+                data,
+                label,
+                validation_data=(data, label),
+                epochs=10,
+                batch_size=16,
+                aggregate_freq=1,
+                **kwargs,
+            )
+            return fl_model, history
+
+        # the average of a single update is the update itself.
+        with pytest.raises(AssertionError):
+            _fit(SecureAggregator(server, device_list), async_buffer_size=1)
+
+        _, sync_history = _fit(PlainAggregator(server))
+        sync_accuracy = sync_history["global_history"]['val_multiclassaccuracy'][-1]
+
+        fl_model, history = _fit(
+            SecureAggregator(server, device_list), async_buffer_size=2
+        )
+        global_metric, _ = fl_model.evaluate(
+            data, label, batch_size=32, random_seed=1234
+        )
+        accuracy = global_metric[0].result().numpy()
+        assert accuracy == history["global_history"]['val_multiclassaccuracy'][-1]
+        assert accuracy > 0.8
+        assert accuracy >= sync_accuracy - 0.1
+
+        # all clients hold the global model after training.
+        weights = [
+            reveal(fl_model._workers[device].get_weights()) for device in device_list
+        ]
+        for client_weights in weights[1:]:
+            for w, expected in zip(client_weights, weights[0]):
+                np.testing.assert_allclose(w, expected, rtol=1e-5, atol=1e-6)
+
+    def test_torch_model_mlp_async_in_production(self, sf_production_setup_devices):
+        device_list = [
+            sf_production_setup_devices.alice,
+            sf_production_setup_devices.bob,
+        ]
+        model_def = TorchModel(
+            model_fn=MlpNet,
+            loss_fn=nn.CrossEntropyLoss,
+            optim_fn=optim_wrapper(optim.Adam, lr=1e-2),
+            metrics=[
+                metric_wrapper(
+                    Accuracy, task="multiclass", num_classes=3, average='micro'
+                ),
+            ],
+        )
+        fl_model = FLModel(
+            server=sf_production_setup_devices.carol,
+            device_list=device_list,
+            model=model_def,
+            aggregator=PlainAggregator(sf_production_setup_devices.carol),
+            strategy="fed_avg_w",
+            backend="torch",
+            random_seed=1234,
+        )
+        # rejected before any data is touched.
+        with pytest.raises(AssertionError, match='production mode'):
+            fl_model.fit(None, None, epochs=1, async_buffer_size=2)
+
 
 class TestFLModelTorchDataBuilder:
     def test_torch_model_databuilder(self, sf_simulation_setup_devices):
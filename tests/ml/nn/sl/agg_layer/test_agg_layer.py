@@ -184,6 +184,49 @@ class TestSPUAggLayer:
             decimal=5,
         )
 
+    def test_spu_average_steps(self, sf_simulation_setup_devices):
+        # SETUP DEVICE
+        alice, bob = (
+            sf_simulation_setup_devices.alice,
+            sf_simulation_setup_devices.bob,
+        )
+        spu = sf_simulation_setup_devices.spu
+
+        # GIVEN
+        spu_agglayer = AggLayer(
+            device_agg=spu,
+            parties=[alice, bob],
+            device_y=bob,
+            agg_method=Average(axis=0),
+        )
+        datas = [
+            {
+                alice: alice(
+                    lambda i=i: ForwardData(hidden=tf.constant([[1.0 + i, 2.0]]))
+                )(),
+                bob: bob(
+                    lambda i=i: ForwardData(hidden=tf.constant([[3.0 + i, 4.0]]))
+                )(),
+            }
+            for i in range(3)
+        ]
+        gradients = [bob(lambda i=i: tf.constant([[2.0 * i, 2.0]]))() for i in range(3)]
+
+        # WHEN
+        forward_objs = sf.reveal(spu_agglayer.forward_steps(datas))
+        backward_objs = sf.reveal(spu_agglayer.backward_steps(gradients))
+
+        # THEN
+        assert len(forward_objs) == 3 and len(backward_objs) == 3
+        for i in range(3):
+            np.testing.assert_almost_equal(
+                forward_objs[i].hidden.numpy(), [[2.0 + i, 3.0]], decimal=5
+            )
+            for device in [alice, bob]:
+                np.testing.assert_almost_equal(
+                    backward_objs[i][device].numpy(), [[1.0 * i, 1.0]], decimal=5
+                )
+
 
 class TestConcatAggLayer:
     def test_spu_concat(self, sf_simulation_setup_devices):
@@ -81,6 +81,9 @@ def torch_model_with_mnist(
     agg_method = kwargs.get('agg_method', None)
     compressor = kwargs.get('compressor', None)
     pipeline_size = kwargs.get('pipeline_size', 1)
+    fused_steps = kwargs.get('fused_steps', 1)
+    device_agg = kwargs.get('device_agg', None)
+    agg_batch_steps = kwargs.get('agg_batch_steps', 1)
 
     atol = kwargs.get('atol', 0.02)
 
@@ -105,6 +108,8 @@ def torch_model_with_mnist(
         agg_method=agg_method,
         compressor=compressor,
         pipeline_size=pipeline_size,
+        device_agg=device_agg,
+        agg_batch_steps=agg_batch_steps,
     )
     history = sl_model.fit(
         data,
@@ -115,6 +120,7 @@ def torch_model_with_mnist(
         shuffle=False,
         random_seed=1234,
         dataset_builder=dataset_builder,
+        fused_steps=fused_steps,
     )
     global_metric = sl_model.evaluate(
         data,
@@ -152,6 +158,8 @@ def torch_model_with_mnist(
         model_fuse=model_fuse,
         dp_strategy_dict=dp_strategy_dict,
         compressor=compressor,
+        agg_method=agg_method,
+        device_agg=device_agg,
         simulation=True,
         random_seed=1234,
         backend=backend,
@@ -280,6 +288,20 @@ class TestSLModelTorch:
             dataset_builder=dataset_buidler_dict,
         )
 
+        # test fused steps
+        print("test fused steps")
+        torch_model_with_mnist(
+            devices=sf_simulation_setup_devices,
+            base_model_dict=base_model_dict,
+            device_y=bob,
+            model_fuse=fuse_model,
+            data=mnist_data,
+            label=mnist_label,
+            strategy='split_nn',
+            backend="torch",
+            fused_steps=4,
+        )
+
         # test compressor
         print("test TopkSparse")
         top_k_compressor = TopkSparse(0.5)
@@ -357,6 +379,117 @@ class TestSLModelTorch:
             agg_method=Average(),
         )
 
+    def test_agg_batch_steps_on_spu(self, sf_simulation_setup_devices):
+        alice = sf_simulation_setup_devices.alice
+        bob = sf_simulation_setup_devices.bob
+        (x_train, y_train), (_, _) = load_mnist(
+            parts={
+                sf_simulation_setup_devices.alice: (0, num_samples),
+                sf_simulation_setup_devices.bob: (0, num_samples),
+            },
+            normalized_x=True,
+            categorical_y=True,
+            is_torch=True,
+        )
+        x_train = x_train.astype(np.float32)
+        y_train = y_train.astype(np.float32)
+        loss_fn = nn.CrossEntropyLoss
+        optim_fn = optim_wrapper(optim.Adam, lr=1e-2)
+        base_model = TorchModel(
+            model_fn=ConvNetBase,
+            loss_fn=loss_fn,
+            optim_fn=optim_fn,
+            metrics=[
+                metric_wrapper(
+                    Accuracy, task="multiclass", num_classes=10, average='micro'
+                ),
+            ],
+        )
+        fuse_model = TorchModel(
+            model_fn=ConvNetFuseAgglayer,
+            loss_fn=loss_fn,
+            optim_fn=optim_fn,
+            metrics=[
+                metric_wrapper(
+                    Accuracy, task="multiclass", num_classes=10, average='micro'
+                ),
+            ],
+        )
+        base_model_dict = {
+            alice: base_model,
+            bob: base_model,
+        }
+
+        # hiddens and gradients of every 2 steps are aggregated on spu at once.
+        torch_model_with_mnist(
+            devices=sf_simulation_setup_devices,
+            base_model_dict=base_model_dict,
+            device_y=bob,
+            model_fuse=fuse_model,
+            data=x_train,
+            label=y_train,
+            strategy='pipeline',
+            backend="torch",
+            pipeline_size=2,
+            agg_method=Average(),
+            device_agg=sf_simulation_setup_devices.spu,
+            agg_batch_steps=2,
+        )
+
+    def test_fused_steps_in_production(self, sf_production_setup_devices):
+        alice = sf_production_setup_devices.alice
+        bob = sf_production_setup_devices.bob
+        (_, _), (mnist_data, mnist_label) = load_mnist(
+            parts={
+                alice: (0, num_samples),
+                bob: (0, num_samples),
+            },
+            normalized_x=True,
+            categorical_y=True,
+            is_torch=True,
+        )
+        mnist_data = mnist_data.astype(np.float32)
+        mnist_label = mnist_label.astype(np.float32)
+        loss_fn = nn.CrossEntropyLoss
+        optim_fn = optim_wrapper(optim.Adam, lr=1e-2)
+        base_model = TorchModel(
+            model_fn=ConvNetBase,
+            loss_fn=loss_fn,
+            optim_fn=optim_fn,
+            metrics=[
+                metric_wrapper(
+                    Accuracy, task="multiclass", num_classes=10, average='micro'
+                ),
+            ],
+        )
+        fuse_model = TorchModel(
+            model_fn=ConvNetFuse,
+            loss_fn=loss_fn,
+            optim_fn=optim_fn,
+            metrics=[
+                metric_wrapper(
+                    Accuracy, task="multiclass", num_classes=10, average='micro'
+                ),
+            ],
+        )
+        base_model_dict = {
+            alice: base_model,
+            bob: base_model,
+        }
+
+        # hiddens and gradients go through the cross-silo channels of fed.
+        torch_model_with_mnist(
+            devices=sf_production_setup_devices,
+            base_model_dict=base_model_dict,
+            device_y=bob,
+            model_fuse=fuse_model,
+            data=mnist_data,
+            label=mnist_label,
+            strategy='split_nn',
+            backend="torch",
+            fused_steps=4,
+        )
+
     def test_single_feature_model(self, sf_simulation_setup_devices):
         alice = sf_simulation_setup_devices.alice
         bob = sf_simulation_setup_devices.bob
@@ -416,3 +549,88 @@ class TestSLModelTorch:
             strategy='split_nn',
             backend="torch",
         )
+
+    def test_torch_strategies(self, sf_simulation_setup_devices):
+        alice = sf_simulation_setup_devices.alice
+        bob = sf_simulation_setup_devices.bob
+        (_, _), (mnist_data, mnist_label) = load_mnist(
+            parts={
+                sf_simulation_setup_devices.alice: (0, num_samples),
+                sf_simulation_setup_devices.bob: (0, num_samples),
+            },
+            normalized_x=True,
+            categorical_y=True,
+            is_torch=True,
+        )
+        mnist_data = mnist_data.astype(np.float32)
+        mnist_label = mnist_label.astype(np.float32)
+
+        loss_fn = nn.CrossEntropyLoss
+        optim_fn = optim_wrapper(optim.Adam, lr=1e-2)
+        base_model = TorchModel(
+            model_fn=ConvNetBase,
+            loss_fn=loss_fn,
+            optim_fn=optim_fn,
+            metrics=[
+                metric_wrapper(
+                    Accuracy, task="multiclass", num_classes=10, average='micro'
+                ),
+            ],
+        )
+        fuse_model = TorchModel(
+            model_fn=ConvNetFuse,
+            loss_fn=loss_fn,
+            optim_fn=optim_fn,
+            metrics=[
+                metric_wrapper(
+                    Accuracy, task="multiclass", num_classes=10, average='micro'
+                ),
+            ],
+        )
+        base_model_dict = {
+            alice: base_model,
+            bob: base_model,
+        }
+
+        print("test pipeline strategy")
+        torch_model_with_mnist(
+            devices=sf_simulation_setup_devices,
+            base_model_dict=base_model_dict,
+            device_y=bob,
+            model_fuse=fuse_model,
+            data=mnist_data,
+            label=mnist_label,
+            strategy='pipeline',
+            backend="torch",
+            pipeline_size=2,
+        )
+
+        print("test split async strategy")
+        torch_model_with_mnist(
+            devices=sf_simulation_setup_devices,
+            base_model_dict=base_model_dict,
+            device_y=bob,
+            model_fuse=fuse_model,
+            data=mnist_data,
+            label=mnist_label,
+            strategy='split_async',
+            backend="torch",
+            base_local_steps=5,
+            fuse_local_steps=5,
+            bound_param=0.1,
+        )
+
+        print("test split state async strategy")
+        torch_model_with_mnist(
+            devices=sf_simulation_setup_devices,
+            base_model_dict=base_model_dict,
+            device_y=bob,
+            model_fuse=fuse_model,
+            data=mnist_data,
+            label=mnist_label,
+            strategy='split_state_async',
+            backend="torch",
+            loss_thres=0.01,
+            split_steps=1,
+            max_fuse_local_steps=10,
+        )
@@ -1,5 +1,8 @@
+import numpy as np
 import pytest
 
+import secretflow as sf
+
 from secretflow.security.aggregation.secure_aggregator import SecureAggregator
 from tests.security.aggregation.test_aggregator_base import AggregatorBase
 
@@ -11,3 +14,52 @@ class TestSecureAggregator(AggregatorBase):
             sf_production_setup_devices.carol,
             [sf_production_setup_devices.alice, sf_production_setup_devices.bob],
         )
+
+
+class TestChunkedSecureAggregator(AggregatorBase):
+    @pytest.fixture()
+    def env_and_aggregator(self, sf_production_setup_devices):
+        yield sf_production_setup_devices, SecureAggregator(
+            sf_production_setup_devices.carol,
+            [sf_production_setup_devices.alice, sf_production_setup_devices.bob],
+            chunk_size=4,
+        )
+
+
+def test_secure_aggregator_should_reject_dropout_in_production(
+    sf_production_setup_devices,
+):
+    with pytest.raises(AssertionError, match='dropout_timeout'):
+        SecureAggregator(
+            sf_production_setup_devices.carol,
+            [sf_production_setup_devices.alice, sf_production_setup_devices.bob],
+            dropout_timeout=1,
+        )
+
+
+def test_secure_aggregator_should_drop_out_failed_participant(
+    sf_simulation_setup_devices,
+):
+    env = sf_simulation_setup_devices
+    aggregator = SecureAggregator(
+        env.carol, [env.alice, env.bob, env.davy], dropout_timeout=60
+    )
+
+    def _fail():
+        raise RuntimeError('participant dropped out')
+
+    a = env.alice(lambda: np.array([[1.0, 2.0], [3.0, 4.0]]))()
+    b = env.bob(lambda: np.array([[11.0, 12.0], [13.0, 14.0]]))()
+    d = env.davy(_fail)()
+
+    # davy is excluded, alice and bob are aggregated in the same round.
+    np.testing.assert_almost_equal(
+        sf.reveal(aggregator.sum([a, b, d], axis=0)),
+        np.array([[12.0, 14.0], [16.0, 18.0]]),
+        decimal=5,
+    )
+    np.testing.assert_almost_equal(
+        sf.reveal(aggregator.average([a, b, d], axis=0, weights=[1, 3, 1])),
+        np.array([[8.5, 9.5], [10.5, 11.5]]),
+        decimal=5,
+    )
@@ -1,10 +1,13 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from sklearn.datasets import load_iris
 
 from secretflow.data import partition
 from secretflow.data.vertical.dataframe import VDataFrame
 from secretflow.stats import table_statistics
+from secretflow.stats.core.table_statistics_core import table_statistics_core
 
 
 @pytest.fixture(scope='module')
@@ -51,3 +54,50 @@ def test_table_statistics(prod_env_and_data):
                 assert (
                     correct_summary.iloc[i, j] == summary.iloc[i, j]
                 ), "row {}, col {} mismatch".format(i, summary.columns[j])
+
+
+def test_table_statistics_core_align_with_pandas():
+    """The fused scan should align with pandas APIs."""
+    iris = load_iris(as_frame=True)
+    table = pd.concat([iris.data, iris.target], axis=1)
+    table.iloc[1, 1] = None
+    table['target'] = table['target'].map({0: 'a', 1: 'b', 2: 'c'})
+    summary = table_statistics_core(table, block_rows=7, block_cols=2)
+
+    numbers = table.select_dtypes("number")
+    central = numbers - numbers.mean()
+    expected = {
+        "count(non-NA count)": table.count(),
+        "min": table.min(numeric_only=True),
+        "max": table.max(numeric_only=True),
+        "mean": table.mean(numeric_only=True),
+        "var(variance)": table.var(numeric_only=True),
+        "sem(standard error)": table.sem(numeric_only=True),
+        "skew": table.skew(numeric_only=True),
+        "kurtosis": table.kurtosis(numeric_only=True),
+        "q2(second quartile, median)": table.quantile(0.5, numeric_only=True),
+        "moment_3": numbers.pow(3).mean(),
+        "central_moment_4": central.pow(4).mean(),
+        "sum": table.sum(numeric_only=True),
+        "sum_2": numbers.pow(2).sum(),
+    }
+    for name, series in expected.items():
+        np.testing.assert_allclose(
+            summary[name].astype(float).values,
+            series.reindex(table.columns).astype(float).values,
+            rtol=1e-9,
+            err_msg=name,
+        )
+
+
+def test_table_statistics_core_should_scan_arrow_table():
+    iris = load_iris(as_frame=True)
+    table = pd.concat([iris.data, iris.target], axis=1)
+    table.iloc[1, 1] = None
+    table['target'] = table['target'].map({0: 'a', 1: 'b', 2: 'c'})
+    arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+
+    pd.testing.assert_frame_equal(
+        table_statistics_core(arrow_table, block_rows=7, block_cols=2),
+        table_statistics_core(table, block_rows=7, block_cols=2),
+    )
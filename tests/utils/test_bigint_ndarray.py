@@ -64,3 +64,17 @@ def test_to_numpy():
     )
     assert isinstance(array_pt[0][0], phe.Plaintext)
     assert array.data[0] == int(array_pt[0][0])
+
+
+def test_from_bytes():
+    for bits in (64, 128):
+        array = ndarray_bigint.randbits((30, 40), bits)
+        buf = array.to_bytes(bits // 8, 'little')
+        res = ndarray_bigint.from_bytes(buf, bits // 8, (30, 40), 'little')
+        assert res.shape == (30, 40)
+        assert res.tolist() == array.to_list()
+
+    array = ndarray_bigint.randbits((100,), 128)
+    buf = array.to_bytes(16, 'big')
+    res = ndarray_bigint.from_bytes(buf, 16, (100,), 'big')
+    assert res.tolist() == array.to_list()
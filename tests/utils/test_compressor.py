@@ -1,7 +1,15 @@
+import pickle
+
 import numpy as np
 import numpy.testing as npt
 
 from secretflow.utils.compressor.mixed_compressor import MixedCompressedData
+from secretflow.utils.compressor.packing import (
+    decode_indices,
+    encode_indices,
+    pack_bits,
+    unpack_bits,
+)
 from secretflow.utils.compressor.quantized_compressor import QuantizedCompressedData
 from secretflow.utils.compressor.sparse_compressor import SparseCompressedData
 
@@ -76,3 +84,37 @@ def test_quantized_kmeans_compressor():
 def test_mixed_compressor():
     do_tests_mix_compressor(MixedCompressor(TopkSparse(0.9), QuantizedZeroPoint()))
     do_tests_mix_compressor(MixedCompressor(RandomSparse(0.8), QuantizedLSTM()))
+
+
+def test_pack_bits():
+    for bits in range(1, 17):
+        values = np.random.randint(0, 1 << bits, size=37)
+        packed = pack_bits(values, bits)
+        assert len(packed) == (37 * bits + 7) // 8
+        npt.assert_equal(unpack_bits(packed, bits, 37), values)
+
+
+def test_encode_indices():
+    shape = (10, 20)
+    index = np.random.choice(200, 30, replace=False)
+    row, col = np.unravel_index(index, shape)
+    row2, col2 = decode_indices(encode_indices((row, col), shape), shape)
+    npt.assert_equal(row, row2)
+    npt.assert_equal(col, col2)
+
+
+def test_compressed_data_bit_packed_on_wire():
+    data = np.random.uniform(low=-5, high=5, size=(64, 64))
+    for compressor in [
+        QuantizedZeroPoint(4),
+        QuantizedLSTM(2),
+        MixedCompressor(TopkSparse(0.9), QuantizedZeroPoint(4)),
+    ]:
+        compressed_data = compressor.compress(data)
+        wire = pickle.dumps(compressed_data)
+        npt.assert_equal(
+            compressor.decompress(pickle.loads(wire)),
+            compressor.decompress(compressed_data),
+        )
+    # 4 bits per value
+    assert len(pickle.dumps(QuantizedZeroPoint(4).compress(data))) < data.size